@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark - thread BatchExecutor vs. AsyncBatchExecutor for I/O waits.
+
+Each item simulates an I/O-bound handler that waits ``--latency``
+seconds. The thread executor is capped by its pool size; the asyncio
+executor keeps ``--concurrency`` waits in flight on a single thread.
+
+Run: python benchmarks/bench_async_batch.py [--items 2000] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import sqlite3
+import time
+
+from spine.core.schema import CORE_DDL
+from spine.execution.batch import AsyncBatchExecutor, BatchExecutor
+from spine.execution.ledger import ExecutionLedger
+
+
+def make_ledger() -> ExecutionLedger:
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    for ddl in CORE_DDL.values():
+        conn.execute(ddl)
+    conn.commit()
+    return ExecutionLedger(conn)
+
+
+def threaded(items: int, latency: float, workers: int) -> float:
+    executor = BatchExecutor(make_ledger(), max_parallel=workers)
+    executor.register_handler("io.fetch", lambda params: time.sleep(latency))
+    for i in range(items):
+        executor.add("io.fetch", {"i": i})
+    start = time.perf_counter()
+    executor.run_all()
+    return time.perf_counter() - start
+
+
+def asynchronous(items: int, latency: float, concurrency: int) -> float:
+    executor = AsyncBatchExecutor(make_ledger(), max_concurrency=concurrency)
+
+    async def fetch(params):
+        await asyncio.sleep(latency)
+
+    executor.register_handler("io.fetch", fetch)
+    for i in range(items):
+        executor.add("io.fetch", {"i": i})
+    start = time.perf_counter()
+    asyncio.run(executor.run_all())
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2_000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=1_000)
+    args = parser.parse_args()
+
+    slow = threaded(args.items, args.latency, args.workers)
+    fast = asynchronous(args.items, args.latency, args.concurrency)
+
+    print(f"items:        {args.items} x {args.latency * 1000:.0f}ms")
+    print(f"threads({args.workers}):  {slow:8.3f}s")
+    print(f"asyncio({args.concurrency}): {fast:8.3f}s")
+    print(f"speedup:      {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark - concurrent group runs: thread-bridged GroupRunner vs AsyncGroupRunner.
+
+Simulates an async service starting ``--groups`` group runs at once,
+each a fan-out of ``--steps`` I/O-bound steps (``--latency`` seconds of
+awaiting per step), with max_concurrency 8 per group:
+
+- bridged: ``GroupRunner.execute`` per run via ``asyncio.to_thread``
+  (default thread pool), steps blocking a worker thread each
+- async: ``AsyncGroupRunner`` on the same loop, steps awaiting an async
+  Dispatcher with a MemoryExecutor
+
+Run: python benchmarks/bench_async_runner.py [--groups 200] [--steps 16] [--latency 0.01]
+"""
+import argparse
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import structlog
+
+from spine.execution import Dispatcher
+from spine.execution.executors import MemoryExecutor
+from spine.framework.pipelines import PipelineStatus
+from spine.orchestration import AsyncGroupRunner, GroupRunner
+from spine.orchestration.models import ExecutionMode, ExecutionPlan, ExecutionPolicy, PlannedStep
+
+
+def make_plan(steps: int) -> ExecutionPlan:
+    planned = [PlannedStep(f"s{i}", "bench.io", {}, (), i) for i in range(steps)]
+    policy = ExecutionPolicy(mode=ExecutionMode.PARALLEL, max_concurrency=8)
+    return ExecutionPlan("bench", 1, "batch", planned, policy)
+
+
+class SleepingDispatcher:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def submit(self, pipeline, params, trigger_source):
+        time.sleep(self.latency)
+        return SimpleNamespace(status=PipelineStatus.COMPLETED, result=None, error=None)
+
+
+async def run_bridged(groups: int, steps: int, latency: float) -> tuple[float, int]:
+    runner = GroupRunner(dispatcher=SleepingDispatcher(latency))
+    peak_threads = 0
+
+    async def one():
+        nonlocal peak_threads
+        peak_threads = max(peak_threads, threading.active_count())
+        return await asyncio.to_thread(runner.execute, make_plan(steps))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(groups)))
+    return time.perf_counter() - start, peak_threads
+
+
+async def run_async(groups: int, steps: int, latency: float) -> tuple[float, int]:
+    async def io(params):
+        await asyncio.sleep(latency)
+
+    dispatcher = Dispatcher(executor=MemoryExecutor(handlers={"pipeline:bench.io": io}))
+    runner = AsyncGroupRunner(dispatcher)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(runner.execute(make_plan(steps)) for _ in range(groups)))
+    return time.perf_counter() - start, threading.active_count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    bridged, bridged_threads = asyncio.run(run_bridged(args.groups, args.steps, args.latency))
+    native, native_threads = asyncio.run(run_async(args.groups, args.steps, args.latency))
+
+    total = args.groups * args.steps
+    print(f"{args.groups} concurrent groups x {args.steps} steps, {args.latency * 1000:.0f}ms per step:")
+    print(f"  bridged GroupRunner: {bridged:7.2f}s  ({total / bridged:7.0f} steps/s, {bridged_threads} threads)")
+    print(f"  AsyncGroupRunner:    {native:7.2f}s  ({total / native:7.0f} steps/s, {native_threads} threads)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark - ConcurrencyGuard acquire under 32-thread contention.
+
+Each thread opens its own SQLite connection to a shared file database
+and repeatedly tries to acquire/release one of a few hot lock keys.
+Three variants are compared:
+
+- legacy:  the previous DELETE + INSERT (+ rollback/SELECT/UPDATE) path
+- upsert:  single-statement upsert acquire, private LocalLockTable per thread
+- shared:  upsert acquire with one LocalLockTable shared by all threads
+
+Run: python benchmarks/bench_concurrency_guard.py [--threads 32] [--attempts 200]
+"""
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from spine.core.schema import CORE_DDL
+from spine.execution.concurrency import ConcurrencyGuard, LocalLockTable, utcnow
+
+HOT_KEYS = [f"pipeline:hot:{i}" for i in range(4)]
+
+
+def legacy_acquire(conn, lock_key: str, execution_id: str, timeout_seconds: int = 3600) -> bool:
+    """The pre-upsert acquire algorithm, kept here for comparison."""
+    now = utcnow()
+    expires_at = now + timedelta(seconds=timeout_seconds)
+    cursor = conn.cursor()
+    cursor.execute(
+        "DELETE FROM core_concurrency_locks WHERE lock_key = ? AND expires_at < ?",
+        (lock_key, now.isoformat()),
+    )
+    try:
+        cursor.execute(
+            "INSERT INTO core_concurrency_locks (lock_key, execution_id, acquired_at, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (lock_key, execution_id, now.isoformat(), expires_at.isoformat()),
+        )
+        conn.commit()
+        return True
+    except Exception:
+        conn.rollback()
+        cursor.execute(
+            "SELECT execution_id FROM core_concurrency_locks WHERE lock_key = ?", (lock_key,)
+        )
+        row = cursor.fetchone()
+        if row and row[0] == execution_id:
+            cursor.execute(
+                "UPDATE core_concurrency_locks SET expires_at = ? "
+                "WHERE lock_key = ? AND execution_id = ?",
+                (expires_at.isoformat(), lock_key, execution_id),
+            )
+            conn.commit()
+            return True
+        return False
+
+
+def setup_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    for ddl in CORE_DDL.values():
+        conn.execute(ddl)
+    conn.commit()
+    conn.close()
+
+
+def run(variant: str, path: Path, threads: int, attempts: int) -> tuple[float, int]:
+    shared = LocalLockTable()
+    barrier = threading.Barrier(threads)
+    acquired = [0] * threads
+
+    def worker(n: int) -> None:
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        guard = ConcurrencyGuard(
+            conn, local_locks=shared if variant == "shared" else LocalLockTable()
+        )
+        execution_id = f"exec-{n}"
+        barrier.wait()
+        for i in range(attempts):
+            key = HOT_KEYS[i % len(HOT_KEYS)]
+            if variant == "legacy":
+                ok = legacy_acquire(conn, key, execution_id)
+            else:
+                ok = guard.acquire(key, execution_id)
+            if ok:
+                acquired[n] += 1
+                guard.release(key, execution_id=execution_id)
+        conn.close()
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start, sum(acquired)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--attempts", type=int, default=200)
+    args = parser.parse_args()
+
+    total = args.threads * args.attempts
+    print(f"threads: {args.threads}  attempts/thread: {args.attempts}  hot keys: {len(HOT_KEYS)}")
+    print(f"{'variant':>8} {'seconds':>9} {'attempts/s':>12} {'acquired':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in ("legacy", "upsert", "shared"):
+            path = Path(tmp) / f"{variant}.db"
+            setup_db(path)
+            elapsed, acquired = run(variant, path, args.threads, args.attempts)
+            print(f"{variant:>8} {elapsed:9.3f} {total / elapsed:12,.0f} {acquired:9}")
+
+
+if __name__ == "__main__":
+    main()
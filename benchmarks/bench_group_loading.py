@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark - startup cost of loading a large directory of group YAML files.
+
+Writes ``--groups`` group files (``--steps`` steps each) to a temporary
+directory and times each way of getting them into the registry:
+
+- cold: ``load_groups_from_directory`` parsing and validating every file
+- cold, parallel: the same with uncached files parsed in ``--workers`` processes
+- warm cache: ``GroupCache`` hit for every file, groups built from the index
+- warm cache, lazy: ``register_groups_from_directory`` registering names only,
+  followed by one ``get_group`` (what a typical CLI command needs)
+
+Run: python benchmarks/bench_group_loading.py [--groups 1000] [--steps 8] [--workers 4]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+
+from spine.orchestration import (
+    GroupCache,
+    clear_group_registry,
+    get_group,
+    load_groups_from_directory,
+    register_groups_from_directory,
+)
+
+
+def write_groups(directory: Path, groups: int, steps: int) -> None:
+    for g in range(groups):
+        lines = [
+            "apiVersion: spine.io/v1",
+            "kind: PipelineGroup",
+            "metadata:",
+            f"  name: bench.group_{g}",
+            f"  domain: bench.domain_{g % 10}",
+            "  description: Benchmark group",
+            "spec:",
+            "  defaults:",
+            '    tier: "{{ params.tier }}"',
+            "  pipelines:",
+        ]
+        for s in range(steps):
+            lines += [f"    - name: step_{s}", f"      pipeline: bench.pipeline_{s}"]
+            if s:
+                lines.append(f"      depends_on: [step_{s - 1}]")
+        lines += ["  policy:", "    execution: parallel", "    max_concurrency: 4"]
+        (directory / f"group_{g}.yaml").write_text("\n".join(lines) + "\n")
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        groups_dir = Path(tmp) / "groups"
+        groups_dir.mkdir()
+        write_groups(groups_dir, args.groups, args.steps)
+        cache_path = Path(tmp) / "group-cache.json"
+
+        def lazy_start():
+            clear_group_registry()
+            register_groups_from_directory(groups_dir, cache=GroupCache(cache_path))
+            get_group("bench.group_0")
+
+        results = {
+            "cold": timed(lambda: load_groups_from_directory(groups_dir)),
+            "cold, parallel": timed(
+                lambda: load_groups_from_directory(groups_dir, workers=args.workers)
+            ),
+            "cold, writing cache": timed(
+                lambda: load_groups_from_directory(groups_dir, cache=GroupCache(cache_path))
+            ),
+            "warm cache": timed(
+                lambda: load_groups_from_directory(groups_dir, cache=GroupCache(cache_path))
+            ),
+            "warm cache, lazy": timed(lazy_start),
+        }
+
+    print(f"{args.groups} group files x {args.steps} steps:")
+    for label, seconds in results.items():
+        print(f"  {label:<20} {seconds * 1000:8.1f}ms  ({results['cold'] / seconds:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
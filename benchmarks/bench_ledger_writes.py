@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark - ExecutionLedger per-statement commits vs. write-behind.
+
+Runs a tracked execution that records N progress events against a
+file-backed SQLite database, first with an unbuffered ledger driven
+directly (one commit per event), then through ``tracked_execution``
+(events buffered and committed when the execution ends).
+
+Run: python benchmarks/bench_ledger_writes.py [--events 2000]
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from spine.core.schema import CORE_DDL
+from spine.execution.context import tracked_execution
+from spine.execution.ledger import ExecutionLedger
+from spine.execution.models import EventType, Execution, ExecutionStatus
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous = FULL")
+    for ddl in CORE_DDL.values():
+        conn.execute(ddl)
+    conn.commit()
+    return conn
+
+
+def unbuffered(conn: sqlite3.Connection, events: int) -> float:
+    ledger = ExecutionLedger(conn)
+    start = time.perf_counter()
+    execution = Execution.create(pipeline="bench.pipeline")
+    ledger.create_execution(execution)
+    ledger.update_status(execution.id, ExecutionStatus.RUNNING)
+    for i in range(events):
+        ledger.record_event(execution.id, EventType.PROGRESS, {"i": i})
+    ledger.update_status(execution.id, ExecutionStatus.COMPLETED)
+    return time.perf_counter() - start
+
+
+def write_behind(conn: sqlite3.Connection, events: int) -> float:
+    ledger = ExecutionLedger(conn, flush_size=events + 10)
+    start = time.perf_counter()
+    with tracked_execution(ledger, None, None, "bench.pipeline") as ctx:
+        for i in range(events):
+            ctx.log_progress("tick", i=i)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        slow = unbuffered(connect(Path(tmp) / "a.db"), args.events)
+        fast = write_behind(connect(Path(tmp) / "b.db"), args.events)
+
+    print(f"events:        {args.events}")
+    print(f"per-commit:    {slow:8.3f}s")
+    print(f"write-behind:  {fast:8.3f}s")
+    print(f"speedup:       {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark - LocalExecutor thread vs. process mode on CPU-bound work.
+
+Runs a fixed number of CPU-bound (pure Python hashing) tasks through
+LocalExecutor in thread and process mode at increasing worker counts.
+Thread mode stays flat because of the GIL; process mode scales with the
+number of available cores.
+
+Run: python benchmarks/bench_local_executor.py [--tasks 32] [--rounds 20000]
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import time
+
+from spine.execution import task_spec
+from spine.execution.executors import LocalExecutor
+
+
+def hash_chain(params: dict) -> str:
+    """CPU-bound handler: repeatedly hash a buffer."""
+    digest = params["seed"].encode()
+    for _ in range(params["rounds"]):
+        digest = hashlib.sha256(digest + b"spine").digest()
+        digest = bytes(b ^ 0x5A for b in digest)  # keep the GIL busy
+    return digest.hex()
+
+
+async def run(mode: str, workers: int, tasks: int, rounds: int) -> float:
+    with LocalExecutor(max_workers=workers, mode=mode) as executor:
+        executor.register_handler("task", "hash_chain", hash_chain)
+        # Warm the pool so process start-up is not measured
+        await executor.result_future(
+            await executor.submit(task_spec("hash_chain", {"seed": "warm", "rounds": 1}))
+        )
+        start = time.perf_counter()
+        refs = [
+            await executor.submit(task_spec("hash_chain", {"seed": str(i), "rounds": rounds}))
+            for i in range(tasks)
+        ]
+        await asyncio.gather(*(executor.result_future(ref) for ref in refs))
+        return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=20_000)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores})
+    print(f"cores: {cores}  tasks: {args.tasks}  rounds: {args.rounds}")
+    print(f"{'workers':>8} {'thread':>10} {'process':>10} {'speedup':>8}")
+    for workers in worker_counts:
+        thread_s = await run("thread", workers, args.tasks, args.rounds)
+        process_s = await run("process", workers, args.tasks, args.rounds)
+        print(f"{workers:>8} {thread_s:9.2f}s {process_s:9.2f}s {thread_s / process_s:7.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark - WorkManifest per-partition calls vs bulk operations on SQLite.
+
+Advances ``--partitions`` partition keys through two stages in an
+on-disk SQLite database and then checks them, once with the
+per-partition API and once with the bulk API:
+
+- advance: ``advance_to`` per key vs ``advance_many``
+- latest stage: ``get_latest_stage`` per key vs ``get_latest_stages``
+- stage gate: ``is_at_least`` per key vs ``filter_at_least``
+
+Run: python benchmarks/bench_manifest_bulk.py [--partitions 100000]
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from spine.core.manifest import WorkManifest
+from spine.core.schema import create_core_tables
+
+STAGES = ["PENDING", "INGESTED", "NORMALIZED", "AGGREGATED"]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(path: Path, keys: list[dict], bulk: bool) -> dict[str, float]:
+    conn = sqlite3.connect(path)
+    create_core_tables(conn)
+    manifest = WorkManifest(conn, domain="bench", stages=STAGES)
+    half = keys[::2]
+
+    def advance():
+        if bulk:
+            manifest.advance_many(keys, "INGESTED", row_count=100)
+            manifest.advance_many(half, "NORMALIZED", row_count=100)
+        else:
+            for key in keys:
+                manifest.advance_to(key, "INGESTED", row_count=100)
+            for key in half:
+                manifest.advance_to(key, "NORMALIZED", row_count=100)
+        conn.commit()
+
+    def latest():
+        if bulk:
+            manifest.get_latest_stages(keys)
+        else:
+            [manifest.get_latest_stage(key) for key in keys]
+
+    def gate():
+        if bulk:
+            manifest.filter_at_least(keys, "NORMALIZED")
+        else:
+            [key for key in keys if manifest.is_at_least(key, "NORMALIZED")]
+
+    results = {"advance": timed(advance), "latest stage": timed(latest), "stage gate": timed(gate)}
+    conn.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--partitions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", DeprecationWarning)  # datetime.utcnow in manifest
+    keys = [
+        {"week_ending": f"2025-W{i % 52:02d}", "tier": "NMS_TIER_1", "symbol": f"SYM{i:06d}"}
+        for i in range(args.partitions)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = run(Path(tmp) / "single.db", keys, bulk=False)
+        bulk = run(Path(tmp) / "bulk.db", keys, bulk=True)
+
+    print(f"{args.partitions:,} partitions on SQLite:")
+    for op in single:
+        print(
+            f"  {op:<13} per-partition {single[op]:6.2f}s   bulk {bulk[op]:6.2f}s"
+            f"  ({single[op] / bulk[op]:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
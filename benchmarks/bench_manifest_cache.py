@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark - repeated WorkManifest stage checks with and without ManifestCache.
+
+Mimics a tracked run over ``--partitions`` partitions of an on-disk
+SQLite manifest (half already NORMALIZED): each partition gets
+``--checks`` rounds of ``is_at_least`` + ``has_stage`` calls (idempotency
+gate and auto-resume), then one ``advance_to``:
+
+- no cache: every check is a query
+- cache: read-through ManifestCache, first check per partition queries
+- cache + preload: ``preload()`` fills the domain in one query first
+
+Run: python benchmarks/bench_manifest_cache.py [--partitions 20000] [--checks 5]
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from spine.core.manifest import ManifestCache, WorkManifest
+from spine.core.schema import create_core_tables
+
+STAGES = ["PENDING", "INGESTED", "NORMALIZED", "AGGREGATED"]
+
+
+def run(conn, keys, checks: int, cache: ManifestCache | None, preload: bool) -> float:
+    manifest = WorkManifest(conn, domain="bench", stages=STAGES, cache=cache)
+    start = time.perf_counter()
+    if preload:
+        manifest.preload()
+    for key in keys:
+        for _ in range(checks):
+            if not manifest.is_at_least(key, "NORMALIZED"):
+                manifest.has_stage(key, "INGESTED")
+        manifest.advance_to(key, "AGGREGATED")
+    conn.rollback()  # keep the seeded state for the next variant
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--partitions", type=int, default=20_000)
+    parser.add_argument("--checks", type=int, default=5)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", DeprecationWarning)  # datetime.utcnow in manifest
+    keys = [{"week_ending": f"2025-W{i % 52:02d}", "symbol": f"SYM{i:06d}"} for i in range(args.partitions)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(Path(tmp) / "bench.db")
+        create_core_tables(conn)
+        seed = WorkManifest(conn, domain="bench", stages=STAGES)
+        seed.advance_many(keys, "INGESTED")
+        seed.advance_many(keys[::2], "NORMALIZED")
+        conn.commit()
+
+        results = {
+            "no cache": run(conn, keys, args.checks, None, False),
+            "cache": run(conn, keys, args.checks, ManifestCache(max_entries=args.partitions), False),
+            "cache + preload": run(conn, keys, args.checks, ManifestCache(max_entries=args.partitions), True),
+        }
+        conn.close()
+
+    print(f"{args.partitions:,} partitions x {args.checks} check rounds + 1 advance:")
+    for label, seconds in results.items():
+        print(f"  {label:<16} {seconds:6.2f}s  ({results['no cache'] / seconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark - PlanResolver with and without the plan cache.
+
+Resolves the same layered ``PipelineGroup`` repeatedly, as a scheduler
+does for recurring runs:
+
+- uncached: ``cache_size=0`` (validate, cycle check, sort, merge params
+  on every call)
+- cached: default LRU cache; every call after the first is a hit
+
+Run: python benchmarks/bench_plan_cache.py [--steps 50] [--resolves 5000]
+"""
+import argparse
+import time
+
+import structlog
+
+from spine.orchestration import PipelineGroup, PipelineStep
+from spine.orchestration.planner import PlanResolver
+
+
+def make_group(steps: int) -> PipelineGroup:
+    pipeline_steps = []
+    for i in range(steps):
+        deps = [f"s{j}" for j in range(max(0, i - 3), i)]
+        pipeline_steps.append(PipelineStep(f"s{i}", f"bench.p{i}", depends_on=deps, params={"i": i}))
+    return PipelineGroup(name="bench.group", steps=pipeline_steps, defaults={"tier": "NMS_TIER_1"})
+
+
+def timed(resolver: PlanResolver, group: PipelineGroup, resolves: int) -> float:
+    params = {"week_ending": "2026-01-09"}
+    start = time.perf_counter()
+    for _ in range(resolves):
+        resolver.resolve(group, params=params)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--resolves", type=int, default=5_000)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    group = make_group(args.steps)
+
+    uncached = timed(PlanResolver(validate_pipelines=False, cache_size=0), group, args.resolves)
+    cached = timed(PlanResolver(validate_pipelines=False), group, args.resolves)
+
+    per_call = lambda total: total / args.resolves * 1e6
+    print(f"{args.resolves} resolves of a {args.steps}-step group:")
+    print(f"  uncached:  {per_call(uncached):8.1f}us/resolve")
+    print(f"  cached:    {per_call(cached):8.1f}us/resolve   ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark - interactive latency behind bulk work, FIFO vs. priority.
+
+Submits ``--bulk`` low-priority tasks to a "backfill" lane, then
+``--interactive`` high-priority tasks to an "interactive" lane, and
+reports how long the interactive tasks take to finish. With a plain
+LocalExecutor they queue behind the whole backlog; behind a
+PriorityExecutor they are dispatched as soon as a worker frees up.
+
+Run: python benchmarks/bench_priority_scheduler.py [--bulk 400] [--workers 4]
+"""
+import argparse
+import asyncio
+import time
+
+from spine.execution.executors import LocalExecutor, PriorityExecutor
+from spine.execution.spec import task_spec
+
+
+async def interactive_latency(args, prioritized: bool) -> float:
+    local = LocalExecutor(max_workers=args.workers)
+    local.register_handler("task", "work", lambda params: time.sleep(args.task_ms / 1000))
+    executor = (
+        PriorityExecutor(
+            local,
+            max_in_flight=args.workers,
+            lane_weights={"interactive": 4, "backfill": 1},
+        )
+        if prioritized
+        else local
+    )
+
+    bulk = [task_spec("work", lane="backfill", priority="low") for _ in range(args.bulk)]
+    urgent = [task_spec("work", lane="interactive", priority="high") for _ in range(args.interactive)]
+    for spec in bulk:
+        await executor.submit(spec)
+
+    start = time.perf_counter()
+    refs = [await executor.submit(spec) for spec in urgent]
+    while True:
+        statuses = [await executor.get_status(ref) for ref in refs]
+        if all(status == "completed" for status in statuses):
+            break
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    # Drop the rest of the bulk backlog
+    local.pool.shutdown(wait=True, cancel_futures=True)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bulk", type=int, default=400)
+    parser.add_argument("--interactive", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--task-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    fifo = asyncio.run(interactive_latency(args, prioritized=False))
+    prio = asyncio.run(interactive_latency(args, prioritized=True))
+
+    print(f"bulk backlog:  {args.bulk} x {args.task_ms:.0f}ms on {args.workers} workers")
+    print(f"FIFO:          {fifo * 1000:8.1f}ms until {args.interactive} interactive tasks finish")
+    print(f"priority:      {prio * 1000:8.1f}ms")
+    print(f"speedup:       {fifo / prio:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark - soak test of Dispatcher memory with and without retention.
+
+Submits N tasks through a Dispatcher backed by a MemoryExecutor and
+samples traced memory at regular checkpoints. Without a retention
+policy every run, event list and executor result is kept; with one,
+memory levels off once ``--max-runs`` finished runs are held.
+
+The default is sized for a quick run; pass ``--submissions 10000000``
+for the full soak (tens of minutes).
+
+Run: python benchmarks/bench_retention_soak.py [--submissions 200000] [--max-runs 10000]
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from spine.execution import Dispatcher, RetentionPolicy
+from spine.execution.executors import MemoryExecutor
+
+
+async def soak(submissions: int, checkpoints: int, policy: RetentionPolicy | None) -> list[float]:
+    executor = MemoryExecutor(handlers={"task:noop": lambda params: None}, retention=policy)
+    dispatcher = Dispatcher(executor=executor, retention=policy)
+    step = max(submissions // checkpoints, 1)
+    samples = []
+
+    for i in range(1, submissions + 1):
+        await dispatcher.submit_task("noop", {"i": i})
+        if i % step == 0:
+            gc.collect()
+            samples.append(tracemalloc.get_traced_memory()[0] / 2**20)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=200_000)
+    parser.add_argument("--max-runs", type=int, default=10_000)
+    parser.add_argument("--checkpoints", type=int, default=5)
+    parser.add_argument("--skip-unbounded", action="store_true",
+                        help="only run the retained soak (for very large N)")
+    args = parser.parse_args()
+
+    runs = [("retained", RetentionPolicy(max_runs=args.max_runs))]
+    if not args.skip_unbounded:
+        runs.insert(0, ("unbounded", None))
+
+    print(f"submissions: {args.submissions}, checkpoints: {args.checkpoints}")
+    for label, policy in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        samples = asyncio.run(soak(args.submissions, args.checkpoints, policy))
+        elapsed = time.perf_counter() - start
+        tracemalloc.stop()
+        curve = "  ".join(f"{mb:7.1f}" for mb in samples)
+        print(f"{label:10s} MiB: {curve}   ({elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark - fetching rolling windows from SQLite: per-week vs bulk queries.
+
+Loads ``--symbols`` symbols x ``--weeks`` weeks of volumes into an
+on-disk SQLite table and computes a ``--size``-week rolling average as
+of the last week for every symbol:
+
+- per week: ``fetch_fn`` running one query per period (size queries/symbol)
+- fetch_many: ``table_fetch_many`` with an IN list (one query/symbol)
+- fetch_many, range: the same with a BETWEEN range
+- batched keys: ``fetch_periods_for_keys`` for ``--batch`` symbols per query
+
+Run: python benchmarks/bench_rolling_fetch.py [--symbols 2000] [--weeks 104] [--size 52] [--batch 200]
+"""
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from spine.core.rolling import RollingWindow, fetch_periods_for_keys, table_fetch_many
+from spine.core.temporal import WeekEnding
+
+
+def average(pairs):
+    return {"avg": sum(v for _, v in pairs) / len(pairs)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=2000)
+    parser.add_argument("--weeks", type=int, default=104)
+    parser.add_argument("--size", type=int, default=52)
+    parser.add_argument("--batch", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    end = WeekEnding("2025-12-26")
+    weeks = [str(w) for w in WeekEnding.range(end.previous(args.weeks - 1), end)]
+    symbols = [f"SYM{i:05d}" for i in range(args.symbols)]
+    window = RollingWindow(size=args.size, step_back=lambda w: w.previous())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(Path(tmp) / "bench.db")
+        conn.execute("CREATE TABLE volume (symbol TEXT, week_ending TEXT, total INTEGER)")
+        conn.execute("CREATE INDEX idx_volume ON volume (symbol, week_ending)")
+        conn.executemany(
+            "INSERT INTO volume VALUES (?, ?, ?)",
+            ((s, w, rng.randint(1, 10**6)) for s in symbols for w in weeks if rng.random() > 0.05),
+        )
+        conn.commit()
+
+        def per_week():
+            for symbol in symbols:
+                def fetch(week, symbol=symbol):
+                    row = conn.execute(
+                        "SELECT total FROM volume WHERE symbol = ? AND week_ending = ?",
+                        (symbol, str(week)),
+                    ).fetchone()
+                    return row[0] if row else None
+                window.compute(end, fetch, average)
+            return args.symbols * args.size
+
+        def bulk(use_range):
+            def run():
+                for symbol in symbols:
+                    fetch_many = table_fetch_many(
+                        conn, "volume", "total", filters={"symbol": symbol}, use_range=use_range
+                    )
+                    window.compute(end, None, average, fetch_many=fetch_many)
+                return args.symbols
+            return run
+
+        def batched():
+            periods = window.get_window(end)
+            for i in range(0, len(symbols), args.batch):
+                keys = symbols[i:i + args.batch]
+                found = fetch_periods_for_keys(conn, "volume", "total", "symbol", keys, periods)
+                for symbol in keys:
+                    window.compute(end, None, average, fetch_many=lambda ps, f=found, s=symbol: f.get(s, {}))
+            return -(-args.symbols // args.batch)
+
+        print(f"{args.symbols} symbols, {args.size}-week window as of {end}:")
+        baseline = None
+        for label, fn in [
+            ("per week", per_week),
+            ("fetch_many", bulk(False)),
+            ("fetch_many, range", bulk(True)),
+            ("batched keys", batched),
+        ]:
+            start = time.perf_counter()
+            queries = fn()
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  {label:<18} {elapsed * 1000:8.1f}ms  {queries:>8,} queries  ({baseline / elapsed:5.1f}x)")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
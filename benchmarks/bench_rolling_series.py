@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark - 52-week rolling statistics: compute() per week vs compute_series().
+
+For ``--symbols`` symbols with ``--weeks`` weeks of data (about 10% of
+weeks missing), computes sum/mean/min/max/std over a ``--size``-week
+window for every week:
+
+- per as_of: ``RollingWindow.compute`` for each week, fetching and
+  aggregating the whole window every time
+- series: one ``RollingWindow.compute_series`` call per symbol, fetching
+  each week once and sliding the window incrementally
+
+Run: python benchmarks/bench_rolling_series.py [--symbols 200] [--weeks 520] [--size 52]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from spine.core.rolling import RollingWindow
+from spine.core.temporal import WeekEnding
+
+
+def aggregate(pairs):
+    values = [v for _, v in pairs]
+    return {
+        "sum": sum(values),
+        "mean": sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+        "std": statistics.stdev(values) if len(values) > 1 else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--weeks", type=int, default=520)
+    parser.add_argument("--size", type=int, default=52)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    end = WeekEnding("2025-12-26")
+    start = end.previous(args.weeks - 1)
+    weeks = list(WeekEnding.range(start.previous(args.size - 1), end))
+    data = [
+        {w.value: rng.randint(1_000, 1_000_000) for w in weeks if rng.random() > 0.1}
+        for _ in range(args.symbols)
+    ]
+    window = RollingWindow(size=args.size, step_back=lambda w: w.previous())
+
+    fetches = 0
+
+    def fetcher(values):
+        def fetch(week):
+            nonlocal fetches
+            fetches += 1
+            return values.get(week.value)
+        return fetch
+
+    t0 = time.perf_counter()
+    for values in data:
+        fetch = fetcher(values)
+        for as_of in WeekEnding.range(start, end):
+            window.compute(as_of, fetch, aggregate)
+    per_as_of, per_as_of_fetches = time.perf_counter() - t0, fetches
+
+    fetches = 0
+    t0 = time.perf_counter()
+    for values in data:
+        window.compute_series(start, end, fetcher(values))
+    series, series_fetches = time.perf_counter() - t0, fetches
+
+    print(f"{args.symbols} symbols x {args.weeks} weeks, {args.size}-week window:")
+    print(f"  per as_of: {per_as_of:7.2f}s  {per_as_of_fetches:>10,} fetches")
+    print(f"  series:    {series:7.2f}s  {series_fetches:>10,} fetches  ({per_as_of / series:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
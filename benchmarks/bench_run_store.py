@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark - indexed in-memory run store listing latency.
+
+Populates a MemoryRunStore with N runs and measures filtered, paginated
+``query`` latency at increasing sizes. Latency should stay flat as N
+grows because each query only touches the runs it returns.
+
+Run: python benchmarks/bench_run_store.py [--max-runs 1000000]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from spine.execution import MemoryRunStore, RunRecord, RunStatus
+from spine.execution.spec import WorkSpec
+
+KINDS = ("task", "pipeline", "workflow", "step")
+STATUSES = (RunStatus.COMPLETED,) * 97 + (RunStatus.FAILED,) * 2 + (RunStatus.RUNNING,)
+
+
+def populate(store: MemoryRunStore, start: int, stop: int, base: datetime) -> None:
+    for i in range(start, stop):
+        kind = KINDS[i % len(KINDS)]
+        parent = f"wf-{i // 50}" if kind == "step" else None
+        store.save(RunRecord(
+            run_id=f"run-{i}",
+            spec=WorkSpec(kind=kind, name=f"handler_{i % 200}", parent_run_id=parent),
+            status=STATUSES[i % len(STATUSES)],
+            created_at=base + timedelta(microseconds=i),
+        ))
+
+
+def timed(fn, repeat: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-runs", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    store = MemoryRunStore()
+    base = datetime(2026, 1, 1)
+    queries = {
+        "newest page": lambda: store.query(limit=50),
+        "kind=pipeline": lambda: store.query(kind="pipeline", limit=50),
+        "status=failed": lambda: store.query(status=RunStatus.FAILED, limit=50),
+        "kind+name+offset": lambda: store.query(kind="task", name="handler_4", limit=20, offset=20),
+        "children": lambda: store.query(parent_run_id="wf-7"),
+    }
+
+    print(f"{'runs':>10} " + " ".join(f"{name:>18}" for name in queries))
+    size = 0
+    target = 1_000
+    while size < args.max_runs:
+        target = min(target * 10, args.max_runs)
+        populate(store, size, target, base)
+        size = target
+        row = [f"{timed(q):15.1f} us" for q in queries.values()]
+        print(f"{size:>10} " + " ".join(row))
+
+
+if __name__ == "__main__":
+    main()
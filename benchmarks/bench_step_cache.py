@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark - workflow re-runs with and without the step result cache.
+
+Runs a chain of ``--steps`` lambda steps, each simulating ``--work``
+seconds of computation and producing ``--rows`` output rows, then runs
+it again with the same params:
+
+- no cache: every re-run repeats all the work
+- DatabaseStepCache (SQLite in memory) and DirectoryStepCache: the
+  re-run only hashes inputs and loads stored outputs
+
+Run: python benchmarks/bench_step_cache.py [--steps 20] [--work 0.005] [--rows 1000]
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+
+import structlog
+
+from spine.core.schema import create_core_tables
+from spine.orchestration import (
+    DatabaseStepCache,
+    DirectoryStepCache,
+    Step,
+    StepResult,
+    Workflow,
+    WorkflowRunner,
+)
+
+
+def make_workflow(steps: int, work: float, rows: int) -> Workflow:
+    def make_step(i: int):
+        def handler(ctx, config):
+            time.sleep(work)
+            return StepResult.ok(output={"rows": [[i, r, r * 0.5] for r in range(rows)]})
+        return handler
+
+    return Workflow(
+        name="bench.cached",
+        steps=[Step.lambda_(f"s{i}", make_step(i)) for i in range(steps)],
+    )
+
+
+def timed(runner: WorkflowRunner, workflow: Workflow) -> float:
+    start = time.perf_counter()
+    runner.execute(workflow, params={"tier": "NMS_TIER_1"})
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--work", type=float, default=0.005, help="seconds per step")
+    parser.add_argument("--rows", type=int, default=1000, help="output rows per step")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    workflow = make_workflow(args.steps, args.work, args.rows)
+
+    conn = sqlite3.connect(":memory:")
+    create_core_tables(conn)
+    with tempfile.TemporaryDirectory() as tmp:
+        runners = {
+            "no cache": WorkflowRunner(),
+            "DatabaseStepCache": WorkflowRunner(cache=DatabaseStepCache(conn)),
+            "DirectoryStepCache": WorkflowRunner(cache=DirectoryStepCache(tmp)),
+        }
+        print(f"{args.steps} steps x {args.work * 1000:.0f}ms, {args.rows} rows each:")
+        for label, runner in runners.items():
+            first = timed(runner, workflow)
+            rerun = timed(runner, workflow)
+            print(f"  {label:<19} first run {first * 1000:7.1f}ms   re-run {rerun * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark - Dispatcher.submit_many vs. looping over submit.
+
+Submits N task specs (half carrying idempotency keys) through a
+Dispatcher backed by StubExecutor, once with ``await submit()`` per spec
+and once with a single ``submit_many()`` call.
+
+Runs twice: with the in-memory store, and with a simulated ledger that
+charges a fixed latency per call to model database round-trips (where
+the bulk ``save_runs``/``record_events`` writes pay off).
+
+Run: python benchmarks/bench_submit_many.py [--specs 20000] [--latency-us 50]
+"""
+import argparse
+import asyncio
+import time
+
+from spine.execution import Dispatcher, task_spec
+from spine.execution.executors import StubExecutor
+
+
+class SimulatedLedger:
+    """Dict-backed ledger that spins for a fixed time per call."""
+
+    def __init__(self, latency_us: float):
+        self.latency = latency_us / 1e6
+        self.calls = 0
+        self.runs = {}
+        self.events = []
+        self.keys = {}
+
+    def _round_trip(self):
+        self.calls += 1
+        deadline = time.perf_counter() + self.latency
+        while time.perf_counter() < deadline:
+            pass
+
+    async def save_run(self, run):
+        self._round_trip()
+        self.runs[run.run_id] = run
+        if run.spec.idempotency_key:
+            self.keys[run.spec.idempotency_key] = run
+
+    async def save_runs(self, runs):
+        self._round_trip()
+        for run in runs:
+            self.runs[run.run_id] = run
+            if run.spec.idempotency_key:
+                self.keys[run.spec.idempotency_key] = run
+
+    async def record_event(self, event):
+        self._round_trip()
+        self.events.append(event)
+
+    async def record_events(self, events):
+        self._round_trip()
+        self.events.extend(events)
+
+    async def find_by_idempotency_key(self, key):
+        self._round_trip()
+        return self.keys.get(key)
+
+    async def find_by_idempotency_keys(self, keys):
+        self._round_trip()
+        return {key: self.keys[key] for key in keys if key in self.keys}
+
+
+def make_specs(n: int, prefix: str):
+    return [
+        task_spec(
+            "fan_out",
+            {"partition": i},
+            idempotency_key=f"{prefix}-{i}" if i % 2 else None,
+        )
+        for i in range(n)
+    ]
+
+
+async def run_loop(n: int, ledger=None) -> float:
+    dispatcher = Dispatcher(executor=StubExecutor(), ledger=ledger)
+    specs = make_specs(n, "loop")
+    start = time.perf_counter()
+    for spec in specs:
+        await dispatcher.submit(spec)
+    return time.perf_counter() - start
+
+
+async def run_batch(n: int, ledger=None) -> float:
+    dispatcher = Dispatcher(executor=StubExecutor(), ledger=ledger)
+    specs = make_specs(n, "batch")
+    start = time.perf_counter()
+    await dispatcher.submit_many(specs)
+    return time.perf_counter() - start
+
+
+def report(label: str, n: int, loop_s: float, batch_s: float) -> None:
+    print(f"\n[{label}]")
+    print(f"  submit loop:  {loop_s:8.3f}s  ({n / loop_s:,.0f}/s)")
+    print(f"  submit_many:  {batch_s:8.3f}s  ({n / batch_s:,.0f}/s)")
+    print(f"  speedup:      {loop_s / batch_s:8.2f}x")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--specs", type=int, default=20_000)
+    parser.add_argument("--latency-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    print(f"specs: {args.specs}")
+    report(
+        "in-memory",
+        args.specs,
+        await run_loop(args.specs),
+        await run_batch(args.specs),
+    )
+
+    loop_ledger = SimulatedLedger(args.latency_us)
+    batch_ledger = SimulatedLedger(args.latency_us)
+    report(
+        f"ledger @ {args.latency_us:g}us/call",
+        args.specs,
+        await run_loop(args.specs, loop_ledger),
+        await run_batch(args.specs, batch_ledger),
+    )
+    print(f"  ledger calls: {loop_ledger.calls:,} (loop) vs {batch_ledger.calls:,} (batch)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
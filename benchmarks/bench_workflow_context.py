@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark - WorkflowContext cost of carrying large step outputs.
+
+Runs a workflow of ``--steps`` lambda steps, each producing an output of
+``--rows`` small dicts (~1MB at the default size), and reports wall
+time and peak traced memory for:
+
+- deepcopy: the previous semantics, where every new context deep-copied
+  all prior outputs (replayed directly on dicts, on a shorter workflow
+  since its cost grows with steps x total output size)
+- copy-on-write: ``WorkflowRunner`` with the shared read-only context
+
+Run: python benchmarks/bench_workflow_context.py [--steps 200] [--rows 10000]
+"""
+import argparse
+import copy
+import time
+import tracemalloc
+
+import structlog
+
+from spine.orchestration import Step, StepResult, Workflow, WorkflowRunner, WorkflowStatus
+
+
+def make_output(step: int, rows: int) -> dict:
+    return {"rows": [{"id": i, "step": step, "px": i * 0.5} for i in range(rows)]}
+
+
+def deepcopy_run(steps: int, rows: int) -> None:
+    params: dict = {}
+    outputs: dict = {}
+    for i in range(steps):
+        output = make_output(i, rows)
+        outputs = copy.deepcopy(outputs)
+        outputs[f"s{i}"] = output
+        params = copy.deepcopy(params)
+
+
+def cow_run(steps: int, rows: int) -> None:
+    def produce(ctx, config):
+        return StepResult.ok(output=make_output(config["i"], rows))
+
+    workflow = Workflow(
+        name="bench.context",
+        steps=[Step.lambda_(f"s{i}", produce, config={"i": i}) for i in range(steps)],
+    )
+    result = WorkflowRunner().execute(workflow)
+    assert result.status == WorkflowStatus.COMPLETED, result.error
+
+
+def measure(fn, *args) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=10_000, help="rows per step output")
+    parser.add_argument("--deepcopy-steps", type=int, default=10,
+                        help="workflow length for the deepcopy baseline")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    old_time, old_peak = measure(deepcopy_run, args.deepcopy_steps, args.rows)
+    small_time, small_peak = measure(cow_run, args.deepcopy_steps, args.rows)
+    big_time, big_peak = measure(cow_run, args.steps, args.rows)
+
+    print(f"{args.deepcopy_steps} steps x {args.rows} rows:")
+    print(f"  deepcopy:       {old_time * 1000:9.1f}ms  peak {old_peak:8.1f}MB")
+    print(f"  copy-on-write:  {small_time * 1000:9.1f}ms  peak {small_peak:8.1f}MB"
+          f"   ({old_time / small_time:.0f}x)")
+    print(f"{args.steps} steps x {args.rows} rows:")
+    print(f"  copy-on-write:  {big_time * 1000:9.1f}ms  peak {big_peak:8.1f}MB"
+          f"   ({big_time / args.steps * 1000:.2f}ms/step)")
+
+
+if __name__ == "__main__":
+    main()
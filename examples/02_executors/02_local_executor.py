@@ -6,8 +6,9 @@ The LocalExecutor runs tasks in a ThreadPoolExecutor. It's ideal for:
 - Small-scale production
 - I/O-bound tasks that need concurrency
 
-Note: LocalExecutor uses synchronous handlers (not async) since
-ThreadPoolExecutor requires regular functions.
+Note: synchronous handlers run on the pool; async handlers are awaited
+directly on the event loop. Use LocalExecutor(mode="process") to run
+CPU-bound, picklable handlers on a ProcessPoolExecutor instead.
 
 Run: python examples/02_executors/02_local_executor.py
 """
@@ -16,7 +17,9 @@ from spine.execution import Dispatcher, HandlerRegistry, WorkSpec
 from spine.execution.executors import LocalExecutor
 
 
-# === Task handlers (must be synchronous for ThreadPoolExecutor) ===
+# === Task handlers ===
+# Sync handlers run on the pool; async handlers are awaited on the event loop.
+# Process mode needs module-level (picklable) handlers like these.
 
 def cpu_intensive_task(params: dict) -> dict:
     """Simulate a CPU-intensive operation."""
@@ -42,6 +45,12 @@ def data_transform(params: dict) -> dict:
     return {"original": data, "transformed": transformed}
 
 
+async def fetch_quote(params: dict) -> dict:
+    """An async handler: awaited on the event loop, not run on the pool."""
+    await asyncio.sleep(0.01)  # stands in for an HTTP call
+    return {"symbol": params.get("symbol", "AAPL"), "price": 187.5}
+
+
 def isolated_operation(params: dict) -> dict:
     """An operation that runs in thread pool."""
     import os
@@ -65,11 +74,13 @@ async def main():
     registry.register("task", "cpu_intensive_task", cpu_intensive_task)
     registry.register("task", "data_transform", data_transform)
     registry.register("task", "isolated_operation", isolated_operation)
+    registry.register("task", "fetch_quote", fetch_quote)
     
     handlers = {
         "task:cpu_intensive_task": cpu_intensive_task,
         "task:data_transform": data_transform,
         "task:isolated_operation": isolated_operation,
+        "task:fetch_quote": fetch_quote,
     }
     
     # LocalExecutor with worker configuration
@@ -138,17 +149,53 @@ async def main():
     else:
         print(f"  Status: {run.status.value}")
     
-    # === 5. Local executor characteristics ===
-    print("\n[5] LocalExecutor Characteristics")
-    print("  ✓ Non-blocking submission (uses ThreadPoolExecutor)")
+    # === 5. Async handler ===
+    print("\n[5] Async Handler")
+    
+    run_id = await dispatcher.submit_task("fetch_quote", {"symbol": "MSFT"})
+    await asyncio.sleep(0.1)
+    run = await dispatcher.get_run(run_id)
+    
+    if run.result:
+        print(f"  {run.result['symbol']}: {run.result['price']} (awaited on the event loop)")
+    else:
+        print(f"  Status: {run.status.value}")
+    
+    # === 6. Process mode for CPU-bound work ===
+    print("\n[6] Process Mode")
+    
+    process_executor = LocalExecutor(
+        handlers={
+            "task:cpu_intensive_task": cpu_intensive_task,
+            "task:isolated_operation": isolated_operation,
+        },
+        max_workers=2,
+        mode="process",
+    )
+    process_dispatcher = Dispatcher(executor=process_executor, registry=registry)
+    
+    run_id = await process_dispatcher.submit_task("isolated_operation", {"value": "test"})
+    await asyncio.sleep(1.0)  # worker processes take a moment to start
+    run = await process_dispatcher.get_run(run_id)
+    
+    if run.result:
+        print(f"  Main PID: {current_pid}, task PID: {run.result['pid']}")
+    else:
+        print(f"  Status: {run.status.value}")
+    
+    # === 7. Local executor characteristics ===
+    print("\n[7] LocalExecutor Characteristics")
+    print("  ✓ Non-blocking submission (thread or process pool)")
     print("  ✓ Configurable worker count")
+    print("  ✓ Sync and async handlers")
     print("  ✓ Good for development and small-scale production")
     print("  ✓ No external dependencies (no Celery/Redis)")
-    print("  ✗ GIL limits CPU parallelism (use ProcessPoolExecutor for CPU)")
-    print("  ✗ Handlers must be synchronous (not async)")
+    print("  ✗ Thread mode: GIL limits CPU parallelism (use mode=\"process\")")
+    print("  ✗ Process mode: handlers, params and results must be picklable")
     
     # Cleanup
     executor.pool.shutdown(wait=False)
+    process_executor.pool.shutdown(wait=True)
     
     print("\n" + "=" * 60)
     print("[OK] Local Executor Complete!")
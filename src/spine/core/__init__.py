@@ -26,7 +26,7 @@ These modules are domain-agnostic and can be composed by any domain:
 from spine.core.execution import ExecutionContext, new_batch_id, new_context
 from spine.core.hashing import compute_hash, compute_record_hash
 from spine.core.idempotency import IdempotencyHelper, IdempotencyLevel
-from spine.core.manifest import ManifestRow, WorkManifest
+from spine.core.manifest import ManifestCache, ManifestRow, WorkManifest
 from spine.core.quality import (
     QualityCategory,
     QualityCheck,
@@ -35,7 +35,7 @@ from spine.core.quality import (
     QualityStatus,
 )
 from spine.core.rejects import Reject, RejectSink
-from spine.core.rolling import RollingResult, RollingWindow
+from spine.core.rolling import RollingResult, RollingSeries, RollingWindow
 from spine.core.schema import CORE_DDL, CORE_TABLES, create_core_tables
 from spine.core.temporal import WeekEnding
 
@@ -91,6 +91,7 @@ __all__ = [
     # manifest
     "WorkManifest",
     "ManifestRow",
+    "ManifestCache",
     # idempotency
     "IdempotencyHelper",
     "IdempotencyLevel",
@@ -106,6 +107,7 @@ __all__ = [
     # rolling
     "RollingWindow",
     "RollingResult",
+    "RollingSeries",
     # errors (NEW)
     "SpineError",
     "TransientError",
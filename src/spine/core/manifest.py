@@ -114,6 +114,10 @@ BEHAVIOR:
 - advance_to() UPSERTS: creates or updates row for that stage
 - is_at_least() compares stage_rank (or configured stage ordering)
 - get() returns all stages for a partition in stage order
+- advance_many() / get_latest_stages() / filter_at_least() do the same for
+  many partitions with one executemany / one query per chunk of keys
+- An optional ManifestCache serves stage lookups from memory (read-through,
+  write-through on advance_to/advance_many)
 
 SYNC-ONLY: All methods are synchronous.
 
@@ -124,6 +128,8 @@ FUTURE-PROOFING (Option B):
 """
 
 import json
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any, Protocol
@@ -138,6 +144,13 @@ class Connection(Protocol):
     def commit(self) -> None: ...
 
 
+# Max partition keys bound into one IN (...) list (under SQLite's 999-parameter limit)
+BULK_CHUNK_SIZE = 500
+
+# Reused encoder: json.dumps builds a new one per call when given options
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+
 # Type alias for the optional event hook (future Option B)
 StageChangeHook = Callable[[str, dict, str, int, dict], None]
 # Arguments: domain, partition_key, stage, stage_rank, metrics
@@ -226,6 +239,151 @@ class ManifestRow:
         return f"ManifestRow(stage={self.stage!r}, rank={self.stage_rank})"
 
 
+class ManifestCache:
+    """
+    In-process read-through cache of recorded stages per partition.
+
+    Holds, for each (domain, partition), the full set of recorded stages
+    and their ranks, so get_latest_stage / is_at_least / is_before /
+    has_stage are answered without a query once a partition has been
+    read. advance_to and advance_many write through, so a single process
+    driving a run always sees its own progress. Each domain is a separate
+    LRU bounded by ``max_entries``.
+
+    Write-through happens when the row is written, before the caller
+    commits. If that transaction is rolled back, roll back with
+    WorkManifest.rollback() (or call invalidate) so the cache does not
+    keep reporting stages that were never committed.
+
+    The cache does not see writes made through other connections or
+    processes; call ``invalidate`` (or WorkManifest.invalidate) when
+    another writer may have advanced the same partitions.
+
+    Examples:
+        >>> cache = ManifestCache(max_entries=50_000)
+        >>> manifest = WorkManifest(conn, "otc", STAGES, cache=cache)
+        >>> manifest.preload()                      # whole domain, one query
+        >>> manifest.is_at_least(key, "INGESTED")   # no query
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        """
+        Args:
+            max_entries: Maximum cached partitions per domain
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._domains: dict[str, OrderedDict[str, dict[str, int]]] = {}
+        # Domains whose every partition is cached, so a miss means "no stages"
+        self._complete: set[str] = set()
+        # Memoized partition key serializations (json.dumps is the main
+        # per-call cost once lookups stop hitting the database)
+        self._serialized: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def serialize(self, key: dict[str, Any]) -> str:
+        """Partition key as stored JSON, memoized for hashable key values."""
+        try:
+            memo_key = tuple((name, value.__class__, value) for name, value in key.items())
+            key_json = self._serialized.get(memo_key)
+        except TypeError:  # unhashable values (lists, dicts)
+            return _KEY_ENCODER.encode(key)
+        if key_json is None:
+            key_json = _KEY_ENCODER.encode(key)
+            if len(self._serialized) >= 4 * self.max_entries:
+                self._serialized.clear()
+            self._serialized[memo_key] = key_json
+        return key_json
+
+    def get(self, domain: str, key_json: str) -> dict[str, int] | None:
+        """Recorded {stage: rank} for a partition, or None if not cached."""
+        with self._lock:
+            entries = self._domains.get(domain)
+            stages = entries.get(key_json) if entries is not None else None
+            if stages is not None:
+                entries.move_to_end(key_json)
+                self.hits += 1
+                return stages
+            if domain in self._complete:
+                self.hits += 1
+                return {}
+            self.misses += 1
+            return None
+
+    def put(self, domain: str, key_json: str, stages: dict[str, int]) -> None:
+        """Cache the complete set of recorded stages for a partition."""
+        with self._lock:
+            self._put(domain, key_json, stages)
+
+    def _put(self, domain: str, key_json: str, stages: dict[str, int]) -> None:
+        entries = self._domains.setdefault(domain, OrderedDict())
+        entries[key_json] = stages
+        entries.move_to_end(key_json)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+            self._complete.discard(domain)
+
+    def record(self, domain: str, key_json: str, stage: str, rank: int) -> None:
+        """Write-through for an upserted stage row."""
+        with self._lock:
+            entries = self._domains.get(domain)
+            stages = entries.get(key_json) if entries is not None else None
+            if stages is not None:
+                stages[stage] = rank
+                entries.move_to_end(key_json)
+            elif domain in self._complete:
+                self._put(domain, key_json, {stage: rank})
+            # Otherwise other stages may exist in the DB; leave it uncached
+
+    def load_domain(self, domain: str, rows: list[tuple[str, str, int]]) -> None:
+        """Replace a domain's entries with (partition_key, stage, rank) rows."""
+        partitions: dict[str, dict[str, int]] = {}
+        for key_json, stage, rank in rows:
+            partitions.setdefault(key_json, {})[stage] = rank
+        with self._lock:
+            self._domains[domain] = OrderedDict()
+            self._complete.add(domain)
+            for key_json, stages in partitions.items():
+                self._put(domain, key_json, stages)
+
+    def invalidate(self, domain: str | None = None, key_json: str | None = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            domain: Domain to drop (None = every domain)
+            key_json: Single serialized partition key within ``domain``
+        """
+        with self._lock:
+            if domain is None:
+                self._domains.clear()
+                self._complete.clear()
+            elif key_json is None:
+                self._domains.pop(domain, None)
+                self._complete.discard(domain)
+            else:
+                entries = self._domains.get(domain)
+                if entries is not None:
+                    entries.pop(key_json, None)
+                self._complete.discard(domain)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._domains.values())
+
+
+def _latest(stages: dict[str, int]) -> str | None:
+    """Highest-ranked stage name in a {stage: rank} mapping."""
+    return max(stages, key=stages.__getitem__) if stages else None
+
+
 class WorkManifest:
     """
     Track processing stages for work items in multi-stage workflows.
@@ -315,10 +473,21 @@ class WorkManifest:
         >>> for row in stages:
         ...     print(f"{row.stage}: {row.row_count} rows")
     
+        Bulk scheduling over many partitions:
+
+        >>> keys = [{"week_ending": w, "tier": "NMS_TIER_1"} for w in weeks]
+        >>> todo = [k for k in keys if k not in manifest.filter_at_least(keys, "NORMALIZED")]
+        >>> manifest.advance_many(todo, "PENDING")
+
     Performance:
         - advance_to(): Single UPSERT, O(1)
         - is_at_least(): Single SELECT, O(1)
         - get(): Index scan, O(number of stages)
+        - advance_many(): One executemany for all keys
+        - get_latest_stages() / filter_at_least(): One SELECT per
+          BULK_CHUNK_SIZE keys
+        - With a ManifestCache: stage checks on cached partitions run no
+          queries; preload() fills a whole domain with one SELECT
     
     Guardrails:
         - SYNC-ONLY: All methods are synchronous
@@ -343,6 +512,7 @@ class WorkManifest:
         domain: str,
         stages: list[str],
         on_stage_change: StageChangeHook | None = None,
+        cache: ManifestCache | None = None,
     ):
         """
         Initialize WorkManifest.
@@ -352,6 +522,8 @@ class WorkManifest:
             domain: Domain name (e.g., "otc")
             stages: Ordered list of stage names
             on_stage_change: Optional hook for event emission (future Option B)
+            cache: Optional ManifestCache for stage lookups (may be shared
+                by manifests of several domains)
         """
         self.conn = conn
         self.domain = domain
@@ -361,10 +533,15 @@ class WorkManifest:
 
         # Future-proofing: optional hook for event emission
         self.on_stage_change = on_stage_change
+        self.cache = cache
+        # Keys written through the cache since the last commit()/rollback()
+        self._uncommitted: set[str] = set()
 
     def _key_json(self, key: dict[str, Any]) -> str:
         """Serialize key dict to JSON for storage."""
-        return json.dumps(key, sort_keys=True, default=str)
+        if self.cache is not None:
+            return self.cache.serialize(key)
+        return _KEY_ENCODER.encode(key)
 
     def _get_rank(self, stage: str) -> int:
         """Get rank for a stage (0-based index in stages list)."""
@@ -395,15 +572,42 @@ class WorkManifest:
             execution_id: Optional execution ID for lineage
             batch_id: Optional batch ID for lineage
             **metrics: Additional metrics stored in metrics_json
+
+        Committing is left to the caller. With a cache, the stage is
+        visible to cached lookups immediately; use commit()/rollback() so
+        a rolled-back write is dropped from the cache too.
         """
         key_json = self._key_json(key)
         stage_rank = self._get_rank(stage)
         updated_at = datetime.utcnow().isoformat()
         metrics_json = json.dumps(metrics) if metrics else None
 
-        # SQLite UPSERT syntax (INSERT OR REPLACE respects UNIQUE constraint)
         self.conn.execute(
-            f"""
+            self._upsert_sql(),
+            (
+                self.domain,
+                key_json,
+                stage,
+                stage_rank,
+                row_count,
+                metrics_json,
+                execution_id,
+                batch_id,
+                updated_at,
+            ),
+        )
+
+        if self.cache is not None:
+            self.cache.record(self.domain, key_json, stage, stage_rank)
+            self._uncommitted.add(key_json)
+
+        # Future-proofing: call event hook if provided
+        if self.on_stage_change:
+            self.on_stage_change(self.domain, key, stage, stage_rank, metrics)
+
+    def _upsert_sql(self) -> str:
+        # SQLite UPSERT syntax (INSERT OR REPLACE respects UNIQUE constraint)
+        return f"""
             INSERT INTO {self.table} 
                 (domain, partition_key, stage, stage_rank, row_count, 
                  metrics_json, execution_id, batch_id, updated_at)
@@ -415,10 +619,45 @@ class WorkManifest:
                 execution_id = excluded.execution_id,
                 batch_id = excluded.batch_id,
                 updated_at = excluded.updated_at
-            """,
+            """
+
+    def advance_many(
+        self,
+        keys: list[dict[str, Any]],
+        stage: str,
+        *,
+        row_count: int | None = None,
+        execution_id: str | None = None,
+        batch_id: str | None = None,
+        **metrics,
+    ) -> None:
+        """
+        Upsert the same stage record for many partitions.
+
+        Equivalent to calling advance_to() for each key, but sends a
+        single executemany, so all rows are written in the caller's
+        current transaction in one round-trip. As with advance_to(),
+        committing is left to the caller, and cached stages should be
+        dropped with rollback() if the transaction is abandoned.
+
+        Args:
+            keys: Partition key dicts
+            stage: Stage name (must be in configured stages list)
+            row_count: Optional row count metric (applied to every key)
+            execution_id: Optional execution ID for lineage
+            batch_id: Optional batch ID for lineage
+            **metrics: Additional metrics stored in metrics_json
+        """
+        stage_rank = self._get_rank(stage)
+        if not keys:
+            return
+        updated_at = datetime.utcnow().isoformat()
+        metrics_json = json.dumps(metrics) if metrics else None
+
+        params = [
             (
                 self.domain,
-                key_json,
+                self._key_json(key),
                 stage,
                 stage_rank,
                 row_count,
@@ -426,12 +665,175 @@ class WorkManifest:
                 execution_id,
                 batch_id,
                 updated_at,
-            ),
-        )
+            )
+            for key in keys
+        ]
+        executemany = getattr(self.conn, "executemany", None)
+        if executemany is not None:
+            executemany(self._upsert_sql(), params)
+        else:
+            sql = self._upsert_sql()
+            for row in params:
+                self.conn.execute(sql, row)
+
+        if self.cache is not None:
+            for row in params:
+                self.cache.record(self.domain, row[1], stage, stage_rank)
+                self._uncommitted.add(row[1])
 
-        # Future-proofing: call event hook if provided
         if self.on_stage_change:
-            self.on_stage_change(self.domain, key, stage, stage_rank, metrics)
+            for key in keys:
+                self.on_stage_change(self.domain, key, stage, stage_rank, metrics)
+
+    def _chunked_query(self, key_jsons: list[str], select: str, extra: tuple = ()):
+        """Run ``select`` once per chunk of serialized keys; yields result rows."""
+        unique = list(dict.fromkeys(key_jsons))
+        for i in range(0, len(unique), BULK_CHUNK_SIZE):
+            chunk = unique[i:i + BULK_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            sql = select.format(table=self.table, keys=placeholders)
+            yield from self.conn.execute(sql, (self.domain, *extra, *chunk)).fetchall()
+
+    def _stage_sets(self, key_jsons: list[str]) -> dict[str, dict[str, int]]:
+        """Recorded {stage: rank} per serialized key, via the cache when set."""
+        found: dict[str, dict[str, int]] = {}
+        missing = key_jsons
+        if self.cache is not None:
+            missing = []
+            for key_json in key_jsons:
+                stages = self.cache.get(self.domain, key_json)
+                if stages is None:
+                    missing.append(key_json)
+                else:
+                    found[key_json] = stages
+        found.update(self._load_stage_sets(missing))
+        return found
+
+    def _load_stage_sets(self, key_jsons: list[str]) -> dict[str, dict[str, int]]:
+        """Query recorded {stage: rank} for serialized keys, filling the cache."""
+        loaded: dict[str, dict[str, int]] = {key_json: {} for key_json in key_jsons}
+        for key_json, stage, rank in self._chunked_query(
+            key_jsons,
+            """
+            SELECT partition_key, stage, stage_rank FROM {table}
+            WHERE domain = ? AND partition_key IN ({keys})
+            """,
+        ):
+            loaded[key_json][stage] = rank
+
+        if self.cache is not None:
+            for key_json, stages in loaded.items():
+                self.cache.put(self.domain, key_json, stages)
+        return loaded
+
+    def get_latest_stages(self, keys: list[dict[str, Any]]) -> list[str | None]:
+        """
+        Get the highest-ranked recorded stage for many partitions.
+
+        Args:
+            keys: Partition key dicts
+
+        Returns:
+            Stage name (or None) for each key, in the order given
+        """
+        key_jsons = [self._key_json(key) for key in keys]
+        stage_sets = self._stage_sets(key_jsons)
+        return [_latest(stage_sets[key_json]) for key_json in key_jsons]
+
+    def filter_at_least(self, keys: list[dict[str, Any]], min_stage: str) -> list[dict[str, Any]]:
+        """
+        Select the partitions that have reached at least the given stage.
+
+        Bulk equivalent of ``[k for k in keys if is_at_least(k, min_stage)]``,
+        comparing the stored stage_rank in SQL.
+
+        Args:
+            keys: Partition key dicts
+            min_stage: Minimum stage to check for
+
+        Returns:
+            Keys at or past min_stage, in the order given
+        """
+        min_rank = self._get_rank(min_stage)
+        key_jsons = [self._key_json(key) for key in keys]
+        if self.cache is not None:
+            stage_sets = self._stage_sets(key_jsons)
+            return [
+                key for key, key_json in zip(keys, key_jsons)
+                if any(rank >= min_rank for rank in stage_sets[key_json].values())
+            ]
+        reached = {
+            row[0]
+            for row in self._chunked_query(
+                key_jsons,
+                """
+                SELECT DISTINCT partition_key FROM {table}
+                WHERE domain = ? AND stage_rank >= ? AND partition_key IN ({keys})
+                """,
+                (min_rank,),
+            )
+        }
+        return [key for key, key_json in zip(keys, key_jsons) if key_json in reached]
+
+    def preload(self) -> int:
+        """
+        Warm the cache with every partition of this domain in one query.
+
+        Afterwards, lookups of partitions with no recorded stages are also
+        answered from memory (until the domain overflows max_entries).
+
+        Returns:
+            Number of partitions loaded
+
+        Raises:
+            ValueError: If the manifest has no cache
+        """
+        if self.cache is None:
+            raise ValueError("preload() requires a WorkManifest created with cache=")
+        rows = self.conn.execute(
+            f"SELECT partition_key, stage, stage_rank FROM {self.table} WHERE domain = ?",
+            (self.domain,),
+        ).fetchall()
+        self.cache.load_domain(self.domain, rows)
+        return len({row[0] for row in rows})
+
+    def invalidate(self, key: dict[str, Any] | None = None) -> None:
+        """
+        Drop cached stages for one partition, or for this whole domain.
+
+        A no-op without a cache.
+        """
+        if self.cache is not None:
+            key_json = self._key_json(key) if key is not None else None
+            self.cache.invalidate(self.domain, key_json)
+
+    def commit(self) -> None:
+        """Commit the connection; cached stages written so far are now durable."""
+        self.conn.commit()
+        self._uncommitted.clear()
+
+    def rollback(self) -> None:
+        """
+        Roll back the connection and drop partitions written since the
+        last commit() from the cache.
+
+        Requires a connection with rollback() (sqlite3, psycopg).
+        """
+        self.conn.rollback()
+        if self.cache is not None:
+            for key_json in self._uncommitted:
+                self.cache.invalidate(self.domain, key_json)
+        self._uncommitted.clear()
+
+    def _cached_stages(self, key: dict[str, Any]) -> dict[str, int] | None:
+        """Recorded {stage: rank} through the cache, or None without one."""
+        if self.cache is None:
+            return None
+        key_json = self.cache.serialize(key)
+        stages = self.cache.get(self.domain, key_json)
+        if stages is None:
+            stages = self._load_stage_sets([key_json])[key_json]
+        return stages
 
     def get(self, key: dict[str, Any]) -> list[ManifestRow]:
         """
@@ -476,6 +878,10 @@ class WorkManifest:
         Returns:
             Stage name, or None if no stages recorded
         """
+        stages = self._cached_stages(key)
+        if stages is not None:
+            return _latest(stages)
+
         key_json = self._key_json(key)
 
         row = self.conn.execute(
@@ -541,6 +947,10 @@ class WorkManifest:
         Returns:
             True if stage exists, False otherwise
         """
+        stages = self._cached_stages(key)
+        if stages is not None:
+            return stage in stages
+
         key_json = self._key_json(key)
 
         row = self.conn.execute(
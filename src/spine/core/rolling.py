@@ -51,7 +51,9 @@ Architecture:
 Features:
     - **RollingWindow:** Generic rolling window computation
     - **RollingResult:** Structured result with completeness tracking
+    - **RollingSeries:** Columnar rolling statistics for a whole date range
     - **compute_trend():** Trend direction from first/last N values
+    - **table_fetch_many():** One-query bulk fetcher for a table of values
     - **Works with any temporal type:** WeekEnding, date, etc.
 
 Examples:
@@ -77,12 +79,24 @@ Doc-Types:
     - Time-Series Patterns
 """
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+import math
+import re
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Generic, Protocol, TypeVar
 
 T = TypeVar("T")  # Time bucket type (WeekEnding, date, etc.)
 V = TypeVar("V")  # Value type
+K = TypeVar("K")  # Series key type (symbol, etc.)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+
+class Connection(Protocol):
+    """Minimal SYNC DB connection interface."""
+
+    def execute(self, sql: str, params: tuple = ()) -> Any: ...
 
 
 @dataclass
@@ -175,6 +189,135 @@ class RollingResult:
     is_complete: bool
 
 
+@dataclass
+class RollingSeries(Generic[T]):
+    """
+    Columnar batch of rolling statistics, one row per as_of period.
+
+    Produced by ``RollingWindow.compute_series``. Each column is a list
+    aligned with ``periods``; statistics are None where the window had
+    no data (``std`` also needs at least two values, as it is the sample
+    standard deviation).
+
+    Examples:
+        >>> series = window.compute_series(start, end, fetch_fn=get_volume)
+        >>> series.mean[-1], series.periods_present[-1]
+        (1234.5, 52)
+        >>> series.result_at(-1).aggregates["max"]
+        5678
+
+    Attributes:
+        periods: as_of period of each row, oldest first
+        periods_total: Window size
+        periods_present: Periods with data in each window
+        sum, mean, min, max, std: Rolling statistics per row
+    """
+
+    periods: list[T]
+    periods_total: int
+    periods_present: list[int] = field(default_factory=list)
+    sum: list[float | None] = field(default_factory=list)
+    mean: list[float | None] = field(default_factory=list)
+    min: list[float | None] = field(default_factory=list)
+    max: list[float | None] = field(default_factory=list)
+    std: list[float | None] = field(default_factory=list)
+
+    STAT_COLUMNS = ("sum", "mean", "min", "max", "std")
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    @property
+    def is_complete(self) -> list[bool]:
+        """Whether each window had data for every period."""
+        return [n == self.periods_total for n in self.periods_present]
+
+    def columns(self) -> dict[str, list]:
+        """All columns by name, e.g. for building a DataFrame or bulk insert."""
+        return {
+            "period": self.periods,
+            "periods_present": self.periods_present,
+            "is_complete": self.is_complete,
+            **{name: getattr(self, name) for name in self.STAT_COLUMNS},
+        }
+
+    def result_at(self, index: int) -> RollingResult:
+        """Row ``index`` as a RollingResult (aggregates empty if no data)."""
+        present = self.periods_present[index]
+        aggregates = (
+            {name: getattr(self, name)[index] for name in self.STAT_COLUMNS}
+            if present else {}
+        )
+        return RollingResult(
+            aggregates=aggregates,
+            periods_present=present,
+            periods_total=self.periods_total,
+            is_complete=present == self.periods_total,
+        )
+
+    def to_results(self) -> list[RollingResult]:
+        """All rows as RollingResults, matching ``compute`` per as_of."""
+        return [self.result_at(i) for i in range(len(self))]
+
+
+class _SlidingStats:
+    """Running sum/count, Welford mean/variance and deque min/max for one window."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        # (slot, value) with values increasing (min) / decreasing (max)
+        self.min_q: deque[tuple[int, Any]] = deque()
+        self.max_q: deque[tuple[int, Any]] = deque()
+
+    def add(self, slot: int, value: Any) -> None:
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        while self.min_q and self.min_q[-1][1] >= value:
+            self.min_q.pop()
+        self.min_q.append((slot, value))
+        while self.max_q and self.max_q[-1][1] <= value:
+            self.max_q.pop()
+        self.max_q.append((slot, value))
+
+    def remove(self, slot: int, value: Any) -> None:
+        self.count -= 1
+        self.total -= value
+        if self.min_q and self.min_q[0][0] == slot:
+            self.min_q.popleft()
+        if self.max_q and self.max_q[0][0] == slot:
+            self.max_q.popleft()
+
+        if self.count <= 1:
+            # Reset exactly so rounding error can't accumulate across gaps
+            self.mean = float(self.min_q[0][1]) if self.count else 0.0
+            self.m2 = 0.0
+        else:
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+
+def _fetch_values(
+    periods: list[T],
+    fetch_fn: Callable[[T], V | None] | None,
+    fetch_many: Callable[[list[T]], Mapping[T, V | None]] | None,
+) -> list[V | None]:
+    """Values for periods in order, via one fetch_many call when available."""
+    if fetch_many is not None:
+        found = fetch_many(periods)
+        return [found.get(p) for p in periods]
+    if fetch_fn is None:
+        raise ValueError("Either fetch_fn or fetch_many is required")
+    return [fetch_fn(p) for p in periods]
+
+
 class RollingWindow(Generic[T]):
     """
     Generic rolling window over time buckets for time-series calculations.
@@ -277,9 +420,31 @@ class RollingWindow(Generic[T]):
         ...     step_back=lambda d: d - relativedelta(months=1)
         ... )
     
+        Rolling series over a date range (each week fetched once):
+
+        >>> window = RollingWindow(size=52, step_back=lambda w: w.previous())
+        >>> series = window.compute_series(
+        ...     start=WeekEnding("2016-01-01"),
+        ...     end=WeekEnding("2025-12-26"),
+        ...     fetch_fn=lambda w: get_volume(w, "AAPL"),
+        ... )
+        >>> series.mean[-1]
+        1234567.0
+
+        One query per window instead of one per week:
+
+        >>> fetch_many = table_fetch_many(
+        ...     conn, "otc_weekly_volume", "total_volume",
+        ...     filters={"symbol": "AAPL", "tier": "NMS_TIER_1"},
+        ... )
+        >>> result = window.compute(as_of, None, aggregate_fn, fetch_many=fetch_many)
+
     Performance:
         - **get_window():** O(size), builds list of periods
-        - **compute():** O(size) fetches + O(present) aggregation
+        - **compute():** O(size) fetches (one call with fetch_many)
+          + O(present) aggregation
+        - **compute_series():** O(periods + size) fetches and O(1)
+          amortized work per period, vs O(periods * size) calling compute()
         - **Memory:** O(size) for period list
     
     Guardrails:
@@ -288,6 +453,9 @@ class RollingWindow(Generic[T]):
         
         ❌ DON'T: Throw exceptions in fetch_fn for missing data
         ✅ DO: Return None for missing periods
+
+        ❌ DON'T: Issue one SQL query per period from fetch_fn
+        ✅ DO: Pass fetch_many (see table_fetch_many / fetch_periods_for_keys)
         
         ❌ DON'T: Assume aggregates exist if window is empty
         ✅ DO: Check periods_present > 0 before accessing aggregates
@@ -330,8 +498,9 @@ class RollingWindow(Generic[T]):
     def compute(
         self,
         as_of: T,
-        fetch_fn: Callable[[T], V | None],
+        fetch_fn: Callable[[T], V | None] | None,
         aggregate_fn: Callable[[list[tuple[T, V]]], dict[str, Any]],
+        fetch_many: Callable[[list[T]], Mapping[T, V | None]] | None = None,
     ) -> RollingResult:
         """
         Compute rolling aggregate.
@@ -340,12 +509,15 @@ class RollingWindow(Generic[T]):
             as_of: Current period (end of window)
             fetch_fn: Get value for period (returns None if no data)
             aggregate_fn: Combine (period, value) pairs into result dict
+            fetch_many: Optional bulk fetcher for all window periods at once
+                (e.g. from ``table_fetch_many``); used instead of fetch_fn
+                when supplied. Periods missing from its result have no data.
 
         Returns:
             RollingResult with aggregates and completeness info
         """
         periods = self.get_window(as_of)
-        values = [(p, fetch_fn(p)) for p in periods]
+        values = list(zip(periods, _fetch_values(periods, fetch_fn, fetch_many)))
         present = [(p, v) for p, v in values if v is not None]
 
         aggregates = aggregate_fn(present) if present else {}
@@ -357,6 +529,78 @@ class RollingWindow(Generic[T]):
             is_complete=len(present) == self.size,
         )
 
+    def compute_series(
+        self,
+        start: T,
+        end: T,
+        fetch_fn: Callable[[T], V | None] | None = None,
+        fetch_many: Callable[[list[T]], Mapping[T, V | None]] | None = None,
+    ) -> RollingSeries[T]:
+        """
+        Compute rolling statistics for every as_of from start to end.
+
+        Each period (including the ``size - 1`` look-back periods before
+        ``start``) is fetched exactly once. The window then slides one
+        period at a time, updating a running sum and count, Welford's
+        mean/variance and monotonic-deque min/max, instead of
+        re-aggregating the whole window per as_of.
+
+        Args:
+            start: First as_of period (inclusive)
+            end: Last as_of period (inclusive)
+            fetch_fn: Get numeric value for period (returns None if no data)
+            fetch_many: Optional bulk fetcher for the whole timeline in one
+                call; used instead of fetch_fn when supplied
+
+        Returns:
+            RollingSeries with one row per as_of, oldest first
+
+        Raises:
+            ValueError: If end is before start, or no fetcher is given
+        """
+        if end < start:
+            raise ValueError(f"end ({end}) is before start ({start})")
+
+        as_ofs = []
+        current = end
+        while not current < start:
+            as_ofs.append(current)
+            current = self.step_back(current)
+        lookback = []
+        for _ in range(self.size - 1):
+            lookback.append(current)
+            current = self.step_back(current)
+
+        timeline = lookback[::-1] + as_ofs[::-1]
+        values = _fetch_values(timeline, fetch_fn, fetch_many)
+
+        series: RollingSeries[T] = RollingSeries(
+            periods=timeline[len(lookback):], periods_total=self.size
+        )
+        stats = _SlidingStats()
+        for slot, value in enumerate(values):
+            if value is not None:
+                stats.add(slot, value)
+            expired = slot - self.size
+            if expired >= 0 and values[expired] is not None:
+                stats.remove(expired, values[expired])
+            if slot < len(lookback):
+                continue
+
+            count = stats.count
+            series.periods_present.append(count)
+            if count == 0:
+                for column in RollingSeries.STAT_COLUMNS:
+                    getattr(series, column).append(None)
+                continue
+            series.sum.append(stats.total)
+            series.mean.append(stats.total / count)
+            series.min.append(stats.min_q[0][1])
+            series.max.append(stats.max_q[0][1])
+            series.std.append(math.sqrt(stats.m2 / (count - 1)) if count > 1 else None)
+
+        return series
+
 
 def compute_trend(
     first_values: list, last_values: list, threshold_pct: float = 5.0
@@ -466,3 +710,170 @@ def compute_trend(
     elif pct < -threshold_pct:
         return "DOWN", round(pct, 2)
     return "FLAT", round(pct, 2)
+
+
+def _check_identifier(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def build_period_query(
+    table: str,
+    value_column: str,
+    periods: list,
+    period_column: str = "week_ending",
+    filters: Mapping[str, Any] | None = None,
+    key_column: str | None = None,
+    keys: Iterable | None = None,
+    use_range: bool = False,
+) -> tuple[str, tuple]:
+    """
+    Build one query selecting values for many periods (and optionally many keys).
+
+    Periods are bound as ``str(period)`` (ISO dates for WeekEnding/date).
+    With ``use_range`` the query uses ``BETWEEN min AND max`` instead of
+    ``IN (...)``, which is cheaper for long contiguous windows but may
+    return extra rows the caller must ignore.
+
+    Args:
+        table: Table name (trusted identifier, validated)
+        value_column: Column holding the value
+        periods: Periods to fetch (must be non-empty)
+        period_column: Column holding the period
+        filters: Extra ``column = value`` conditions (e.g. symbol, tier)
+        key_column: Column to group results by when fetching many keys
+        keys: Values of key_column to fetch (required with key_column)
+        use_range: Use a BETWEEN range instead of an IN list for periods
+
+    Returns:
+        (sql, params) selecting ``period[, key], value`` rows
+
+    Raises:
+        ValueError: If periods is empty or an identifier is invalid
+    """
+    if not periods:
+        raise ValueError("periods must not be empty")
+
+    columns = [_check_identifier(period_column)]
+    conditions = []
+    params: list[Any] = []
+
+    for column, value in (filters or {}).items():
+        conditions.append(f"{_check_identifier(column)} = ?")
+        params.append(value)
+
+    if key_column is not None:
+        key_list = list(keys or [])
+        if not key_list:
+            raise ValueError("keys must not be empty when key_column is given")
+        columns.append(_check_identifier(key_column))
+        conditions.append(f"{key_column} IN ({', '.join('?' * len(key_list))})")
+        params.extend(key_list)
+
+    bound = [str(p) for p in periods]
+    if use_range:
+        conditions.append(f"{period_column} BETWEEN ? AND ?")
+        params.extend([min(bound), max(bound)])
+    else:
+        conditions.append(f"{period_column} IN ({', '.join('?' * len(bound))})")
+        params.extend(bound)
+
+    columns.append(_check_identifier(value_column))
+    sql = (
+        f"SELECT {', '.join(columns)} FROM {_check_identifier(table)} "
+        f"WHERE {' AND '.join(conditions)}"
+    )
+    return sql, tuple(params)
+
+
+def table_fetch_many(
+    conn: Connection,
+    table: str,
+    value_column: str,
+    period_column: str = "week_ending",
+    filters: Mapping[str, Any] | None = None,
+    use_range: bool = False,
+) -> Callable[[list[T]], dict[T, Any]]:
+    """
+    Create a ``fetch_many`` for RollingWindow that reads one series from a table.
+
+    Each call runs a single query (see ``build_period_query``) and maps
+    the returned rows back to the requested period objects.
+
+    Args:
+        conn: Database connection
+        table: Table name
+        value_column: Column holding the value
+        period_column: Column holding the period (compared as ``str(period)``)
+        filters: ``column = value`` conditions selecting the series
+        use_range: Query a BETWEEN range instead of an IN list
+
+    Returns:
+        Callable mapping a list of periods to ``{period: value}``
+    """
+    def fetch_many(periods: list[T]) -> dict[T, Any]:
+        if not periods:
+            return {}
+        by_str = {str(p): p for p in periods}
+        sql, params = build_period_query(
+            table, value_column, periods, period_column, filters, use_range=use_range
+        )
+        found = {}
+        for period, value in conn.execute(sql, params).fetchall():
+            requested = by_str.get(str(period))
+            if requested is not None:
+                found[requested] = value
+        return found
+
+    return fetch_many
+
+
+def fetch_periods_for_keys(
+    conn: Connection,
+    table: str,
+    value_column: str,
+    key_column: str,
+    keys: Iterable[K],
+    periods: list[T],
+    period_column: str = "week_ending",
+    filters: Mapping[str, Any] | None = None,
+    use_range: bool = False,
+) -> dict[K, dict[T, Any]]:
+    """
+    Fetch values for many keys (e.g. symbols) and periods in one query.
+
+    Pass ``lambda ps, s=symbol: batch.get(s, {})`` as ``fetch_many`` for
+    each key to compute rolling windows for a whole batch with one
+    round-trip. Bind the key as a default as shown: a lambda built in a
+    loop otherwise sees only the loop's last key. Keep batches within the
+    database's bound-parameter limit.
+
+    Args:
+        conn: Database connection
+        table: Table name
+        value_column: Column holding the value
+        key_column: Column identifying the series (e.g. "symbol")
+        keys: Keys to fetch
+        periods: Periods to fetch (e.g. the union of all windows)
+        period_column: Column holding the period
+        filters: Extra ``column = value`` conditions
+        use_range: Query a BETWEEN range instead of an IN list
+
+    Returns:
+        ``{key: {period: value}}`` for rows that exist
+    """
+    keys = list(keys)
+    if not keys or not periods:
+        return {}
+    by_str = {str(p): p for p in periods}
+    sql, params = build_period_query(
+        table, value_column, periods, period_column, filters,
+        key_column=key_column, keys=keys, use_range=use_range,
+    )
+    found: dict[K, dict[T, Any]] = {}
+    for period, key, value in conn.execute(sql, params).fetchall():
+        requested = by_str.get(str(period))
+        if requested is not None:
+            found.setdefault(key, {})[requested] = value
+    return found
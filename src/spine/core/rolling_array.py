@@ -0,0 +1,260 @@
+"""
+Vectorized rolling window aggregates over NumPy arrays.
+
+RollingWindow works one symbol at a time on Python lists. For bulk
+analytics (every symbol, every week) this module computes the same
+rolling statistics for a whole symbols x periods matrix at once, using
+cumulative sums for sum/mean/std/trend and blocked prefix/suffix scans
+for min/max.
+
+Requires NumPy (optional dependency): pip install numpy
+
+Examples:
+    52-week statistics for 10k symbols over 10 years of weeks:
+
+    >>> import numpy as np
+    >>> from spine.core.rolling_array import rolling_aggregates
+    >>> volumes = np.array(...)              # shape (10_000, 520)
+    >>> missing = np.isnan(volumes)          # or a separate mask
+    >>> stats = rolling_aggregates(volumes, size=52, mask=missing)
+    >>> stats.mean[symbol_idx, -1], stats.completeness[symbol_idx, -1]
+    (1234567.0, 0.96)
+    >>> stats.result_at(symbol_idx, -1)      # RollingResult
+    RollingResult(aggregates={...}, periods_present=50, periods_total=52, ...)
+
+Semantics:
+    Column ``t`` is the window ending at period ``t`` (inclusive), the
+    same as ``RollingWindow.compute(as_of=period[t])`` with periods
+    before the first column treated as missing. Statistics are NaN where
+    the window has no data; ``std`` is the sample standard deviation and
+    needs two values. Trend follows ``compute_trend`` on the present
+    values among the first and last ``trend_periods`` periods of each
+    window.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from spine.core.rolling import RollingResult
+
+# NumPy is an optional dependency
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+
+STAT_NAMES = ("sum", "mean", "min", "max", "std")
+
+
+@dataclass
+class RollingArrays:
+    """
+    Rolling statistics for every symbol and period, as symbols x periods arrays.
+
+    Attributes:
+        sum, mean, min, max, std: Float arrays, NaN where undefined
+        periods_present: Int array of present periods per window
+        periods_total: Window size
+        trend_direction: "UP" / "DOWN" / "FLAT" per window
+        trend_pct: Trend percentage per window (rounded to 2 places)
+    """
+
+    sum: Any
+    mean: Any
+    min: Any
+    max: Any
+    std: Any
+    periods_present: Any
+    periods_total: int
+    trend_direction: Any
+    trend_pct: Any
+
+    @property
+    def completeness(self) -> Any:
+        """Fraction of the window with data (0.0 - 1.0)."""
+        return self.periods_present / self.periods_total
+
+    @property
+    def is_complete(self) -> Any:
+        """Boolean array, True where every period in the window had data."""
+        return self.periods_present == self.periods_total
+
+    def result_at(self, symbol: int, period: int) -> RollingResult:
+        """
+        One window as a RollingResult.
+
+        Aggregates hold plain Python floats (None for NaN) plus
+        ``trend_direction`` / ``trend_pct``; empty windows have ``{}``.
+        """
+        present = int(self.periods_present[symbol, period])
+        aggregates: dict[str, Any] = {}
+        if present:
+            for name in STAT_NAMES:
+                value = float(getattr(self, name)[symbol, period])
+                aggregates[name] = None if value != value else value
+            aggregates["trend_direction"] = str(self.trend_direction[symbol, period])
+            aggregates["trend_pct"] = float(self.trend_pct[symbol, period])
+        return RollingResult(
+            aggregates=aggregates,
+            periods_present=present,
+            periods_total=self.periods_total,
+            is_complete=present == self.periods_total,
+        )
+
+    def to_results(self, symbol: int) -> list[RollingResult]:
+        """All windows for one symbol as RollingResults, oldest first."""
+        return [self.result_at(symbol, t) for t in range(self.periods_present.shape[1])]
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "NumPy is required for vectorized rolling aggregates. Install with: pip install numpy"
+        )
+
+
+def _window_sums(cumulative: Any, size: int) -> Any:
+    """Sum over each trailing window from a zero-prefixed cumulative sum."""
+    periods = cumulative.shape[1] - 1
+    ends = np.arange(1, periods + 1)
+    starts = np.maximum(ends - size, 0)
+    return cumulative[:, ends] - cumulative[:, starts]
+
+
+def _segment_means(cumulative: Any, counts: Any, first: Any, last: Any) -> tuple[Any, Any]:
+    """Sum/count of present values over slot ranges [first, last) per column."""
+    first = np.clip(first, 0, None)
+    last = np.clip(last, 0, None)
+    return (
+        cumulative[:, last] - cumulative[:, first],
+        counts[:, last] - counts[:, first],
+    )
+
+
+def _sliding_extreme(values: Any, size: int, fill: float, ufunc: Any) -> Any:
+    """
+    Trailing-window min/max in O(periods) regardless of size (van Herk/Gil-Werman).
+
+    The left-padded rows are cut into blocks of ``size``; every window
+    spans at most two blocks, so its extreme is the suffix scan of one
+    block combined with the prefix scan of the next.
+    """
+    n_symbols, n_periods = values.shape
+    n_blocks = -(-(n_periods + size - 1) // size)
+    padded = np.full((n_symbols, n_blocks * size), fill)
+    padded[:, size - 1:size - 1 + n_periods] = values
+    blocks = padded.reshape(n_symbols, n_blocks, size)
+    prefix = ufunc.accumulate(blocks, axis=2).reshape(n_symbols, -1)
+    suffix = ufunc.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(n_symbols, -1)
+    return ufunc(suffix[:, :n_periods], prefix[:, size - 1:size - 1 + n_periods])
+
+
+def rolling_aggregates(
+    values: Any,
+    size: int,
+    mask: Any = None,
+    trend_periods: int = 2,
+    threshold_pct: float = 5.0,
+) -> RollingArrays:
+    """
+    Compute rolling sum, mean, std, min, max, trend and completeness.
+
+    Args:
+        values: 2-D array-like, symbols x periods (oldest period first)
+        size: Number of periods in window
+        mask: Boolean array, True where a value is missing. Defaults to
+            NaNs in ``values``
+        trend_periods: Periods at each end of the window compared for trend
+        threshold_pct: Percentage threshold for UP/DOWN (as compute_trend)
+
+    Returns:
+        RollingArrays with one column per window end
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If shapes don't match or size/trend_periods are invalid
+    """
+    _require_numpy()
+
+    data = np.asarray(values, dtype=np.float64)
+    if data.ndim != 2:
+        raise ValueError(f"values must be 2-D (symbols x periods), got {data.ndim}-D")
+    if size < 1:
+        raise ValueError(f"size must be >= 1, got {size}")
+    if not 1 <= trend_periods <= size:
+        raise ValueError(f"trend_periods must be between 1 and size, got {trend_periods}")
+
+    missing = np.isnan(data)
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != data.shape:
+            raise ValueError(f"mask shape {mask.shape} does not match values {data.shape}")
+        missing |= mask
+    present = ~missing
+    n_symbols, n_periods = data.shape
+
+    def cumulative(arr: Any) -> Any:
+        out = np.zeros((n_symbols, n_periods + 1), dtype=arr.dtype)
+        np.cumsum(arr, axis=1, out=out[:, 1:])
+        return out
+
+    counts_cum = cumulative(present.astype(np.int64))
+    count = _window_sums(counts_cum, size)
+
+    # Shift by each symbol's mean before squaring to keep the variance
+    # computation from cancelling catastrophically on large values
+    zeroed = np.where(present, data, 0.0)
+    per_symbol = present.sum(axis=1)
+    shift = np.divide(
+        zeroed.sum(axis=1), per_symbol,
+        out=np.zeros(n_symbols), where=per_symbol > 0,
+    )[:, None]
+    centered = np.where(present, data - shift, 0.0)
+
+    values_cum = cumulative(zeroed)
+    total = _window_sums(values_cum, size)
+    centered_sum = _window_sums(cumulative(centered), size)
+    centered_sq = _window_sums(cumulative(centered * centered), size)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        has_data = count > 0
+        mean = np.where(has_data, total / count, np.nan)
+        var = (centered_sq - centered_sum * centered_sum / count) / (count - 1)
+        std = np.where(count > 1, np.sqrt(np.clip(var, 0.0, None)), np.nan)
+
+        minimum = _sliding_extreme(np.where(present, data, np.inf), size, np.inf, np.minimum)
+        maximum = _sliding_extreme(np.where(present, data, -np.inf), size, -np.inf, np.maximum)
+        minimum = np.where(has_data, minimum, np.nan)
+        maximum = np.where(has_data, maximum, np.nan)
+
+        # Trend: first/last trend_periods slots of each window, by slot position
+        ends = np.arange(1, n_periods + 1)
+        first_sum, first_n = _segment_means(
+            values_cum, counts_cum, ends - size, ends - size + trend_periods
+        )
+        last_sum, last_n = _segment_means(
+            values_cum, counts_cum, ends - trend_periods, ends
+        )
+        first_avg = first_sum / first_n
+        last_avg = last_sum / last_n
+        defined = (first_n > 0) & (last_n > 0) & (first_avg != 0)
+        pct = np.where(defined, np.round((last_avg - first_avg) / first_avg * 100, 2), 0.0)
+
+    direction = np.where(
+        pct > threshold_pct, "UP", np.where(pct < -threshold_pct, "DOWN", "FLAT")
+    )
+
+    return RollingArrays(
+        sum=np.where(has_data, total, np.nan),
+        mean=mean,
+        min=minimum,
+        max=maximum,
+        std=std,
+        periods_present=count,
+        periods_total=size,
+        trend_direction=direction,
+        trend_pct=pct,
+    )
@@ -117,6 +117,8 @@ CORE_TABLES = {
     "execution_events": "core_execution_events",
     "dead_letters": "core_dead_letters",
     "concurrency_locks": "core_concurrency_locks",
+    "workflow_checkpoints": "core_workflow_checkpoints",
+    "step_cache": "core_step_cache",
 }
 
 
@@ -397,6 +399,57 @@ CORE_DDL = {
         CREATE INDEX IF NOT EXISTS idx_core_concurrency_locks_expires
         ON core_concurrency_locks(expires_at)
     """,
+    # =========================================================================
+    # CORE_WORKFLOW_CHECKPOINTS: Resumable workflow state
+    #
+    # One row per workflow run, overwritten after each successful step with
+    # a (compressed) WorkflowContext snapshot and the next step to run.
+    # =========================================================================
+    "workflow_checkpoints": """
+        CREATE TABLE IF NOT EXISTS core_workflow_checkpoints (
+            run_id TEXT PRIMARY KEY,
+            workflow_name TEXT NOT NULL,
+            partition_key TEXT NOT NULL,        -- JSON (sorted keys)
+            next_step TEXT,                     -- NULL once the run finished
+            completed_steps TEXT DEFAULT '[]',  -- JSON
+            codec TEXT NOT NULL,                -- Snapshot compression
+            snapshot BLOB NOT NULL,             -- WorkflowContext.to_dict()
+            updated_at TEXT NOT NULL
+        )
+    """,
+    "workflow_checkpoints_idx_partition": """
+        CREATE INDEX IF NOT EXISTS idx_core_workflow_checkpoints_partition
+        ON core_workflow_checkpoints(workflow_name, partition_key, updated_at)
+    """,
+    # =========================================================================
+    # CORE_STEP_CACHE: Reusable workflow step results
+    #
+    # Keyed by a hash of the step's inputs (see orchestration.step_cache).
+    # accessed_at drives LRU eviction, created_at the TTL.
+    # =========================================================================
+    "step_cache": """
+        CREATE TABLE IF NOT EXISTS core_step_cache (
+            cache_key TEXT PRIMARY KEY,
+            workflow_name TEXT NOT NULL,
+            step_name TEXT NOT NULL,
+            payload TEXT NOT NULL,              -- JSON: output, context_updates
+            size_bytes INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            accessed_at TEXT NOT NULL
+        )
+    """,
+    "step_cache_idx_workflow": """
+        CREATE INDEX IF NOT EXISTS idx_core_step_cache_workflow
+        ON core_step_cache(workflow_name, step_name)
+    """,
+    "step_cache_idx_accessed": """
+        CREATE INDEX IF NOT EXISTS idx_core_step_cache_accessed
+        ON core_step_cache(accessed_at)
+    """,
+    "step_cache_idx_created": """
+        CREATE INDEX IF NOT EXISTS idx_core_step_cache_created
+        ON core_step_cache(created_at)
+    """,
 }
 
 
@@ -164,3 +164,44 @@ CREATE TABLE IF NOT EXISTS core_workflow_events (
 CREATE INDEX IF NOT EXISTS idx_workflow_events_run ON core_workflow_events(run_id, timestamp);
 CREATE INDEX IF NOT EXISTS idx_workflow_events_step ON core_workflow_events(step_id) WHERE step_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_workflow_events_type ON core_workflow_events(event_type);
+
+
+-- =============================================================================
+-- WORKFLOW CHECKPOINTS (Resumable context snapshots)
+-- =============================================================================
+
+-- Latest WorkflowContext snapshot per run, written after each successful step
+-- Lets a failed or interrupted run resume without re-running earlier steps
+CREATE TABLE IF NOT EXISTS core_workflow_checkpoints (
+    run_id TEXT PRIMARY KEY,                -- WorkflowContext.run_id
+    workflow_name TEXT NOT NULL,
+    partition_key TEXT NOT NULL,            -- JSON (sorted keys)
+    next_step TEXT,                         -- First incomplete step (NULL = finished)
+    completed_steps TEXT DEFAULT '[]',      -- JSON: Step names completed so far
+    codec TEXT NOT NULL,                    -- Snapshot compression: none, zlib, gzip, lzma
+    snapshot BLOB NOT NULL,                 -- Compressed JSON of WorkflowContext.to_dict()
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_workflow_checkpoints_partition ON core_workflow_checkpoints(workflow_name, partition_key, updated_at);
+
+
+-- =============================================================================
+-- STEP CACHE (Reusable step results)
+-- =============================================================================
+
+-- Successful lambda/pipeline step results keyed by a hash of the step's inputs
+-- (config, params, upstream outputs); reused by WorkflowRunner(cache=...)
+CREATE TABLE IF NOT EXISTS core_step_cache (
+    cache_key TEXT PRIMARY KEY,             -- compute_hash of step inputs
+    workflow_name TEXT NOT NULL,
+    step_name TEXT NOT NULL,
+    payload TEXT NOT NULL,                  -- JSON: output, context_updates
+    size_bytes INTEGER NOT NULL,
+    created_at TEXT NOT NULL,               -- TTL reference
+    accessed_at TEXT NOT NULL               -- LRU eviction order
+);
+
+CREATE INDEX IF NOT EXISTS idx_step_cache_workflow ON core_step_cache(workflow_name, step_name);
+CREATE INDEX IF NOT EXISTS idx_step_cache_accessed ON core_step_cache(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_step_cache_created ON core_step_cache(created_at);
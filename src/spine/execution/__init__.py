@@ -40,6 +40,8 @@ from .events import RunEvent, EventType
 
 # Dispatcher
 from .dispatcher import Dispatcher
+from .run_store import MemoryRunStore
+from .retention import RetentionPolicy, RetentionTracker
 
 # Registry
 from .registry import (
@@ -66,9 +68,10 @@ from .models import (
 
 # Execution infrastructure
 from .ledger import ExecutionLedger
-from .concurrency import ConcurrencyGuard
+from .concurrency import ConcurrencyGuard, LocalLockTable
 from .dlq import DLQManager
 from .repository import ExecutionRepository
+from .scheduler import PriorityScheduler, PRIORITY_LEVELS
 
 # Advanced execution patterns
 from .retry import (
@@ -111,6 +114,8 @@ from .batch import (
     BatchResult,
     BatchBuilder,
     BatchExecutor,
+    AsyncBatchBuilder,
+    AsyncBatchExecutor,
 )
 
 # FastAPI (optional)
@@ -135,6 +140,9 @@ __all__ = [
     
     # Dispatcher
     "Dispatcher",
+    "MemoryRunStore",
+    "RetentionPolicy",
+    "RetentionTracker",
     
     # Registry
     "HandlerRegistry",
@@ -158,8 +166,11 @@ __all__ = [
     # Execution infrastructure
     "ExecutionLedger",
     "ConcurrencyGuard",
+    "LocalLockTable",
     "DLQManager",
     "ExecutionRepository",
+    "PriorityScheduler",
+    "PRIORITY_LEVELS",
     
     # Retry strategies
     "RetryStrategy",
@@ -201,6 +212,8 @@ __all__ = [
     "BatchResult",
     "BatchBuilder",
     "BatchExecutor",
+    "AsyncBatchBuilder",
+    "AsyncBatchExecutor",
     
     # FastAPI
     "create_runs_router",
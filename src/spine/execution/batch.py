@@ -15,20 +15,33 @@ Example:
     >>>
     >>> results = batch.run_all()
     >>> print(f"Completed: {results.successful}/{results.total}")
+    >>>
+    >>> # Streaming: bounded memory for very large batches
+    >>> partitions = (("sec.filings", {"date": d}) for d in dates)
+    >>> for item in batch.stream(partitions, max_in_flight=16):
+    ...     print(item.pipeline, item.status)
+    >>>
+    >>> # Asyncio: coroutine handlers, thousands in flight
+    >>> batch = AsyncBatchExecutor(ledger, dlq=dlq, max_concurrency=2000)
+    >>> batch.register_handler("sec.filings", fetch_filings)
+    >>> results = await batch.run_all()
 """
 
+import asyncio
 import concurrent.futures
+import inspect
 import threading
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 import uuid
 
 from .models import Execution, ExecutionStatus, TriggerSource
 from .ledger import ExecutionLedger
 from .concurrency import ConcurrencyGuard
 from .dlq import DLQManager
-from .context import tracked_execution
+from .context import tracked_execution, tracked_execution_async
 
 
 def utcnow() -> datetime:
@@ -59,26 +72,36 @@ class BatchResult:
     items: list[BatchItem]
     started_at: datetime
     completed_at: datetime | None = None
+    counts: dict[ExecutionStatus, int] | None = None
+    """Per-status counters, used instead of ``items`` when a streamed
+    batch does not retain its items."""
+
+    def _count(self, status: ExecutionStatus) -> int:
+        if self.counts is not None:
+            return self.counts.get(status, 0)
+        return sum(1 for item in self.items if item.status == status)
 
     @property
     def total(self) -> int:
         """Total number of items."""
+        if self.counts is not None:
+            return sum(self.counts.values())
         return len(self.items)
 
     @property
     def successful(self) -> int:
         """Number of successful items."""
-        return sum(1 for item in self.items if item.status == ExecutionStatus.COMPLETED)
+        return self._count(ExecutionStatus.COMPLETED)
 
     @property
     def failed(self) -> int:
         """Number of failed items."""
-        return sum(1 for item in self.items if item.status == ExecutionStatus.FAILED)
+        return self._count(ExecutionStatus.FAILED)
 
     @property
     def pending(self) -> int:
         """Number of pending items."""
-        return sum(1 for item in self.items if item.status == ExecutionStatus.PENDING)
+        return self._count(ExecutionStatus.PENDING)
 
     @property
     def success_rate(self) -> float:
@@ -120,37 +143,19 @@ class BatchResult:
         }
 
 
-class BatchExecutor:
-    """Execute multiple pipelines as a coordinated batch.
-    
-    Supports:
-    - Adding items to batch
-    - Parallel or sequential execution
-    - Custom pipeline handlers
-    - Progress callbacks
-    """
+class _BatchBase:
+    """Item queue and handler registry shared by the batch executors."""
 
     def __init__(
         self,
         ledger: ExecutionLedger,
         guard: ConcurrencyGuard | None = None,
         dlq: DLQManager | None = None,
-        max_parallel: int = 4,
         default_handler: Callable[[str, dict[str, Any]], dict[str, Any]] | None = None,
     ):
-        """Initialize batch executor.
-        
-        Args:
-            ledger: Execution ledger for tracking
-            guard: Concurrency guard for locking
-            dlq: Dead letter queue for failures
-            max_parallel: Maximum parallel executions
-            default_handler: Default function to execute pipelines
-        """
         self._ledger = ledger
         self._guard = guard
         self._dlq = dlq
-        self._max_parallel = max_parallel
         self._default_handler = default_handler
         
         self._items: list[BatchItem] = []
@@ -202,6 +207,53 @@ class BatchExecutor:
             return self._handlers[pipeline]
         return self._default_handler
 
+    def _snapshot(self) -> list[BatchItem]:
+        """Copy of the queued items."""
+        with self._lock:
+            return list(self._items)
+
+    def clear(self) -> None:
+        """Clear all items from the batch."""
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def item_count(self) -> int:
+        """Get number of items in batch."""
+        with self._lock:
+            return len(self._items)
+
+
+class BatchExecutor(_BatchBase):
+    """Execute multiple pipelines as a coordinated batch.
+    
+    Supports:
+    - Adding items to batch
+    - Parallel or sequential execution
+    - Custom pipeline handlers
+    - Progress callbacks
+    """
+
+    def __init__(
+        self,
+        ledger: ExecutionLedger,
+        guard: ConcurrencyGuard | None = None,
+        dlq: DLQManager | None = None,
+        max_parallel: int = 4,
+        default_handler: Callable[[str, dict[str, Any]], dict[str, Any]] | None = None,
+    ):
+        """Initialize batch executor.
+        
+        Args:
+            ledger: Execution ledger for tracking
+            guard: Concurrency guard for locking
+            dlq: Dead letter queue for failures
+            max_parallel: Maximum parallel executions
+            default_handler: Default function to execute pipelines
+        """
+        super().__init__(ledger, guard, dlq, default_handler)
+        self._max_parallel = max_parallel
+
     def _execute_item(
         self,
         item: BatchItem,
@@ -255,8 +307,7 @@ class BatchExecutor:
         batch_id = str(uuid.uuid4())
         started_at = utcnow()
         
-        with self._lock:
-            items = list(self._items)
+        items = self._snapshot()
         
         if parallel and self._max_parallel > 1:
             # Parallel execution
@@ -280,6 +331,99 @@ class BatchExecutor:
             completed_at=utcnow(),
         )
 
+    def stream(
+        self,
+        items: Iterable[BatchItem | tuple[str, dict[str, Any]] | str],
+        *,
+        max_in_flight: int | None = None,
+        on_progress: Callable[[BatchItem], None] | None = None,
+    ) -> Iterator[BatchItem]:
+        """Run items from an iterable, yielding each as it completes.
+        
+        Items are pulled from ``items`` lazily and at most
+        ``max_in_flight`` are submitted at a time, so memory stays flat
+        regardless of batch size. Items queued with add() are not used.
+        Closing the iterator early cancels work that has not started.
+        
+        Args:
+            items: BatchItems, (pipeline, params) tuples or pipeline names
+            max_in_flight: Submission window (default: 2 x max_parallel)
+            on_progress: Callback for each completed item
+            
+        Yields:
+            Completed BatchItems, in completion order
+        """
+        source = (self._as_item(entry) for entry in items)
+        
+        if self._max_parallel <= 1:
+            for item in source:
+                self._execute_item(item, on_progress)
+                yield item
+            return
+        
+        window = max(max_in_flight or self._max_parallel * 2, 1)
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_parallel)
+        in_flight: dict[concurrent.futures.Future, BatchItem] = {}
+        try:
+            for item in source:
+                while len(in_flight) >= window:
+                    done, _ = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        yield in_flight.pop(future)
+                in_flight[pool.submit(self._execute_item, item, on_progress)] = item
+            
+            while in_flight:
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield in_flight.pop(future)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def run_stream(
+        self,
+        items: Iterable[BatchItem | tuple[str, dict[str, Any]] | str],
+        *,
+        max_in_flight: int | None = None,
+        on_progress: Callable[[BatchItem], None] | None = None,
+    ) -> BatchResult:
+        """Run items from an iterable, keeping only aggregate counters.
+        
+        Like stream(), but consumes the results itself. The returned
+        BatchResult has empty ``items`` and per-status ``counts``; use
+        ``on_progress`` to observe individual items.
+        
+        Returns:
+            BatchResult with counters only
+        """
+        batch_id = str(uuid.uuid4())
+        started_at = utcnow()
+        counts: Counter[ExecutionStatus] = Counter()
+        
+        for item in self.stream(items, max_in_flight=max_in_flight, on_progress=on_progress):
+            counts[item.status] += 1
+        
+        return BatchResult(
+            batch_id=batch_id,
+            items=[],
+            started_at=started_at,
+            completed_at=utcnow(),
+            counts=dict(counts),
+        )
+
+    @staticmethod
+    def _as_item(entry: BatchItem | tuple[str, dict[str, Any]] | str) -> BatchItem:
+        """Normalize a streamed entry into a BatchItem."""
+        if isinstance(entry, BatchItem):
+            return entry
+        if isinstance(entry, str):
+            return BatchItem(id=str(uuid.uuid4()), pipeline=entry, params={})
+        pipeline, params = entry
+        return BatchItem(id=str(uuid.uuid4()), pipeline=pipeline, params=params or {})
+
     def run_sequential(
         self,
         on_progress: Callable[[BatchItem], None] | None = None,
@@ -297,8 +441,7 @@ class BatchExecutor:
         batch_id = str(uuid.uuid4())
         started_at = utcnow()
         
-        with self._lock:
-            items = list(self._items)
+        items = self._snapshot()
         
         for item in items:
             self._execute_item(item, on_progress)
@@ -313,16 +456,171 @@ class BatchExecutor:
             completed_at=utcnow(),
         )
 
-    def clear(self) -> None:
-        """Clear all items from the batch."""
-        with self._lock:
-            self._items.clear()
 
-    @property
-    def item_count(self) -> int:
-        """Get number of items in batch."""
-        with self._lock:
-            return len(self._items)
+class AsyncBatchExecutor(_BatchBase):
+    """Execute a batch of pipelines as asyncio tasks.
+    
+    Meant for I/O-bound handlers: concurrency is bounded by an
+    asyncio.Semaphore rather than a thread pool, so thousands of items
+    can be waiting on the network at once. Each item runs inside
+    tracked_execution_async; failures go to the DLQ.
+    
+    Coroutine handlers are awaited on the loop. Plain callables are run
+    with asyncio.to_thread so they cannot block it.
+    
+    Example:
+        >>> async def fetch(params):
+        ...     async with session.get(params["url"]) as resp:
+        ...         return {"status": resp.status}
+        >>>
+        >>> batch = AsyncBatchExecutor(ledger, dlq=dlq, max_concurrency=1000)
+        >>> batch.register_handler("http.fetch", fetch)
+        >>> for url in urls:
+        ...     batch.add("http.fetch", {"url": url})
+        >>> result = await batch.run_all()
+    """
+
+    def __init__(
+        self,
+        ledger: ExecutionLedger,
+        guard: ConcurrencyGuard | None = None,
+        dlq: DLQManager | None = None,
+        max_concurrency: int = 100,
+        default_handler: Callable[[str, dict[str, Any]], dict[str, Any]] | None = None,
+    ):
+        """Initialize async batch executor.
+        
+        Args:
+            ledger: Execution ledger for tracking
+            guard: Concurrency guard for locking
+            dlq: Dead letter queue for failures
+            max_concurrency: Maximum items in flight at once
+            default_handler: Default function to execute pipelines
+        """
+        super().__init__(ledger, guard, dlq, default_handler)
+        self._max_concurrency = max_concurrency
+
+    async def _call_handler(self, handler: Callable, params: dict[str, Any]) -> Any:
+        """Await a coroutine handler or run a sync one off the loop."""
+        if inspect.iscoroutinefunction(handler):
+            return await handler(params)
+        result = await asyncio.to_thread(handler, params)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _execute_item(
+        self,
+        item: BatchItem,
+        on_progress: Callable[[BatchItem], None] | None = None,
+    ) -> None:
+        """Execute a single batch item."""
+        item.started_at = utcnow()
+        handler = self._get_handler(item.pipeline)
+        
+        try:
+            async with tracked_execution_async(
+                ledger=self._ledger,
+                guard=self._guard,
+                dlq=self._dlq,
+                pipeline=item.pipeline,
+                params=item.params,
+                add_to_dlq_on_failure=True,
+            ) as ctx:
+                item.execution_id = ctx.id
+                
+                if handler is not None:
+                    result = await self._call_handler(handler, item.params)
+                    ctx.set_result(result)
+                    item.result = result
+                
+                item.status = ExecutionStatus.COMPLETED
+                
+        except Exception as e:
+            item.status = ExecutionStatus.FAILED
+            item.error = str(e)
+        
+        finally:
+            item.completed_at = utcnow()
+            if on_progress:
+                on_progress(item)
+
+    async def run_all(
+        self,
+        on_progress: Callable[[BatchItem], None] | None = None,
+    ) -> BatchResult:
+        """Run all items concurrently, at most max_concurrency at a time.
+        
+        Tasks are created only as semaphore slots free up, so the number
+        of live tasks never exceeds max_concurrency.
+        
+        Args:
+            on_progress: Callback for each completed item
+            
+        Returns:
+            BatchResult with all execution results
+        """
+        batch_id = str(uuid.uuid4())
+        started_at = utcnow()
+        items = self._snapshot()
+        
+        semaphore = asyncio.Semaphore(max(self._max_concurrency, 1))
+        tasks: set[asyncio.Task] = set()
+        
+        def _release(task: asyncio.Task) -> None:
+            tasks.discard(task)
+            semaphore.release()
+        
+        try:
+            for item in items:
+                await semaphore.acquire()
+                task = asyncio.create_task(self._execute_item(item, on_progress))
+                tasks.add(task)
+                task.add_done_callback(_release)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            # Only non-empty if run_all itself was cancelled
+            for task in tasks:
+                task.cancel()
+        
+        return BatchResult(
+            batch_id=batch_id,
+            items=items,
+            started_at=started_at,
+            completed_at=utcnow(),
+        )
+
+    async def run_sequential(
+        self,
+        on_progress: Callable[[BatchItem], None] | None = None,
+        stop_on_failure: bool = False,
+    ) -> BatchResult:
+        """Run items one at a time with optional early stop.
+        
+        Args:
+            on_progress: Callback for each completed item
+            stop_on_failure: Stop batch on first failure
+            
+        Returns:
+            BatchResult with execution results
+        """
+        batch_id = str(uuid.uuid4())
+        started_at = utcnow()
+        items = self._snapshot()
+        
+        for item in items:
+            await self._execute_item(item, on_progress)
+            
+            if stop_on_failure and item.status == ExecutionStatus.FAILED:
+                break
+        
+        return BatchResult(
+            batch_id=batch_id,
+            items=items,
+            started_at=started_at,
+            completed_at=utcnow(),
+        )
 
 
 class BatchBuilder:
@@ -398,3 +696,74 @@ class BatchBuilder:
                 on_progress=self._on_progress,
                 stop_on_failure=self._stop_on_failure,
             )
+
+
+class AsyncBatchBuilder:
+    """Fluent builder for asyncio batch executions.
+    
+    Example:
+        >>> result = await (
+        ...     AsyncBatchBuilder(ledger, guard, dlq)
+        ...     .handler("http.fetch", fetch)
+        ...     .add("http.fetch", {"url": "https://a.example"})
+        ...     .add("http.fetch", {"url": "https://b.example"})
+        ...     .concurrency(500)
+        ...     .run()
+        ... )
+    """
+
+    def __init__(
+        self,
+        ledger: ExecutionLedger,
+        guard: ConcurrencyGuard | None = None,
+        dlq: DLQManager | None = None,
+    ):
+        self._executor = AsyncBatchExecutor(ledger, guard, dlq)
+        self._parallel = True
+        self._max_concurrency = self._executor._max_concurrency
+        self._stop_on_failure = False
+        self._on_progress: Callable[[BatchItem], None] | None = None
+
+    def add(self, pipeline: str, params: dict[str, Any] | None = None) -> "AsyncBatchBuilder":
+        """Add a pipeline to the batch."""
+        self._executor.add(pipeline, params)
+        return self
+
+    def handler(
+        self,
+        pipeline: str,
+        handler: Callable[[dict[str, Any]], Any],
+    ) -> "AsyncBatchBuilder":
+        """Register a handler (coroutine function or callable) for a pipeline."""
+        self._executor.register_handler(pipeline, handler)
+        return self
+
+    def concurrency(self, max_concurrency: int = 100) -> "AsyncBatchBuilder":
+        """Run items concurrently, at most max_concurrency at a time."""
+        self._parallel = True
+        self._max_concurrency = max_concurrency
+        self._executor._max_concurrency = max_concurrency
+        return self
+
+    def sequential(self, stop_on_failure: bool = False) -> "AsyncBatchBuilder":
+        """Enable sequential execution."""
+        self._parallel = False
+        self._stop_on_failure = stop_on_failure
+        return self
+
+    def on_progress(
+        self,
+        callback: Callable[[BatchItem], None],
+    ) -> "AsyncBatchBuilder":
+        """Set progress callback."""
+        self._on_progress = callback
+        return self
+
+    async def run(self) -> BatchResult:
+        """Execute the batch."""
+        if self._parallel:
+            return await self._executor.run_all(on_progress=self._on_progress)
+        return await self._executor.run_sequential(
+            on_progress=self._on_progress,
+            stop_on_failure=self._stop_on_failure,
+        )
@@ -15,9 +15,16 @@ Example:
     ...         pass
     ...     finally:
     ...         guard.release(lock_key)
+    >>>
+    >>> # Threads in one worker can share a LocalLockTable so contention
+    >>> # between them is resolved in-process without a database round-trip
+    >>> locks = LocalLockTable()
+    >>> guard = ConcurrencyGuard(conn, local_locks=locks)
 """
 
+import threading
 from datetime import datetime, timedelta, timezone
+from typing import Iterable
 
 
 def utcnow() -> datetime:
@@ -25,6 +32,85 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class LocalLockTable:
+    """In-process mirror of the locks held by this worker.
+    
+    Shared between ConcurrencyGuard instances (e.g. one guard per thread,
+    each with its own connection) so that a key already held by another
+    execution in this process is refused without touching the database.
+    The database stays the source of truth: entries are only recorded
+    while a guard is acquiring or holding the lock there.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._held: dict[str, tuple[str, datetime]] = {}
+
+    def __len__(self) -> int:
+        return len(self._held)
+
+    def claim(
+        self,
+        lock_keys: Iterable[str],
+        execution_id: str,
+        expires_at: datetime,
+        now: datetime,
+    ) -> bool:
+        """Record execution_id as holder of all keys, or none of them.
+        
+        Returns:
+            False if any key is held (and unexpired) by another execution
+        """
+        lock_keys = list(lock_keys)
+        with self._mutex:
+            for key in lock_keys:
+                holder = self._held.get(key)
+                if holder and holder[0] != execution_id and holder[1] >= now:
+                    return False
+            for key in lock_keys:
+                self._held[key] = (execution_id, expires_at)
+            return True
+
+    def drop(self, lock_keys: Iterable[str], execution_id: str | None = None) -> None:
+        """Forget keys (only those held by execution_id, if given)."""
+        with self._mutex:
+            for key in lock_keys:
+                holder = self._held.get(key)
+                if holder and (execution_id is None or holder[0] == execution_id):
+                    del self._held[key]
+
+    def extend(self, lock_key: str, execution_id: str, expires_at: datetime) -> None:
+        """Update the expiry of a key held by execution_id."""
+        with self._mutex:
+            holder = self._held.get(lock_key)
+            if holder and holder[0] == execution_id:
+                self._held[lock_key] = (execution_id, expires_at)
+
+    def prune(self, now: datetime) -> None:
+        """Forget expired entries."""
+        with self._mutex:
+            for key in [k for k, (_, exp) in self._held.items() if exp < now]:
+                del self._held[key]
+
+
+# Acquire in one statement: insert, or take over the row if it expired or
+# is already ours (in which case only the expiry moves).
+_UPSERT_LOCK = """
+    INSERT INTO core_concurrency_locks (lock_key, execution_id, acquired_at, expires_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (lock_key) DO UPDATE SET
+        acquired_at = CASE
+            WHEN core_concurrency_locks.execution_id = excluded.execution_id
+            THEN core_concurrency_locks.acquired_at
+            ELSE excluded.acquired_at
+        END,
+        execution_id = excluded.execution_id,
+        expires_at = excluded.expires_at
+    WHERE core_concurrency_locks.expires_at < excluded.acquired_at
+       OR core_concurrency_locks.execution_id = excluded.execution_id
+"""
+
+
 class ConcurrencyGuard:
     """Guards against concurrent execution of the same pipeline/params.
     
@@ -36,13 +122,16 @@ class ConcurrencyGuard:
     - "finra.otc.ingest:2025-01-09:NMS_TIER_1" for tier-specific
     """
 
-    def __init__(self, conn):
+    def __init__(self, conn, local_locks: LocalLockTable | None = None):
         """Initialize with a database connection.
         
         Args:
             conn: Database connection (sqlite3.Connection or psycopg.Connection)
+            local_locks: In-process lock table, shared with other guards in
+                this worker to short-circuit contention (default: private)
         """
         self._conn = conn
+        self._local = local_locks if local_locks is not None else LocalLockTable()
 
     def acquire(
         self,
@@ -60,59 +149,61 @@ class ConcurrencyGuard:
         Returns:
             True if lock acquired, False if already locked by another execution
         """
+        return self.acquire_many([lock_key], execution_id, timeout_seconds)
+
+    def acquire_many(
+        self,
+        lock_keys: Iterable[str],
+        execution_id: str,
+        timeout_seconds: int = 3600,
+    ) -> bool:
+        """Acquire several locks atomically (all or none).
+        
+        Keys held by other executions in this process are refused
+        in-process. Otherwise every key is upserted in one transaction;
+        if any key is held elsewhere the transaction is rolled back.
+        
+        Args:
+            lock_keys: Lock keys to acquire together
+            execution_id: Execution ID trying to acquire the locks
+            timeout_seconds: Locks expire after this many seconds
+            
+        Returns:
+            True if all locks acquired, False if any is held by another execution
+        """
+        lock_keys = list(dict.fromkeys(lock_keys))
+        if not lock_keys:
+            return True
         now = utcnow()
         expires_at = now + timedelta(seconds=timeout_seconds)
-        cursor = self._conn.cursor()
 
-        # First, clean up expired locks
-        cursor.execute(
-            """
-            DELETE FROM core_concurrency_locks
-            WHERE lock_key = ? AND expires_at < ?
-            """,
-            (lock_key, now.isoformat()),
-        )
+        if not self._local.claim(lock_keys, execution_id, expires_at, now):
+            return False
 
-        # Try to insert new lock
+        acquired = False
         try:
-            cursor.execute(
-                """
-                INSERT INTO core_concurrency_locks (lock_key, execution_id, acquired_at, expires_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    lock_key,
-                    execution_id,
-                    now.isoformat(),
-                    expires_at.isoformat(),
-                ),
+            cursor = self._conn.cursor()
+            cursor.executemany(
+                _UPSERT_LOCK,
+                [
+                    (key, execution_id, now.isoformat(), expires_at.isoformat())
+                    for key in lock_keys
+                ],
             )
-            self._conn.commit()
-            return True
+            acquired = cursor.rowcount == len(lock_keys)
+            if acquired:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
         except Exception:
-            # Lock already exists - check if we own it
+            # Don't leave partial upserts open on the caller's connection
+            acquired = False
             self._conn.rollback()
-            cursor.execute(
-                """
-                SELECT execution_id FROM core_concurrency_locks
-                WHERE lock_key = ?
-                """,
-                (lock_key,),
-            )
-            row = cursor.fetchone()
-            if row and row[0] == execution_id:
-                # We already hold the lock, extend it
-                cursor.execute(
-                    """
-                    UPDATE core_concurrency_locks
-                    SET expires_at = ?
-                    WHERE lock_key = ? AND execution_id = ?
-                    """,
-                    (expires_at.isoformat(), lock_key, execution_id),
-                )
-                self._conn.commit()
-                return True
-            return False
+            raise
+        finally:
+            if not acquired:
+                self._local.drop(lock_keys, execution_id)
+        return acquired
 
     def release(self, lock_key: str, execution_id: str | None = None) -> bool:
         """Release a lock.
@@ -144,6 +235,7 @@ class ConcurrencyGuard:
             )
 
         self._conn.commit()
+        self._local.drop([lock_key], execution_id)
         return cursor.rowcount > 0
 
     def is_locked(self, lock_key: str) -> bool:
@@ -225,7 +317,10 @@ class ConcurrencyGuard:
             (expires_at.isoformat(), lock_key, execution_id),
         )
         self._conn.commit()
-        return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            self._local.extend(lock_key, execution_id, expires_at)
+            return True
+        return False
 
     def cleanup_expired(self) -> int:
         """Clean up all expired locks.
@@ -233,15 +328,17 @@ class ConcurrencyGuard:
         Returns:
             Number of locks cleaned up
         """
+        now = utcnow()
         cursor = self._conn.cursor()
         cursor.execute(
             """
             DELETE FROM core_concurrency_locks
             WHERE expires_at < ?
             """,
-            (utcnow().isoformat(),),
+            (now.isoformat(),),
         )
         self._conn.commit()
+        self._local.prune(now)
         return cursor.rowcount
 
     def list_active_locks(self) -> list[dict]:
@@ -22,12 +22,12 @@ Example:
 """
 
 import traceback
-from contextlib import contextmanager, asynccontextmanager
+from contextlib import contextmanager, asynccontextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Generator, AsyncGenerator
+from typing import Any, AsyncGenerator, ContextManager, Generator
 
-from .models import Execution, ExecutionStatus, TriggerSource
+from .models import EventType, Execution, ExecutionStatus, TriggerSource
 from .ledger import ExecutionLedger
 from .concurrency import ConcurrencyGuard
 from .dlq import DLQManager
@@ -38,6 +38,23 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _write_behind(ledger: ExecutionLedger) -> ContextManager:
+    """Buffer ledger writes for one tracked execution, if supported.
+    
+    Progress events and the final status are committed together when
+    the execution ends instead of one commit per write.
+    """
+    batch = getattr(ledger, "batch", None)
+    return batch() if batch is not None else nullcontext()
+
+
+def _flush(ledger: ExecutionLedger) -> None:
+    """Flush buffered ledger writes, if supported."""
+    flush = getattr(ledger, "flush", None)
+    if flush is not None:
+        flush()
+
+
 class ExecutionLockError(Exception):
     """Raised when execution lock cannot be acquired."""
     pass
@@ -82,9 +99,8 @@ class ExecutionContext:
         """Log a progress event."""
         self.ledger.record_event(
             self.execution.id,
-            event_type="progress",
-            message=message,
-            metadata=data,
+            event_type=EventType.PROGRESS,
+            data={"message": message, **data},
         )
 
 
@@ -134,71 +150,73 @@ def tracked_execution(
             yield ExecutionContext(execution=existing, ledger=ledger)
             return
     
-    # Create execution
-    execution = Execution.create(
-        pipeline=pipeline,
-        params=params,
-        trigger_source=trigger_source,
-        idempotency_key=idempotency_key,
-    )
-    ledger.create_execution(execution)
-    
-    ctx = ExecutionContext(execution=execution, ledger=ledger)
-    
-    try:
-        # Acquire lock if guard provided
-        if guard is not None:
-            lock_acquired = guard.acquire(
-                lock_key=lock_key,
-                execution_id=execution.id,
-                timeout_seconds=lock_timeout,
-            )
-            if not lock_acquired:
-                ledger.update_status(execution.id, ExecutionStatus.CANCELLED)
-                raise ExecutionLockError(
-                    f"Could not acquire lock for {pipeline}"
-                )
-        
-        # Mark as running
-        ledger.update_status(execution.id, ExecutionStatus.RUNNING)
-        
-        # Yield control to user code
-        yield ctx
-        
-        # Mark as completed
-        ledger.update_status(
-            execution.id,
-            ExecutionStatus.COMPLETED,
-            result=ctx._result,
+    with _write_behind(ledger):
+        # Create execution
+        execution = Execution.create(
+            pipeline=pipeline,
+            params=params,
+            trigger_source=trigger_source,
+            idempotency_key=idempotency_key,
         )
+        ledger.create_execution(execution)
         
-    except ExecutionLockError:
-        raise  # Re-raise lock errors
+        ctx = ExecutionContext(execution=execution, ledger=ledger)
         
-    except Exception as e:
-        # Mark as failed
-        error_msg = str(e)
-        ledger.update_status(
-            execution.id,
-            ExecutionStatus.FAILED,
-            error=error_msg,
-        )
-        
-        # Add to DLQ if enabled
-        if add_to_dlq_on_failure and dlq is not None:
-            dlq.add_to_dlq(
-                execution_id=execution.id,
-                pipeline=pipeline,
-                params=params,
+        try:
+            # Acquire lock if guard provided
+            if guard is not None:
+                lock_acquired = guard.acquire(
+                    lock_key=lock_key,
+                    execution_id=execution.id,
+                    timeout_seconds=lock_timeout,
+                )
+                if not lock_acquired:
+                    ledger.update_status(execution.id, ExecutionStatus.CANCELLED)
+                    raise ExecutionLockError(
+                        f"Could not acquire lock for {pipeline}"
+                    )
+            
+            # Mark as running (flushed so the run is visible while it works)
+            ledger.update_status(execution.id, ExecutionStatus.RUNNING)
+            _flush(ledger)
+            
+            # Yield control to user code
+            yield ctx
+            
+            # Mark as completed
+            ledger.update_status(
+                execution.id,
+                ExecutionStatus.COMPLETED,
+                result=ctx._result,
+            )
+            
+        except ExecutionLockError:
+            raise  # Re-raise lock errors
+            
+        except Exception as e:
+            # Mark as failed
+            error_msg = str(e)
+            ledger.update_status(
+                execution.id,
+                ExecutionStatus.FAILED,
                 error=error_msg,
             )
-        
-        raise
-        
-    finally:
-        # Always release lock
-        if lock_acquired and guard is not None:
-            guard.release(lock_key, execution_id=execution.id)
+            
+            # Add to DLQ if enabled
+            if add_to_dlq_on_failure and dlq is not None:
+                dlq.add_to_dlq(
+                    execution_id=execution.id,
+                    pipeline=pipeline,
+                    params=params,
+                    error=error_msg,
+                )
+            
+            raise
+            
+        finally:
+            # Always release lock
+            if lock_acquired and guard is not None:
+                guard.release(lock_key, execution_id=execution.id)
 
 
 @asynccontextmanager
@@ -230,68 +248,70 @@ async def tracked_execution_async(
             yield ExecutionContext(execution=existing, ledger=ledger)
             return
     
-    # Create execution
-    execution = Execution.create(
-        pipeline=pipeline,
-        params=params,
-        trigger_source=trigger_source,
-        idempotency_key=idempotency_key,
-    )
-    ledger.create_execution(execution)
-    
-    ctx = ExecutionContext(execution=execution, ledger=ledger)
-    
-    try:
-        # Acquire lock if guard provided
-        if guard is not None:
-            lock_acquired = guard.acquire(
-                lock_key=lock_key,
-                execution_id=execution.id,
-                timeout_seconds=lock_timeout,
-            )
-            if not lock_acquired:
-                ledger.update_status(execution.id, ExecutionStatus.CANCELLED)
-                raise ExecutionLockError(
-                    f"Could not acquire lock for {pipeline}"
-                )
-        
-        # Mark as running
-        ledger.update_status(execution.id, ExecutionStatus.RUNNING)
-        
-        # Yield control to user code
-        yield ctx
-        
-        # Mark as completed
-        ledger.update_status(
-            execution.id,
-            ExecutionStatus.COMPLETED,
-            result=ctx._result,
+    with _write_behind(ledger):
+        # Create execution
+        execution = Execution.create(
+            pipeline=pipeline,
+            params=params,
+            trigger_source=trigger_source,
+            idempotency_key=idempotency_key,
         )
+        ledger.create_execution(execution)
         
-    except ExecutionLockError:
-        raise
-        
-    except Exception as e:
-        error_msg = str(e)
-        ledger.update_status(
-            execution.id,
-            ExecutionStatus.FAILED,
-            error=error_msg,
-        )
+        ctx = ExecutionContext(execution=execution, ledger=ledger)
         
-        if add_to_dlq_on_failure and dlq is not None:
-            dlq.add_to_dlq(
-                execution_id=execution.id,
-                pipeline=pipeline,
-                params=params,
+        try:
+            # Acquire lock if guard provided
+            if guard is not None:
+                lock_acquired = guard.acquire(
+                    lock_key=lock_key,
+                    execution_id=execution.id,
+                    timeout_seconds=lock_timeout,
+                )
+                if not lock_acquired:
+                    ledger.update_status(execution.id, ExecutionStatus.CANCELLED)
+                    raise ExecutionLockError(
+                        f"Could not acquire lock for {pipeline}"
+                    )
+            
+            # Mark as running (flushed so the run is visible while it works)
+            ledger.update_status(execution.id, ExecutionStatus.RUNNING)
+            _flush(ledger)
+            
+            # Yield control to user code
+            yield ctx
+            
+            # Mark as completed
+            ledger.update_status(
+                execution.id,
+                ExecutionStatus.COMPLETED,
+                result=ctx._result,
+            )
+            
+        except ExecutionLockError:
+            raise
+            
+        except Exception as e:
+            error_msg = str(e)
+            ledger.update_status(
+                execution.id,
+                ExecutionStatus.FAILED,
                 error=error_msg,
             )
-        
-        raise
-        
-    finally:
-        if lock_acquired and guard is not None:
-            guard.release(lock_key, execution_id=execution.id)
+            
+            if add_to_dlq_on_failure and dlq is not None:
+                dlq.add_to_dlq(
+                    execution_id=execution.id,
+                    pipeline=pipeline,
+                    params=params,
+                    error=error_msg,
+                )
+            
+            raise
+            
+        finally:
+            if lock_acquired and guard is not None:
+                guard.release(lock_key, execution_id=execution.id)
 
 
 # Convenience aliases
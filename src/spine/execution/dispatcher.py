@@ -9,18 +9,30 @@ This provides a single, unified interface regardless of:
 - Executor (Memory, Local, Celery, etc.)
 - Persistence (in-memory or database ledger)
 """
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Iterable, TYPE_CHECKING
 
 from .spec import WorkSpec
 from .runs import RunRecord, RunStatus, RunSummary
 from .events import RunEvent, EventType
+from .run_store import MemoryRunStore
+from .retention import RetentionPolicy, RetentionTracker
+from .executors.protocol import SupportsCompletionCallbacks
 
 if TYPE_CHECKING:
     from .executors.protocol import Executor
 
 
+TERMINAL_STATUSES = frozenset({
+    RunStatus.COMPLETED,
+    RunStatus.FAILED,
+    RunStatus.CANCELLED,
+    RunStatus.DEAD_LETTERED,
+})
+
+
 class Dispatcher:
     """Central submission point for all work types.
     
@@ -54,6 +66,8 @@ class Dispatcher:
         ledger: Any = None,  # Optional RunLedger for persistence
         registry: Any = None,  # Optional HandlerRegistry
         concurrency: Any = None,  # Optional ConcurrencyGuard
+        retention: RetentionPolicy | None = None,
+        spill: Any = None,  # Optional RunLedger receiving evicted runs
     ):
         """Initialize dispatcher.
         
@@ -62,16 +76,34 @@ class Dispatcher:
             ledger: Optional run persistence (in-memory if None)
             registry: Optional handler registry
             concurrency: Optional concurrency control
+            retention: Limits on finished runs kept in memory
+                (unbounded if None)
+            spill: Ledger that evicted in-memory runs and their events
+                are written to; get_run/get_events fall back to it
         """
         self.executor = executor
         self.ledger = ledger
         self.registry = registry
         self.concurrency = concurrency
+        self.spill = spill
+        self._retention = RetentionTracker(retention) if retention else None
         
         # In-memory ledger if none provided
-        self._memory_runs: Dict[str, RunRecord] = {}
+        self._memory_runs = MemoryRunStore()
         self._memory_events: Dict[str, list[RunEvent]] = {}
         self._idempotency_index: Dict[str, str] = {}  # idempotency_key -> run_id
+        
+        # Push-based completion: executors that support callbacks report
+        # state changes as they happen instead of being polled.
+        self._push_updates = isinstance(executor, SupportsCompletionCallbacks)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ref_index: Dict[str, str] = {}  # external_ref -> run_id (in flight)
+        self._early_updates: Dict[str, list[tuple]] = {}  # updates before ref was known
+        self._submits_in_flight = 0
+        self._update_tasks: set[asyncio.Task] = set()
+        self._waiters: Dict[str, list[asyncio.Future]] = {}
+        if self._push_updates:
+            executor.add_completion_callback(self._on_executor_update)
     
     # === CANONICAL API ===
     
@@ -102,24 +134,11 @@ class Dispatcher:
                 return existing.run_id
         
         # Create run record
-        run_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        run = self._new_run(spec, datetime.utcnow())
+        run_id = run.run_id
         
-        run = RunRecord(
-            run_id=run_id,
-            spec=spec,
-            status=RunStatus.PENDING,
-            created_at=now,
-            executor_name=getattr(self.executor, 'name', None),
-            tags={
-                "kind": spec.kind,
-                "name": spec.name,
-                **(spec.metadata or {}),
-            }
-        )
-        
-        # Index idempotency key
-        if spec.idempotency_key:
+        # Index idempotency key (a persistent ledger indexes its own)
+        if spec.idempotency_key and not self.ledger:
             self._idempotency_index[spec.idempotency_key] = run_id
         
         # Persist
@@ -130,6 +149,7 @@ class Dispatcher:
         })
         
         # Submit to executor
+        self._begin_submit()
         try:
             external_ref = await self.executor.submit(spec)
             run.external_ref = external_ref
@@ -139,9 +159,17 @@ class Dispatcher:
                 "external_ref": external_ref
             })
             
-            # For synchronous executors (like MemoryExecutor), the work may
-            # already be complete. Check status and sync if needed.
-            await self._sync_from_executor(run)
+            if self._push_updates:
+                # Apply anything the executor reported before we knew the ref
+                for update in self._track_ref(run):
+                    event = self._transition(run, *update)
+                    if event:
+                        await self._save_run(run)
+                        await self._record_event(run_id, *event)
+            else:
+                # For synchronous executors (like MemoryExecutor), the work may
+                # already be complete. Check status and sync if needed.
+                await self._sync_from_executor(run)
             
         except Exception as e:
             run.status = RunStatus.FAILED
@@ -152,9 +180,149 @@ class Dispatcher:
                 "error": str(e),
                 "error_type": type(e).__name__,
             })
+        finally:
+            self._end_submit()
         
+        if run.status in TERMINAL_STATUSES:
+            await self._finalize(run)
         return run_id
     
+    async def submit_many(self, specs: Iterable[WorkSpec]) -> list[str]:
+        """Submit a batch of work in one pass.
+        
+        Equivalent to calling submit() for each spec, but idempotency keys
+        are resolved up front, run records and events are persisted per
+        phase rather than per spec, and executors that implement
+        ``submit_many`` receive the whole batch at once.
+        
+        Args:
+            specs: Work specifications
+            
+        Returns:
+            run_ids in the same order as specs. Specs whose idempotency
+            key matches an existing run (or an earlier spec in the same
+            batch) map to that run's id.
+            
+        Example:
+            >>> run_ids = await dispatcher.submit_many(
+            ...     pipeline_spec("ingest", {"symbol": s}) for s in symbols
+            ... )
+        """
+        specs = list(specs)
+        run_ids: list[str] = []
+        runs: list[RunRecord] = []
+        
+        # Resolve idempotency keys in one pass
+        keys = {spec.idempotency_key for spec in specs if spec.idempotency_key}
+        known = await self._find_run_ids_by_idempotency_keys(keys) if keys else {}
+        
+        now = datetime.utcnow()
+        for spec in specs:
+            key = spec.idempotency_key
+            if key and key in known:
+                run_ids.append(known[key])
+                continue
+            run = self._new_run(spec, now)
+            if key:
+                known[key] = run.run_id
+                if not self.ledger:
+                    self._idempotency_index[key] = run.run_id
+            runs.append(run)
+            run_ids.append(run.run_id)
+        
+        if not runs:
+            return run_ids
+        
+        await self._save_runs(runs)
+        await self._record_events([
+            (run.run_id, EventType.CREATED, {"kind": run.spec.kind, "name": run.spec.name})
+            for run in runs
+        ])
+        
+        # Submit to executor, as a batch when supported
+        self._begin_submit()
+        try:
+            await self._submit_batch(runs)
+        finally:
+            self._end_submit()
+        
+        for run in runs:
+            if run.status in TERMINAL_STATUSES:
+                await self._finalize(run)
+        return run_ids
+    
+    async def _submit_batch(self, runs: list[RunRecord]) -> None:
+        """Hand new runs to the executor and record the outcome in bulk."""
+        outcomes: list[str | Exception] | None = None
+        submit_batch = getattr(self.executor, "submit_many", None)
+        if submit_batch is not None:
+            try:
+                refs = list(await submit_batch([run.spec for run in runs]))
+            except Exception:
+                # submit_many validates the whole batch before queuing
+                # anything (see Executor), so nothing has run yet and the
+                # failing spec(s) can be isolated by submitting one by one.
+                pass
+            else:
+                if len(refs) == len(runs):
+                    outcomes = list(refs)
+                else:
+                    # Some work may have been queued; resubmitting could
+                    # run it twice, so fail the batch instead.
+                    error = RuntimeError(
+                        f"submit_many returned {len(refs)} refs for {len(runs)} specs"
+                    )
+                    outcomes = [error] * len(runs)
+        if outcomes is None:
+            outcomes = []
+            for run in runs:
+                try:
+                    outcomes.append(await self.executor.submit(run.spec))
+                except Exception as e:
+                    outcomes.append(e)
+        
+        events: list[tuple[str, str, dict]] = []
+        for run, outcome in zip(runs, outcomes):
+            if isinstance(outcome, Exception):
+                run.status = RunStatus.FAILED
+                run.error = str(outcome)
+                run.error_type = type(outcome).__name__
+                events.append((run.run_id, EventType.FAILED, {
+                    "error": str(outcome),
+                    "error_type": type(outcome).__name__,
+                }))
+            else:
+                run.external_ref = outcome
+                run.status = RunStatus.QUEUED
+                events.append((run.run_id, EventType.QUEUED, {"external_ref": outcome}))
+        
+        await self._save_runs(runs)
+        await self._record_events(events)
+        
+        # Work may already be complete (synchronous executors)
+        synced: list[RunRecord] = []
+        events = []
+        for run in runs:
+            if run.status != RunStatus.QUEUED:
+                continue
+            if self._push_updates:
+                updates = self._track_ref(run)
+            else:
+                event = await self._poll_executor(run)
+                updates = []
+                if event:
+                    events.append((run.run_id, *event))
+                    synced.append(run)
+            for update in updates:
+                event = self._transition(run, *update)
+                if event:
+                    events.append((run.run_id, *event))
+                    if not synced or synced[-1] is not run:
+                        synced.append(run)
+        if synced:
+            await self._save_runs(synced)
+            await self._record_events(events)
+    
     # === CONVENIENCE WRAPPERS ===
     
     async def submit_task(
@@ -238,7 +406,14 @@ class Dispatcher:
         """
         if self.ledger:
             return await self.ledger.get_run(run_id)
-        return self._memory_runs.get(run_id)
+        run = self._memory_runs.get(run_id)
+        if run is not None:
+            if self._retention is not None:
+                self._retention.touch(run_id)
+            return run
+        if self.spill:
+            return await self.spill.get_run(run_id)
+        return None
     
     async def list_runs(
         self,
@@ -272,21 +447,11 @@ class Dispatcher:
                 parent_run_id=parent_run_id, limit=limit, offset=offset
             )
         
-        # In-memory filter
-        runs = list(self._memory_runs.values())
-        
-        if kind:
-            runs = [r for r in runs if r.spec.kind == kind]
-        if status:
-            runs = [r for r in runs if r.status == status]
-        if name:
-            runs = [r for r in runs if r.spec.name == name]
-        if parent_run_id:
-            runs = [r for r in runs if r.spec.parent_run_id == parent_run_id]
-        
-        # Sort by created_at descending (newest first)
-        runs = sorted(runs, key=lambda r: r.created_at, reverse=True)
-        runs = runs[offset:offset + limit]
+        # In-memory indexed query
+        runs = self._memory_runs.query(
+            kind=kind, status=status, name=name,
+            parent_run_id=parent_run_id, limit=limit, offset=offset,
+        )
         
         return [
             RunSummary(
@@ -311,6 +476,8 @@ class Dispatcher:
         """
         if self.ledger:
             return await self.ledger.get_events(run_id)
+        if run_id not in self._memory_events and self.spill:
+            return await self.spill.get_events(run_id)
         return self._memory_events.get(run_id, [])
     
     async def get_children(self, parent_run_id: str) -> list[RunSummary]:
@@ -324,6 +491,63 @@ class Dispatcher:
         """
         return await self.list_runs(parent_run_id=parent_run_id)
     
+    async def wait_for(
+        self,
+        run_id: str,
+        timeout: float | None = None,
+        poll_interval: float = 0.1,
+    ) -> RunRecord:
+        """Wait until a run reaches a terminal status.
+        
+        With executors that push completion (SupportsCompletionCallbacks)
+        this awaits the completion notification directly. Other executors
+        are polled every ``poll_interval`` seconds.
+        
+        Args:
+            run_id: Run identifier
+            timeout: Max seconds to wait (None = wait forever)
+            poll_interval: Polling period for executors without callbacks
+            
+        Returns:
+            The finished RunRecord
+            
+        Raises:
+            ValueError: If run not found
+            TimeoutError: If timeout exceeded
+            
+        Example:
+            >>> run_id = await dispatcher.submit_pipeline("ingest_otc", params)
+            >>> run = await dispatcher.wait_for(run_id, timeout=300)
+        """
+        run = await self.get_run(run_id)
+        if not run:
+            raise ValueError(f"Run {run_id} not found")
+        if run.status in TERMINAL_STATUSES:
+            return run
+        
+        if not self._push_updates:
+            async def poll() -> RunRecord:
+                while True:
+                    current = await self.get_run(run_id)
+                    await self._sync_from_executor(current)
+                    if current.status in TERMINAL_STATUSES:
+                        return current
+                    await asyncio.sleep(poll_interval)
+            
+            return await asyncio.wait_for(poll(), timeout)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(run_id, []).append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        finally:
+            waiters = self._waiters.get(run_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[run_id]
+        return await self.get_run(run_id)
+    
     # === CONTROL ===
     
     async def cancel(self, run_id: str) -> bool:
@@ -347,6 +571,7 @@ class Dispatcher:
             run.mark_cancelled()
             await self._save_run(run)
             await self._record_event(run_id, EventType.CANCELLED)
+            await self._finalize(run)
         
         return success
     
@@ -418,6 +643,7 @@ class Dispatcher:
             await self._record_event(run_id, EventType.COMPLETED, {
                 "duration_seconds": run.duration_seconds,
             })
+            await self._finalize(run)
     
     async def mark_failed(self, run_id: str, error: str, error_type: str | None = None) -> None:
         """Mark run as failed with error."""
@@ -429,6 +655,7 @@ class Dispatcher:
                 "error": error,
                 "error_type": error_type,
             })
+            await self._finalize(run)
     
     async def record_progress(self, run_id: str, progress: float, message: str | None = None) -> None:
         """Record progress update for long-running work."""
@@ -439,12 +666,49 @@ class Dispatcher:
     
     # === INTERNAL ===
     
+    def _new_run(self, spec: WorkSpec, now: datetime) -> RunRecord:
+        """Build a PENDING run record for spec."""
+        return RunRecord(
+            run_id=str(uuid.uuid4()),
+            spec=spec,
+            status=RunStatus.PENDING,
+            created_at=now,
+            executor_name=getattr(self.executor, 'name', None),
+            tags={
+                "kind": spec.kind,
+                "name": spec.name,
+                **(spec.metadata or {}),
+            }
+        )
+    
+    def _is_evicted(self, run_id: str) -> bool:
+        """True if retention has dropped run_id from memory.
+        
+        Runs are saved before any of their events are recorded, so under
+        retention a run missing from memory was evicted.
+        """
+        return self._retention is not None and run_id not in self._memory_runs
+    
     async def _save_run(self, run: RunRecord) -> None:
         """Persist run."""
         if self.ledger:
             await self.ledger.save_run(run)
+        elif run.status in TERMINAL_STATUSES and self._is_evicted(run.run_id):
+            # Reloaded from the spill (or updated after eviction): keep it
+            # out of memory, where retention no longer tracks it
+            if self.spill:
+                await self.spill.save_run(run)
         else:
-            self._memory_runs[run.run_id] = run
+            self._memory_runs.save(run)
+    
+    async def _save_runs(self, runs: list[RunRecord]) -> None:
+        """Persist several runs."""
+        if self.ledger:
+            for run in runs:
+                await self.ledger.save_run(run)
+        else:
+            for run in runs:
+                await self._save_run(run)
     
     async def _record_event(self, run_id: str, event_type: str, data: dict | None = None) -> None:
         """Record an event."""
@@ -458,11 +722,39 @@ class Dispatcher:
         
         if self.ledger:
             await self.ledger.record_event(event)
+        elif self._is_evicted(run_id):
+            if self.spill:
+                await self.spill.record_event(event)
         else:
             if run_id not in self._memory_events:
                 self._memory_events[run_id] = []
             self._memory_events[run_id].append(event)
     
+    async def _record_events(self, items: list[tuple[str, str, dict | None]]) -> None:
+        """Record several (run_id, event_type, data) events at once."""
+        now = datetime.utcnow()
+        events = [
+            RunEvent(
+                event_id=str(uuid.uuid4()),
+                run_id=run_id,
+                event_type=event_type,
+                timestamp=now,
+                data=data or {},
+            )
+            for run_id, event_type, data in items
+        ]
+        
+        if self.ledger:
+            for event in events:
+                await self.ledger.record_event(event)
+        else:
+            for event in events:
+                if self._is_evicted(event.run_id):
+                    if self.spill:
+                        await self.spill.record_event(event)
+                else:
+                    self._memory_events.setdefault(event.run_id, []).append(event)
+    
     async def _find_by_idempotency_key(self, key: str) -> RunRecord | None:
         """Find existing run by idempotency key."""
         if self.ledger:
@@ -472,8 +764,32 @@ class Dispatcher:
         run_id = self._idempotency_index.get(key)
         if run_id:
             return self._memory_runs.get(run_id)
+        if self.spill:
+            return await self.spill.find_by_idempotency_key(key)
         return None
     
+    async def _find_run_ids_by_idempotency_keys(self, keys: set[str]) -> dict[str, str]:
+        """Resolve several idempotency keys to existing run_ids."""
+        if self.ledger:
+            resolved = {}
+            for key in keys:
+                run = await self.ledger.find_by_idempotency_key(key)
+                if run:
+                    resolved[key] = run.run_id
+            return resolved
+        
+        resolved = {
+            key: self._idempotency_index[key]
+            for key in keys
+            if key in self._idempotency_index and self._idempotency_index[key] in self._memory_runs
+        }
+        if self.spill:
+            for key in keys - resolved.keys():
+                run = await self.spill.find_by_idempotency_key(key)
+                if run:
+                    resolved[key] = run.run_id
+        return resolved
+    
     async def _sync_from_executor(self, run: RunRecord) -> None:
         """Sync run status from executor.
         
@@ -481,12 +797,25 @@ class Dispatcher:
         submit(). This method checks the executor status and updates the
         run record accordingly.
         """
+        event = await self._poll_executor(run)
+        if event:
+            await self._save_run(run)
+            await self._record_event(run.run_id, *event)
+            await self._finalize(run)
+    
+    async def _poll_executor(self, run: RunRecord) -> tuple[str, dict] | None:
+        """Apply executor status to run in place (without persisting).
+        
+        Returns:
+            (event_type, data) to record if the run reached a terminal
+            state, None otherwise
+        """
         if not run.external_ref:
-            return
+            return None
         
         # Check if executor has status method
         if not hasattr(self.executor, 'get_status'):
-            return
+            return None
         
         try:
             status = await self.executor.get_status(run.external_ref)
@@ -496,30 +825,189 @@ class Dispatcher:
                 result = None
                 if hasattr(self.executor, 'get_result'):
                     result = await self.executor.get_result(run.external_ref)
-                
-                run.mark_completed(result)
-                await self._save_run(run)
-                await self._record_event(run.run_id, EventType.COMPLETED, {
-                    "duration_seconds": run.duration_seconds,
-                })
+                return self._transition(run, status, result, None)
                 
             elif status == "failed":
-                error = "Unknown error"
+                error = None
                 if hasattr(self.executor, 'get_error'):
-                    error = await self.executor.get_error(run.external_ref) or error
-                
-                run.mark_failed(error)
-                await self._save_run(run)
-                await self._record_event(run.run_id, EventType.FAILED, {
-                    "error": error,
-                })
+                    error = await self.executor.get_error(run.external_ref)
+                return self._transition(run, status, None, error)
                 
         except Exception:
             # Executor doesn't support status checking, that's fine
             pass
+        return None
+    
+    @staticmethod
+    def _transition(
+        run: RunRecord,
+        status: str,
+        result: Any,
+        error: str | None,
+    ) -> tuple[str, dict] | None:
+        """Apply an executor-reported status to run in place.
+        
+        Returns:
+            (event_type, data) to record, or None if nothing changed
+        """
+        if run.status in TERMINAL_STATUSES:
+            return None
+        
+        if status == "running":
+            if run.status in (RunStatus.PENDING, RunStatus.QUEUED):
+                run.mark_started()
+                return EventType.STARTED, {}
+        elif status == "completed":
+            run.mark_completed(result)
+            return EventType.COMPLETED, {"duration_seconds": run.duration_seconds}
+        elif status == "failed":
+            error = error or "Unknown error"
+            run.mark_failed(error)
+            return EventType.FAILED, {"error": error}
+        elif status == "cancelled":
+            run.mark_cancelled()
+            return EventType.CANCELLED, {}
+        return None
+    
+    # --- push-based completion ---
+    
+    def _begin_submit(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._submits_in_flight += 1
+    
+    def _end_submit(self) -> None:
+        self._submits_in_flight -= 1
+        if not self._submits_in_flight:
+            # Anything left belongs to another dispatcher sharing the executor
+            self._early_updates.clear()
+    
+    def _track_ref(self, run: RunRecord) -> list[tuple]:
+        """Start routing executor updates for run.
+        
+        Returns:
+            Updates the executor reported before submit() returned the ref
+        """
+        self._ref_index[run.external_ref] = run.run_id
+        return self._early_updates.pop(run.external_ref, [])
+    
+    def _on_executor_update(
+        self,
+        external_ref: str,
+        status: str,
+        result: Any,
+        error: str | None,
+    ) -> None:
+        """Completion callback registered with the executor.
+        
+        May be called from executor worker threads; hops onto the
+        dispatcher's event loop before touching any state.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        
+        if current is loop:
+            self._route_update(external_ref, status, result, error)
+        else:
+            try:
+                loop.call_soon_threadsafe(
+                    self._route_update, external_ref, status, result, error
+                )
+            except RuntimeError:
+                pass  # Loop closed; nothing left to update
+    
+    def _route_update(
+        self,
+        external_ref: str,
+        status: str,
+        result: Any,
+        error: str | None,
+    ) -> None:
+        """Dispatch an executor update to its run (runs on the event loop)."""
+        run_id = self._ref_index.get(external_ref)
+        if run_id is None:
+            if self._submits_in_flight:
+                self._early_updates.setdefault(external_ref, []).append(
+                    (status, result, error)
+                )
+            return
+        
+        task = self._loop.create_task(
+            self._apply_executor_update(run_id, status, result, error)
+        )
+        self._update_tasks.add(task)
+        task.add_done_callback(self._update_tasks.discard)
+    
+    async def _apply_executor_update(
+        self,
+        run_id: str,
+        status: str,
+        result: Any,
+        error: str | None,
+    ) -> None:
+        """Persist an executor-pushed state change and emit its event."""
+        run = await self.get_run(run_id)
+        if not run:
+            return
+        event = self._transition(run, status, result, error)
+        if not event:
+            return
+        await self._save_run(run)
+        await self._record_event(run_id, *event)
+        if run.status in TERMINAL_STATUSES:
+            await self._finalize(run)
+    
+    async def _finalize(self, run: RunRecord) -> None:
+        """Stop tracking a finished run, wake its waiters and apply retention."""
+        if run.external_ref:
+            self._ref_index.pop(run.external_ref, None)
+        for waiter in self._waiters.pop(run.run_id, []):
+            if not waiter.done():
+                waiter.set_result(None)
+        if self._retention is not None and not self.ledger and not self._is_evicted(run.run_id):
+            for run_id in self._retention.finished(run.run_id):
+                await self._evict(run_id)
+    
+    async def _evict(self, run_id: str) -> None:
+        """Drop a finished run from memory, spilling it if configured."""
+        run = self._memory_runs.remove(run_id)
+        events = self._memory_events.pop(run_id, [])
+        if run is None:
+            return
+        if self.spill:
+            await self.spill.save_run(run)
+            for event in events:
+                await self.spill.record_event(event)
+        key = run.spec.idempotency_key
+        if key and self._idempotency_index.get(key) == run_id:
+            del self._idempotency_index[key]
+    
+    async def sweep(self) -> int:
+        """Evict finished runs past the retention age.
+        
+        Eviction otherwise only happens as runs finish; call this
+        periodically on workers that can go idle for long stretches.
+        
+        Returns:
+            Number of runs evicted
+        """
+        if self._retention is None or self.ledger:
+            return 0
+        evicted = self._retention.sweep()
+        for run_id in evicted:
+            await self._evict(run_id)
+        return len(evicted)
     
     def clear(self) -> None:
         """Clear all in-memory data (for testing)."""
         self._memory_runs.clear()
         self._memory_events.clear()
         self._idempotency_index.clear()
+        if self._retention is not None:
+            self._retention.clear()
+        self._ref_index.clear()
+        self._early_updates.clear()
@@ -8,6 +8,7 @@ Available executors:
 - LocalExecutor: ThreadPool-based (development, small-scale production)
 - CeleryExecutor: Distributed via Celery (production)
 - StubExecutor: No-op (testing dispatcher logic)
+- PriorityExecutor: Priority/lane-ordered front end for Local/Memory
 
 Example:
     >>> from spine.execution.executors import MemoryExecutor, Executor
@@ -18,17 +19,21 @@ Example:
     >>> status = await executor.get_status(ref)
 """
 
-from .protocol import Executor
+from .protocol import Executor, CompletionCallback, SupportsCompletionCallbacks
 from .memory import MemoryExecutor
 from .local import LocalExecutor
 from .stub import StubExecutor
+from .priority import PriorityExecutor
 
 # CeleryExecutor is optional (requires celery package)
 __all__ = [
     "Executor",
+    "CompletionCallback",
+    "SupportsCompletionCallbacks",
     "MemoryExecutor",
     "LocalExecutor",
     "StubExecutor",
+    "PriorityExecutor",
 ]
 
 try:
@@ -1,18 +1,23 @@
-"""Local threadpool executor for development and small-scale production.
+"""Local pool executor for development and small-scale production.
 
-This executor uses Python's ThreadPoolExecutor for concurrent execution.
-It's good for development and small-scale production when you don't want
-the overhead of Celery.
+This executor uses Python's ThreadPoolExecutor (or, in process mode, a
+ProcessPoolExecutor) for concurrent execution. Coroutine handlers run
+directly on the event loop. It's good for development and small-scale
+production when you don't want the overhead of Celery.
 """
 import asyncio
+import inspect
 import uuid
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Dict, Callable, Any
+from concurrent.futures import Executor as PoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal
+from ..retention import RetentionPolicy, RetentionTracker
 from ..spec import WorkSpec
+from .protocol import CompletionCallback
 
 
 class LocalExecutor:
-    """ThreadPoolExecutor-based executor.
+    """Pool-based executor with thread and process modes.
     
     Good for:
     - Development
@@ -23,6 +28,12 @@ class LocalExecutor:
     - Async/non-blocking submission
     - Configurable worker count
     - Cancellation support (for pending work)
+    - Coroutine handlers run on the event loop (no pool thread)
+    - ``mode="process"`` runs sync handlers on a ProcessPoolExecutor,
+      sidestepping the GIL for CPU-bound work (parsing, hashing)
+    
+    In process mode handlers and their params/results must be picklable,
+    i.e. module-level functions rather than lambdas or closures.
     
     Example:
         >>> def process_data(params):
@@ -31,23 +42,38 @@ class LocalExecutor:
         >>> executor = LocalExecutor(max_workers=4)
         >>> executor.register_handler("task", "process", process_data)
         >>> ref = await executor.submit(task_spec("process", {"data": [1,2,3]}))
+        >>> result = await executor.result_future(ref)
     """
     
     def __init__(
         self,
         max_workers: int = 4,
-        handlers: Dict[str, Callable] | None = None
+        handlers: Dict[str, Callable] | None = None,
+        mode: Literal["thread", "process"] = "thread",
+        retention: RetentionPolicy | None = None,
     ):
         """Initialize with worker pool.
         
         Args:
-            max_workers: ThreadPool size (default: 4)
+            max_workers: Pool size (default: 4)
             handlers: Map of "kind:name" -> handler function
+            mode: "thread" (ThreadPoolExecutor) or "process"
+                (ProcessPoolExecutor) for sync handlers
+            retention: Limits on finished work kept (unbounded if None)
         """
-        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown LocalExecutor mode: {mode!r}")
+        self.mode = mode
+        self.pool: PoolExecutor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if mode == "process"
+            else ThreadPoolExecutor(max_workers=max_workers)
+        )
         self.handlers = handlers or {}
-        self._futures: Dict[str, Future] = {}
+        self._futures: Dict[str, Future | asyncio.Future] = {}
         self._results: Dict[str, Any] = {}
+        self._callbacks: list[CompletionCallback] = []
+        self._retention = RetentionTracker(retention) if retention else None
     
     def register_handler(self, kind: str, name: str, handler: Callable) -> None:
         """Register a handler at runtime.
@@ -55,16 +81,26 @@ class LocalExecutor:
         Args:
             kind: Work kind (task, pipeline, workflow, step)
             name: Handler name
-            handler: Callable(params: dict) -> Any (sync only for ThreadPool)
+            handler: Callable(params: dict) -> Any, or an async function
+                (must be picklable in process mode)
         """
         key = f"{kind}:{name}"
         self.handlers[key] = handler
     
+    def add_completion_callback(self, callback: CompletionCallback) -> None:
+        """Register a callback for run state changes.
+        
+        Called with "running" when a worker picks the work up (thread and
+        coroutine handlers only), then with "completed", "failed" or
+        "cancelled". May be invoked from pool threads.
+        """
+        self._callbacks.append(callback)
+    
     async def submit(self, spec: WorkSpec) -> str:
-        """Submit work to thread pool.
+        """Submit work to the pool (or the event loop for coroutines).
         
-        Work is queued in the thread pool and a reference is returned
-        immediately. Use get_status() to check progress.
+        Work is queued and a reference is returned immediately. Use
+        get_status() or await result_future() to follow progress.
         
         Raises:
             ValueError: If no handler registered for spec.kind:spec.name
@@ -78,27 +114,90 @@ class LocalExecutor:
         
         handler = self.handlers[handler_key]
         
-        # Create wrapper to capture result
-        def run_and_capture():
-            try:
-                result = handler(spec.params)
-                self._results[external_ref] = {"status": "completed", "result": result}
-                return result
-            except Exception as e:
-                self._results[external_ref] = {"status": "failed", "error": str(e)}
-                raise
-        
-        # Submit to thread pool
-        future = self.pool.submit(run_and_capture)
+        if inspect.iscoroutinefunction(handler):
+            future = asyncio.get_running_loop().create_task(
+                self._run_async(external_ref, handler, spec.params)
+            )
+        elif self.mode == "process":
+            future = self.pool.submit(handler, spec.params)
+        else:
+            future = self.pool.submit(self._run_sync, external_ref, handler, spec.params)
+        
         self._futures[external_ref] = future
+        future.add_done_callback(lambda f: self._on_done(external_ref, f))
         
         return external_ref
     
+    async def submit_many(self, specs: list[WorkSpec]) -> list[str]:
+        """Submit a batch of work to the pool.
+        
+        All handlers are resolved before anything is queued, so a
+        missing handler rejects the whole batch without side effects.
+        
+        Raises:
+            ValueError: If any spec has no registered handler
+        """
+        missing = {
+            f"{spec.kind}:{spec.name}" for spec in specs
+            if f"{spec.kind}:{spec.name}" not in self.handlers
+        }
+        if missing:
+            raise ValueError(f"No handler for {', '.join(sorted(missing))}")
+        return [await self.submit(spec) for spec in specs]
+    
+    def _run_sync(self, external_ref: str, handler: Callable, params: dict) -> Any:
+        """Thread-pool wrapper that reports the start of execution."""
+        self._notify(external_ref, "running")
+        return handler(params)
+    
+    async def _run_async(self, external_ref: str, handler: Callable, params: dict) -> Any:
+        """Event-loop wrapper for coroutine handlers."""
+        self._notify(external_ref, "running")
+        return await handler(params)
+    
+    def _on_done(self, external_ref: str, future: Future | asyncio.Future) -> None:
+        """Capture the outcome of a finished future and notify callbacks."""
+        if future.cancelled():
+            self._results[external_ref] = {"status": "cancelled"}
+            self._notify(external_ref, "cancelled")
+        elif future.exception() is not None:
+            error = str(future.exception())
+            self._results[external_ref] = {"status": "failed", "error": error}
+            self._notify(external_ref, "failed", error=error)
+        else:
+            result = future.result()
+            self._results[external_ref] = {"status": "completed", "result": result}
+            self._notify(external_ref, "completed", result=result)
+        
+        if self._retention is not None:
+            for ref in self._retention.finished(external_ref):
+                self._futures.pop(ref, None)
+                self._results.pop(ref, None)
+    
+    def _lookup(self, external_ref: str) -> Future | asyncio.Future | None:
+        """Future for a ref, marking finished work recently used."""
+        future = self._futures.get(external_ref)
+        if future is not None and self._retention is not None:
+            self._retention.touch(external_ref)
+        return future
+    
+    def _notify(
+        self,
+        external_ref: str,
+        status: str,
+        result: Any = None,
+        error: str | None = None,
+    ) -> None:
+        """Push a state change to registered callbacks."""
+        for callback in self._callbacks:
+            callback(external_ref, status, result, error)
+    
     async def cancel(self, external_ref: str) -> bool:
         """Cancel pending/running work.
         
-        Note: Only pending (not yet started) work can be cancelled.
-        Running work will continue to completion.
+        Note: Only pending (not yet started) pool work can be cancelled;
+        running pool work continues to completion. Coroutine handlers are
+        cancelled at their next await.
         """
         future = self._futures.get(external_ref)
         if not future:
@@ -107,7 +206,7 @@ class LocalExecutor:
     
     async def get_status(self, external_ref: str) -> str | None:
         """Get status from future state."""
-        future = self._futures.get(external_ref)
+        future = self._lookup(external_ref)
         if not future:
             return None
         
@@ -115,45 +214,60 @@ class LocalExecutor:
             return "cancelled"
         elif future.done():
             return "completed" if not future.exception() else "failed"
-        elif future.running():
+        elif isinstance(future, asyncio.Future) or future.running():
             return "running"
         else:
             return "queued"
     
+    def result_future(self, external_ref: str) -> asyncio.Future | None:
+        """Awaitable for the handler's result.
+        
+        Pool futures are bridged with ``asyncio.wrap_future``, so awaiting
+        never blocks the event loop. Awaiting raises the handler's
+        exception if it failed.
+        
+        Returns:
+            asyncio.Future resolving to the result, or None if unknown ref
+        """
+        future = self._lookup(external_ref)
+        if future is None:
+            return None
+        if isinstance(future, asyncio.Future):
+            return future
+        return asyncio.wrap_future(future)
+    
     async def get_result(self, external_ref: str, timeout: float | None = None) -> Any:
         """Get result, optionally waiting for completion.
         
         Args:
             external_ref: Runtime identifier
             timeout: Max seconds to wait (None = don't wait)
-            
+        
         Returns:
             Result if completed, None otherwise
-            
+        
         Raises:
             TimeoutError: If timeout exceeded while waiting
         """
-        future = self._futures.get(external_ref)
+        future = self._lookup(external_ref)
         if not future:
             return None
         
-        if timeout is not None:
-            # Wait for completion
-            loop = asyncio.get_event_loop()
-            try:
-                await asyncio.wait_for(
-                    loop.run_in_executor(None, future.result, timeout),
-                    timeout=timeout
-                )
-            except asyncio.TimeoutError:
+        if timeout is not None and not future.done():
+            # Wait without cancelling the work if the timeout expires
+            waiter = self.result_future(external_ref)
+            done, _ = await asyncio.wait({waiter}, timeout=timeout)
+            if not done:
+                waiter.add_done_callback(_consume_outcome)
                 raise TimeoutError(f"Waiting for {external_ref} exceeded {timeout}s")
+            waiter.result()
         
-        if future.done() and not future.exception():
+        if future.done() and not future.cancelled() and not future.exception():
             return future.result()
         return None
     
     def shutdown(self, wait: bool = True) -> None:
-        """Shutdown thread pool.
+        """Shutdown the worker pool.
         
         Args:
             wait: If True, wait for pending work to complete
@@ -165,3 +279,9 @@ class LocalExecutor:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.shutdown(wait=True)
+
+
+def _consume_outcome(future: asyncio.Future) -> None:
+    """Mark an abandoned waiter's exception as retrieved."""
+    if not future.cancelled():
+        future.exception()
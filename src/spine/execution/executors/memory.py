@@ -7,7 +7,9 @@ import asyncio
 import inspect
 import uuid
 from typing import Dict, Any, Callable
+from ..retention import RetentionPolicy, RetentionTracker
 from ..spec import WorkSpec
+from .protocol import CompletionCallback
 
 
 class MemoryExecutor:
@@ -29,15 +31,22 @@ class MemoryExecutor:
         >>> status = await executor.get_status(ref)  # "completed"
     """
     
-    def __init__(self, handlers: Dict[str, Callable] | None = None):
+    def __init__(
+        self,
+        handlers: Dict[str, Callable] | None = None,
+        retention: RetentionPolicy | None = None,
+    ):
         """Initialize with optional handler map.
         
         Args:
             handlers: Map of "kind:name" -> handler function.
                       Handler receives (params: dict) and returns result.
+            retention: Limits on finished runs kept (unbounded if None)
         """
         self.handlers = handlers or {}
         self._runs: Dict[str, Dict[str, Any]] = {}  # external_ref -> run data
+        self._callbacks: list[CompletionCallback] = []
+        self._retention = RetentionTracker(retention) if retention else None
     
     def register_handler(self, kind: str, name: str, handler: Callable) -> None:
         """Register a handler at runtime.
@@ -50,6 +59,14 @@ class MemoryExecutor:
         key = f"{kind}:{name}"
         self.handlers[key] = handler
     
+    def add_completion_callback(self, callback: CompletionCallback) -> None:
+        """Register a callback invoked when each run finishes.
+        
+        Runs finish inside submit(), so callbacks fire before submit()
+        returns the external_ref.
+        """
+        self._callbacks.append(callback)
+    
     async def submit(self, spec: WorkSpec) -> str:
         """Run work immediately in current process.
         
@@ -66,6 +83,7 @@ class MemoryExecutor:
                 "error": f"No handler for {handler_key}",
                 "result": None,
             }
+            self._notify(external_ref)
             return external_ref
         
         # Execute
@@ -88,8 +106,32 @@ class MemoryExecutor:
                 "result": None,
             }
         
+        self._notify(external_ref)
         return external_ref
     
+    async def submit_many(self, specs: list[WorkSpec]) -> list[str]:
+        """Run a batch of work in order, returning one ref per spec.
+        
+        Handler failures are recorded per ref, so the batch never raises.
+        """
+        return [await self.submit(spec) for spec in specs]
+    
+    def _notify(self, external_ref: str) -> None:
+        """Push the final state of a run to registered callbacks."""
+        run_data = self._runs[external_ref]
+        for callback in self._callbacks:
+            callback(external_ref, run_data["status"], run_data["result"], run_data["error"])
+        if self._retention is not None:
+            for ref in self._retention.finished(external_ref):
+                self._runs.pop(ref, None)
+    
+    def _lookup(self, external_ref: str) -> Dict[str, Any] | None:
+        """Run data for a ref, marking it recently used."""
+        run_data = self._runs.get(external_ref)
+        if run_data is not None and self._retention is not None:
+            self._retention.touch(external_ref)
+        return run_data
+    
     async def cancel(self, external_ref: str) -> bool:
         """Not supported for synchronous execution.
         
@@ -99,19 +141,21 @@ class MemoryExecutor:
     
     async def get_status(self, external_ref: str) -> str | None:
         """Get status from in-memory cache."""
-        run_data = self._runs.get(external_ref)
+        run_data = self._lookup(external_ref)
         return run_data["status"] if run_data else None
     
     async def get_result(self, external_ref: str) -> Any:
         """Get result from in-memory cache (MemoryExecutor-specific)."""
-        run_data = self._runs.get(external_ref)
+        run_data = self._lookup(external_ref)
         return run_data.get("result") if run_data else None
     
     async def get_error(self, external_ref: str) -> str | None:
         """Get error from in-memory cache (MemoryExecutor-specific)."""
-        run_data = self._runs.get(external_ref)
+        run_data = self._lookup(external_ref)
         return run_data.get("error") if run_data else None
     
     def clear(self) -> None:
         """Clear all run data (for testing)."""
         self._runs.clear()
+        if self._retention is not None:
+            self._retention.clear()
@@ -0,0 +1,262 @@
+"""Priority-ordered front end for in-process executors.
+
+LocalExecutor and MemoryExecutor start work in submission order. This
+wrapper holds submitted work in a PriorityScheduler and only hands it to
+the wrapped executor while fewer than ``max_in_flight`` items are
+running, so queued work is ordered by lane weight and priority instead
+of arrival.
+"""
+import asyncio
+import threading
+import uuid
+from typing import Any
+
+from ..retention import RetentionPolicy, RetentionTracker
+from ..scheduler import PRIORITY_LEVELS, PriorityScheduler
+from ..spec import WorkSpec
+from .protocol import CompletionCallback, Executor, SupportsCompletionCallbacks
+
+_TERMINAL = frozenset({"completed", "failed", "cancelled"})
+
+
+class PriorityExecutor:
+    """Executor wrapper that dispatches queued work by priority.
+
+    The wrapped executor must push completion (LocalExecutor,
+    MemoryExecutor) so slots are freed as soon as work finishes. Set
+    ``max_in_flight`` to the wrapped executor's worker count: anything
+    above that just recreates the FIFO backlog inside its pool.
+
+    Example:
+        >>> executor = PriorityExecutor(
+        ...     LocalExecutor(max_workers=8),
+        ...     max_in_flight=8,
+        ...     lane_weights={"interactive": 4, "backfill": 1},
+        ... )
+        >>> dispatcher = Dispatcher(executor=executor)
+        >>> await dispatcher.submit_pipeline("nightly.bulk", {}, lane="backfill", priority="low")
+        >>> await dispatcher.submit_pipeline("adhoc.backfill", {}, lane="interactive", priority="high")
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_in_flight: int = 4,
+        scheduler: PriorityScheduler | None = None,
+        lane_weights: dict[str, float] | None = None,
+        aging_seconds: float = 30.0,
+        retention: RetentionPolicy | None = None,
+    ):
+        """Initialize wrapper.
+
+        Args:
+            executor: Executor that runs dispatched work
+            max_in_flight: Max items handed to the executor at once
+            scheduler: Pre-configured scheduler (overrides lane_weights
+                and aging_seconds)
+            lane_weights: Relative dispatch share per lane
+            aging_seconds: Wait that offsets one priority level
+            retention: Limits on finished refs kept (unbounded if None)
+
+        Raises:
+            TypeError: If executor does not support completion callbacks
+        """
+        if not isinstance(executor, SupportsCompletionCallbacks):
+            raise TypeError(
+                f"{type(executor).__name__} does not push completion; "
+                "PriorityExecutor needs add_completion_callback()"
+            )
+        self.executor = executor
+        self.max_in_flight = max(max_in_flight, 1)
+        self.scheduler = scheduler or PriorityScheduler(
+            lane_weights=lane_weights, aging_seconds=aging_seconds,
+        )
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._inner_refs: dict[str, str] = {}
+        self._outer_refs: dict[str, str] = {}
+        self._early: dict[str, list[tuple[str, Any, str | None]]] = {}
+        self._finished: dict[str, str] = {}
+        self._callbacks: list[CompletionCallback] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._drain_task: asyncio.Task | None = None
+        self._retention = RetentionTracker(retention) if retention else None
+
+        executor.add_completion_callback(self._on_inner_update)
+
+    def add_completion_callback(self, callback: CompletionCallback) -> None:
+        """Register a callback for run state changes.
+
+        Updates from the wrapped executor are forwarded under this
+        executor's refs. Work cancelled while still queued reports
+        "cancelled".
+        """
+        self._callbacks.append(callback)
+
+    async def submit(self, spec: WorkSpec) -> str:
+        """Queue work and dispatch whatever fits in the in-flight window.
+
+        Raises:
+            ValueError: If spec.priority is unknown
+        """
+        ref = self._enqueue(spec)
+        await self._drain()
+        return ref
+
+    async def submit_many(self, specs: list[WorkSpec]) -> list[str]:
+        """Queue a batch, then dispatch once, so the batch is ordered
+        by priority rather than list position.
+
+        Priorities are checked before anything is queued, so an unknown
+        priority rejects the whole batch without side effects.
+
+        Raises:
+            ValueError: If any spec.priority is unknown
+        """
+        unknown = {spec.priority for spec in specs if spec.priority not in PRIORITY_LEVELS}
+        if unknown:
+            raise ValueError(f"Unknown priority: {', '.join(sorted(map(repr, unknown)))}")
+        refs = [self._enqueue(spec) for spec in specs]
+        await self._drain()
+        return refs
+
+    def _enqueue(self, spec: WorkSpec) -> str:
+        self._loop = asyncio.get_running_loop()
+        ref = f"prio-{uuid.uuid4().hex[:8]}"
+        with self._lock:
+            self.scheduler.push(ref, spec, priority=spec.priority, lane=spec.lane)
+        return ref
+
+    async def _drain(self) -> None:
+        """Hand queued work to the executor until the window is full."""
+        while True:
+            with self._lock:
+                if self._in_flight >= self.max_in_flight:
+                    return
+                entry = self.scheduler.pop()
+                if entry is None:
+                    return
+                self._in_flight += 1
+
+            ref, spec = entry
+            try:
+                inner_ref = await self.executor.submit(spec)
+            except Exception as e:
+                self._apply(ref, "failed", None, str(e))
+                continue
+
+            with self._lock:
+                self._inner_refs[ref] = inner_ref
+                self._outer_refs[inner_ref] = ref
+                early = self._early.pop(inner_ref, [])
+            for status, result, error in early:
+                self._apply(ref, status, result, error)
+
+    def _on_inner_update(
+        self,
+        inner_ref: str,
+        status: str,
+        result: Any = None,
+        error: str | None = None,
+    ) -> None:
+        """Completion callback registered on the wrapped executor."""
+        with self._lock:
+            ref = self._outer_refs.get(inner_ref)
+            if ref is None:
+                # Finished inside submit() before the ref was recorded
+                self._early.setdefault(inner_ref, []).append((status, result, error))
+                return
+        self._apply(ref, status, result, error)
+
+    def _apply(self, ref: str, status: str, result: Any, error: str | None) -> None:
+        """Forward an update; free the slot on terminal states."""
+        if status in _TERMINAL:
+            with self._lock:
+                if ref in self._finished:
+                    return
+                self._finished[ref] = status
+                self._in_flight -= 1
+                inner_ref = self._inner_refs.get(ref)
+                if inner_ref is not None:
+                    # No further updates are expected for this ref
+                    self._outer_refs.pop(inner_ref, None)
+            self._wake()
+        for callback in self._callbacks:
+            callback(ref, status, result, error)
+        if status in _TERMINAL:
+            self._retire(ref)
+
+    def _retire(self, ref: str) -> None:
+        """Apply the retention policy after ref finished."""
+        if self._retention is None:
+            return
+        evicted = self._retention.finished(ref)
+        with self._lock:
+            for old in evicted:
+                self._finished.pop(old, None)
+                self._inner_refs.pop(old, None)
+
+    def _wake(self) -> None:
+        """Schedule a drain on the event loop (safe from any thread)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._start_drain)
+
+    def _start_drain(self) -> None:
+        # A drain that is mid-submit re-checks the window before its next
+        # pop, so only start one if none is running
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def cancel(self, external_ref: str) -> bool:
+        """Cancel queued work, or delegate to the executor once dispatched."""
+        with self._lock:
+            removed = self.scheduler.discard(external_ref)
+            if removed:
+                self._finished[external_ref] = "cancelled"
+            inner_ref = self._inner_refs.get(external_ref)
+        if removed:
+            for callback in self._callbacks:
+                callback(external_ref, "cancelled", None, None)
+            self._retire(external_ref)
+            return True
+        if inner_ref is None:
+            return False
+        return await self.executor.cancel(inner_ref)
+
+    async def get_status(self, external_ref: str) -> str | None:
+        """"queued" while waiting in the scheduler, then the executor's status."""
+        with self._lock:
+            if external_ref in self.scheduler:
+                return "queued"
+            inner_ref = self._inner_refs.get(external_ref)
+            finished = self._finished.get(external_ref)
+        if finished is not None and self._retention is not None:
+            self._retention.touch(external_ref)
+        if inner_ref is None:
+            return finished
+        return await self.executor.get_status(inner_ref)
+
+    async def get_result(self, external_ref: str, timeout: float | None = None) -> Any:
+        """Result from the wrapped executor, if it exposes get_result."""
+        inner_ref = self._inner_refs.get(external_ref)
+        get_result = getattr(self.executor, "get_result", None)
+        if inner_ref is None or get_result is None:
+            return None
+        if timeout is None:
+            return await get_result(inner_ref)
+        return await get_result(inner_ref, timeout=timeout)
+
+    @property
+    def queued(self) -> int:
+        """Number of items waiting in the scheduler."""
+        with self._lock:
+            return len(self.scheduler)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of items handed to the executor and not yet finished."""
+        with self._lock:
+            return self._in_flight
@@ -6,10 +6,18 @@ the interface is the same.
 
 The Executor is THE ONLY "backend" concept in spine-core.
 """
-from typing import Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
 from ..spec import WorkSpec
 
 
+CompletionCallback = Callable[[str, str, Any, "str | None"], None]
+"""Callback(external_ref, status, result, error) pushed by executors.
+
+status is one of "running", "completed", "failed", "cancelled". Executors
+may invoke callbacks from worker threads; receivers must be thread-safe.
+"""
+
+
 @runtime_checkable
 class Executor(Protocol):
     """Executor adapter - how work gets executed.
@@ -21,6 +29,13 @@ class Executor(Protocol):
     - Submit work to the underlying runtime
     - Return an external_ref for tracking
     - Optionally: cancel, get status (if runtime supports)
+    - Optionally: ``submit_many(specs) -> list[str]`` to accept a whole
+      batch at once (used by ``Dispatcher.submit_many``). It must return
+      one ref per spec in input order, and may only raise before any
+      spec has been queued: validate the whole batch up front, since the
+      Dispatcher resubmits specs individually when the batch is rejected
+    - Optionally: ``add_completion_callback(cb)`` to push state changes
+      instead of being polled (see ``SupportsCompletionCallbacks``)
     
     Example implementation:
         >>> class MyExecutor:
@@ -74,3 +89,28 @@ class Executor(Protocol):
             Runtime-specific status string, or None if not available
         """
         ...
+
+
+@runtime_checkable
+class SupportsCompletionCallbacks(Protocol):
+    """Executors that push completion instead of being polled.
+    
+    The Dispatcher registers a callback at construction time. When work
+    starts or finishes, the executor calls it with the external_ref and
+    new status, so run records update without get_status round-trips.
+    
+    Example:
+        >>> executor = LocalExecutor()
+        >>> executor.add_completion_callback(
+        ...     lambda ref, status, result, error: print(ref, status)
+        ... )
+    """
+    
+    def add_completion_callback(self, callback: CompletionCallback) -> None:
+        """Register a callback for run state changes.
+        
+        Args:
+            callback: Called as callback(external_ref, status, result, error).
+                May be invoked from a worker thread.
+        """
+        ...
@@ -42,6 +42,11 @@ class StubExecutor:
         self._submitted.append(spec)
         return f"stub-{uuid.uuid4().hex[:8]}"
     
+    async def submit_many(self, specs: list[WorkSpec]) -> list[str]:
+        """Return one fake external_ref per spec without executing."""
+        self._submitted.extend(specs)
+        return [f"stub-{uuid.uuid4().hex[:8]}" for _ in specs]
+    
     async def cancel(self, external_ref: str) -> bool:
         """Always succeeds (no-op)."""
         return True
@@ -172,6 +172,12 @@ def create_runs_router(
         >>> app = FastAPI()
         >>> dispatcher = Dispatcher(executor=LocalExecutor())
         >>> app.include_router(create_runs_router(dispatcher))
+        >>>
+        >>> # Long-lived workers: bound what stays in memory
+        >>> policy = RetentionPolicy(max_runs=50_000, max_age_seconds=3600)
+        >>> dispatcher = Dispatcher(
+        ...     executor=LocalExecutor(retention=policy), retention=policy,
+        ... )
         
     Endpoints:
         GET  /runs              - List runs with filters
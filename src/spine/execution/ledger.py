@@ -12,11 +12,21 @@ Example:
     >>> execution = Execution.create(pipeline="finra.otc.ingest")
     >>> ledger.create_execution(execution)
     >>> ledger.record_event(execution.id, EventType.STARTED)
+    >>>
+    >>> # Write-behind: group many writes into one transaction
+    >>> with ledger.batch():
+    ...     for i in range(1000):
+    ...         ledger.record_event(execution.id, EventType.PROGRESS, {"i": i})
 """
 
 import json
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Generator
 
 from .models import (
     Execution,
@@ -40,15 +50,121 @@ class ExecutionLedger:
     - Events (record, list by execution)
     
     Works with SQLite (sqlite3 connection) or PostgreSQL (psycopg connection).
+    
+    Writes normally commit one statement at a time. In buffered mode
+    (``buffered=True`` or inside ``batch()``) inserts and updates are
+    queued and written with ``executemany`` in a single transaction when
+    ``flush_size`` writes are pending, when the oldest pending write is
+    ``flush_interval`` seconds old, on ``flush()``, on context exit, or
+    before any read. Batches may overlap (concurrent tracked executions,
+    BatchExecutor threads): the ledger stays buffered until the last open
+    batch exits.
     """
 
-    def __init__(self, conn):
+    def __init__(
+        self,
+        conn,
+        *,
+        buffered: bool = False,
+        flush_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
         """Initialize with a database connection.
         
         Args:
             conn: Database connection (sqlite3.Connection or psycopg.Connection)
+            buffered: Queue writes and commit them in batches
+            flush_size: Flush once this many writes are pending
+            flush_interval: Flush once the oldest pending write is this
+                many seconds old (checked on each write)
         """
         self._conn = conn
+        self._buffered = buffered
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._pending: list[tuple[str, tuple]] = []
+        self._pending_since = 0.0
+
+    def __enter__(self) -> "ExecutionLedger":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()
+
+    # =========================================================================
+    # WRITE-BEHIND BUFFER
+    # =========================================================================
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of buffered writes not yet committed."""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """Write all buffered statements in one transaction.
+        
+        Consecutive writes of the same statement are sent with a single
+        ``executemany``. On error the transaction is rolled back and the
+        buffer is discarded.
+        
+        Returns:
+            Number of writes flushed
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, []
+        cursor = self._conn.cursor()
+        try:
+            for sql, group in groupby(pending, key=itemgetter(0)):
+                cursor.executemany(sql, [params for _, params in group])
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        return len(pending)
+
+    @contextmanager
+    def batch(self) -> Generator["ExecutionLedger", None, None]:
+        """Buffer writes for the duration of the block, then flush.
+        
+        Example:
+            >>> with ledger.batch():
+            ...     ledger.update_status(execution.id, ExecutionStatus.RUNNING)
+            ...     ledger.record_event(execution.id, EventType.PROGRESS, {"pct": 50})
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+            self.flush()
+
+    def _write(self, sql: str, params: tuple) -> None:
+        """Execute and commit a write, or queue it when buffered."""
+        due = False
+        with self._lock:
+            buffered = self._buffered or self._batch_depth > 0
+            if buffered:
+                now = time.monotonic()
+                if not self._pending:
+                    self._pending_since = now
+                self._pending.append((sql, params))
+                due = (
+                    len(self._pending) >= self.flush_size
+                    or now - self._pending_since >= self.flush_interval
+                )
+
+        if not buffered:
+            cursor = self._conn.cursor()
+            cursor.execute(sql, params)
+            self._conn.commit()
+        elif due:
+            self.flush()
 
     # =========================================================================
     # EXECUTION CRUD
@@ -63,8 +179,7 @@ class ExecutionLedger:
         Returns:
             The same execution (for chaining)
         """
-        cursor = self._conn.cursor()
-        cursor.execute(
+        self._write(
             """
             INSERT INTO core_executions (
                 id, pipeline, params, status, lane, trigger_source,
@@ -84,7 +199,6 @@ class ExecutionLedger:
                 execution.idempotency_key,
             ),
         )
-        self._conn.commit()
 
         # Record creation event
         self.record_event(execution.id, EventType.CREATED, {"pipeline": execution.pipeline})
@@ -99,6 +213,7 @@ class ExecutionLedger:
         Returns:
             Execution or None if not found
         """
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute(
             """
@@ -124,6 +239,7 @@ class ExecutionLedger:
         Returns:
             Execution or None if not found
         """
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute(
             """
@@ -155,12 +271,11 @@ class ExecutionLedger:
             result: Optional result data (for COMPLETED)
             error: Optional error message (for FAILED)
         """
-        cursor = self._conn.cursor()
         now = utcnow()
 
         # Determine which timestamp to update
         if status == ExecutionStatus.RUNNING:
-            cursor.execute(
+            self._write(
                 """
                 UPDATE core_executions
                 SET status = ?, started_at = ?
@@ -169,7 +284,7 @@ class ExecutionLedger:
                 (status.value, now.isoformat(), execution_id),
             )
         elif status in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED, ExecutionStatus.CANCELLED):
-            cursor.execute(
+            self._write(
                 """
                 UPDATE core_executions
                 SET status = ?, completed_at = ?, result = ?, error = ?
@@ -184,7 +299,7 @@ class ExecutionLedger:
                 ),
             )
         else:
-            cursor.execute(
+            self._write(
                 """
                 UPDATE core_executions
                 SET status = ?
@@ -193,8 +308,6 @@ class ExecutionLedger:
                 (status.value, execution_id),
             )
 
-        self._conn.commit()
-
         # Record event - map status to corresponding event type
         status_to_event = {
             ExecutionStatus.PENDING: EventType.CREATED,
@@ -217,6 +330,7 @@ class ExecutionLedger:
         Returns:
             New retry count
         """
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute(
             """
@@ -257,6 +371,7 @@ class ExecutionLedger:
         Returns:
             List of Execution objects
         """
+        self.flush()
         cursor = self._conn.cursor()
 
         query = """
@@ -305,8 +420,7 @@ class ExecutionLedger:
             Created ExecutionEvent
         """
         event = ExecutionEvent.create(execution_id, event_type, data)
-        cursor = self._conn.cursor()
-        cursor.execute(
+        self._write(
             """
             INSERT INTO core_execution_events (id, execution_id, event_type, timestamp, data)
             VALUES (?, ?, ?, ?, ?)
@@ -319,7 +433,6 @@ class ExecutionLedger:
                 json.dumps(event.data),
             ),
         )
-        self._conn.commit()
         return event
 
     def get_events(self, execution_id: str) -> list[ExecutionEvent]:
@@ -331,6 +444,7 @@ class ExecutionLedger:
         Returns:
             List of ExecutionEvent objects in chronological order
         """
+        self.flush()
         cursor = self._conn.cursor()
         cursor.execute(
             """
@@ -0,0 +1,124 @@
+"""Retention of finished runs held in memory.
+
+The Dispatcher (without a ledger) and the in-process executors keep
+every run they have seen, so long-lived workers grow without bound. A
+``RetentionPolicy`` caps what is kept once work has finished:
+
+- ``max_runs``: at most this many finished entries; the least recently
+  used are evicted first
+- ``max_age_seconds``: finished entries idle (not finished or read) for
+  longer than this are evicted
+
+Runs that are still pending or running are never evicted. The same
+policy object can be passed to ``Dispatcher``, ``MemoryExecutor``,
+``LocalExecutor`` and ``PriorityExecutor``; each tracks its own entries
+with a ``RetentionTracker``.
+
+Example:
+    >>> policy = RetentionPolicy(max_runs=10_000, max_age_seconds=3600)
+    >>> executor = LocalExecutor(max_workers=8, retention=policy)
+    >>> dispatcher = Dispatcher(executor=executor, retention=policy, spill=run_ledger)
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Limits on finished entries kept in memory.
+
+    Attributes:
+        max_runs: Max finished entries retained (None = unlimited)
+        max_age_seconds: Max idle time of a finished entry (None = forever)
+    """
+
+    max_runs: int | None = None
+    max_age_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_runs is not None and self.max_runs < 0:
+            raise ValueError("max_runs must be >= 0")
+        if self.max_age_seconds is not None and self.max_age_seconds < 0:
+            raise ValueError("max_age_seconds must be >= 0")
+
+
+class RetentionTracker:
+    """LRU of finished keys that reports which ones to evict.
+
+    Thread-safe: executors report completion from pool threads.
+
+    Example:
+        >>> tracker = RetentionTracker(RetentionPolicy(max_runs=2))
+        >>> tracker.finished("a"), tracker.finished("b"), tracker.finished("c")
+        ([], [], ['a'])
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.policy = policy
+        self._clock = clock
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def finished(self, key: str) -> list[str]:
+        """Record that key reached a terminal state.
+
+        Returns:
+            Keys to evict now (may include key itself if max_runs is 0)
+        """
+        with self._lock:
+            self._entries[key] = self._clock()
+            self._entries.move_to_end(key)
+            return self._expire()
+
+    def touch(self, key: str) -> None:
+        """Mark a finished key as recently used."""
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = self._clock()
+                self._entries.move_to_end(key)
+
+    def discard(self, key: str) -> None:
+        """Stop tracking key (removed by other means)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def sweep(self) -> list[str]:
+        """Evict by age without a new completion (e.g. on a timer).
+
+        Returns:
+            Keys to evict
+        """
+        with self._lock:
+            return self._expire()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _expire(self) -> list[str]:
+        evicted: list[str] = []
+        entries = self._entries
+        max_runs = self.policy.max_runs
+        if max_runs is not None:
+            while len(entries) > max_runs:
+                evicted.append(entries.popitem(last=False)[0])
+        max_age = self.policy.max_age_seconds
+        if max_age is not None and entries:
+            cutoff = self._clock() - max_age
+            while entries:
+                key, last_used = next(iter(entries.items()))
+                if last_used > cutoff:
+                    break
+                del entries[key]
+                evicted.append(key)
+        return evicted
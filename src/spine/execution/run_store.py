@@ -0,0 +1,275 @@
+"""Indexed in-memory run store.
+
+The Dispatcher keeps runs in memory when no persistent ledger is
+configured. A plain dict forces every ``list_runs`` call to copy all
+records, filter them linearly and sort them by ``created_at``. This
+module provides ``MemoryRunStore``, which maintains secondary indexes so
+filtered, paginated listing only touches the runs it returns.
+
+Indexes maintained:
+- kind, name, parent_run_id: buckets ordered by ``created_at``
+  (these fields never change after creation)
+- status: unordered membership buckets, re-indexed on every save
+- a global ``created_at``-ordered index of all runs
+
+Example:
+    >>> store = MemoryRunStore()
+    >>> store.save(run)
+    >>> store.query(kind="pipeline", status=RunStatus.FAILED, limit=20)
+"""
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterator
+
+from .runs import RunRecord, RunStatus
+
+
+class _CreatedIndex:
+    """Run IDs ordered by (created_at, insertion sequence).
+
+    Runs are almost always saved in creation order, so inserts are
+    amortized O(1) appends; out-of-order inserts fall back to bisect.
+    Removal tombstones the slot in O(log N) and the lists are compacted
+    once tombstones outnumber live entries, so retention sweeps that
+    evict runs one at a time stay linear overall.
+    """
+
+    __slots__ = ("_keys", "_ids", "_dead")
+
+    #: Tombstones tolerated before compaction regardless of live size
+    COMPACT_MIN = 64
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[datetime, int]] = []
+        self._ids: list[str | None] = []
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._ids) - self._dead
+
+    def add(self, key: tuple[datetime, int], run_id: str) -> None:
+        if not self._keys or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._ids.append(run_id)
+        else:
+            i = bisect_right(self._keys, key)
+            self._keys.insert(i, key)
+            self._ids.insert(i, run_id)
+
+    def remove(self, key: tuple[datetime, int]) -> None:
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key and self._ids[i] is not None:
+            self._ids[i] = None
+            self._dead += 1
+            if self._dead > self.COMPACT_MIN and self._dead > len(self):
+                self._compact()
+
+    def newest_first(self) -> Iterator[str]:
+        return (run_id for run_id in reversed(self._ids) if run_id is not None)
+
+    def _compact(self) -> None:
+        live = [(k, run_id) for k, run_id in zip(self._keys, self._ids) if run_id is not None]
+        self._keys = [k for k, _ in live]
+        self._ids = [run_id for _, run_id in live]
+        self._dead = 0
+
+
+class MemoryRunStore:
+    """In-memory RunRecord storage with secondary indexes.
+
+    Listing cost is proportional to the runs examined to fill the page
+    rather than to the total number of runs held.
+
+    Example:
+        >>> store = MemoryRunStore()
+        >>> store.save(run)
+        >>> store.get(run.run_id) is run
+        True
+        >>> store.query(parent_run_id=workflow_run_id)
+    """
+
+    def __init__(self) -> None:
+        self._runs: dict[str, RunRecord] = {}
+        self._keys: dict[str, tuple[datetime, int]] = {}
+        self._indexed_status: dict[str, RunStatus] = {}
+        self._seq = 0
+
+        self._order = _CreatedIndex()
+        self._by_kind: dict[str, _CreatedIndex] = {}
+        self._by_name: dict[str, _CreatedIndex] = {}
+        self._by_parent: dict[str, _CreatedIndex] = {}
+        self._by_status: dict[RunStatus, dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self._runs
+
+    def get(self, run_id: str) -> RunRecord | None:
+        """Get run by ID."""
+        return self._runs.get(run_id)
+
+    def values(self) -> list[RunRecord]:
+        """All runs in insertion order."""
+        return list(self._runs.values())
+
+    def save(self, run: RunRecord) -> None:
+        """Insert or update a run, refreshing the status index.
+
+        Kind, name and parent_run_id are indexed on first save only;
+        they are part of the immutable spec.
+        """
+        run_id = run.run_id
+        if run_id not in self._keys:
+            self._seq += 1
+            key = (run.created_at, self._seq)
+            self._keys[run_id] = key
+            self._order.add(key, run_id)
+            self._bucket(self._by_kind, run.spec.kind).add(key, run_id)
+            self._bucket(self._by_name, run.spec.name).add(key, run_id)
+            if run.spec.parent_run_id:
+                self._bucket(self._by_parent, run.spec.parent_run_id).add(key, run_id)
+        else:
+            previous = self._indexed_status.get(run_id)
+            if previous is not None and previous != run.status:
+                self._by_status[previous].pop(run_id, None)
+
+        self._runs[run_id] = run
+        self._indexed_status[run_id] = run.status
+        self._by_status.setdefault(run.status, {})[run_id] = None
+
+    def remove(self, run_id: str) -> RunRecord | None:
+        """Remove a run from the store and all indexes.
+
+        Returns:
+            The removed run, or None if it was not present
+        """
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return None
+
+        key = self._keys.pop(run_id)
+        self._order.remove(key)
+        self._unbucket(self._by_kind, run.spec.kind, key)
+        self._unbucket(self._by_name, run.spec.name, key)
+        if run.spec.parent_run_id:
+            self._unbucket(self._by_parent, run.spec.parent_run_id, key)
+
+        status = self._indexed_status.pop(run_id)
+        bucket = self._by_status.get(status)
+        if bucket is not None:
+            bucket.pop(run_id, None)
+        return run
+
+    def clear(self) -> None:
+        """Remove all runs."""
+        self._runs.clear()
+        self._keys.clear()
+        self._indexed_status.clear()
+        self._order = _CreatedIndex()
+        self._by_kind.clear()
+        self._by_name.clear()
+        self._by_parent.clear()
+        self._by_status.clear()
+
+    def query(
+        self,
+        kind: str | None = None,
+        status: RunStatus | str | None = None,
+        name: str | None = None,
+        parent_run_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[RunRecord]:
+        """List runs matching all given filters, newest first.
+
+        The most selective index drives the scan: an ordered bucket is
+        walked newest-first until the page is full, or, when matches in
+        it would be sparse, the status bucket's members are ranked with
+        a bounded heap instead.
+
+        Args:
+            kind: Filter by work kind
+            status: Filter by run status
+            name: Filter by handler/pipeline name
+            parent_run_id: Filter by parent workflow run
+            limit: Max results
+            offset: Skip first N matches
+
+        Returns:
+            Matching RunRecords ordered by created_at descending
+        """
+        if limit <= 0:
+            return []
+        if status:
+            status = RunStatus(status)
+
+        ordered = self._order
+        for index, value in (
+            (self._by_kind, kind),
+            (self._by_name, name),
+            (self._by_parent, parent_run_id),
+        ):
+            if not value:
+                continue
+            bucket = index.get(value)
+            if bucket is None:
+                return []
+            if len(bucket) < len(ordered):
+                ordered = bucket
+
+        def matches(run: RunRecord) -> bool:
+            return (
+                (not kind or run.spec.kind == kind)
+                and (not status or run.status == status)
+                and (not name or run.spec.name == name)
+                and (not parent_run_id or run.spec.parent_run_id == parent_run_id)
+            )
+
+        if status:
+            members = self._by_status.get(status)
+            if not members:
+                return []
+            # Walking the ordered bucket inspects about
+            # page * len(ordered) / len(members) runs; ranking the status
+            # bucket inspects all of its members. Pick the cheaper one.
+            if (offset + limit) * len(ordered) > len(members) ** 2:
+                candidates = (self._runs[run_id] for run_id in members)
+                top = heapq.nlargest(
+                    offset + limit,
+                    (run for run in candidates if matches(run)),
+                    key=lambda run: self._keys[run.run_id],
+                )
+                return top[offset:]
+
+        results: list[RunRecord] = []
+        skipped = 0
+        for run_id in ordered.newest_first():
+            run = self._runs[run_id]
+            if not matches(run):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(run)
+            if len(results) >= limit:
+                break
+        return results
+
+    @staticmethod
+    def _bucket(index: dict[str, _CreatedIndex], value: str) -> _CreatedIndex:
+        bucket = index.get(value)
+        if bucket is None:
+            bucket = index[value] = _CreatedIndex()
+        return bucket
+
+    @staticmethod
+    def _unbucket(index: dict[str, _CreatedIndex], value: str, key: tuple[datetime, int]) -> None:
+        bucket = index.get(value)
+        if bucket is None:
+            return
+        bucket.remove(key)
+        if not len(bucket):
+            del index[value]
@@ -13,15 +13,18 @@ logger = structlog.get_logger()
 # Global pipeline registry
 _registry: dict[str, type["Pipeline"]] = {}
 _loaded: bool = False
+_generation: int = 0  # Bumped on every change, for caches keyed on the registry
 
 
 def register_pipeline(name: str) -> Callable[[type["Pipeline"]], type["Pipeline"]]:
     """Decorator to register a pipeline class."""
 
     def decorator(cls: type["Pipeline"]) -> type["Pipeline"]:
+        global _generation
         if name in _registry:
             raise ValueError(f"Pipeline '{name}' is already registered")
         _registry[name] = cls
+        _generation += 1
         # Get description from class if available
         description = getattr(cls, "description", "No description available")
         logger.debug(
@@ -60,9 +63,15 @@ def list_pipelines() -> list[str]:
 
 def clear_registry() -> None:
     """Clear registry (for testing)."""
-    global _loaded
+    global _loaded, _generation
     _registry.clear()
     _loaded = False
+    _generation += 1
+
+
+def registry_generation() -> int:
+    """Get a counter that changes whenever the pipeline registry changes."""
+    return _generation
 
 
 def _load_pipelines() -> None:
@@ -507,6 +507,19 @@ class ExecutionMetrics:
             "spine_locks_held",
             "Number of currently held locks",
         )
+        
+        self.queue_depth = reg.gauge(
+            "spine_queue_depth",
+            "Number of items waiting in the in-process scheduler",
+            ["lane"],
+        )
+        
+        self.queue_wait = reg.histogram(
+            "spine_queue_wait_seconds",
+            "Time spent queued before dispatch in seconds",
+            ["lane"],
+            buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, float("inf")),
+        )
 
     def record_submission(self, pipeline: str) -> None:
         """Record an execution submission."""
@@ -519,6 +532,20 @@ class ExecutionMetrics:
         self.duration.labels(pipeline=pipeline).observe(duration)
         self.active_executions.labels(pipeline=pipeline).dec()
 
+    def record_enqueue(self, lane: str) -> None:
+        """Record an item entering a scheduler lane."""
+        self.queue_depth.labels(lane=lane).inc()
+
+    def record_dequeue(self, lane: str, wait_seconds: float | None = None) -> None:
+        """Record an item leaving a scheduler lane.
+        
+        ``wait_seconds`` is observed when the item was dispatched; pass
+        None for items removed without running (e.g. cancelled).
+        """
+        self.queue_depth.labels(lane=lane).dec()
+        if wait_seconds is not None:
+            self.queue_wait.labels(lane=lane).observe(wait_seconds)
+
 
 # Global execution metrics instance
 execution_metrics = ExecutionMetrics()
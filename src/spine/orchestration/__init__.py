@@ -91,12 +91,15 @@ from spine.orchestration.registry import (
     list_groups,
     clear_group_registry,
     group_exists,
+    register_lazy_group,
+    register_groups_from_directory,
 )
 from spine.orchestration.planner import PlanResolver
 from spine.orchestration.loader import (
     load_group_from_yaml,
     load_groups_from_directory,
     group_to_yaml,
+    GroupCache,
 )
 from spine.orchestration.runner import (
     GroupRunner,
@@ -127,6 +130,11 @@ from spine.orchestration.step_types import (
     RetryPolicy,
 )
 from spine.orchestration.workflow import Workflow
+from spine.orchestration.step_cache import (
+    StepCache,
+    DatabaseStepCache,
+    DirectoryStepCache,
+)
 from spine.orchestration.workflow_runner import (
     WorkflowRunner,
     WorkflowResult,
@@ -135,7 +143,16 @@ from spine.orchestration.workflow_runner import (
     get_workflow_runner,
 )
 
+# Async runners (single event loop, async Dispatcher)
+from spine.orchestration.async_runner import AsyncGroupRunner, AsyncWorkflowRunner
+
 # Tracked runner (with database persistence)
+from spine.orchestration.checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+    SnapshotCodec,
+    register_codec,
+)
 from spine.orchestration.tracked_runner import (
     TrackedWorkflowRunner,
     get_workflow_state,
@@ -169,12 +186,15 @@ __all__ = [
     "list_groups",
     "clear_group_registry",
     "group_exists",
+    "register_lazy_group",
+    "register_groups_from_directory",
     # Planner
     "PlanResolver",
     # Loader
     "load_group_from_yaml",
     "load_groups_from_directory",
     "group_to_yaml",
+    "GroupCache",
     # Group Runner
     "GroupRunner",
     "GroupExecutionResult",
@@ -199,14 +219,26 @@ __all__ = [
     "RetryPolicy",
     # Workflow
     "Workflow",
+    # Step Cache
+    "StepCache",
+    "DatabaseStepCache",
+    "DirectoryStepCache",
     # Workflow Runner
     "WorkflowRunner",
     "WorkflowResult",
     "WorkflowStatus",
     "StepExecution",
     "get_workflow_runner",
+    # Async Runners
+    "AsyncGroupRunner",
+    "AsyncWorkflowRunner",
     # Tracked Runner (database persistence)
     "TrackedWorkflowRunner",
     "get_workflow_state",
     "list_workflow_failures",
+    # Checkpoints
+    "Checkpoint",
+    "CheckpointStore",
+    "SnapshotCodec",
+    "register_codec",
 ]
@@ -0,0 +1,777 @@
+"""
+Async runners - Group and workflow execution on a single event loop.
+
+GroupRunner and WorkflowRunner are synchronous: parallel steps occupy a
+worker thread each, and an async service has to bridge into them with a
+thread per run. AsyncGroupRunner and AsyncWorkflowRunner run every step
+as a task on the caller's event loop and submit pipelines to the async
+``spine.execution.Dispatcher``, awaiting each run with
+``Dispatcher.wait_for``. An idle step costs a coroutine, not a thread,
+so one worker process can drive many group runs at once.
+
+Cancellation propagates: cancelling ``execute()`` cancels every running
+step, and each step cancels its dispatcher run before the
+CancelledError is re-raised.
+
+Results are the same GroupExecutionResult / WorkflowResult types the
+sync runners return; group StepExecutions also carry the dispatcher
+``run_id``.
+
+Tier: Intermediate (requires an async Dispatcher for pipeline steps)
+
+Example:
+    from spine.execution import Dispatcher
+    from spine.orchestration import AsyncGroupRunner, AsyncWorkflowRunner
+
+    dispatcher = Dispatcher(executor=LocalExecutor(max_workers=8))
+
+    @app.post("/groups/{name}/run")
+    async def run_group(name: str):
+        plan = PlanResolver().resolve(get_group(name))
+        result = await AsyncGroupRunner(dispatcher).execute(plan)
+        return result.to_dict()
+
+    result = await AsyncWorkflowRunner(dispatcher, parallel=True).execute(workflow)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from spine.execution.runs import RunStatus
+from spine.execution.spec import pipeline_spec
+from spine.orchestration.exceptions import GroupError
+from spine.orchestration.models import ExecutionMode, ExecutionPlan, FailurePolicy, PlannedStep
+from spine.orchestration.runner import (
+    GroupExecutionResult,
+    StepExecution,
+    StepStatus,
+    _final_status,
+    _ReadyQueue,
+    _start_result,
+)
+from spine.orchestration.step_result import StepResult
+from spine.orchestration.step_types import ErrorPolicy, RetryPolicy, Step, StepType
+from spine.orchestration.workflow import Workflow
+from spine.orchestration.workflow_context import WorkflowContext
+from spine.orchestration.workflow_runner import (
+    _BARRIER_TYPES,
+    WorkflowResult,
+    WorkflowStatus,
+    _batch_dependencies,
+    _evaluate_choice,
+    _failure_category,
+    _merge_result,
+    _resolve_path,
+)
+from spine.orchestration.workflow_runner import (
+    StepExecution as WorkflowStepExecution,
+)
+
+if TYPE_CHECKING:
+    from spine.execution.dispatcher import Dispatcher
+    from spine.execution.runs import RunRecord
+
+logger = structlog.get_logger(__name__)
+
+
+async def _run_pipeline(
+    dispatcher: Dispatcher,
+    pipeline: str,
+    params: dict[str, Any],
+    correlation_id: str,
+    timeout: float | None,
+) -> RunRecord:
+    """
+    Submit a pipeline run and await its terminal record.
+
+    If the awaiting task is cancelled or times out, the run is cancelled
+    in the dispatcher before the error propagates.
+    """
+    run_id = await dispatcher.submit(
+        pipeline_spec(pipeline, params, correlation_id=correlation_id, trigger_source="scheduler")
+    )
+    try:
+        return await dispatcher.wait_for(run_id, timeout=timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        await dispatcher.cancel(run_id)
+        raise
+
+
+async def _cancel_all(tasks: set[asyncio.Task] | list[asyncio.Task]) -> None:
+    """Cancel tasks and wait until every one has finished unwinding."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class AsyncGroupRunner:
+    """
+    Execute resolved pipeline group plans on the running event loop.
+
+    Same semantics as GroupRunner (dependency order, failure policy,
+    critical-path dispatch, makespan report); each step is a task that
+    submits its pipeline to an async Dispatcher. At most
+    ``max_concurrency`` steps run at once (1 in sequential mode).
+
+    Example:
+        runner = AsyncGroupRunner(dispatcher)
+        result = await runner.execute(plan)
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        step_durations: Mapping[str, float] | None = None,
+        step_timeout: float | None = None,
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            dispatcher: Async spine.execution Dispatcher that runs pipelines
+            step_durations: Expected seconds by pipeline or step name
+            step_timeout: Max seconds to wait for one step (None = forever);
+                a step that times out is cancelled and fails
+        """
+        self.dispatcher = dispatcher
+        self.step_durations = step_durations
+        self.step_timeout = step_timeout
+
+    async def execute(self, plan: ExecutionPlan) -> GroupExecutionResult:
+        """
+        Execute an execution plan.
+
+        Args:
+            plan: Resolved execution plan from PlanResolver
+
+        Returns:
+            GroupExecutionResult with aggregated results
+
+        Raises:
+            GroupError: If plan execution fails catastrophically
+            asyncio.CancelledError: If cancelled (running steps are cancelled first)
+        """
+        logger.info(
+            "group_runner.execute.start",
+            group=plan.group_name,
+            batch_id=plan.batch_id,
+            step_count=plan.step_count,
+            policy=plan.policy.mode.value,
+            runner="async",
+        )
+
+        result, priorities = _start_result(plan, self.step_durations)
+        workers = 1
+        if plan.policy.mode == ExecutionMode.PARALLEL:
+            workers = plan.policy.max_concurrency or 4
+        else:
+            # Sequential: plan order (the first ready step in plan order
+            # is always the next one in the topological sort)
+            priorities = {}
+
+        try:
+            await self._execute_dag(plan, result, priorities, workers)
+            result.status = _final_status(plan, result)
+        except asyncio.CancelledError:
+            logger.warning("group_runner.cancelled", group=plan.group_name, batch_id=plan.batch_id)
+            raise
+        except Exception as e:
+            logger.error(
+                "group_runner.execute.error",
+                group=plan.group_name,
+                batch_id=plan.batch_id,
+                error=str(e),
+            )
+            raise GroupError(f"Group execution failed: {e}") from e
+        finally:
+            result.completed_at = datetime.now(timezone.utc)
+
+        logger.info(
+            "group_runner.execute.complete",
+            group=plan.group_name,
+            batch_id=plan.batch_id,
+            status=result.status.value,
+            successful=result.successful_steps,
+            failed=result.failed_steps,
+            skipped=result.skipped_steps,
+            duration_seconds=result.duration_seconds,
+            predicted_seconds=result.predicted_makespan_seconds,
+        )
+        return result
+
+    async def _execute_dag(
+        self,
+        plan: ExecutionPlan,
+        result: GroupExecutionResult,
+        priorities: Mapping[str, float],
+        workers: int,
+    ) -> None:
+        """Run steps as tasks, at most ``workers`` at a time.
+
+        Mirrors GroupRunner._execute_parallel: a ready queue releases
+        dependents on completion, a failure skips every transitive
+        dependent, and FailurePolicy.STOP stops new steps from starting.
+        """
+        queue = _ReadyQueue(plan, priorities)
+        step_results: dict[str, StepExecution] = {}
+        running: dict[asyncio.Task, PlannedStep] = {}
+        should_stop = False
+
+        try:
+            while True:
+                while not should_stop and len(running) < workers:
+                    step = queue.pop()
+                    if step is None:
+                        break
+                    running[asyncio.create_task(self._execute_step(plan, step))] = step
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    step_exec = task.result()
+                    step_results[step.step_name] = step_exec
+
+                    if step_exec.status == StepStatus.COMPLETED:
+                        queue.complete(step.step_name)
+                        continue
+
+                    for skipped in queue.fail(step.step_name):
+                        step_results[skipped.step_name] = StepExecution(
+                            step_name=skipped.step_name,
+                            pipeline_name=skipped.pipeline_name,
+                            status=StepStatus.SKIPPED,
+                        )
+                        logger.warning(
+                            "group_runner.step_skipped",
+                            step=skipped.step_name,
+                            reason="dependency_failed",
+                            failed_step=step.step_name,
+                        )
+
+                    if plan.policy.on_failure == FailurePolicy.STOP:
+                        should_stop = True
+        except asyncio.CancelledError:
+            await _cancel_all(list(running))
+            raise
+
+        for step in plan.steps:
+            result.step_executions.append(
+                step_results.get(step.step_name)
+                or StepExecution(
+                    step_name=step.step_name,
+                    pipeline_name=step.pipeline_name,
+                    status=StepStatus.SKIPPED,
+                )
+            )
+
+    async def _execute_step(self, plan: ExecutionPlan, step: PlannedStep) -> StepExecution:
+        """Run one step's pipeline through the dispatcher."""
+        logger.info(
+            "group_runner.step.start",
+            group=plan.group_name,
+            step=step.step_name,
+            pipeline=step.pipeline_name,
+            sequence=step.sequence_order,
+            batch_id=plan.batch_id,
+        )
+
+        step_exec = StepExecution(
+            step_name=step.step_name,
+            pipeline_name=step.pipeline_name,
+            status=StepStatus.RUNNING,
+            started_at=datetime.now(timezone.utc),
+        )
+
+        try:
+            run = await _run_pipeline(
+                self.dispatcher,
+                step.pipeline_name,
+                {**step.params, "batch_id": plan.batch_id},
+                correlation_id=plan.batch_id,
+                timeout=self.step_timeout,
+            )
+            step_exec.run_id = run.run_id
+            if run.status == RunStatus.COMPLETED:
+                step_exec.status = StepStatus.COMPLETED
+            else:
+                step_exec.status = StepStatus.FAILED
+                step_exec.error = run.error or f"Run {run.status.value}"
+                logger.error(
+                    "group_runner.step.failed",
+                    group=plan.group_name,
+                    step=step.step_name,
+                    pipeline=step.pipeline_name,
+                    batch_id=plan.batch_id,
+                    status=run.status.value,
+                    error=step_exec.error,
+                )
+        except asyncio.TimeoutError:
+            step_exec.status = StepStatus.FAILED
+            step_exec.error = f"Step timed out after {self.step_timeout}s"
+            logger.error("group_runner.step.timeout", step=step.step_name, timeout=self.step_timeout)
+        except Exception as e:
+            step_exec.status = StepStatus.FAILED
+            step_exec.error = str(e)
+            logger.error(
+                "group_runner.step.exception",
+                step=step.step_name,
+                pipeline=step.pipeline_name,
+                error=str(e),
+            )
+        finally:
+            step_exec.completed_at = datetime.now(timezone.utc)
+
+        return step_exec
+
+
+class AsyncWorkflowRunner:
+    """
+    Executes workflows with context passing on the running event loop.
+
+    Same semantics as WorkflowRunner. Lambda handlers and choice
+    conditions may be plain functions or coroutines; plain handlers run
+    on the loop, so they should not block. Pipeline steps are submitted
+    to an async Dispatcher, wait steps use ``asyncio.sleep``, map items
+    and independent steps (``parallel=True``) are tasks bounded by a
+    semaphore.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher | None = None,
+        dry_run: bool = False,
+        parallel: bool = False,
+        max_workers: int = 4,
+        step_timeout: float | None = None,
+    ):
+        """
+        Initialize the workflow runner.
+
+        Args:
+            dispatcher: Async spine.execution Dispatcher for pipeline steps
+                (required only if the workflow has pipeline steps)
+            dry_run: If True, pipeline steps return mock success
+            parallel: Run steps whose dependencies are met concurrently
+                (see Step.depends_on); choice and wait steps still run
+                alone, in order
+            max_workers: Max concurrent steps in parallel mode
+            step_timeout: Max seconds to wait for one pipeline run
+        """
+        self.dispatcher = dispatcher
+        self._dry_run = dry_run
+        self._parallel = parallel
+        self._max_workers = max(1, max_workers)
+        self.step_timeout = step_timeout
+
+    async def execute(
+        self,
+        workflow: Workflow,
+        params: dict[str, Any] | None = None,
+        partition: dict[str, Any] | None = None,
+        context: WorkflowContext | None = None,
+        start_from: str | None = None,
+    ) -> WorkflowResult:
+        """
+        Execute a workflow.
+
+        Args:
+            workflow: The workflow to execute
+            params: Input parameters
+            partition: Partition key for tracking
+            context: Resume from existing context (for checkpoint resume)
+            start_from: Start from specific step (skip earlier steps)
+
+        Returns:
+            WorkflowResult with final status and context
+
+        Raises:
+            GroupError: If start_from is not a step of the workflow
+            asyncio.CancelledError: If cancelled (running steps are cancelled first)
+        """
+        if context is None:
+            context = WorkflowContext.create(
+                workflow_name=workflow.name,
+                params={**workflow.defaults, **(params or {})},
+                partition=partition or {},
+                dry_run=self._dry_run,
+            )
+
+        started_at = datetime.now(timezone.utc)
+        step_executions: list[WorkflowStepExecution] = []
+        error_step: str | None = None
+        error_msg: str | None = None
+        final_status = WorkflowStatus.COMPLETED
+
+        current_index = 0
+        if start_from:
+            current_index = workflow.step_index(start_from)
+            if current_index < 0:
+                raise GroupError(f"Start step not found: {start_from}")
+
+        logger.info(
+            "workflow.start",
+            workflow=workflow.name,
+            run_id=context.run_id,
+            step_count=len(workflow.steps),
+            start_from=start_from,
+            runner="async",
+        )
+
+        skip_to_step: str | None = None
+        stopped = False
+
+        while current_index < len(workflow.steps) and not stopped:
+            step = workflow.steps[current_index]
+
+            if skip_to_step:
+                if step.name != skip_to_step:
+                    current_index += 1
+                    continue
+                skip_to_step = None
+
+            if self._parallel and step.step_type not in _BARRIER_TYPES:
+                end = current_index
+                while end < len(workflow.steps) and workflow.steps[end].step_type not in _BARRIER_TYPES:
+                    end += 1
+                batch = workflow.steps[current_index:end]
+                executed = await self._execute_batch(batch, context, workflow)
+                current_index = end
+            else:
+                executed = [(step, await self._execute_step(step, context, workflow))]
+                current_index += 1
+
+            for step, step_exec in executed:
+                step_executions.append(step_exec)
+
+                if step_exec.status == "completed":
+                    context = _merge_result(context, step, step_exec)
+                    if step_exec.result and step_exec.result.next_step:
+                        skip_to_step = step_exec.result.next_step
+
+                elif step_exec.status == "failed":
+                    if error_step is None or final_status != WorkflowStatus.FAILED:
+                        error_step = step.name
+                        error_msg = step_exec.error
+
+                    if step.on_error == ErrorPolicy.STOP:
+                        final_status = WorkflowStatus.FAILED
+                        stopped = True
+                    elif step.on_error == ErrorPolicy.CONTINUE and final_status != WorkflowStatus.FAILED:
+                        final_status = WorkflowStatus.PARTIAL
+
+        completed_at = datetime.now(timezone.utc)
+
+        logger.info(
+            "workflow.complete",
+            workflow=workflow.name,
+            run_id=context.run_id,
+            status=final_status.value,
+            duration_seconds=(completed_at - started_at).total_seconds(),
+            completed_steps=len([s for s in step_executions if s.status == "completed"]),
+            failed_steps=len([s for s in step_executions if s.status == "failed"]),
+        )
+
+        return WorkflowResult(
+            workflow_name=workflow.name,
+            run_id=context.run_id,
+            status=final_status,
+            context=context,
+            started_at=started_at,
+            completed_at=completed_at,
+            step_executions=step_executions,
+            error_step=error_step,
+            error=error_msg,
+        )
+
+    async def _execute_step(
+        self,
+        step: Step,
+        context: WorkflowContext,
+        workflow: Workflow,
+    ) -> WorkflowStepExecution:
+        """Execute a single step."""
+        started_at = datetime.now(timezone.utc)
+
+        try:
+            if step.step_type == StepType.LAMBDA:
+                result = await self._execute_lambda(step, context)
+            elif step.step_type == StepType.PIPELINE:
+                result = await self._execute_pipeline(step, context)
+            elif step.step_type == StepType.CHOICE:
+                result = _evaluate_choice(step, context)
+            elif step.step_type == StepType.WAIT:
+                result = await self._execute_wait(step)
+            elif step.step_type == StepType.MAP:
+                result = await self._execute_map(step, context, workflow)
+            else:
+                result = StepResult.fail(f"Unknown step type: {step.step_type}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(
+                "step.exception",
+                workflow=workflow.name,
+                step=step.name,
+                error=str(e),
+            )
+            result = StepResult.fail(error=str(e), category="INTERNAL")
+
+        return WorkflowStepExecution(
+            step_name=step.name,
+            step_type=step.step_type.value,
+            status="completed" if result.success else "failed",
+            started_at=started_at,
+            completed_at=datetime.now(timezone.utc),
+            result=result,
+            error=result.error if not result.success else None,
+        )
+
+    async def _execute_batch(
+        self,
+        batch: list[Step],
+        context: WorkflowContext,
+        workflow: Workflow,
+    ) -> list[tuple[Step, WorkflowStepExecution]]:
+        """
+        Execute consecutive non-barrier steps as a dependency graph.
+
+        Every step is a task that awaits its dependencies' tasks, then a
+        slot of a max_workers semaphore. Contexts are built as in
+        WorkflowRunner._execute_batch, so results do not depend on
+        completion order.
+        """
+        deps = _batch_dependencies(batch, workflow)
+        ancestors: dict[str, set[str]] = {}
+        for step in batch:
+            ancestors[step.name] = set(deps[step.name])
+            for dep in deps[step.name]:
+                ancestors[step.name] |= ancestors[dep]
+
+        semaphore = asyncio.Semaphore(self._max_workers)
+        executions: dict[str, WorkflowStepExecution] = {}
+        tasks: dict[str, asyncio.Task] = {}
+        stopped = False
+
+        async def run(step: Step) -> None:
+            nonlocal stopped
+            await asyncio.gather(*(tasks[dep] for dep in deps[step.name]))
+            async with semaphore:
+                # Dependencies that were never run (stop) block the step too
+                if stopped or any(dep not in executions for dep in deps[step.name]):
+                    return
+                step_context = context
+                for prior in batch:
+                    if prior.name in ancestors[step.name]:
+                        step_context = _merge_result(step_context, prior, executions[prior.name])
+                step_exec = await self._execute_step(step, step_context, workflow)
+                executions[step.name] = step_exec
+                if step_exec.status == "failed" and step.on_error == ErrorPolicy.STOP:
+                    stopped = True
+
+        for step in batch:
+            tasks[step.name] = asyncio.create_task(run(step))
+        try:
+            await asyncio.gather(*tasks.values())
+        except asyncio.CancelledError:
+            await _cancel_all(list(tasks.values()))
+            raise
+
+        return [(step, executions[step.name]) for step in batch if step.name in executions]
+
+    async def _execute_lambda(self, step: Step, context: WorkflowContext) -> StepResult:
+        """Execute a lambda step (plain or async handler)."""
+        if step.handler is None:
+            return StepResult.fail("Lambda step has no handler")
+
+        result = step.handler(context, step.config)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _execute_pipeline(self, step: Step, context: WorkflowContext) -> StepResult:
+        """Execute a pipeline step via the async Dispatcher."""
+        if step.pipeline_name is None:
+            return StepResult.fail("Pipeline step has no pipeline_name")
+
+        if self._dry_run:
+            return StepResult.ok(output={"dry_run": True, "pipeline": step.pipeline_name})
+
+        if self.dispatcher is None:
+            return StepResult.fail(
+                "AsyncWorkflowRunner needs a dispatcher for pipeline steps",
+                category="CONFIGURATION",
+            )
+
+        try:
+            run = await _run_pipeline(
+                self.dispatcher,
+                step.pipeline_name,
+                {**context.params, **step.config},
+                correlation_id=context.run_id,
+                timeout=self.step_timeout,
+            )
+        except asyncio.TimeoutError:
+            return StepResult.fail(f"Pipeline timed out after {self.step_timeout}s", category="TIMEOUT")
+
+        pipeline_result = {
+            "run_id": run.run_id,
+            "status": run.status.value,
+            "started_at": run.started_at.isoformat() if run.started_at else None,
+            "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+        }
+        if run.status == RunStatus.COMPLETED:
+            return StepResult.ok(output={"pipeline_result": {**pipeline_result, "result": run.result}})
+        return StepResult.fail(
+            error=run.error or "Pipeline failed",
+            category="INTERNAL",
+            output={"pipeline_result": {**pipeline_result, "error": run.error}},
+        )
+
+    async def _execute_wait(self, step: Step) -> StepResult:
+        """Execute a wait step without blocking the loop."""
+        duration = step.duration_seconds or 0
+        if duration > 0 and not self._dry_run:
+            await asyncio.sleep(duration)
+        return StepResult.ok(output={"waited_seconds": duration})
+
+    async def _execute_map(
+        self,
+        step: Step,
+        context: WorkflowContext,
+        workflow: Workflow,
+    ) -> StepResult:
+        """
+        Execute a map step (fan-out/fan-in).
+
+        Item runs are tasks bounded by a step.max_concurrency semaphore;
+        output and on_error handling match WorkflowRunner._execute_map.
+        """
+        if step.iterator_workflow is None:
+            return StepResult.fail("Map step has no iterator_workflow", category="CONFIGURATION")
+
+        try:
+            items = _resolve_path(context, step.items_path or "")
+        except (KeyError, TypeError, IndexError, ValueError):
+            return StepResult.fail(
+                f"Map items not found at {step.items_path!r}",
+                category="CONFIGURATION",
+            )
+        if not isinstance(items, (list, tuple)):
+            return StepResult.fail(
+                f"Map items at {step.items_path!r} must be a list, got {type(items).__name__}",
+                category="CONFIGURATION",
+            )
+
+        fail_fast = step.on_error != ErrorPolicy.CONTINUE
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        errors: list[dict[str, Any]] = []
+        first_failure: tuple[int, str, str] | None = None
+        skipped = 0
+        semaphore = asyncio.Semaphore(max(1, step.max_concurrency))
+
+        async def run_item(index: int, item: Any) -> WorkflowResult:
+            async with semaphore:
+                return await self._run_map_item(step, context, index, item)
+
+        tasks = {asyncio.create_task(run_item(i, item)): i for i, item in enumerate(items)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = tasks[task]
+                    item_result = task.result()
+                    if item_result.skipped:
+                        skipped += 1
+                        continue
+                    if item_result.status != WorkflowStatus.FAILED:
+                        results[index] = item_result.context.outputs_dict()
+                        continue
+
+                    error = item_result.error or "Map item failed"
+                    errors.append({"index": index, "error": error})
+                    logger.warning(
+                        "map.item_failed",
+                        workflow=workflow.name,
+                        step=step.name,
+                        index=index,
+                        error=error,
+                    )
+                    if first_failure is None or index < first_failure[0]:
+                        first_failure = (index, error, _failure_category(item_result))
+                if fail_fast and first_failure is not None and pending:
+                    await _cancel_all(pending)
+                    break
+        except asyncio.CancelledError:
+            await _cancel_all(list(tasks))
+            raise
+
+        skipped += sum(task.cancelled() for task in tasks)
+        errors.sort(key=lambda e: e["index"])
+        output = {
+            "count": len(items),
+            "completed": len(items) - len(errors) - skipped,
+            "failed": len(errors),
+            "skipped": skipped,
+            "results": results,
+            "errors": errors,
+        }
+
+        if first_failure is not None and fail_fast:
+            index, error, category = first_failure
+            return StepResult.fail(
+                error=f"Map item {index} failed: {error}",
+                category=category,
+                output=output,
+            )
+        return StepResult.ok(output=output)
+
+    async def _run_map_item(
+        self,
+        step: Step,
+        context: WorkflowContext,
+        index: int,
+        item: Any,
+    ) -> WorkflowResult:
+        """
+        Run the iterator workflow for one map item (with retries).
+
+        Items run through AsyncWorkflowRunner.execute even in subclasses;
+        see WorkflowRunner._run_map_item.
+        """
+        params = {
+            **context.params,
+            step.config.get("item_param", "item"): item,
+            "__map_index": index,
+        }
+        policy = step.retry_policy or RetryPolicy()
+        max_attempts = policy.max_attempts if step.on_error == ErrorPolicy.RETRY else 1
+
+        attempt = 1
+        while True:
+            result = await AsyncWorkflowRunner.execute(
+                self, step.iterator_workflow, params=params, partition=context.partition
+            )
+            if result.status != WorkflowStatus.FAILED or attempt >= max_attempts:
+                return result
+            if _failure_category(result) not in policy.retryable_categories:
+                return result
+
+            delay = min(
+                policy.initial_delay_seconds * policy.backoff_multiplier ** (attempt - 1),
+                policy.max_delay_seconds,
+            )
+            logger.debug("map.item_retry", step=step.name, index=index, attempt=attempt, delay=delay)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            attempt += 1
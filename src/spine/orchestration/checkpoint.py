@@ -0,0 +1,249 @@
+"""
+Workflow Checkpoints - Persisted context snapshots for resumable runs.
+
+TrackedWorkflowRunner records manifest stages, which tells a restart
+*where* to resume but not *what* earlier steps produced. A
+CheckpointStore keeps the latest WorkflowContext of each run (one row in
+core_workflow_checkpoints, overwritten after every successful step) so a
+resumed run starts from the first incomplete step with all prior outputs
+restored.
+
+Snapshots are ``WorkflowContext.to_dict()`` encoded as compact JSON and
+compressed with a pluggable codec ("zlib" by default; "none", "gzip" and
+"lzma" are built in, others can be added with ``register_codec``). Params
+and outputs must be JSON-serializable: ``save()`` raises rather than store
+a value that would come back as something else after a resume.
+
+Tier: Intermediate (requires database connection)
+
+Example:
+    from spine.orchestration import CheckpointStore, TrackedWorkflowRunner
+
+    runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn))
+    result = runner.execute(workflow, params=params, partition=partition)
+
+    # After a crash: continue the same run from its last checkpoint
+    result = runner.resume(result.run_id, workflow)
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Protocol
+
+from spine.core.schema import CORE_TABLES
+from spine.orchestration.workflow_context import WorkflowContext
+
+
+class Connection(Protocol):
+    """Minimal SYNC DB connection interface."""
+
+    def execute(self, sql: str, params: tuple = ()) -> Any: ...
+    def commit(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class SnapshotCodec:
+    """Compression applied to serialized snapshots.
+
+    The codec name is stored with each snapshot, so snapshots written
+    with one codec stay readable after the default changes.
+    """
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+_CODECS: dict[str, SnapshotCodec] = {
+    "none": SnapshotCodec("none", bytes, bytes),
+    "zlib": SnapshotCodec("zlib", zlib.compress, zlib.decompress),
+    "gzip": SnapshotCodec("gzip", gzip.compress, gzip.decompress),
+    "lzma": SnapshotCodec("lzma", lzma.compress, lzma.decompress),
+}
+
+
+def register_codec(codec: SnapshotCodec) -> None:
+    """Make a codec available by name (e.g. zstd from an optional package)."""
+    _CODECS[codec.name] = codec
+
+
+def get_codec(name: str) -> SnapshotCodec:
+    """Look up a registered codec.
+
+    Raises:
+        ValueError: If no codec is registered under name
+    """
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown snapshot codec: {name!r}. Registered: {sorted(_CODECS)}") from None
+
+
+@dataclass
+class Checkpoint:
+    """Latest persisted state of a workflow run."""
+
+    run_id: str
+    workflow_name: str
+    partition: dict[str, Any]
+    context: WorkflowContext
+    next_step: str | None
+    completed_steps: list[str] = field(default_factory=list)
+    updated_at: str | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        """True once no step is left to run."""
+        return self.next_step is None
+
+
+class CheckpointStore:
+    """
+    Stores one context snapshot per workflow run.
+
+    ``save()`` commits, so a checkpoint survives a crash of the process
+    running the workflow. The commit covers everything pending on the
+    store's connection: given the runner's own connection, the run's
+    manifest and anomaly writes become durable step by step and a later
+    rollback no longer undoes them. Pass a separate connection to keep
+    those writes in the caller's transaction.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        codec: str | SnapshotCodec = "zlib",
+        table: str | None = None,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            conn: Database connection (sync protocol)
+            codec: Codec name or instance used for new snapshots
+            table: Table name (default: core_workflow_checkpoints)
+        """
+        self.conn = conn
+        self.codec = codec if isinstance(codec, SnapshotCodec) else get_codec(codec)
+        self.table = table or CORE_TABLES["workflow_checkpoints"]
+
+    @staticmethod
+    def _key_json(partition: dict[str, Any]) -> str:
+        return json.dumps(partition, sort_keys=True, default=str)
+
+    def encode(self, context: WorkflowContext) -> bytes:
+        """Serialize and compress a context.
+
+        Raises:
+            ValueError: If params or outputs hold values JSON can't represent
+        """
+        try:
+            raw = json.dumps(context.to_dict(), separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"Cannot checkpoint run {context.run_id}: context is not JSON-serializable ({e})"
+            ) from e
+        return self.codec.compress(raw.encode("utf-8"))
+
+    @staticmethod
+    def decode(snapshot: bytes, codec: str) -> WorkflowContext:
+        """Decompress and deserialize a snapshot."""
+        raw = get_codec(codec).decompress(bytes(snapshot))
+        return WorkflowContext.from_dict(json.loads(raw))
+
+    def save(
+        self,
+        context: WorkflowContext,
+        partition: dict[str, Any],
+        next_step: str | None,
+        completed_steps: list[str],
+    ) -> None:
+        """
+        Write (or overwrite) the checkpoint for context.run_id.
+
+        Args:
+            context: Context after the last successful step
+            partition: Partition key of the run
+            next_step: First step still to run (None = finished)
+            completed_steps: Steps completed so far, in order
+
+        Raises:
+            ValueError: If the context is not JSON-serializable
+        """
+        self.conn.execute(
+            f"""
+            INSERT INTO {self.table}
+                (run_id, workflow_name, partition_key, next_step,
+                 completed_steps, codec, snapshot, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_id) DO UPDATE SET
+                next_step = excluded.next_step,
+                completed_steps = excluded.completed_steps,
+                codec = excluded.codec,
+                snapshot = excluded.snapshot,
+                updated_at = excluded.updated_at
+            """,
+            (
+                context.run_id,
+                context.workflow_name,
+                self._key_json(partition),
+                next_step,
+                json.dumps(completed_steps),
+                self.codec.name,
+                self.encode(context),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self.conn.commit()
+
+    def load(self, run_id: str) -> Checkpoint | None:
+        """Get the checkpoint of a run, or None."""
+        cursor = self.conn.execute(
+            f"""
+            SELECT run_id, workflow_name, partition_key, next_step,
+                   completed_steps, codec, snapshot, updated_at
+            FROM {self.table}
+            WHERE run_id = ?
+            """,
+            (run_id,),
+        )
+        return self._row_to_checkpoint(cursor.fetchone())
+
+    def latest(self, workflow_name: str, partition: dict[str, Any]) -> Checkpoint | None:
+        """Get the most recently updated checkpoint for a workflow partition."""
+        cursor = self.conn.execute(
+            f"""
+            SELECT run_id, workflow_name, partition_key, next_step,
+                   completed_steps, codec, snapshot, updated_at
+            FROM {self.table}
+            WHERE workflow_name = ? AND partition_key = ?
+            ORDER BY updated_at DESC
+            LIMIT 1
+            """,
+            (workflow_name, self._key_json(partition)),
+        )
+        return self._row_to_checkpoint(cursor.fetchone())
+
+    def delete(self, run_id: str) -> None:
+        """Remove a run's checkpoint."""
+        self.conn.execute(f"DELETE FROM {self.table} WHERE run_id = ?", (run_id,))
+        self.conn.commit()
+
+    def _row_to_checkpoint(self, row: Any) -> Checkpoint | None:
+        if row is None:
+            return None
+        return Checkpoint(
+            run_id=row[0],
+            workflow_name=row[1],
+            partition=json.loads(row[2]),
+            next_step=row[3],
+            completed_steps=json.loads(row[4] or "[]"),
+            context=self.decode(row[6], row[5]),
+            updated_at=row[7],
+        )
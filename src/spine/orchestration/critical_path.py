@@ -0,0 +1,259 @@
+"""
+Critical-path analysis for execution plans.
+
+When more steps are ready than ``max_concurrency`` allows, the order in
+which GroupRunner starts them decides the makespan: starting a short
+leaf before the head of a long chain delays everything behind that
+chain. Each step is ranked by the longest duration-weighted path from
+it to a sink (its "bottom level", the classic list-scheduling
+priority), so the runner always starts the step with the most work
+still depending on it.
+
+Durations come from history, keyed by step name or pipeline name:
+
+- ``durations_from_executions(conn)``: average run time per pipeline
+  from the core_executions ledger
+- ``durations_from_results(results)``: average per pipeline from past
+  GroupExecutionResult objects
+
+Steps without history use the mean of the known durations (1.0 when
+nothing is known, which ranks by remaining chain length).
+
+Example:
+    from spine.orchestration import GroupRunner
+    from spine.orchestration.critical_path import durations_from_executions
+
+    runner = GroupRunner(step_durations=durations_from_executions(conn))
+    result = runner.execute(plan)
+    print(result.makespan_report())
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Protocol
+
+from spine.core.schema import CORE_TABLES
+
+if TYPE_CHECKING:
+    from spine.orchestration.models import ExecutionPlan
+    from spine.orchestration.runner import GroupExecutionResult
+
+
+class Connection(Protocol):
+    """Minimal SYNC DB connection interface."""
+
+    def execute(self, sql: str, params: tuple = ()) -> Any: ...
+
+
+def step_weights(
+    plan: ExecutionPlan,
+    durations: Mapping[str, float] | None = None,
+) -> dict[str, float]:
+    """
+    Expected duration of every step in a plan.
+
+    Args:
+        plan: Execution plan
+        durations: Seconds by step name or pipeline name (step name wins)
+
+    Returns:
+        Seconds per step name
+    """
+    durations = durations or {}
+    known = [float(v) for v in durations.values()]
+    default = sum(known) / len(known) if known else 1.0
+    weights = {}
+    for step in plan.steps:
+        weight = durations.get(step.step_name, durations.get(step.pipeline_name, default))
+        weights[step.step_name] = max(float(weight), 0.0)
+    return weights
+
+
+def critical_path_priorities(
+    plan: ExecutionPlan,
+    weights: Mapping[str, float],
+) -> dict[str, float]:
+    """
+    Longest weighted path from each step to a sink, including the step.
+
+    plan.steps is topologically ordered by PlanResolver, so one reverse
+    pass computes every path length in O(steps + edges).
+
+    Args:
+        plan: Execution plan
+        weights: Seconds per step name (see step_weights)
+
+    Returns:
+        Priority per step name (higher = start first)
+    """
+    dependents: dict[str, list[str]] = defaultdict(list)
+    for step in plan.steps:
+        for dep in step.depends_on:
+            dependents[dep].append(step.step_name)
+
+    priorities: dict[str, float] = {}
+    for step in reversed(plan.steps):
+        tail = max((priorities.get(child, 0.0) for child in dependents[step.step_name]), default=0.0)
+        priorities[step.step_name] = weights[step.step_name] + tail
+    return priorities
+
+
+def critical_path(plan: ExecutionPlan, priorities: Mapping[str, float]) -> list[str]:
+    """
+    The chain of steps that bounds the makespan, source to sink.
+
+    Args:
+        plan: Execution plan
+        priorities: Output of critical_path_priorities
+
+    Returns:
+        Step names along the longest path (empty for an empty plan)
+    """
+    if not plan.steps:
+        return []
+    dependents: dict[str, list[str]] = defaultdict(list)
+    for step in plan.steps:
+        for dep in step.depends_on:
+            dependents[dep].append(step.step_name)
+
+    roots = [s.step_name for s in plan.steps if not s.depends_on]
+    path = [max(roots or [plan.steps[0].step_name], key=lambda name: priorities[name])]
+    while dependents[path[-1]]:
+        path.append(max(dependents[path[-1]], key=lambda name: priorities[name]))
+    return path
+
+
+def predict_makespan(
+    plan: ExecutionPlan,
+    weights: Mapping[str, float],
+    max_concurrency: int,
+    priorities: Mapping[str, float] | None = None,
+) -> float:
+    """
+    Simulate critical-path list scheduling with max_concurrency workers.
+
+    Args:
+        plan: Execution plan
+        weights: Seconds per step name (see step_weights)
+        max_concurrency: Worker count (1 = sequential)
+        priorities: Dispatch priorities (computed if omitted; missing
+            steps rank lowest, ties go in plan order)
+
+    Returns:
+        Predicted wall-clock seconds for the whole plan
+    """
+    if priorities is None:
+        priorities = critical_path_priorities(plan, weights)
+    order = {step.step_name: i for i, step in enumerate(plan.steps)}
+    dependents: dict[str, list[str]] = defaultdict(list)
+    unmet: dict[str, int] = {}
+    ready: list[tuple[float, int, str]] = []
+    for step in plan.steps:
+        deps = set(step.depends_on)
+        unmet[step.step_name] = len(deps)
+        for dep in deps:
+            dependents[dep].append(step.step_name)
+        if not deps:
+            ready.append((-priorities.get(step.step_name, 0.0), order[step.step_name], step.step_name))
+    heapq.heapify(ready)
+
+    now = 0.0
+    running: list[tuple[float, str]] = []
+    workers = max(max_concurrency, 1)
+    while ready or running:
+        while ready and len(running) < workers:
+            _, _, name = heapq.heappop(ready)
+            heapq.heappush(running, (now + weights[name], name))
+        now, name = heapq.heappop(running)
+        for child in dependents[name]:
+            unmet[child] -= 1
+            if unmet[child] == 0:
+                heapq.heappush(ready, (-priorities.get(child, 0.0), order[child], child))
+    return now
+
+
+def durations_from_executions(
+    conn: Connection,
+    pipelines: Iterable[str] | None = None,
+    window: int = 20,
+    table: str | None = None,
+) -> dict[str, float]:
+    """
+    Average run time per pipeline from the execution ledger.
+
+    Only completed executions with both timestamps count; the latest
+    ``window`` runs of each pipeline are averaged.
+
+    Args:
+        conn: Database connection (sync protocol)
+        pipelines: Restrict to these pipelines (default: all)
+        window: Recent runs averaged per pipeline
+        table: Table name (default: core_executions)
+
+    Returns:
+        Seconds by pipeline name
+    """
+    table = table or CORE_TABLES["executions"]
+    where = """
+        status = 'completed'
+          AND started_at IS NOT NULL AND completed_at IS NOT NULL
+    """
+    params: tuple = ()
+    if pipelines is not None:
+        names = tuple(pipelines)
+        if not names:
+            return {}
+        where += f" AND pipeline IN ({', '.join('?' * len(names))})"
+        params = names
+    # Cap rows per pipeline in SQL so a long-lived ledger isn't read in full
+    sql = f"""
+        SELECT pipeline, started_at, completed_at
+        FROM (
+            SELECT pipeline, started_at, completed_at,
+                   ROW_NUMBER() OVER (PARTITION BY pipeline ORDER BY completed_at DESC) AS recent
+            FROM {table}
+            WHERE {where}
+        ) ranked
+        WHERE recent <= ?
+    """
+    params += (window,)
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    for pipeline, started_at, completed_at in conn.execute(sql, params).fetchall():
+        try:
+            seconds = (_parse_ts(completed_at) - _parse_ts(started_at)).total_seconds()
+        except (TypeError, ValueError):
+            continue
+        samples[pipeline].append(max(seconds, 0.0))
+    return {name: sum(vals) / len(vals) for name, vals in samples.items() if vals}
+
+
+def durations_from_results(results: Iterable[GroupExecutionResult]) -> dict[str, float]:
+    """
+    Average run time per pipeline from past group runs.
+
+    Args:
+        results: Earlier GroupExecutionResult objects
+
+    Returns:
+        Seconds by pipeline name (completed steps only)
+    """
+    from spine.orchestration.runner import StepStatus
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    for result in results:
+        for step_exec in result.step_executions:
+            seconds = step_exec.duration_seconds
+            if step_exec.status == StepStatus.COMPLETED and seconds is not None:
+                samples[step_exec.pipeline_name].append(seconds)
+    return {name: sum(vals) / len(vals) for name, vals in samples.items()}
+
+
+def _parse_ts(value: str | datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
@@ -27,6 +27,11 @@ File Format (YAML):
         on_failure: stop
 """
 
+import fnmatch
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +45,9 @@ logger = structlog.get_logger()
 # Supported API versions
 SUPPORTED_API_VERSIONS = {"spine.io/v1"}
 
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 32
+
 
 def load_group_from_yaml(path: Path | str) -> PipelineGroup:
     """
@@ -70,9 +78,12 @@ def load_group_from_yaml(path: Path | str) -> PipelineGroup:
 
     logger.debug("loader.load_yaml", path=str(path))
 
+    # The libyaml-backed loader is several times faster when available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     with open(path, "r", encoding="utf-8") as f:
         try:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
         except yaml.YAMLError as e:
             raise InvalidGroupSpecError(f"Invalid YAML in {path}: {e}")
 
@@ -111,21 +122,187 @@ def load_group_from_yaml(path: Path | str) -> PipelineGroup:
     return group
 
 
-def load_groups_from_directory(
+class GroupCache:
+    """
+    On-disk cache of parsed PipelineGroups for a group directory.
+
+    A single JSON index maps each YAML file to its mtime, size, SHA-256
+    and the parsed group (flat ``to_dict`` format). A file whose mtime
+    and size are unchanged is a hit without being read; one that was
+    touched but not edited is re-hashed and still hits. Anything else is
+    a miss and gets re-parsed and validated.
+
+    Example:
+        cache = GroupCache(".spine/group-cache.json")
+        groups = load_groups_from_directory("groups/", cache=cache)
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: Path | str):
+        """
+        Args:
+            path: Location of the JSON index file (created on first save)
+        """
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("loader.cache_unreadable", path=str(self.path), error=str(e))
+            return
+        if isinstance(data, dict) and data.get("version") == self.FORMAT_VERSION:
+            self._entries = data.get("entries", {})
+
+    def lookup(self, path: Path) -> dict[str, Any] | None:
+        """
+        Get the cached group dict for a file, if still valid.
+
+        Args:
+            path: YAML file path
+
+        Returns:
+            Flat group dict for PipelineGroup.from_dict, or None on a miss
+        """
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stat = path.stat()
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            if _file_digest(path) != entry["sha256"]:
+                self.misses += 1
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._dirty = True
+
+        self.hits += 1
+        return entry["group"]
+
+    def store(self, path: Path, group: PipelineGroup) -> None:
+        """Record a freshly parsed group for a file."""
+        stat = path.stat()
+        self._entries[str(path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _file_digest(path),
+            "group": group.to_dict(),
+        }
+        self._dirty = True
+
+    def prune(self, directory: Path, pattern: str, keep: set[str]) -> None:
+        """
+        Drop entries for files that no longer exist under the scanned directory.
+
+        Only keys under directory that match pattern are candidates, so
+        one cache can be shared by scans of several directories or
+        patterns.
+
+        Args:
+            directory: Directory that was scanned
+            pattern: Glob pattern of the scan
+            keep: Keys of the files the scan found
+        """
+        pattern_parts = Path(pattern).parts
+        stale = [
+            key
+            for key in self._entries
+            if key not in keep and _in_scan(Path(key), directory, pattern_parts)
+        ]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index if anything changed (atomically, via rename)."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": self.FORMAT_VERSION, "entries": self._entries}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _in_scan(path: Path, directory: Path, pattern_parts: tuple[str, ...]) -> bool:
+    """True if directory.glob(pattern) would yield path (when it exists)."""
+    if not path.is_relative_to(directory):
+        return False
+    return _match_parts(path.relative_to(directory).parts, pattern_parts)
+
+
+def _match_parts(parts: tuple[str, ...], pattern_parts: tuple[str, ...]) -> bool:
+    if not pattern_parts:
+        return not parts
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head == "**":
+        return any(_match_parts(parts[i:], rest) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatch.fnmatchcase(parts[0], head) and _match_parts(parts[1:], rest)
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _parse_in_worker(path: str) -> PipelineGroup | None:
+    """Process-pool entry point; failures are re-raised by the parent."""
+    try:
+        return load_group_from_yaml(path)
+    except Exception:
+        return None
+
+
+def _parse_files(paths: list[Path], workers: int | None) -> list[PipelineGroup | None]:
+    """Parse files in order, fanning out to a process pool for large batches."""
+    if workers is None or workers <= 1 or len(paths) < PARALLEL_PARSE_THRESHOLD:
+        return [_parse_in_worker(str(p)) for p in paths]
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_in_worker, [str(p) for p in paths], chunksize=chunksize))
+
+
+def scan_group_directory(
     directory: Path | str,
     pattern: str = "**/*.yaml",
     ignore_errors: bool = False,
-) -> list[PipelineGroup]:
+    cache: GroupCache | None = None,
+    workers: int | None = None,
+) -> list[PipelineGroup | dict[str, Any]]:
     """
-    Load all PipelineGroups from a directory.
+    Collect group definitions from a directory without building cached ones.
+
+    Cache hits are returned as flat group dicts so callers can defer
+    ``PipelineGroup.from_dict`` (see ``register_groups_from_directory``);
+    misses are parsed, validated and returned as PipelineGroups.
 
     Args:
         directory: Directory to scan
         pattern: Glob pattern for YAML files
         ignore_errors: If True, skip invalid files instead of raising
+        cache: Optional GroupCache to consult and update
+        workers: Parse cache misses in this many processes (None = in-process)
 
     Returns:
-        List of parsed PipelineGroups
+        One PipelineGroup or group dict per valid file, in glob order
     """
     directory = Path(directory)
 
@@ -133,29 +310,74 @@ def load_groups_from_directory(
         logger.warning("loader.directory_not_found", path=str(directory))
         return []
 
-    groups = []
-    errors = []
+    paths = [path for path in directory.glob(pattern) if path.is_file()]
+    found: list[PipelineGroup | dict[str, Any] | None] = [None] * len(paths)
+    missed: list[int] = []
 
-    for path in directory.glob(pattern):
-        if path.is_file():
+    for i, path in enumerate(paths):
+        cached = cache.lookup(path) if cache is not None else None
+        if cached is None:
+            missed.append(i)
+        else:
+            found[i] = cached
+
+    errors = 0
+    parsed = _parse_files([paths[i] for i in missed], workers)
+    for i, group in zip(missed, parsed):
+        path = paths[i]
+        if group is None:
+            # Re-parse in-process to surface the real error
             try:
                 group = load_group_from_yaml(path)
-                groups.append(group)
             except Exception as e:
-                if ignore_errors:
-                    logger.warning("loader.file_error", path=str(path), error=str(e))
-                    errors.append((path, e))
-                else:
+                if not ignore_errors:
                     raise
+                logger.warning("loader.file_error", path=str(path), error=str(e))
+                errors += 1
+                continue
+        found[i] = group
+        if cache is not None:
+            cache.store(path, group)
+
+    if cache is not None:
+        cache.prune(directory, pattern, {str(p) for p in paths})
+        cache.save()
 
     logger.info(
         "loader.directory_loaded",
         directory=str(directory),
-        loaded=len(groups),
-        errors=len(errors),
+        loaded=len(paths) - errors,
+        parsed=len(missed),
+        errors=errors,
     )
 
-    return groups
+    return [item for item in found if item is not None]
+
+
+def load_groups_from_directory(
+    directory: Path | str,
+    pattern: str = "**/*.yaml",
+    ignore_errors: bool = False,
+    cache: GroupCache | None = None,
+    workers: int | None = None,
+) -> list[PipelineGroup]:
+    """
+    Load all PipelineGroups from a directory.
+
+    Args:
+        directory: Directory to scan
+        pattern: Glob pattern for YAML files
+        ignore_errors: If True, skip invalid files instead of raising
+        cache: Optional GroupCache; unchanged files skip YAML parsing
+        workers: Parse uncached files in this many processes (None = in-process)
+
+    Returns:
+        List of parsed PipelineGroups
+    """
+    return [
+        item if isinstance(item, PipelineGroup) else PipelineGroup.from_dict(item)
+        for item in scan_group_directory(directory, pattern, ignore_errors, cache, workers)
+    ]
 
 
 def group_to_yaml(group: PipelineGroup) -> str:
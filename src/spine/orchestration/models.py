@@ -11,6 +11,7 @@ Design Principles:
 - Aligned with RFC-001 specification
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -277,7 +278,7 @@ class PlannedStep:
 
     step_name: str
     pipeline_name: str
-    params: dict[str, Any]
+    params: Mapping[str, Any]  # Read-only when produced by PlanResolver
     depends_on: tuple[str, ...]
     sequence_order: int
 
@@ -286,7 +287,7 @@ class PlannedStep:
         return {
             "step_name": self.step_name,
             "pipeline_name": self.pipeline_name,
-            "params": self.params,
+            "params": dict(self.params),
             "depends_on": list(self.depends_on),
             "sequence_order": self.sequence_order,
         }
@@ -314,7 +315,7 @@ class ExecutionPlan:
     batch_id: str
     steps: list[PlannedStep]
     policy: ExecutionPolicy
-    params: dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
     resolved_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     @property
@@ -341,6 +342,6 @@ class ExecutionPlan:
                 "max_concurrency": self.policy.max_concurrency,
                 "on_failure": self.policy.on_failure.value,
             },
-            "params": self.params,
+            "params": dict(self.params),
             "resolved_at": self.resolved_at.isoformat(),
         }
@@ -8,6 +8,11 @@ This is the core orchestration logic:
 4. Merge parameters (group.defaults < run_params < step.params)
 5. Return ExecutionPlan ready for GroupRunner
 
+Resolved plans are cached per resolver (LRU), keyed on a content hash of
+the group definition and the run params, so re-resolving the same group
+skips steps 1-4. Cached entries are dropped whenever the group or
+pipeline registry changes.
+
 Design Principles:
 - Pure functions where possible (testable, deterministic)
 - No database access (that's for persistence layer)
@@ -15,12 +20,19 @@ Design Principles:
 - Clear error messages for all failure modes
 """
 
-from collections import defaultdict, deque
+import hashlib
+import json
+import threading
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Hashable
+from datetime import datetime, timezone
+from types import MappingProxyType
 
 import structlog
 
 from spine.core.execution import new_batch_id
 from spine.framework.registry import get_pipeline
+from spine.framework.registry import registry_generation as pipeline_registry_generation
 from spine.orchestration.exceptions import (
     CycleDetectedError,
     DependencyError,
@@ -33,6 +45,7 @@ from spine.orchestration.models import (
     PipelineStep,
     PlannedStep,
 )
+from spine.orchestration.registry import registry_generation
 
 logger = structlog.get_logger()
 
@@ -41,7 +54,12 @@ class PlanResolver:
     """
     Resolves a PipelineGroup into an ExecutionPlan.
 
-    Thread-safe: No mutable state, each resolve() call is independent.
+    Thread-safe: the only mutable state is the plan cache, which is
+    guarded by a lock.
+
+    Cache hits return a new ExecutionPlan (own batch_id and resolved_at)
+    that shares the cached, immutable steps: PlannedStep is frozen and its
+    params are a read-only mapping.
 
     Example:
         resolver = PlanResolver()
@@ -53,15 +71,22 @@ class PlanResolver:
         # plan.batch_id links all child executions
     """
 
-    def __init__(self, validate_pipelines: bool = True):
+    def __init__(self, validate_pipelines: bool = True, cache_size: int = 256):
         """
         Initialize resolver.
 
         Args:
             validate_pipelines: If True, verify all pipelines exist in registry.
                                Set to False for testing without pipeline registration.
+            cache_size: Max cached plans (LRU). 0 disables caching.
         """
         self.validate_pipelines = validate_pipelines
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Hashable, ExecutionPlan] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation: tuple[int, int] | None = None
+        self._hits = 0
+        self._misses = 0
 
     def resolve(
         self,
@@ -89,6 +114,12 @@ class PlanResolver:
         params = params or {}
         batch_id = batch_id or new_batch_id(f"group_{group.name}")
 
+        key = self._cache_key(group, params) if self.cache_size > 0 else None
+        if key is not None:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return self._instantiate(cached, batch_id)
+
         logger.debug(
             "plan_resolver.start",
             group=group.name,
@@ -117,7 +148,7 @@ class PlanResolver:
                 PlannedStep(
                     step_name=step.name,
                     pipeline_name=step.pipeline,
-                    params=merged_params,
+                    params=MappingProxyType(merged_params),
                     depends_on=step.depends_on,
                     sequence_order=order,
                 )
@@ -129,7 +160,7 @@ class PlanResolver:
             batch_id=batch_id,
             steps=planned_steps,
             policy=group.policy,
-            params=params,
+            params=MappingProxyType(dict(params)),
         )
 
         logger.info(
@@ -140,8 +171,83 @@ class PlanResolver:
             execution_mode=group.policy.mode.value,
         )
 
+        if key is not None:
+            self._cache_put(key, plan)
+            return self._instantiate(plan, batch_id)
         return plan
 
+    # =========================================================================
+    # Plan cache
+    # =========================================================================
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Cache hits, misses and current size."""
+        with self._cache_lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._cache)}
+
+    def clear_cache(self) -> None:
+        """Drop all cached plans."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cache_key(self, group: PipelineGroup, params: dict) -> Hashable:
+        """
+        Key for the group's resolved content plus the run params.
+
+        A tuple of the definition itself, so lookups compare by value and
+        cannot collide. Falls back to a JSON digest when params hold
+        unhashable values (lists, dicts).
+        """
+        try:
+            key = (
+                group.name,
+                group.version,
+                _freeze(group.defaults),
+                group.policy,
+                tuple((s.name, s.pipeline, s.depends_on, _freeze(s.params)) for s in group.steps),
+                _freeze(params),
+            )
+            hash(key)
+            return key
+        except TypeError:
+            payload = json.dumps([group.to_dict(), params], sort_keys=True, default=str)
+            return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: Hashable) -> ExecutionPlan | None:
+        generation = (registry_generation(), pipeline_registry_generation())
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                # Registered groups or pipelines changed since caching
+                self._cache.clear()
+                self._cache_generation = generation
+            plan = self._cache.get(key)
+            if plan is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return plan
+
+    def _cache_put(self, key: Hashable, plan: ExecutionPlan) -> None:
+        with self._cache_lock:
+            self._cache[key] = plan
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _instantiate(template: ExecutionPlan, batch_id: str) -> ExecutionPlan:
+        """New plan sharing the template's immutable steps."""
+        return ExecutionPlan(
+            group_name=template.group_name,
+            group_version=template.group_version,
+            batch_id=batch_id,
+            steps=list(template.steps),
+            policy=template.policy,
+            params=template.params,
+            resolved_at=datetime.now(timezone.utc),
+        )
+
     def _validate_pipelines(self, steps: list[PipelineStep]) -> None:
         """Validate all pipelines are registered."""
         for step in steps:
@@ -283,6 +389,11 @@ class PlanResolver:
 # =============================================================================
 
 
+def _freeze(params: dict) -> tuple:
+    """Hashable form of a params dict; value types are kept so 1 != True."""
+    return tuple(sorted((k, type(v), v) for k, v in params.items())) if params else ()
+
+
 def validate_group(group: PipelineGroup, validate_pipelines: bool = True) -> list[str]:
     """
     Validate a group definition without resolving it.
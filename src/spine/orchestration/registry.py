@@ -23,20 +23,27 @@ Usage:
 
     # List all
     names = list_groups()
+
+    # Register a directory of YAML groups; cached ones are built on first use
+    register_groups_from_directory("groups/", cache=GroupCache(".spine/groups.json"))
 """
 
+from pathlib import Path
 from typing import Callable
 
 import structlog
 
 from spine.orchestration.models import PipelineGroup
 from spine.orchestration.exceptions import GroupNotFoundError
+from spine.orchestration.loader import GroupCache, scan_group_directory
 
 logger = structlog.get_logger()
 
 # Global group registry
 _registry: dict[str, PipelineGroup] = {}
+_lazy: dict[str, tuple[str, Callable[[], PipelineGroup]]] = {}  # name -> (domain, factory)
 _loaded: bool = False
+_generation: int = 0  # Bumped on every change, for caches keyed on the registry
 
 
 def register_group(
@@ -79,10 +86,12 @@ def register_group(
             "If using as decorator, the function must return a PipelineGroup."
         )
 
-    if group.name in _registry:
+    if group.name in _registry or group.name in _lazy:
         raise ValueError(f"Pipeline group '{group.name}' is already registered")
 
+    global _generation
     _registry[group.name] = group
+    _generation += 1
 
     logger.debug(
         "group_registered",
@@ -94,6 +103,77 @@ def register_group(
     return group
 
 
+def register_lazy_group(
+    name: str,
+    factory: Callable[[], PipelineGroup],
+    domain: str = "",
+) -> None:
+    """
+    Register a group that is only built on first lookup.
+
+    ``list_groups`` and ``group_exists`` answer from the name and domain
+    alone; ``get_group`` calls the factory once and keeps the result.
+
+    Args:
+        name: The group name the factory will produce
+        factory: Zero-argument callable returning the PipelineGroup
+        domain: Domain of the group (for ``list_groups`` filtering)
+
+    Raises:
+        ValueError: If a group with the same name is already registered
+    """
+    if name in _registry or name in _lazy:
+        raise ValueError(f"Pipeline group '{name}' is already registered")
+
+    global _generation
+    _lazy[name] = (domain, factory)
+    _generation += 1
+
+    logger.debug("group_registered_lazy", name=name, domain=domain)
+
+
+def register_groups_from_directory(
+    directory: Path | str,
+    pattern: str = "**/*.yaml",
+    ignore_errors: bool = False,
+    cache: GroupCache | None = None,
+    workers: int | None = None,
+) -> list[str]:
+    """
+    Register every group defined in a directory of YAML files.
+
+    Groups served from ``cache`` are registered lazily, so a warm start
+    only stats the files; changed or new files are parsed (optionally in
+    ``workers`` processes) and registered directly.
+
+    Args:
+        directory: Directory to scan
+        pattern: Glob pattern for YAML files
+        ignore_errors: If True, skip invalid files instead of raising
+        cache: Optional GroupCache for parsed groups
+        workers: Parse uncached files in this many processes
+
+    Returns:
+        Names of the registered groups
+
+    Raises:
+        ValueError: If a group name is already registered
+    """
+    names = []
+    for item in scan_group_directory(directory, pattern, ignore_errors, cache, workers):
+        if isinstance(item, PipelineGroup):
+            register_group(item)
+            names.append(item.name)
+        else:
+            register_lazy_group(
+                item["name"],
+                lambda data=item: PipelineGroup.from_dict(data),
+                domain=item.get("domain", ""),
+            )
+            names.append(item["name"])
+    return names
+
+
 def get_group(name: str) -> PipelineGroup:
     """
     Get a pipeline group by name.
@@ -109,6 +189,9 @@ def get_group(name: str) -> PipelineGroup:
     """
     _ensure_loaded()
 
+    if name in _lazy:
+        _materialize(name)
+
     if name not in _registry:
         available = ", ".join(sorted(_registry.keys())) if _registry else "(none)"
         raise GroupNotFoundError(name)
@@ -130,16 +213,28 @@ def list_groups(domain: str | None = None) -> list[str]:
 
     if domain:
         return sorted(
-            name for name, group in _registry.items()
-            if group.domain == domain
+            [name for name, group in _registry.items() if group.domain == domain]
+            + [name for name, (group_domain, _) in _lazy.items() if group_domain == domain]
         )
-    return sorted(_registry.keys())
+    return sorted([*_registry, *_lazy])
 
 
 def group_exists(name: str) -> bool:
     """Check if a group is registered."""
     _ensure_loaded()
-    return name in _registry
+    return name in _registry or name in _lazy
+
+
+def _materialize(name: str) -> None:
+    """Build a lazily registered group and move it into the registry."""
+    _, factory = _lazy[name]
+    group = factory()
+    if group.name != name:
+        raise ValueError(
+            f"Lazy group factory for '{name}' returned group '{group.name}'"
+        )
+    _registry[name] = group
+    del _lazy[name]
 
 
 def clear_group_registry() -> None:
@@ -148,12 +243,23 @@ def clear_group_registry() -> None:
 
     Primarily for testing - allows tests to start with a clean registry.
     """
-    global _loaded
+    global _loaded, _generation
     _registry.clear()
+    _lazy.clear()
     _loaded = False
+    _generation += 1
     logger.debug("group_registry_cleared")
 
 
+def registry_generation() -> int:
+    """
+    Get a counter that changes whenever the group registry changes.
+
+    Used by PlanResolver to invalidate cached plans.
+    """
+    return _generation
+
+
 def _ensure_loaded() -> None:
     """
     Ensure groups are loaded (lazy initialization).
@@ -184,11 +290,14 @@ def get_registry_stats() -> dict:
     _ensure_loaded()
 
     domains = {}
-    for group in _registry.values():
-        domain = group.domain or "(no domain)"
+    group_domains = [group.domain for group in _registry.values()]
+    group_domains += [domain for domain, _ in _lazy.values()]
+    for domain in group_domains:
+        domain = domain or "(no domain)"
         domains[domain] = domains.get(domain, 0) + 1
 
     return {
-        "total_groups": len(_registry),
+        "total_groups": len(_registry) + len(_lazy),
         "groups_by_domain": domains,
+        "lazy_groups": len(_lazy),
     }
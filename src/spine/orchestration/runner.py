@@ -7,6 +7,7 @@ and runs each step in dependency order using the existing Dispatcher.
 Features:
 - Sequential execution with dependency ordering
 - Parallel execution with max_concurrency and dependency respect
+- Critical-path ordering of ready steps, weighted by historical durations
 - Stop-on-failure or continue-on-failure policies
 - Status tracking per step
 - Integration with Dispatcher.submit()
@@ -32,18 +33,25 @@ Example:
 
 from __future__ import annotations
 
+import heapq
 import structlog
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, Future, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from threading import Lock
 from typing import Any, TYPE_CHECKING
 
 from spine.framework.dispatcher import Dispatcher, get_dispatcher, TriggerSource
 from spine.framework.pipelines import PipelineStatus
 from spine.orchestration.models import ExecutionPlan, PlannedStep, FailurePolicy, ExecutionMode
 from spine.orchestration.exceptions import GroupError
+from spine.orchestration.critical_path import (
+    critical_path,
+    critical_path_priorities,
+    predict_makespan,
+    step_weights,
+)
 
 if TYPE_CHECKING:
     from spine.framework.pipelines import PipelineResult
@@ -77,6 +85,7 @@ class StepExecution:
     completed_at: datetime | None = None
     result: PipelineResult | None = None
     error: str | None = None
+    run_id: str | None = None  # Dispatcher run (AsyncGroupRunner)
 
     @property
     def duration_seconds(self) -> float | None:
@@ -104,6 +113,7 @@ class StepExecution:
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "duration_seconds": self.duration_seconds,
             "error": self.error,
+            "run_id": self.run_id,
             "result": result_dict,
         }
 
@@ -131,6 +141,8 @@ class GroupExecutionResult:
     started_at: datetime
     completed_at: datetime | None = None
     step_executions: list[StepExecution] = field(default_factory=list)
+    predicted_makespan_seconds: float | None = None
+    critical_path: list[str] = field(default_factory=list)
 
     @property
     def duration_seconds(self) -> float | None:
@@ -139,6 +151,31 @@ class GroupExecutionResult:
             return (self.completed_at - self.started_at).total_seconds()
         return None
 
+    def makespan_report(self) -> dict[str, Any]:
+        """
+        Predicted vs. actual makespan of this run.
+
+        The prediction is only set when the runner had step durations.
+
+        Returns:
+            Dict with predicted_seconds, actual_seconds, error_seconds
+            (actual - predicted), ratio (actual / predicted) and the
+            predicted critical_path
+        """
+        predicted = self.predicted_makespan_seconds
+        actual = self.duration_seconds
+        error = ratio = None
+        if predicted is not None and actual is not None:
+            error = actual - predicted
+            ratio = actual / predicted if predicted > 0 else None
+        return {
+            "predicted_seconds": predicted,
+            "actual_seconds": actual,
+            "error_seconds": error,
+            "ratio": ratio,
+            "critical_path": list(self.critical_path),
+        }
+
     @property
     def successful_steps(self) -> int:
         """Count of successfully completed steps."""
@@ -188,6 +225,7 @@ class GroupExecutionResult:
             "successful_steps": self.successful_steps,
             "failed_steps": self.failed_steps,
             "skipped_steps": self.skipped_steps,
+            "makespan": self.makespan_report(),
             "step_executions": [s.to_dict() for s in self.step_executions],
         }
 
@@ -199,6 +237,13 @@ class GroupRunner:
     Takes an ExecutionPlan and runs each step in dependency order,
     respecting the execution policy (sequential/parallel, failure handling).
 
+    In parallel mode, ready steps start in critical-path order: the step
+    with the longest duration-weighted path to a sink goes first. Pass
+    ``step_durations`` (seconds by pipeline or step name, e.g. from
+    ``critical_path.durations_from_executions``) to weight by history
+    and to get a predicted makespan on each result; without it every
+    step weighs the same.
+
     Example:
         plan = resolver.resolve(group, params={...})
         runner = GroupRunner()
@@ -210,14 +255,20 @@ class GroupRunner:
             print(f"Failed: {result.failed_steps} failures")
     """
 
-    def __init__(self, dispatcher: Dispatcher | None = None):
+    def __init__(
+        self,
+        dispatcher: Dispatcher | None = None,
+        step_durations: Mapping[str, float] | None = None,
+    ):
         """
         Initialize runner.
 
         Args:
             dispatcher: Optional dispatcher instance. If None, uses get_dispatcher()
+            step_durations: Expected seconds by pipeline or step name
         """
         self.dispatcher = dispatcher or get_dispatcher()
+        self.step_durations = step_durations
 
     def execute(self, plan: ExecutionPlan) -> GroupExecutionResult:
         """
@@ -240,12 +291,7 @@ class GroupRunner:
             policy=plan.policy.mode.value,
         )
 
-        result = GroupExecutionResult(
-            group_name=plan.group_name,
-            batch_id=plan.batch_id,
-            status=GroupExecutionStatus.RUNNING,
-            started_at=datetime.now(timezone.utc),
-        )
+        result, priorities = _start_result(plan, self.step_durations)
 
         try:
             # Route to appropriate execution mode
@@ -255,31 +301,11 @@ class GroupRunner:
                     group=plan.group_name,
                     max_concurrency=plan.policy.max_concurrency,
                 )
-                self._execute_parallel(plan, result)
+                self._execute_parallel(plan, result, priorities)
             else:
                 self._execute_sequential(plan, result)
 
-            # Determine final status based on policy and outcomes
-            if result.failed_steps == 0 and result.skipped_steps == 0:
-                # All steps completed successfully
-                result.status = GroupExecutionStatus.COMPLETED
-            elif result.failed_steps > 0:
-                # At least one step failed
-                if plan.policy.on_failure == FailurePolicy.STOP:
-                    # STOP policy: any failure means overall failure
-                    result.status = GroupExecutionStatus.FAILED
-                elif result.successful_steps > 0:
-                    # CONTINUE policy with mixed results
-                    result.status = GroupExecutionStatus.PARTIAL
-                else:
-                    # CONTINUE policy but nothing succeeded
-                    result.status = GroupExecutionStatus.FAILED
-            elif result.skipped_steps > 0 and result.successful_steps > 0:
-                # Steps were skipped (dependency failures) but some succeeded
-                result.status = GroupExecutionStatus.PARTIAL
-            else:
-                # Everything was skipped
-                result.status = GroupExecutionStatus.FAILED
+            result.status = _final_status(plan, result)
 
         except Exception as e:
             logger.error(
@@ -303,6 +329,7 @@ class GroupRunner:
             failed=result.failed_steps,
             skipped=result.skipped_steps,
             duration_seconds=result.duration_seconds,
+            predicted_seconds=result.predicted_makespan_seconds,
         )
 
         return result
@@ -370,128 +397,59 @@ class GroupRunner:
         self,
         plan: ExecutionPlan,
         result: GroupExecutionResult,
+        priorities: Mapping[str, float] | None = None,
     ) -> None:
         """
         Execute steps in parallel, respecting dependencies.
 
         Uses a ThreadPoolExecutor with max_concurrency limit.
         Steps wait for their dependencies to complete before starting.
-        
-        The algorithm:
-        1. Track completed and failed steps
-        2. Find "ready" steps (all deps completed)
-        3. Submit ready steps to thread pool (up to max_concurrency)
-        4. Wait for completions, update tracking
-        5. Repeat until all steps processed or stopped
+
+        The algorithm (event-driven; no rescans of pending steps):
+        1. Count unmet dependencies (in-degree) per step; steps with none
+           are ready
+        2. Submit ready steps to the thread pool (up to max_concurrency),
+           highest critical-path priority first
+        3. On each completion, decrement the in-degree of its dependents
+           and queue those that reach zero
+        4. On a failure, skip every transitive dependent in one pass
+           (and stop submitting under FailurePolicy.STOP)
+
+        Scheduling cost is O((steps + edges) log steps) for the whole plan.
 
         Args:
             plan: Execution plan
             result: Result object to populate
+            priorities: Dispatch priority per step name (default: plan order)
         """
         max_workers = plan.policy.max_concurrency or 4
-        
-        # Thread-safe tracking
-        lock = Lock()
-        completed_steps: set[str] = set()
-        failed_steps: set[str] = set()
+        queue = _ReadyQueue(plan, priorities)
         step_results: dict[str, StepExecution] = {}
         should_stop = False
-        
-        # Map step names to PlannedStep for easy lookup
-        step_map = {s.step_name: s for s in plan.steps}
-        pending_steps = set(step_map.keys())
-        
-        def is_ready_unlocked(step: PlannedStep) -> bool:
-            """Check if step's dependencies are all completed successfully.
-            MUST be called while holding lock."""
-            if step.step_name not in pending_steps:
-                return False  # Already processed
-            # All deps must be completed (not failed, not pending)
-            return all(dep in completed_steps for dep in step.depends_on)
-        
-        def should_skip_unlocked(step: PlannedStep) -> bool:
-            """Check if step should be skipped due to failed dependencies.
-            MUST be called while holding lock."""
-            # If any dependency failed, this step should be skipped
-            return any(dep in failed_steps for dep in step.depends_on)
-        
-        def run_step(step: PlannedStep) -> StepExecution:
-            """Execute a single step (runs in thread pool)."""
-            return self._execute_step(plan, step)
-        
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures: dict[Future, PlannedStep] = {}
-            
-            while pending_steps and not should_stop:
-                # Find ready steps that aren't already running
-                running_steps = {step.step_name for step in futures.values()}
-                
-                with lock:
-                    ready = [
-                        step_map[name] for name in pending_steps
-                        if name not in running_steps
-                        and is_ready_unlocked(step_map[name])
-                    ]
-                    
-                    # Also find steps to skip (failed deps)
-                    to_skip = [
-                        step_map[name] for name in pending_steps
-                        if name not in running_steps
-                        and should_skip_unlocked(step_map[name])
-                    ]
-                
-                # Mark skipped steps
-                for step in to_skip:
-                    step_exec = StepExecution(
-                        step_name=step.step_name,
-                        pipeline_name=step.pipeline_name,
-                        status=StepStatus.SKIPPED,
-                    )
-                    with lock:
-                        step_results[step.step_name] = step_exec
-                        pending_steps.discard(step.step_name)
-                    
-                    logger.warning(
-                        "group_runner.step_skipped",
-                        step=step.step_name,
-                        reason="dependency_failed",
-                    )
-                
-                # Submit ready steps (up to available slots)
-                slots_available = max_workers - len(futures)
-                for step in ready[:slots_available]:
-                    future = executor.submit(run_step, step)
-                    futures[future] = step
-                    
+
+            while True:
+                # Fill free slots from the ready queue
+                while not should_stop and len(futures) < max_workers:
+                    step = queue.pop()
+                    if step is None:
+                        break
+                    futures[executor.submit(self._execute_step, plan, step)] = step
+
                     logger.debug(
                         "group_runner.parallel.submitted",
                         step=step.step_name,
                         active_futures=len(futures),
                     )
-                
-                # If no futures and no ready steps, we might be stuck or done
+
                 if not futures:
-                    if pending_steps:
-                        # All remaining steps have unmet dependencies
-                        # This shouldn't happen with valid DAG, but mark as skipped
-                        for name in list(pending_steps):
-                            step = step_map[name]
-                            step_exec = StepExecution(
-                                step_name=step.step_name,
-                                pipeline_name=step.pipeline_name,
-                                status=StepStatus.SKIPPED,
-                            )
-                            step_results[step.step_name] = step_exec
-                            pending_steps.discard(name)
                     break
-                
-                # Wait for at least one future to complete
-                done_futures = []
-                for future in as_completed(futures.keys()):
-                    done_futures.append(future)
-                    break  # Process one at a time to recheck ready steps
-                
-                for future in done_futures:
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
                     step = futures.pop(future)
                     try:
                         step_exec = future.result()
@@ -502,48 +460,51 @@ class GroupRunner:
                             status=StepStatus.FAILED,
                             error=str(e),
                         )
-                    
-                    with lock:
-                        step_results[step.step_name] = step_exec
-                        pending_steps.discard(step.step_name)
-                        
-                        if step_exec.status == StepStatus.COMPLETED:
-                            completed_steps.add(step.step_name)
-                        else:
-                            failed_steps.add(step.step_name)
-                            
-                            if plan.policy.on_failure == FailurePolicy.STOP:
-                                should_stop = True
-                                logger.error(
-                                    "group_runner.parallel.stopping_on_failure",
-                                    step=step.step_name,
-                                    policy="stop",
-                                )
-            
-            # If we stopped early, cancel remaining futures and mark pending as skipped
-            if should_stop:
-                for future in futures:
-                    future.cancel()
-                
-                for name in list(pending_steps):
-                    step = step_map[name]
-                    step_exec = StepExecution(
-                        step_name=step.step_name,
-                        pipeline_name=step.pipeline_name,
-                        status=StepStatus.SKIPPED,
-                    )
                     step_results[step.step_name] = step_exec
-                    
-                    logger.debug(
-                        "group_runner.step_skipped",
-                        step=step.step_name,
-                        reason="stopped_on_failure",
-                    )
-        
+
+                    if step_exec.status == StepStatus.COMPLETED:
+                        queue.complete(step.step_name)
+                        continue
+
+                    for skipped in queue.fail(step.step_name):
+                        step_results[skipped.step_name] = StepExecution(
+                            step_name=skipped.step_name,
+                            pipeline_name=skipped.pipeline_name,
+                            status=StepStatus.SKIPPED,
+                        )
+                        logger.warning(
+                            "group_runner.step_skipped",
+                            step=skipped.step_name,
+                            reason="dependency_failed",
+                            failed_step=step.step_name,
+                        )
+
+                    if plan.policy.on_failure == FailurePolicy.STOP and not should_stop:
+                        should_stop = True
+                        logger.error(
+                            "group_runner.parallel.stopping_on_failure",
+                            step=step.step_name,
+                            policy="stop",
+                        )
+
+        # Anything never started: stopped early, or dependencies that
+        # can never be met (unknown step names)
+        for step in plan.steps:
+            if step.step_name not in step_results:
+                step_results[step.step_name] = StepExecution(
+                    step_name=step.step_name,
+                    pipeline_name=step.pipeline_name,
+                    status=StepStatus.SKIPPED,
+                )
+                logger.debug(
+                    "group_runner.step_skipped",
+                    step=step.step_name,
+                    reason="stopped_on_failure" if should_stop else "dependency_unmet",
+                )
+
         # Add results in original order
         for step in plan.steps:
-            if step.step_name in step_results:
-                result.step_executions.append(step_results[step.step_name])
+            result.step_executions.append(step_results[step.step_name])
 
     def _execute_step(
         self,
@@ -692,6 +653,125 @@ class GroupRunner:
             )
 
 
+def _start_result(
+    plan: ExecutionPlan,
+    step_durations: Mapping[str, float] | None,
+) -> tuple[GroupExecutionResult, dict[str, float]]:
+    """
+    Create the RUNNING result of a plan and its dispatch priorities.
+
+    Sets the critical path, and the predicted makespan when durations
+    are known.
+    """
+    result = GroupExecutionResult(
+        group_name=plan.group_name,
+        batch_id=plan.batch_id,
+        status=GroupExecutionStatus.RUNNING,
+        started_at=datetime.now(timezone.utc),
+    )
+
+    weights = step_weights(plan, step_durations)
+    priorities = critical_path_priorities(plan, weights)
+    result.critical_path = critical_path(plan, priorities)
+    if step_durations is not None:
+        concurrency = 1
+        if plan.policy.mode == ExecutionMode.PARALLEL:
+            concurrency = plan.policy.max_concurrency or 4
+        result.predicted_makespan_seconds = predict_makespan(plan, weights, concurrency, priorities)
+    return result, priorities
+
+
+def _final_status(plan: ExecutionPlan, result: GroupExecutionResult) -> GroupExecutionStatus:
+    """Overall status from step outcomes and the failure policy."""
+    if result.failed_steps == 0 and result.skipped_steps == 0:
+        # All steps completed successfully
+        return GroupExecutionStatus.COMPLETED
+    elif result.failed_steps > 0:
+        # At least one step failed
+        if plan.policy.on_failure == FailurePolicy.STOP:
+            # STOP policy: any failure means overall failure
+            return GroupExecutionStatus.FAILED
+        elif result.successful_steps > 0:
+            # CONTINUE policy with mixed results
+            return GroupExecutionStatus.PARTIAL
+        else:
+            # CONTINUE policy but nothing succeeded
+            return GroupExecutionStatus.FAILED
+    elif result.skipped_steps > 0 and result.successful_steps > 0:
+        # Steps were skipped (dependency failures) but some succeeded
+        return GroupExecutionStatus.PARTIAL
+    else:
+        # Everything was skipped
+        return GroupExecutionStatus.FAILED
+
+
+class _ReadyQueue:
+    """
+    In-degree counting scheduler over an ExecutionPlan's dependency DAG.
+
+    Steps become ready when their last dependency completes; a failure
+    removes all transitive dependents at once. Every step and edge is
+    visited a constant number of times over the whole run. Ready steps
+    pop highest priority first, ties in plan order.
+    """
+
+    def __init__(self, plan: ExecutionPlan, priorities: Mapping[str, float] | None = None):
+        self._steps = {step.step_name: step for step in plan.steps}
+        self._dependents: dict[str, list[str]] = {name: [] for name in self._steps}
+        self._unmet: dict[str, int] = {}
+        self._ready: list[tuple[float, int, str]] = []
+        self._done: set[str] = set()
+        priorities = priorities or {}
+        self._keys = {
+            step.step_name: (-priorities.get(step.step_name, 0.0), i)
+            for i, step in enumerate(plan.steps)
+        }
+
+        for step in plan.steps:
+            deps = set(step.depends_on)
+            # Unknown dependencies are never met; such steps stay unscheduled
+            self._unmet[step.step_name] = len(deps)
+            for dep in deps:
+                if dep in self._dependents:
+                    self._dependents[dep].append(step.step_name)
+            if not deps:
+                self._push(step.step_name)
+
+    def _push(self, name: str) -> None:
+        heapq.heappush(self._ready, (*self._keys[name], name))
+
+    def pop(self) -> PlannedStep | None:
+        """Next ready step, or None if nothing is ready."""
+        return self._steps[heapq.heappop(self._ready)[2]] if self._ready else None
+
+    def complete(self, step_name: str) -> None:
+        """Mark a step successful and release dependents that are now ready."""
+        self._done.add(step_name)
+        for name in self._dependents[step_name]:
+            self._unmet[name] -= 1
+            if self._unmet[name] == 0 and name not in self._done:
+                self._push(name)
+
+    def fail(self, step_name: str) -> list[PlannedStep]:
+        """
+        Mark a step failed.
+
+        Returns:
+            Transitive dependents that can no longer run
+        """
+        self._done.add(step_name)
+        skipped: list[PlannedStep] = []
+        frontier = [step_name]
+        while frontier:
+            name = frontier.pop()
+            for child in self._dependents[name]:
+                if child not in self._done:
+                    self._done.add(child)
+                    skipped.append(self._steps[child])
+                    frontier.append(child)
+        return skipped
+
+
 def get_runner(dispatcher: Dispatcher | None = None) -> GroupRunner:
     """
     Get a GroupRunner instance.
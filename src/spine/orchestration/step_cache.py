@@ -0,0 +1,644 @@
+"""
+Step Cache - Reuse step results when a step's inputs have not changed.
+
+Re-running a workflow re-executes every step, even when nothing it
+reads has changed. With a StepCache, WorkflowRunner looks up each
+lambda and pipeline step before running it and reuses the stored
+output on a hit.
+
+The cache key is a ``compute_hash`` of:
+
+- workflow name, step name, type and pipeline name
+- the lambda handler's identity and bytecode, plus its defaults and
+  closure variables (editing the function, or building it from a factory
+  with other arguments, invalidates its entries)
+- step config
+- context params (minus ``ignore_params``, e.g. volatile run ids)
+- outputs of the step's upstream steps (``Workflow.upstream()``)
+
+Keys are built from plain JSON, never from ``str()`` of arbitrary
+objects: a step whose config, params, upstream outputs or captured
+handler state are not JSON-serializable is run without the cache.
+
+Only successful results whose output and context_updates are
+JSON-serializable are stored (quality metrics and events are not).
+Steps created with ``cacheable=False`` are never cached; use it for
+steps with side effects (publishing, notifications).
+
+Backends:
+- ``DatabaseStepCache``: core_step_cache table (SQLite or any sync
+  connection)
+- ``DirectoryStepCache``: one JSON file per entry in a local directory
+
+Both evict entries older than ``ttl_seconds`` and, when over
+``max_entries`` / ``max_bytes``, the least recently used.
+
+Tier: Intermediate
+
+Example:
+    from spine.orchestration import DatabaseStepCache, WorkflowRunner
+
+    cache = DatabaseStepCache(conn, ttl_seconds=7 * 86400, ignore_params=["requested_at"])
+    runner = WorkflowRunner(cache=cache)
+    runner.execute(workflow, params=params)  # runs every step
+    runner.execute(workflow, params=params)  # reuses every cacheable step
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Protocol
+
+import structlog
+
+from spine.core.hashing import compute_hash
+from spine.core.schema import CORE_TABLES
+from spine.orchestration.step_result import StepResult
+from spine.orchestration.step_types import Step, StepType
+
+if TYPE_CHECKING:
+    from spine.orchestration.workflow_context import WorkflowContext
+
+logger = structlog.get_logger(__name__)
+
+_CACHEABLE_TYPES = frozenset({StepType.LAMBDA, StepType.PIPELINE})
+
+
+class Connection(Protocol):
+    """Minimal SYNC DB connection interface."""
+
+    def execute(self, sql: str, params: tuple = ()) -> Any: ...
+    def commit(self) -> None: ...
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters of a StepCache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evictions": self.evictions}
+
+
+def _canonical(value: Any) -> str:
+    """Stable JSON encoding of a key component.
+
+    Raises:
+        TypeError: If value is not JSON-serializable
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _code_digest(code: CodeType, h: Any) -> None:
+    """
+    Feed a code object into hash h, recursing into nested code objects.
+
+    repr() of a nested code object includes its memory address, so
+    constants are hashed structurally to keep keys stable across
+    processes.
+    """
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        _const_digest(const, h)
+
+
+def _const_digest(const: Any, h: Any) -> None:
+    """Feed one code constant into hash h."""
+    if isinstance(const, CodeType):
+        _code_digest(const, h)
+    elif isinstance(const, tuple):
+        h.update(b"(")
+        for item in const:
+            _const_digest(item, h)
+        h.update(b")")
+    elif isinstance(const, frozenset):
+        # Iteration order of a set of str depends on the hash seed
+        h.update(repr(sorted(repr(item) for item in const)).encode())
+    else:
+        h.update(repr(const).encode())
+    h.update(b"\x00")
+
+
+def _handler_fingerprint(handler: Any, _seen: frozenset[int] = frozenset()) -> str:
+    """
+    Name, bytecode digest and captured state of a handler function (or
+    callable object).
+
+    Defaults, keyword defaults and closure cells are part of the
+    fingerprint, so closures built by one factory with different
+    arguments get different keys. Nested functions are fingerprinted
+    recursively.
+
+    Raises:
+        TypeError: If captured state is not JSON-serializable
+    """
+    if handler is None:
+        return ""
+    state: list[Any] = []
+    if hasattr(handler, "__code__"):
+        target = handler
+        bound = getattr(handler, "__self__", None)
+        if bound is not None:
+            state.append(getattr(bound, "__dict__", None))
+    else:
+        target = type(handler).__call__
+        state.append(getattr(handler, "__dict__", None))
+    name = f"{getattr(target, '__module__', '')}.{getattr(target, '__qualname__', repr(target))}"
+    code = getattr(target, "__code__", None)
+    if code is None:
+        return name
+
+    seen = _seen | {id(target)}
+    captured: list[Any] = [getattr(target, "__defaults__", None), getattr(target, "__kwdefaults__", None)]
+    for cell in getattr(target, "__closure__", None) or ():
+        try:
+            captured.append(cell.cell_contents)
+        except ValueError:  # empty cell
+            captured.append(None)
+    for value in captured:
+        if callable(value) and hasattr(value, "__code__"):
+            # Recursive closures reference themselves
+            state.append("<self>" if id(value) in seen else _handler_fingerprint(value, seen))
+        else:
+            state.append(value)
+
+    h = hashlib.blake2b(digest_size=8)
+    _code_digest(code, h)
+    h.update(_canonical(state).encode())
+    return f"{name}:{h.hexdigest()}"
+
+
+class StepCache(ABC):
+    """
+    Base class for step result caches.
+
+    Subclasses store opaque JSON payloads under a key; this class builds
+    keys and converts StepResults. Thread-safe for the parallel runner.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ignore_params: Iterable[str] = (),
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Max age of an entry (None = no expiry)
+            max_entries: Max entries kept (None = unlimited)
+            max_bytes: Max total payload size (None = unlimited)
+            ignore_params: Context params left out of keys
+
+        Raises:
+            ValueError: If a limit is negative
+        """
+        for label, limit in (("ttl_seconds", ttl_seconds), ("max_entries", max_entries), ("max_bytes", max_bytes)):
+            if limit is not None and limit < 0:
+                raise ValueError(f"{label} must be >= 0")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ignore_params = frozenset(ignore_params)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # id(output) -> (output, digest); holding the output keeps its id
+        # from being reused while the entry exists
+        self._digests: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+
+    # -------------------------------------------------------------------------
+    # Runner API
+    # -------------------------------------------------------------------------
+
+    def applies_to(self, step: Step) -> bool:
+        """True if results of this step may be cached."""
+        return step.cacheable and step.step_type in _CACHEABLE_TYPES
+
+    def key_for(
+        self,
+        workflow_name: str,
+        step: Step,
+        context: WorkflowContext,
+        upstream: Iterable[str],
+    ) -> str | None:
+        """
+        Cache key for running step in context.
+
+        Args:
+            workflow_name: Workflow the step belongs to
+            step: Step about to run
+            context: Context the step would see
+            upstream: Steps whose outputs the step may read
+
+        Returns:
+            The key, or None if an input can't be encoded stably (the
+            step then runs uncached)
+        """
+        params = {k: v for k, v in context.params.items() if k not in self.ignore_params}
+        try:
+            outputs = {
+                name: self._output_digest(context.outputs[name])
+                for name in upstream
+                if name in context.outputs
+            }
+            parts = (
+                _handler_fingerprint(step.handler),
+                _canonical(step.config),
+                _canonical(params),
+                _canonical(outputs),
+            )
+        except (TypeError, ValueError, RecursionError):
+            logger.debug("step_cache.unkeyable", workflow=workflow_name, step=step.name)
+            return None
+        return compute_hash(
+            workflow_name,
+            step.name,
+            step.step_type.value,
+            step.pipeline_name or "",
+            *parts,
+            length=64,
+        )
+
+    def _output_digest(self, output: Any) -> str:
+        """Digest of a step output, memoized per (immutable) output object.
+
+        Later steps hash every upstream output; without this a chain of
+        n steps would serialize O(n^2) outputs per run.
+        """
+        with self._lock:
+            hit = self._digests.get(id(output))
+            if hit is not None and hit[0] is output:
+                self._digests.move_to_end(id(output))
+                return hit[1]
+        digest = hashlib.blake2b(_canonical(dict(output)).encode(), digest_size=16).hexdigest()
+        with self._lock:
+            self._digests[id(output)] = (output, digest)
+            if len(self._digests) > 256:
+                self._digests.popitem(last=False)
+        return digest
+
+    def lookup(self, key: str) -> StepResult | None:
+        """Cached result for key, or None (expired entries count as misses)."""
+        with self._lock:
+            payload = self._get(key)
+            if payload is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        data = json.loads(payload)
+        return StepResult.ok(output=data["output"], context_updates=data["context_updates"])
+
+    def store(self, key: str, workflow_name: str, step_name: str, result: StepResult) -> bool:
+        """
+        Store a successful result.
+
+        Returns:
+            False if the result was not cacheable (failed, or not
+            JSON-serializable)
+        """
+        if not result.success:
+            return False
+        try:
+            payload = json.dumps(
+                {"output": result.output, "context_updates": result.context_updates},
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            logger.debug("step_cache.unserializable", workflow=workflow_name, step=step_name)
+            return False
+        with self._lock:
+            self._put(key, workflow_name, step_name, payload)
+            self.stats.stores += 1
+            self.stats.evictions += self._evict()
+        return True
+
+    def invalidate(self, workflow_name: str, step_name: str | None = None) -> int:
+        """
+        Drop entries of a workflow (or one of its steps).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._invalidate(workflow_name, step_name)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._invalidate(None, None)
+
+    def _cutoff(self) -> datetime | None:
+        if self.ttl_seconds is None:
+            return None
+        return datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+
+    # -------------------------------------------------------------------------
+    # Backend hooks (called with the lock held)
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    def _get(self, key: str) -> str | None:
+        """Payload stored under key (None if missing or expired); marks it used."""
+        ...
+
+    @abstractmethod
+    def _put(self, key: str, workflow_name: str, step_name: str, payload: str) -> None:
+        """Insert or replace an entry."""
+        ...
+
+    @abstractmethod
+    def _evict(self) -> int:
+        """Apply TTL and size limits; return the number of entries removed."""
+        ...
+
+    @abstractmethod
+    def _invalidate(self, workflow_name: str | None, step_name: str | None) -> int:
+        """Remove matching entries (all if workflow_name is None)."""
+        ...
+
+
+class DatabaseStepCache(StepCache):
+    """
+    Step cache in the core_step_cache table.
+
+    Writes are committed, so entries survive the process. Hits don't
+    commit: their access times are buffered and written with the next
+    store or eviction (or every ``TOUCH_BATCH`` hits), so LRU order may
+    lag by a few hits after a crash.
+    """
+
+    #: Buffered access-time updates written without waiting for a store
+    TOUCH_BATCH = 100
+
+    def __init__(
+        self,
+        conn: Connection,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ignore_params: Iterable[str] = (),
+        table: str | None = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            conn: Database connection (sync protocol)
+            ttl_seconds: Max age of an entry (None = no expiry)
+            max_entries: Max entries kept (None = unlimited)
+            max_bytes: Max total payload size (None = unlimited)
+            ignore_params: Context params left out of keys
+            table: Table name (default: core_step_cache)
+        """
+        super().__init__(ttl_seconds, max_entries, max_bytes, ignore_params)
+        self.conn = conn
+        self.table = table or CORE_TABLES["step_cache"]
+        self._touched: dict[str, str] = {}
+
+    def _flush_touches(self) -> None:
+        """Write buffered access times (the caller commits)."""
+        if self._touched:
+            self.conn.executemany(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE cache_key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _get(self, key: str) -> str | None:
+        row = self.conn.execute(
+            f"SELECT payload, created_at FROM {self.table} WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        cutoff = self._cutoff()
+        if cutoff is not None and row[1] < cutoff.isoformat():
+            self._touched.pop(key, None)
+            self.conn.execute(f"DELETE FROM {self.table} WHERE cache_key = ?", (key,))
+            self.conn.commit()
+            return None
+        self._touched[key] = datetime.now(timezone.utc).isoformat()
+        if len(self._touched) >= self.TOUCH_BATCH:
+            self._flush_touches()
+            self.conn.commit()
+        return row[0]
+
+    def _put(self, key: str, workflow_name: str, step_name: str, payload: str) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        self._touched.pop(key, None)
+        self._flush_touches()
+        self.conn.execute(
+            f"""
+            INSERT INTO {self.table}
+                (cache_key, workflow_name, step_name, payload, size_bytes, created_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                payload = excluded.payload,
+                size_bytes = excluded.size_bytes,
+                created_at = excluded.created_at,
+                accessed_at = excluded.accessed_at
+            """,
+            (key, workflow_name, step_name, payload, len(payload), now, now),
+        )
+        self.conn.commit()
+
+    def _evict(self) -> int:
+        self._flush_touches()
+        evicted = 0
+        cutoff = self._cutoff()
+        if cutoff is not None:
+            cursor = self.conn.execute(f"DELETE FROM {self.table} WHERE created_at < ?", (cutoff.isoformat(),))
+            evicted += max(cursor.rowcount, 0)
+
+        if self.max_entries is not None or self.max_bytes is not None:
+            count, total = self.conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM {self.table}"
+            ).fetchone()
+            doomed = []
+            if (self.max_entries is not None and count > self.max_entries) or (
+                self.max_bytes is not None and total > self.max_bytes
+            ):
+                rows = self.conn.execute(
+                    f"SELECT cache_key, size_bytes FROM {self.table} ORDER BY accessed_at"
+                ).fetchall()
+                for key, size in rows:
+                    if (self.max_entries is None or count <= self.max_entries) and (
+                        self.max_bytes is None or total <= self.max_bytes
+                    ):
+                        break
+                    doomed.append((key,))
+                    count -= 1
+                    total -= size
+            if doomed:
+                self.conn.executemany(f"DELETE FROM {self.table} WHERE cache_key = ?", doomed)
+                evicted += len(doomed)
+
+        self.conn.commit()
+        return evicted
+
+    def _invalidate(self, workflow_name: str | None, step_name: str | None) -> int:
+        self._flush_touches()
+        if workflow_name is None:
+            cursor = self.conn.execute(f"DELETE FROM {self.table}")
+        elif step_name is None:
+            cursor = self.conn.execute(f"DELETE FROM {self.table} WHERE workflow_name = ?", (workflow_name,))
+        else:
+            cursor = self.conn.execute(
+                f"DELETE FROM {self.table} WHERE workflow_name = ? AND step_name = ?",
+                (workflow_name, step_name),
+            )
+        self.conn.commit()
+        return max(cursor.rowcount, 0)
+
+
+class DirectoryStepCache(StepCache):
+    """
+    Step cache as one JSON file per entry under a directory.
+
+    File mtime is the last access time (LRU order); the creation time is
+    stored in the file. Writes go through a temp file and rename, so a
+    crash never leaves a partial entry.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ignore_params: Iterable[str] = (),
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            path: Cache directory (created if missing)
+            ttl_seconds: Max age of an entry (None = no expiry)
+            max_entries: Max entries kept (None = unlimited)
+            max_bytes: Max total file size (None = unlimited)
+            ignore_params: Context params left out of keys
+        """
+        super().__init__(ttl_seconds, max_entries, max_bytes, ignore_params)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._last_sweep = 0.0
+        self._last_touch_ns = 0
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def _touch(self, file: Path) -> None:
+        # Set strictly increasing mtimes explicitly: filesystem timestamps
+        # are often coarser than back-to-back accesses, which would tie
+        now = max(time.time_ns(), self._last_touch_ns + 1)
+        self._last_touch_ns = now
+        os.utime(file, ns=(now, now))
+
+    def _read(self, file: Path) -> dict[str, Any] | None:
+        try:
+            return json.loads(file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _expired(self, entry: dict[str, Any]) -> bool:
+        return self.ttl_seconds is not None and time.time() - entry["created_at"] > self.ttl_seconds
+
+    def _get(self, key: str) -> str | None:
+        file = self._file(key)
+        entry = self._read(file)
+        if entry is None:
+            return None
+        if self._expired(entry):
+            file.unlink(missing_ok=True)
+            return None
+        self._touch(file)
+        return entry["payload"]
+
+    def _put(self, key: str, workflow_name: str, step_name: str, payload: str) -> None:
+        entry = {
+            "workflow_name": workflow_name,
+            "step_name": step_name,
+            "created_at": time.time(),
+            "payload": payload,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._file(key))
+        self._touch(self._file(key))
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        entries = []
+        for file in self.path.glob("*.json"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, file))
+        entries.sort()
+        return entries
+
+    def _evict(self) -> int:
+        # Expired entries are also dropped on read, so sweeping them (which
+        # reads every file) is rate-limited
+        sweep = self.ttl_seconds is not None and time.time() - self._last_sweep > min(self.ttl_seconds, 60.0)
+        if not sweep and self.max_entries is None and self.max_bytes is None:
+            return 0
+        evicted = 0
+        entries = self._entries()
+        if sweep:
+            self._last_sweep = time.time()
+            kept = []
+            for mtime, size, file in entries:
+                entry = self._read(file)
+                if entry is None or self._expired(entry):
+                    file.unlink(missing_ok=True)
+                    evicted += 1
+                else:
+                    kept.append((mtime, size, file))
+            entries = kept
+
+        count = len(entries)
+        total = sum(size for _, size, _ in entries)
+        for _, size, file in entries:
+            if (self.max_entries is None or count <= self.max_entries) and (
+                self.max_bytes is None or total <= self.max_bytes
+            ):
+                break
+            file.unlink(missing_ok=True)
+            evicted += 1
+            count -= 1
+            total -= size
+        return evicted
+
+    def _invalidate(self, workflow_name: str | None, step_name: str | None) -> int:
+        removed = 0
+        for _, _, file in self._entries():
+            if workflow_name is not None:
+                entry = self._read(file)
+                if entry is None or entry["workflow_name"] != workflow_name:
+                    continue
+                if step_name is not None and entry["step_name"] != step_name:
+                    continue
+            file.unlink(missing_ok=True)
+            removed += 1
+        return removed
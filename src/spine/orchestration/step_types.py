@@ -129,6 +129,8 @@ class Step:
     config: dict[str, Any] = field(default_factory=dict)
     on_error: ErrorPolicy = ErrorPolicy.STOP
     retry_policy: RetryPolicy | None = None
+    depends_on: tuple[str, ...] | None = None  # None = after all earlier steps
+    cacheable: bool = True                     # Lambda/pipeline, with a StepCache
 
     # Type-specific fields (only some apply per type)
     handler: StepHandlerFn | None = None      # Lambda
@@ -152,6 +154,8 @@ class Step:
         handler: StepHandlerFn,
         config: dict[str, Any] | None = None,
         on_error: ErrorPolicy = ErrorPolicy.STOP,
+        depends_on: list[str] | tuple[str, ...] | None = None,
+        cacheable: bool = True,
     ) -> "Step":
         """
         Create a lambda step (inline function).
@@ -163,6 +167,10 @@ class Step:
             handler: Function (ctx, config) -> StepResult
             config: Step-specific configuration
             on_error: Error handling policy
+            depends_on: Earlier steps this step needs (None = all earlier
+                steps; [] = independent, may run in parallel)
+            cacheable: Allow a runner's StepCache to reuse this step's
+                result (disable for steps with side effects)
         """
         return cls(
             name=name,
@@ -170,6 +178,8 @@ class Step:
             handler=handler,
             config=config or {},
             on_error=on_error,
+            depends_on=tuple(depends_on) if depends_on is not None else None,
+            cacheable=cacheable,
         )
 
     @classmethod
@@ -179,6 +189,8 @@ class Step:
         pipeline_name: str,
         params: dict[str, Any] | None = None,
         on_error: ErrorPolicy = ErrorPolicy.STOP,
+        depends_on: list[str] | tuple[str, ...] | None = None,
+        cacheable: bool = True,
     ) -> "Step":
         """
         Create a pipeline step (wraps registered pipeline).
@@ -190,6 +202,10 @@ class Step:
             pipeline_name: Registered pipeline name (e.g., "finra.otc.ingest")
             params: Additional params to merge with context params
             on_error: Error handling policy
+            depends_on: Earlier steps this step needs (None = all earlier
+                steps; [] = independent, may run in parallel)
+            cacheable: Allow a runner's StepCache to reuse this step's
+                result (disable for steps with side effects)
         """
         return cls(
             name=name,
@@ -197,6 +213,8 @@ class Step:
             pipeline_name=pipeline_name,
             config=params or {},
             on_error=on_error,
+            depends_on=tuple(depends_on) if depends_on is not None else None,
+            cacheable=cacheable,
         )
 
     @classmethod
@@ -258,6 +276,8 @@ class Step:
         iterator_workflow: Any,  # Workflow type
         max_concurrency: int = 4,
         item_param: str = "item",
+        on_error: ErrorPolicy = ErrorPolicy.STOP,
+        retry_policy: RetryPolicy | None = None,
     ) -> "Step":
         """
         Create a map step (fan-out/fan-in).
@@ -266,10 +286,14 @@ class Step:
 
         Args:
             name: Unique step name within workflow
-            items_path: Path in context.params to the items list
+            items_path: Dotted path to the items list in context.params,
+                or "outputs.<step>.<key>" to read a previous step's output
             iterator_workflow: Workflow to run for each item
             max_concurrency: Max parallel executions
             item_param: Param name for each item in iterator context
+            on_error: Per-item failure policy (STOP fails fast, CONTINUE
+                collects failures, RETRY retries items per retry_policy)
+            retry_policy: Item retry settings when on_error is RETRY
         """
         return cls(
             name=name,
@@ -278,6 +302,8 @@ class Step:
             iterator_workflow=iterator_workflow,
             max_concurrency=max_concurrency,
             config={"item_param": item_param},
+            on_error=on_error,
+            retry_policy=retry_policy,
         )
 
     # =========================================================================
@@ -307,6 +333,10 @@ class Step:
             result["config"] = self.config
         if self.on_error != ErrorPolicy.STOP:
             result["on_error"] = self.on_error.value
+        if self.depends_on is not None:
+            result["depends_on"] = list(self.depends_on)
+        if not self.cacheable:
+            result["cacheable"] = False
 
         # Type-specific fields
         if self.step_type == StepType.PIPELINE:
@@ -8,7 +8,7 @@ This module extends WorkflowRunner to add full database tracking:
 - Full audit trail
 
 This is the PRODUCTION runner that should be used when you need:
-- Resumable workflows
+- Resumable workflows (with a CheckpointStore, prior outputs are restored)
 - Failure tracking
 - Idempotent execution
 - Observability
@@ -41,16 +41,24 @@ Example:
     # Idempotent - running again with same partition skips
     result2 = runner.execute(workflow, params=..., partition=same_partition)
     # result2.status == "skipped" if already completed
+
+    # With checkpoints, a failed run resumes with earlier outputs restored
+    runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn))
+    result = runner.resume(failed_run_id, workflow)
 """
 
 from __future__ import annotations
 
+import json
 import structlog
 from datetime import datetime, timezone
 from typing import Any, Protocol
 
-from spine.core.manifest import WorkManifest
+from spine.core.manifest import ManifestCache, WorkManifest
 from spine.core.anomalies import AnomalyRecorder, Severity, AnomalyCategory
+from spine.orchestration.checkpoint import CheckpointStore
+from spine.orchestration.exceptions import GroupError
+from spine.orchestration.step_cache import StepCache
 from spine.orchestration.workflow import Workflow
 from spine.orchestration.workflow_context import WorkflowContext
 from spine.orchestration.workflow_runner import (
@@ -81,6 +89,21 @@ def _make_stages(workflow: Workflow) -> list[str]:
     return stages
 
 
+def _check_resume_params(context: WorkflowContext, params: dict[str, Any]) -> None:
+    """Refuse to continue a checkpointed run with different params."""
+    changed = sorted(
+        key for key, value in params.items()
+        if json.dumps(context.params.get(key), sort_keys=True, default=str)
+        != json.dumps(value, sort_keys=True, default=str)
+    )
+    if changed:
+        raise GroupError(
+            f"Checkpointed run {context.run_id} was started with different params "
+            f"({', '.join(changed)}); resume it without params or start a new run "
+            "with auto_resume disabled"
+        )
+
+
 class TrackedWorkflowRunner(WorkflowRunner):
     """
     Workflow runner with full database tracking.
@@ -90,6 +113,8 @@ class TrackedWorkflowRunner(WorkflowRunner):
     - Error recording in core_anomalies
     - Idempotency via manifest checks (skip if already completed)
     - Automatic retry from last successful stage
+    - Optional context checkpoints, so a retry restores earlier outputs
+      instead of re-running the steps that produced them
 
     This extends the basic WorkflowRunner with persistence.
     """
@@ -101,6 +126,10 @@ class TrackedWorkflowRunner(WorkflowRunner):
         dispatcher=None,
         dry_run: bool = False,
         skip_if_completed: bool = True,
+        checkpoints: CheckpointStore | None = None,
+        auto_resume: bool = False,
+        cache: StepCache | None = None,
+        manifest_cache: ManifestCache | None = None,
     ):
         """
         Initialize tracked workflow runner.
@@ -110,10 +139,22 @@ class TrackedWorkflowRunner(WorkflowRunner):
             dispatcher: Optional dispatcher for pipeline execution
             dry_run: If True, pipeline steps return mock success
             skip_if_completed: If True, skip workflow if already completed
+            checkpoints: Store for context snapshots after each successful
+                step (no snapshots if None). Its save() commits; on the
+                runner's own conn that commits tracking writes per step
+            auto_resume: If True, execute() without context or start_from
+                continues the latest unfinished checkpoint of the partition
+                instead of starting a new run (otherwise use resume())
+            cache: Step result cache (see WorkflowRunner)
+            manifest_cache: In-process cache for manifest stage checks
+                (idempotency and auto-resume), shared across runs
         """
-        super().__init__(dispatcher=dispatcher, dry_run=dry_run)
+        super().__init__(dispatcher=dispatcher, dry_run=dry_run, cache=cache)
         self.conn = conn
         self.skip_if_completed = skip_if_completed
+        self.checkpoints = checkpoints
+        self.auto_resume = auto_resume
+        self.manifest_cache = manifest_cache
 
     def execute(
         self,
@@ -126,6 +167,13 @@ class TrackedWorkflowRunner(WorkflowRunner):
         """
         Execute a workflow with database tracking.
 
+        With a CheckpointStore, ``auto_resume=True`` and neither context
+        nor start_from given, an unfinished checkpoint for this workflow
+        and partition is resumed: its context is restored and execution
+        continues at its next step. Params passed here must match the
+        checkpointed run's; otherwise GroupError is raised rather than
+        silently running with either set.
+
         Args:
             workflow: The workflow to execute
             params: Input parameters
@@ -135,6 +183,10 @@ class TrackedWorkflowRunner(WorkflowRunner):
 
         Returns:
             WorkflowResult with final status and context
+
+        Raises:
+            GroupError: If auto-resuming a checkpoint whose params differ
+                from params
         """
         # Require partition for tracking
         if partition is None:
@@ -145,11 +197,36 @@ class TrackedWorkflowRunner(WorkflowRunner):
             )
             return super().execute(workflow, params, partition, context, start_from)
 
-        # Initialize trackers
         domain = f"workflow.{workflow.name}"
         stages = _make_stages(workflow)
-        manifest = WorkManifest(self.conn, domain=domain, stages=stages)
-        anomaly_recorder = AnomalyRecorder(self.conn, domain=workflow.domain or domain)
+        manifest = WorkManifest(self.conn, domain=domain, stages=stages, cache=self.manifest_cache)
+
+        # Manifest writes reach the shared cache before the caller commits.
+        # A failed run may be rolled back, so don't let its stages make
+        # later runs skip work as already done. (Stores that commit on
+        # self.conn, such as checkpoints and anomalies, may already have
+        # made them durable; dropping them from the cache then only costs
+        # a re-read.)
+        try:
+            result = self._execute_tracked(workflow, params, partition, context, start_from, manifest)
+        except Exception:
+            manifest.invalidate(partition)
+            raise
+        if result.status == WorkflowStatus.FAILED:
+            manifest.invalidate(partition)
+        return result
+
+    def _execute_tracked(
+        self,
+        workflow: Workflow,
+        params: dict[str, Any] | None,
+        partition: dict[str, Any],
+        context: WorkflowContext | None,
+        start_from: str | None,
+        manifest: WorkManifest,
+    ) -> WorkflowResult:
+        """Body of execute() for a partitioned run."""
+        anomaly_recorder = AnomalyRecorder(self.conn, domain=workflow.domain or manifest.domain)
 
         # Check idempotency
         if self.skip_if_completed and manifest.is_at_least(partition, "COMPLETED"):
@@ -175,8 +252,30 @@ class TrackedWorkflowRunner(WorkflowRunner):
                 step_executions=[],
                 error_step=None,
                 error="Skipped - already completed",
+                skipped=True,
             )
 
+        # Restore the latest unfinished checkpoint, if any
+        completed_before: list[str] = []
+        if self.checkpoints is not None:
+            checkpoint = None
+            if context is not None:
+                checkpoint = self.checkpoints.load(context.run_id)
+            elif start_from is None and self.auto_resume:
+                checkpoint = self.checkpoints.latest(workflow.name, partition)
+                if checkpoint is not None and not checkpoint.is_finished:
+                    _check_resume_params(checkpoint.context, {**workflow.defaults, **(params or {})})
+                    context = checkpoint.context
+                    start_from = checkpoint.next_step
+                    logger.info(
+                        "workflow.checkpoint_restored",
+                        workflow=workflow.name,
+                        run_id=context.run_id,
+                        next_step=start_from,
+                    )
+            if checkpoint is not None and context is not None and checkpoint.run_id == context.run_id:
+                completed_before = list(checkpoint.completed_steps)
+
         # Create context
         if context is None:
             context = WorkflowContext.create(
@@ -208,7 +307,6 @@ class TrackedWorkflowRunner(WorkflowRunner):
         if start_from:
             start_index = workflow.step_index(start_from)
             if start_index < 0:
-                from spine.orchestration.exceptions import GroupError
                 raise GroupError(f"Start step not found: {start_from}")
         else:
             # Auto-resume: find last completed stage
@@ -266,6 +364,12 @@ class TrackedWorkflowRunner(WorkflowRunner):
                     if step_exec.result.next_step:
                         skip_to_step = step_exec.result.next_step
 
+                if self.checkpoints is not None:
+                    self._save_checkpoint(
+                        workflow, context, partition, current_index, skip_to_step,
+                        completed_before + [s.step_name for s in step_executions if s.status == "completed"],
+                    )
+
             elif step_exec.status == "failed":
                 error_step = step.name
                 error_msg = step_exec.error
@@ -342,6 +446,70 @@ class TrackedWorkflowRunner(WorkflowRunner):
             error=error_msg,
         )
 
+    def resume(self, run_id: str, workflow: Workflow) -> WorkflowResult:
+        """
+        Continue a checkpointed run from its first incomplete step.
+
+        The run's context is restored from its checkpoint, so steps that
+        already completed are not re-run and their outputs stay available.
+
+        Args:
+            run_id: Run to resume (WorkflowResult.run_id)
+            workflow: Workflow definition the run was started with
+
+        Returns:
+            WorkflowResult of the resumed run (same run_id)
+
+        Raises:
+            GroupError: If checkpoints are disabled, no checkpoint exists
+                for run_id, or it belongs to a different workflow
+        """
+        if self.checkpoints is None:
+            raise GroupError("resume() requires a CheckpointStore")
+        checkpoint = self.checkpoints.load(run_id)
+        if checkpoint is None:
+            raise GroupError(f"No checkpoint for run: {run_id}")
+        if checkpoint.workflow_name != workflow.name:
+            raise GroupError(
+                f"Run {run_id} belongs to workflow {checkpoint.workflow_name!r}, not {workflow.name!r}"
+            )
+
+        if checkpoint.is_finished:
+            now = datetime.now(timezone.utc)
+            return WorkflowResult(
+                workflow_name=workflow.name,
+                run_id=run_id,
+                status=WorkflowStatus.COMPLETED,
+                context=checkpoint.context,
+                started_at=now,
+                completed_at=now,
+            )
+
+        return self.execute(
+            workflow,
+            partition=checkpoint.partition,
+            context=checkpoint.context,
+            start_from=checkpoint.next_step,
+        )
+
+    def _save_checkpoint(
+        self,
+        workflow: Workflow,
+        context: WorkflowContext,
+        partition: dict[str, Any],
+        index: int,
+        skip_to_step: str | None,
+        completed_steps: list[str],
+    ) -> None:
+        """Snapshot context after the step at index completed."""
+        if skip_to_step is not None:
+            next_step: str | None = skip_to_step
+        elif index + 1 < len(workflow.steps):
+            next_step = workflow.steps[index + 1].name
+        else:
+            next_step = None
+        self.checkpoints.save(context, partition, next_step, completed_steps)
+
 
 # =============================================================================
 # Query Functions for Monitoring
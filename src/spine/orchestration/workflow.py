@@ -68,6 +68,12 @@ class Workflow:
     defaults: dict[str, Any] = field(default_factory=dict)
     tags: list[str] = field(default_factory=list)
 
+    # Derived from steps on first use; steps are not mutated after validation
+    _dependencies: dict[str, tuple[str, ...] | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _positions: dict[str, int] | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate workflow structure."""
         self._validate_steps()
@@ -82,6 +88,20 @@ class Workflow:
                 raise ValueError(f"Duplicate step name: {step.name}")
             step_names.add(step.name)
 
+        # Validate depends_on: only earlier steps, so list order stays a
+        # valid execution order
+        seen: set[str] = set()
+        for step in self.steps:
+            for dep in step.depends_on or ():
+                if dep not in step_names:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step: {dep}")
+                if dep not in seen:
+                    raise ValueError(
+                        f"Step '{step.name}' depends on later step '{dep}'; "
+                        "dependencies must appear earlier in the workflow"
+                    )
+            seen.add(step.name)
+
         # Validate choice step references
         for step in self.steps:
             if step.step_type == StepType.CHOICE:
@@ -109,12 +129,37 @@ class Workflow:
         """Get ordered list of step names."""
         return [s.name for s in self.steps]
 
+    def dependencies(self) -> dict[str, tuple[str, ...] | None]:
+        """
+        Get each step's declared dependencies.
+
+        Steps with explicit ``depends_on`` map to it; steps without it map
+        to None, meaning they depend on every earlier step, so undeclared
+        workflows stay sequential (see ``upstream()`` for the expanded
+        list). The map is built once and cached on the workflow.
+        """
+        if self._dependencies is None:
+            self._dependencies = {step.name: step.depends_on for step in self.steps}
+        return self._dependencies
+
+    def upstream(self, name: str) -> tuple[str, ...]:
+        """
+        Get the steps a step depends on, expanding the implicit "every
+        earlier step" of steps without ``depends_on``.
+
+        Raises:
+            KeyError: If there is no step with that name
+        """
+        deps = self.dependencies()[name]
+        if deps is not None:
+            return deps
+        return tuple(step.name for step in self.steps[:self.step_index(name)])
+
     def step_index(self, name: str) -> int:
         """Get index of step by name, or -1 if not found."""
-        for i, step in enumerate(self.steps):
-            if step.name == name:
-                return i
-        return -1
+        if self._positions is None:
+            self._positions = {step.name: i for i, step in enumerate(self.steps)}
+        return self._positions.get(name, -1)
 
     # =========================================================================
     # Tier Analysis
@@ -197,6 +242,8 @@ class Workflow:
                     name=step_data["name"],
                     pipeline_name=step_data["pipeline"],
                     params=step_data.get("config"),
+                    depends_on=step_data.get("depends_on"),
+                    cacheable=step_data.get("cacheable", True),
                 ))
             elif step_type == "choice":
                 # Choice steps from YAML need a condition expression (future)
@@ -9,10 +9,18 @@ Tier: Basic (spine-core)
 
 Design Principles:
 - Immutable: Steps return updates, runner creates new context
+- Copy-on-write: params, outputs, partition and metadata are read-only
+  mapping views; a new context copies only the top-level mapping it
+  changes and shares every value with its predecessor, so a step costs
+  O(number of keys), not O(size of all prior outputs)
 - Thread-safe: No shared mutable state
 - Serializable: Can checkpoint to database or JSON
 - Composable: Integrates with ExecutionContext for lineage
 
+Values are shared between contexts, not copied. Treat nested lists and
+dicts read from a context as read-only; build new objects and return
+them as output or context_updates instead.
+
 Example:
     from spine.orchestration import WorkflowContext, StepResult
 
@@ -32,8 +40,8 @@ Example:
 
 from __future__ import annotations
 
-import copy
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -55,16 +63,29 @@ class WorkflowContext:
         execution: ExecutionContext for lineage tracking
         started_at: When this workflow run began
         metadata: Additional metadata (e.g., caller info, dry_run flag)
+
+    params, outputs (and each step's output), partition and metadata are
+    read-only mappings; plain dicts passed to the constructor are copied
+    (shallowly) into them.
     """
 
     run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     workflow_name: str = ""
-    params: dict[str, Any] = field(default_factory=dict)
-    outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
-    partition: dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
+    outputs: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    partition: Mapping[str, Any] = field(default_factory=dict)
     execution: ExecutionContext = field(default_factory=new_context)
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.params = _freeze(self.params)
+        if not isinstance(self.outputs, FrozenDict):
+            self.outputs = FrozenDict(
+                {name: _freeze(output) for name, output in self.outputs.items()}
+            )
+        self.partition = _freeze(self.partition)
+        self.metadata = _freeze(self.metadata)
 
     # =========================================================================
     # Factories
@@ -185,11 +206,12 @@ class WorkflowContext:
         """
         Create new context with step output added.
 
-        This is called by the runner after each step completes.
+        This is called by the runner after each step completes. Earlier
+        outputs are shared with this context, not copied.
         """
-        new_outputs = copy.deepcopy(self.outputs)
-        new_outputs[step_name] = output
-        return self._copy_with(outputs=new_outputs)
+        new_outputs = dict(self.outputs)
+        new_outputs[step_name] = _freeze(output)
+        return self._copy_with(outputs=FrozenDict(new_outputs))
 
     def with_params(self, updates: dict[str, Any]) -> "WorkflowContext":
         """
@@ -198,24 +220,27 @@ class WorkflowContext:
         This is called by the runner when a step returns context_updates.
         """
         new_params = {**self.params, **updates}
-        return self._copy_with(params=new_params)
+        return self._copy_with(params=FrozenDict(new_params))
 
     def with_metadata(self, updates: dict[str, Any]) -> "WorkflowContext":
         """Create new context with metadata merged."""
         new_metadata = {**self.metadata, **updates}
-        return self._copy_with(metadata=new_metadata)
+        return self._copy_with(metadata=FrozenDict(new_metadata))
 
     def _copy_with(self, **overrides: Any) -> "WorkflowContext":
-        """Create a copy with specific fields overridden."""
+        """Create a copy with specific fields overridden.
+
+        Unchanged mappings are read-only, so they are shared as-is.
+        """
         return WorkflowContext(
             run_id=overrides.get("run_id", self.run_id),
             workflow_name=overrides.get("workflow_name", self.workflow_name),
-            params=overrides.get("params", copy.deepcopy(self.params)),
-            outputs=overrides.get("outputs", copy.deepcopy(self.outputs)),
-            partition=overrides.get("partition", copy.deepcopy(self.partition)),
+            params=overrides.get("params", self.params),
+            outputs=overrides.get("outputs", self.outputs),
+            partition=overrides.get("partition", self.partition),
             execution=overrides.get("execution", self.execution),
             started_at=overrides.get("started_at", self.started_at),
-            metadata=overrides.get("metadata", copy.deepcopy(self.metadata)),
+            metadata=overrides.get("metadata", self.metadata),
         )
 
     # =========================================================================
@@ -227,16 +252,23 @@ class WorkflowContext:
         return {
             "run_id": self.run_id,
             "workflow_name": self.workflow_name,
-            "params": self.params,
-            "outputs": self.outputs,
-            "partition": self.partition,
+            "params": dict(self.params),
+            "outputs": self.outputs_dict(),
+            "partition": dict(self.partition),
             "execution": {
                 "execution_id": self.execution.execution_id,
                 "batch_id": self.execution.batch_id,
                 "parent_execution_id": self.execution.parent_execution_id,
             },
             "started_at": self.started_at.isoformat(),
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
+        }
+
+    def outputs_dict(self) -> dict[str, dict[str, Any]]:
+        """Step outputs as plain (shallow-copied) dicts."""
+        return {
+            name: dict(output) if isinstance(output, Mapping) else output
+            for name, output in self.outputs.items()
         }
 
     def __repr__(self) -> str:
@@ -245,3 +277,41 @@ class WorkflowContext:
             f"workflow={self.workflow_name!r}, "
             f"steps={list(self.outputs.keys())})"
         )
+
+
+def _readonly(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used for context mappings.
+
+    Still a dict, so it JSON-encodes, pickles and deep-copies like one;
+    every in-place mutation raises TypeError.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only shallow copy of a mapping.
+
+    Already-frozen mappings are returned as-is; non-mappings (e.g. a
+    step output of None) are stored unchanged.
+    """
+    if isinstance(value, FrozenDict) or not isinstance(value, Mapping):
+        return value
+    return FrozenDict(value)
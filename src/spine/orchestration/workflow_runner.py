@@ -6,6 +6,9 @@ passing context between steps. It handles:
 - Lambda step execution (call handler with context)
 - Pipeline step execution (dispatch via existing framework)
 - Choice step evaluation (conditional branching - Intermediate)
+- Map step fan-out/fan-in over a bounded thread pool (Advanced)
+- Concurrent execution of independent steps (``parallel=True``)
+- Reuse of unchanged step results (``cache=StepCache``)
 - Error handling per step's ErrorPolicy
 - Result aggregation
 
@@ -34,6 +37,9 @@ Example:
 from __future__ import annotations
 
 import structlog
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -42,13 +48,18 @@ from typing import Any
 from spine.framework.dispatcher import Dispatcher, get_dispatcher
 from spine.framework.pipelines import PipelineResult, PipelineStatus
 from spine.orchestration.exceptions import GroupError
+from spine.orchestration.step_cache import StepCache
 from spine.orchestration.step_result import StepResult, QualityMetrics
-from spine.orchestration.step_types import Step, StepType, ErrorPolicy
+from spine.orchestration.step_types import Step, StepType, ErrorPolicy, RetryPolicy
 from spine.orchestration.workflow import Workflow
 from spine.orchestration.workflow_context import WorkflowContext
 
 logger = structlog.get_logger(__name__)
 
+# Steps that always run alone in parallel mode: choice decides which
+# steps run next, wait exists to order execution in time
+_BARRIER_TYPES = frozenset({StepType.CHOICE, StepType.WAIT})
+
 
 class WorkflowStatus(str, Enum):
     """Overall status of workflow execution."""
@@ -70,6 +81,7 @@ class StepExecution:
     completed_at: datetime | None = None
     result: StepResult | None = None
     error: str | None = None
+    cached: bool = False  # Result reused from the runner's StepCache
 
     @property
     def duration_seconds(self) -> float | None:
@@ -88,6 +100,7 @@ class StepExecution:
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "duration_seconds": self.duration_seconds,
             "error": self.error,
+            "cached": self.cached,
             "output": self.result.output if self.result else None,
         }
 
@@ -105,6 +118,7 @@ class WorkflowResult:
     step_executions: list[StepExecution] = field(default_factory=list)
     error_step: str | None = None
     error: str | None = None
+    skipped: bool = False  # Not run (e.g. partition already completed)
 
     @property
     def duration_seconds(self) -> float | None:
@@ -157,17 +171,23 @@ class WorkflowRunner:
 
     Intermediate tier adds:
     - Choice steps (conditional branching)
+    - Parallel mode: independent steps (per ``depends_on``) run
+      concurrently between choice/wait steps
 
     Advanced tier adds:
     - Wait steps (requires scheduler)
-    - Map steps (requires parallel execution)
+    - Map steps (bounded thread pool per step, ordered fan-in)
     - Checkpointing (requires database)
+    - Step result cache (reuse results of steps whose inputs are unchanged)
     """
 
     def __init__(
         self,
         dispatcher: Dispatcher | None = None,
         dry_run: bool = False,
+        parallel: bool = False,
+        max_workers: int = 4,
+        cache: StepCache | None = None,
     ):
         """
         Initialize the workflow runner.
@@ -175,9 +195,18 @@ class WorkflowRunner:
         Args:
             dispatcher: Dispatcher for pipeline execution (uses default if None)
             dry_run: If True, pipeline steps return mock success
+            parallel: Run steps whose dependencies are met concurrently
+                (see Step.depends_on); choice and wait steps still run
+                alone, in order
+            max_workers: Max concurrent steps in parallel mode
+            cache: Step result cache; cacheable lambda and pipeline steps
+                whose inputs match a stored entry are not re-run
         """
         self._dispatcher = dispatcher
         self._dry_run = dry_run
+        self._parallel = parallel
+        self._max_workers = max(1, max_workers)
+        self._cache = cache
 
     @property
     def dispatcher(self) -> Dispatcher:
@@ -240,8 +269,9 @@ class WorkflowRunner:
         # Execute steps
         current_index = start_index
         skip_to_step: str | None = None
+        stopped = False
 
-        while current_index < len(workflow.steps):
+        while current_index < len(workflow.steps) and not stopped:
             step = workflow.steps[current_index]
 
             # Handle choice step jumps
@@ -251,19 +281,27 @@ class WorkflowRunner:
                     continue
                 skip_to_step = None
 
-            # Execute step
-            step_exec = self._execute_step(step, context, workflow)
-            step_executions.append(step_exec)
+            # Execute step, or a batch of independent steps in parallel mode
+            if self._parallel and step.step_type not in _BARRIER_TYPES:
+                end = current_index
+                while end < len(workflow.steps) and workflow.steps[end].step_type not in _BARRIER_TYPES:
+                    end += 1
+                batch = workflow.steps[current_index:end]
+                executed = self._execute_batch(batch, context, workflow)
+                current_index = end
+            else:
+                executed = [(step, self._execute_step(step, context, workflow))]
+                current_index += 1
+
+            for step, step_exec in executed:
+                step_executions.append(step_exec)
 
-            if step_exec.status == "completed":
-                # Update context with step output
-                if step_exec.result:
-                    context = context.with_output(step.name, step_exec.result.output)
-                    if step_exec.result.context_updates:
-                        context = context.with_params(step_exec.result.context_updates)
+                if step_exec.status == "completed":
+                    # Update context with step output
+                    context = _merge_result(context, step, step_exec)
 
                     # Handle choice step branching
-                    if step_exec.result.next_step:
+                    if step_exec.result and step_exec.result.next_step:
                         skip_to_step = step_exec.result.next_step
                         logger.debug(
                             "workflow.branch",
@@ -271,18 +309,17 @@ class WorkflowRunner:
                             next_step=skip_to_step,
                         )
 
-            elif step_exec.status == "failed":
-                error_step = step.name
-                error_msg = step_exec.error
+                elif step_exec.status == "failed":
+                    if error_step is None or final_status != WorkflowStatus.FAILED:
+                        error_step = step.name
+                        error_msg = step_exec.error
 
-                if step.on_error == ErrorPolicy.STOP:
-                    final_status = WorkflowStatus.FAILED
-                    break
-                elif step.on_error == ErrorPolicy.CONTINUE:
-                    final_status = WorkflowStatus.PARTIAL
-                    # Continue to next step
-
-            current_index += 1
+                    if step.on_error == ErrorPolicy.STOP:
+                        final_status = WorkflowStatus.FAILED
+                        stopped = True
+                    elif step.on_error == ErrorPolicy.CONTINUE and final_status != WorkflowStatus.FAILED:
+                        final_status = WorkflowStatus.PARTIAL
+                        # Continue to next step
 
         completed_at = datetime.now(timezone.utc)
 
@@ -324,8 +361,13 @@ class WorkflowRunner:
             type=step.step_type.value,
         )
 
+        cache_key, result = self._cache_lookup(step, context, workflow)
+        cached = result is not None
+
         try:
-            if step.step_type == StepType.LAMBDA:
+            if result is not None:
+                logger.debug("step.cache_hit", workflow=workflow.name, step=step.name)
+            elif step.step_type == StepType.LAMBDA:
                 result = self._execute_lambda(step, context)
             elif step.step_type == StepType.PIPELINE:
                 result = self._execute_pipeline(step, context)
@@ -350,6 +392,9 @@ class WorkflowRunner:
                 category="INTERNAL",
             )
 
+        if cache_key is not None and not cached and result.success:
+            self._cache_store(cache_key, step, workflow, result)
+
         completed_at = datetime.now(timezone.utc)
 
         status = "completed" if result.success else "failed"
@@ -359,6 +404,7 @@ class WorkflowRunner:
             workflow=workflow.name,
             step=step.name,
             status=status,
+            cached=cached,
             duration_seconds=(completed_at - started_at).total_seconds(),
         )
 
@@ -370,8 +416,104 @@ class WorkflowRunner:
             completed_at=completed_at,
             result=result,
             error=result.error if not result.success else None,
+            cached=cached,
         )
 
+    def _cache_lookup(
+        self,
+        step: Step,
+        context: WorkflowContext,
+        workflow: Workflow,
+    ) -> tuple[str | None, StepResult | None]:
+        """
+        Look a step up in the cache.
+
+        Returns:
+            (key, cached result); key is None if the step is not cached.
+            Cache errors are logged and treated as a miss.
+        """
+        if self._cache is None or self._dry_run or not self._cache.applies_to(step):
+            return None, None
+        try:
+            key = self._cache.key_for(workflow.name, step, context, workflow.upstream(step.name))
+            if key is None:
+                return None, None
+            return key, self._cache.lookup(key)
+        except Exception as e:
+            logger.warning("step_cache.error", workflow=workflow.name, step=step.name, error=str(e))
+            return None, None
+
+    def _cache_store(self, key: str, step: Step, workflow: Workflow, result: StepResult) -> None:
+        """Store a successful result; cache errors are logged, not raised."""
+        try:
+            self._cache.store(key, workflow.name, step.name, result)
+        except Exception as e:
+            logger.warning("step_cache.error", workflow=workflow.name, step=step.name, error=str(e))
+
+    def _execute_batch(
+        self,
+        batch: list[Step],
+        context: WorkflowContext,
+        workflow: Workflow,
+    ) -> list[tuple[Step, StepExecution]]:
+        """
+        Execute consecutive non-barrier steps as a dependency graph.
+
+        A step starts once the steps it depends on within the batch have
+        finished. It sees the batch's starting context plus the results
+        of its (transitive) dependencies, applied in workflow order, so
+        what a step observes never depends on thread timing. Results are
+        returned in workflow order for the caller to merge.
+
+        A failed STOP step stops new steps from starting; steps already
+        running are allowed to finish.
+        """
+        deps = _batch_dependencies(batch, workflow)
+
+        ancestors: dict[str, set[str]] = {}
+        dependents: dict[str, list[Step]] = {step.name: [] for step in batch}
+        remaining: dict[str, int] = {}
+        for step in batch:
+            ancestors[step.name] = set(deps[step.name])
+            for dep in deps[step.name]:
+                ancestors[step.name] |= ancestors[dep]
+                dependents[dep].append(step)
+            remaining[step.name] = len(deps[step.name])
+
+        ready = deque(step for step in batch if remaining[step.name] == 0)
+        executions: dict[str, StepExecution] = {}
+        running: dict[Future, Step] = {}
+        stopped = False
+        workers = min(self._max_workers, len(batch))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="workflow-step") as pool:
+            while True:
+                while ready and not stopped and len(running) < workers:
+                    step = ready.popleft()
+                    step_context = context
+                    for prior in batch:
+                        if prior.name in ancestors[step.name]:
+                            step_context = _merge_result(step_context, prior, executions[prior.name])
+                    future = pool.submit(self._execute_step, step, step_context, workflow)
+                    running[future] = step
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    step_exec = future.result()
+                    executions[step.name] = step_exec
+                    if step_exec.status == "failed" and step.on_error == ErrorPolicy.STOP:
+                        stopped = True
+                    for dependent in dependents[step.name]:
+                        remaining[dependent.name] -= 1
+                        if remaining[dependent.name] == 0:
+                            ready.append(dependent)
+
+        return [(step, executions[step.name]) for step in batch if step.name in executions]
+
     def _execute_lambda(self, step: Step, context: WorkflowContext) -> StepResult:
         """Execute a lambda step (inline function)."""
         if step.handler is None:
@@ -424,34 +566,7 @@ class WorkflowRunner:
 
     def _execute_choice(self, step: Step, context: WorkflowContext) -> StepResult:
         """Execute a choice step (conditional branch)."""
-        if step.condition is None:
-            return StepResult.fail("Choice step has no condition")
-
-        try:
-            condition_result = step.condition(context)
-        except Exception as e:
-            return StepResult.fail(f"Condition evaluation failed: {e}")
-
-        if condition_result:
-            next_step = step.then_step
-            branch = "then"
-        else:
-            next_step = step.else_step
-            branch = "else"
-
-        logger.debug(
-            "choice.evaluated",
-            step=step.name,
-            result=condition_result,
-            branch=branch,
-            next_step=next_step,
-        )
-
-        return StepResult.ok(
-            output={"condition_result": condition_result, "branch": branch},
-            context_updates={f"__choice_{step.name}": branch},
-            # next_step tells runner where to jump
-        )._replace_next_step(next_step)
+        return _evaluate_choice(step, context)
 
     def _execute_wait(self, step: Step, context: WorkflowContext) -> StepResult:
         """Execute a wait step (pause execution)."""
@@ -460,7 +575,6 @@ class WorkflowRunner:
         duration = step.duration_seconds or 0
 
         if duration > 0 and not self._dry_run:
-            import time
             time.sleep(duration)
 
         return StepResult.ok(
@@ -473,13 +587,253 @@ class WorkflowRunner:
         context: WorkflowContext,
         workflow: Workflow,
     ) -> StepResult:
-        """Execute a map step (fan-out/fan-in)."""
-        # Advanced tier feature - not implemented in Basic
-        return StepResult.fail(
-            error="Map steps require Advanced tier (parallel execution)",
-            category="CONFIGURATION",
+        """
+        Execute a map step (fan-out/fan-in).
+
+        Runs step.iterator_workflow once per item on a thread pool of
+        at most step.max_concurrency workers. Each item run gets the
+        parent params plus ``{item_param: item, "__map_index": i}``.
+        Item outputs are collected in input order regardless of which
+        item finishes first.
+
+        Per-item failures follow step.on_error:
+        - STOP: fail the step on the first failed item; items not yet
+          started are cancelled
+        - CONTINUE: run every item, record failures, step succeeds
+        - RETRY: retry retryable failures per step.retry_policy, then
+          behave like STOP
+        """
+        if step.iterator_workflow is None:
+            return StepResult.fail("Map step has no iterator_workflow", category="CONFIGURATION")
+
+        try:
+            items = _resolve_path(context, step.items_path or "")
+        except (KeyError, TypeError, IndexError, ValueError):
+            return StepResult.fail(
+                f"Map items not found at {step.items_path!r}",
+                category="CONFIGURATION",
+            )
+        if not isinstance(items, (list, tuple)):
+            return StepResult.fail(
+                f"Map items at {step.items_path!r} must be a list, got {type(items).__name__}",
+                category="CONFIGURATION",
+            )
+
+        fail_fast = step.on_error != ErrorPolicy.CONTINUE
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        errors: list[dict[str, Any]] = []
+        first_failure: tuple[int, str, str] | None = None
+        skipped = 0
+
+        if items:
+            workers = max(1, min(step.max_concurrency, len(items)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"map-{step.name}") as pool:
+                futures = {
+                    pool.submit(self._run_map_item, step, context, index, item): index
+                    for index, item in enumerate(items)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    if future.cancelled():
+                        continue
+                    item_result = future.result()
+                    if item_result.skipped:
+                        skipped += 1
+                        continue
+                    if item_result.status != WorkflowStatus.FAILED:
+                        results[index] = item_result.context.outputs_dict()
+                        continue
+
+                    error = item_result.error or "Map item failed"
+                    errors.append({"index": index, "error": error})
+                    logger.warning(
+                        "map.item_failed",
+                        workflow=workflow.name,
+                        step=step.name,
+                        index=index,
+                        error=error,
+                    )
+                    if first_failure is None or index < first_failure[0]:
+                        first_failure = (index, error, _failure_category(item_result))
+                    if fail_fast:
+                        for pending in futures:
+                            pending.cancel()
+                skipped += sum(f.cancelled() for f in futures)
+
+        errors.sort(key=lambda e: e["index"])
+        output = {
+            "count": len(items),
+            "completed": len(items) - len(errors) - skipped,
+            "failed": len(errors),
+            "skipped": skipped,
+            "results": results,
+            "errors": errors,
+        }
+
+        logger.debug(
+            "map.complete",
+            workflow=workflow.name,
+            step=step.name,
+            count=output["count"],
+            failed=output["failed"],
+            skipped=skipped,
         )
 
+        if first_failure is not None and fail_fast:
+            index, error, category = first_failure
+            return StepResult.fail(
+                error=f"Map item {index} failed: {error}",
+                category=category,
+                output=output,
+            )
+        return StepResult.ok(output=output)
+
+    def _run_map_item(
+        self,
+        step: Step,
+        context: WorkflowContext,
+        index: int,
+        item: Any,
+    ) -> WorkflowResult:
+        """
+        Run the iterator workflow for one map item (with retries).
+
+        Items always run through the base WorkflowRunner.execute: a
+        subclass's tracking (e.g. one manifest partition per run) would
+        treat every item as the same run, and item runs happen on worker
+        threads that must not share the caller's connection.
+        """
+        params = {
+            **context.params,
+            step.config.get("item_param", "item"): item,
+            "__map_index": index,
+        }
+        policy = step.retry_policy or RetryPolicy()
+        max_attempts = policy.max_attempts if step.on_error == ErrorPolicy.RETRY else 1
+
+        attempt = 1
+        while True:
+            result = WorkflowRunner.execute(self, step.iterator_workflow, params=params, partition=context.partition)
+            if result.status != WorkflowStatus.FAILED or attempt >= max_attempts:
+                return result
+            if _failure_category(result) not in policy.retryable_categories:
+                return result
+
+            delay = min(
+                policy.initial_delay_seconds * policy.backoff_multiplier ** (attempt - 1),
+                policy.max_delay_seconds,
+            )
+            logger.debug("map.item_retry", step=step.name, index=index, attempt=attempt, delay=delay)
+            if delay > 0:
+                time.sleep(delay)
+            attempt += 1
+
+
+def _batch_dependencies(batch: list[Step], workflow: Workflow) -> dict[str, list[str]]:
+    """
+    In-batch dependencies of each batch step.
+
+    A step without ``depends_on`` depends on every earlier step; it is
+    given only the earlier steps nothing else in the batch depends on
+    yet, which imply the rest, so a long sequential batch has O(n) edges.
+    """
+    declared = workflow.dependencies()
+    names = {step.name for step in batch}
+    frontier: dict[str, None] = {}
+    deps: dict[str, list[str]] = {}
+    for step in batch:
+        explicit = declared[step.name]
+        if explicit is None:
+            deps[step.name] = list(frontier)
+            frontier.clear()
+        else:
+            deps[step.name] = [d for d in explicit if d in names]
+            for dep in deps[step.name]:
+                frontier.pop(dep, None)
+        frontier[step.name] = None
+    return deps
+
+
+def _merge_result(
+    context: WorkflowContext,
+    step: Step,
+    step_exec: StepExecution,
+) -> WorkflowContext:
+    """Apply a completed step's output and context_updates."""
+    if step_exec.status != "completed" or not step_exec.result:
+        return context
+    context = context.with_output(step.name, step_exec.result.output)
+    if step_exec.result.context_updates:
+        context = context.with_params(step_exec.result.context_updates)
+    return context
+
+
+def _evaluate_choice(step: Step, context: WorkflowContext) -> StepResult:
+    """Evaluate a choice step's condition and pick the branch."""
+    if step.condition is None:
+        return StepResult.fail("Choice step has no condition")
+
+    try:
+        condition_result = step.condition(context)
+    except Exception as e:
+        return StepResult.fail(f"Condition evaluation failed: {e}")
+
+    if condition_result:
+        next_step = step.then_step
+        branch = "then"
+    else:
+        next_step = step.else_step
+        branch = "else"
+
+    logger.debug(
+        "choice.evaluated",
+        step=step.name,
+        result=condition_result,
+        branch=branch,
+        next_step=next_step,
+    )
+
+    return StepResult.ok(
+        output={"condition_result": condition_result, "branch": branch},
+        context_updates={f"__choice_{step.name}": branch},
+        # next_step tells runner where to jump
+    )._replace_next_step(next_step)
+
+
+def _resolve_path(context: WorkflowContext, path: str) -> Any:
+    """
+    Resolve a dotted path against the context.
+
+    "outputs.<step>.<key>..." reads step outputs; anything else is read
+    from params ("params." prefix optional). List segments may be indexed
+    with integers.
+    """
+    parts = path.split(".") if path else []
+    if parts and parts[0] == "outputs":
+        value: Any = context.outputs
+        parts = parts[1:]
+    else:
+        value = context.params
+        if parts and parts[0] == "params":
+            parts = parts[1:]
+    if not parts:
+        raise KeyError(path)
+
+    for part in parts:
+        if isinstance(value, (list, tuple)):
+            value = value[int(part)]
+        else:
+            value = value[part]
+    return value
+
+
+def _failure_category(result: WorkflowResult) -> str:
+    """Error category of the step that failed a workflow run."""
+    for execution in reversed(result.step_executions):
+        if execution.status == "failed" and execution.result is not None:
+            return execution.result.error_category or "INTERNAL"
+    return "INTERNAL"
+
 
 # Helper for StepResult to set next_step (immutable pattern)
 def _replace_next_step(self: StepResult, next_step: str | None) -> StepResult:
@@ -503,6 +857,7 @@ StepResult._replace_next_step = _replace_next_step
 def get_workflow_runner(
     dispatcher: Dispatcher | None = None,
     dry_run: bool = False,
+    cache: StepCache | None = None,
 ) -> WorkflowRunner:
     """Get a workflow runner instance."""
-    return WorkflowRunner(dispatcher=dispatcher, dry_run=dry_run)
+    return WorkflowRunner(dispatcher=dispatcher, dry_run=dry_run, cache=cache)
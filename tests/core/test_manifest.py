@@ -0,0 +1,228 @@
+"""
+Tests for spine.core.manifest module.
+
+Tests cover:
+- Single-partition stage tracking
+- Bulk advance and set-based stage queries
+- Read-through ManifestCache
+"""
+
+import sqlite3
+
+import pytest
+
+from spine.core import manifest as manifest_module
+from spine.core.manifest import ManifestCache, WorkManifest
+from spine.core.schema import create_core_tables
+
+STAGES = ["PENDING", "INGESTED", "NORMALIZED", "AGGREGATED"]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    create_core_tables(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def manifest(conn):
+    return WorkManifest(conn, domain="otc", stages=STAGES)
+
+
+class CountingConnection:
+    """sqlite3 connection wrapper counting SELECT statements."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.selects = 0
+
+    def execute(self, sql, params=()):
+        if sql.lstrip().upper().startswith("SELECT"):
+            self.selects += 1
+        return self.conn.execute(sql, params)
+
+    def executemany(self, sql, params):
+        return self.conn.executemany(sql, params)
+
+    def commit(self):
+        self.conn.commit()
+
+
+def week_keys(n):
+    return [{"week_ending": f"2025-{i:04d}", "tier": "NMS_TIER_1"} for i in range(n)]
+
+
+class TestWorkManifest:
+    """Tests for single-partition operations."""
+
+    def test_advance_and_query(self, manifest):
+        key = {"week_ending": "2025-12-26", "tier": "NMS_TIER_1"}
+        manifest.advance_to(key, "INGESTED", row_count=10, source="api")
+        manifest.advance_to(key, "NORMALIZED")
+
+        assert manifest.get_latest_stage(key) == "NORMALIZED"
+        assert manifest.is_at_least(key, "INGESTED")
+        assert not manifest.is_at_least(key, "AGGREGATED")
+        assert [r.stage for r in manifest.get(key)] == ["INGESTED", "NORMALIZED"]
+        assert manifest.get_stage_metrics(key, "INGESTED").metrics == {"source": "api"}
+
+    def test_unknown_stage_rejected(self, manifest):
+        with pytest.raises(ValueError, match="Unknown stage"):
+            manifest.advance_to({"k": 1}, "PUBLISHED")
+
+
+class TestBulkManifest:
+    """Tests for advance_many, get_latest_stages and filter_at_least."""
+
+    def test_advance_many_matches_advance_to(self, conn, manifest):
+        keys = week_keys(3)
+        other = WorkManifest(conn, domain="other", stages=STAGES)
+
+        manifest.advance_many(keys, "INGESTED", row_count=5, execution_id="e1", checked=True)
+        for key in keys:
+            other.advance_to(key, "INGESTED", row_count=5, execution_id="e1", checked=True)
+
+        for key in keys:
+            bulk, single = manifest.get(key)[0], other.get(key)[0]
+            assert (bulk.stage, bulk.row_count, bulk.metrics, bulk.execution_id) == (
+                single.stage, single.row_count, single.metrics, single.execution_id
+            )
+
+    def test_advance_many_upserts_and_calls_hook(self, conn):
+        events = []
+        manifest = WorkManifest(
+            conn, domain="otc", stages=STAGES,
+            on_stage_change=lambda domain, key, stage, rank, metrics: events.append((key, stage)),
+        )
+        keys = week_keys(2)
+
+        manifest.advance_many(keys, "INGESTED", row_count=1)
+        manifest.advance_many(keys, "INGESTED", row_count=2)
+
+        assert [r.row_count for r in manifest.get(keys[0])] == [2]
+        assert len(events) == 4
+
+    def test_get_latest_stages_preserves_order(self, manifest, monkeypatch):
+        monkeypatch.setattr(manifest_module, "BULK_CHUNK_SIZE", 2)
+        keys = week_keys(5)
+        manifest.advance_many(keys[:3], "INGESTED")
+        manifest.advance_many([keys[1]], "AGGREGATED")
+
+        latest = manifest.get_latest_stages(keys + [keys[1]])
+
+        assert latest == ["INGESTED", "AGGREGATED", "INGESTED", None, None, "AGGREGATED"]
+        assert latest[:5] == [manifest.get_latest_stage(k) for k in keys]
+
+    def test_filter_at_least(self, manifest, monkeypatch):
+        monkeypatch.setattr(manifest_module, "BULK_CHUNK_SIZE", 2)
+        keys = week_keys(5)
+        manifest.advance_many(keys, "PENDING")
+        manifest.advance_many(keys[1::2], "NORMALIZED")
+
+        assert manifest.filter_at_least(keys, "INGESTED") == [keys[1], keys[3]]
+        assert manifest.filter_at_least(keys, "PENDING") == keys
+        assert manifest.filter_at_least([], "PENDING") == []
+        with pytest.raises(ValueError):
+            manifest.filter_at_least(keys, "PUBLISHED")
+
+
+class TestManifestCache:
+    """Tests for the read-through manifest cache."""
+
+    @pytest.fixture
+    def counting(self, conn):
+        return CountingConnection(conn)
+
+    def test_repeated_checks_hit_cache(self, counting):
+        manifest = WorkManifest(counting, "otc", STAGES, cache=ManifestCache())
+        key = week_keys(1)[0]
+        manifest.advance_to(key, "INGESTED")
+
+        checks = [manifest.is_at_least(key, "PENDING") for _ in range(5)]
+        checks.append(manifest.has_stage(key, "INGESTED"))
+        checks.append(manifest.is_before(key, "NORMALIZED"))
+
+        assert all(checks)
+        assert counting.selects == 1
+
+    def test_write_through_keeps_cache_current(self, counting):
+        cache = ManifestCache()
+        manifest = WorkManifest(counting, "otc", STAGES, cache=cache)
+        keys = week_keys(3)
+        assert manifest.get_latest_stages(keys) == [None, None, None]
+
+        manifest.advance_to(keys[0], "NORMALIZED")
+        manifest.advance_many(keys[1:], "INGESTED")
+        manifest.advance_to(keys[0], "INGESTED")  # lower stage keeps latest
+
+        assert manifest.get_latest_stages(keys) == ["NORMALIZED", "INGESTED", "INGESTED"]
+        assert manifest.filter_at_least(keys, "NORMALIZED") == [keys[0]]
+        assert counting.selects == 1
+        uncached = WorkManifest(counting.conn, "otc", STAGES)
+        assert uncached.get_latest_stages(keys) == ["NORMALIZED", "INGESTED", "INGESTED"]
+
+    def test_preload_answers_whole_domain(self, conn, counting):
+        keys = week_keys(4)
+        WorkManifest(conn, "otc", STAGES).advance_many(keys[:2], "INGESTED")
+        manifest = WorkManifest(counting, "otc", STAGES, cache=ManifestCache())
+
+        assert manifest.preload() == 2
+        assert manifest.get_latest_stages(keys) == ["INGESTED", "INGESTED", None, None]
+        manifest.advance_to(keys[3], "PENDING")
+        assert manifest.get_latest_stage(keys[3]) == "PENDING"
+        assert counting.selects == 1
+
+    def test_per_domain_lru_and_invalidate(self, conn, counting):
+        cache = ManifestCache(max_entries=2)
+        otc = WorkManifest(counting, "otc", STAGES, cache=cache)
+        equity = WorkManifest(counting, "equity", STAGES, cache=cache)
+        keys = week_keys(3)
+
+        otc.get_latest_stages(keys)
+        equity.get_latest_stages(keys[:2])
+        assert len(cache) == 4
+        assert cache.evictions == 1
+
+        # Another writer advances a partition; invalidate to see it
+        WorkManifest(conn, "equity", STAGES).advance_to(keys[0], "AGGREGATED")
+        assert equity.get_latest_stage(keys[0]) is None
+        equity.invalidate(keys[0])
+        assert equity.get_latest_stage(keys[0]) == "AGGREGATED"
+
+        otc.invalidate()
+        selects = counting.selects
+        otc.get_latest_stage(keys[2])
+        assert counting.selects == selects + 1
+
+    def test_rollback_drops_uncommitted_stages(self, conn):
+        manifest = WorkManifest(conn, "otc", STAGES, cache=ManifestCache())
+        keys = week_keys(3)
+        manifest.advance_to(keys[0], "INGESTED")
+        manifest.commit()
+
+        manifest.advance_to(keys[0], "NORMALIZED")
+        manifest.advance_many(keys[1:], "INGESTED")
+        assert manifest.is_at_least(keys[1], "INGESTED")
+        manifest.rollback()
+
+        assert manifest.get_latest_stages(keys) == ["INGESTED", None, None]
+        assert not manifest.is_at_least(keys[0], "NORMALIZED")
+
+    def test_preload_requires_cache(self, manifest):
+        with pytest.raises(ValueError):
+            manifest.preload()
+        with pytest.raises(ValueError):
+            ManifestCache(max_entries=0)
+
+    def test_key_serialization_memo(self, manifest, conn):
+        cache = ManifestCache()
+        cached = WorkManifest(conn, "otc", STAGES, cache=cache)
+        keys = [{"flag": 1}, {"flag": True}, {"flag": 1.0}, {"weeks": ["a", "b"]}]
+
+        assert [cached._key_json(k) for k in keys * 2] == [manifest._key_json(k) for k in keys * 2]
+
+        cached.get_latest_stage(keys[0])
+        cached.get_latest_stage(keys[0])
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -5,17 +5,26 @@ Tests cover:
 - RollingWindow creation
 - Window period generation
 - Rolling computation with fetch/aggregate
+- Incremental rolling series
+- Bulk fetching (fetch_many and SQL helpers)
 - RollingResult dataclass
 - Trend computation
 """
 
-import pytest
+import random
+import sqlite3
+import statistics
 from datetime import date
 
+import pytest
+
 from spine.core.rolling import (
-    RollingWindow,
     RollingResult,
+    RollingWindow,
+    build_period_query,
     compute_trend,
+    fetch_periods_for_keys,
+    table_fetch_many,
 )
 from spine.core.temporal import WeekEnding
 
@@ -197,6 +206,163 @@ class TestRollingCompute:
         assert result.aggregates == {}
 
 
+def full_aggregate(pairs):
+    values = [v for _, v in pairs]
+    return {
+        "sum": sum(values),
+        "mean": sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+        "std": statistics.stdev(values) if len(values) > 1 else None,
+    }
+
+
+class TestComputeSeries:
+    """Tests for RollingWindow.compute_series."""
+
+    @pytest.fixture
+    def week_window(self):
+        return RollingWindow(size=4, step_back=lambda w: w.previous())
+
+    def test_matches_compute_for_every_as_of(self, week_window):
+        """Each row equals compute() at that as_of, including gaps."""
+        rng = random.Random(7)
+        start, end = WeekEnding("2025-06-06"), WeekEnding("2026-01-09")
+        data = {
+            w.value: rng.randint(1, 1000)
+            for w in WeekEnding.range(start.previous(3), end)
+            if rng.random() > 0.25
+        }
+
+        series = week_window.compute_series(start, end, fetch_fn=lambda w: data.get(w.value))
+
+        assert series.periods == list(WeekEnding.range(start, end))
+        for as_of, result in zip(series.periods, series.to_results()):
+            expected = week_window.compute(as_of, lambda w: data.get(w.value), full_aggregate)
+            assert result.periods_present == expected.periods_present
+            assert result.is_complete == expected.is_complete
+            assert result.aggregates.keys() == expected.aggregates.keys()
+            for name, value in expected.aggregates.items():
+                assert result.aggregates[name] == pytest.approx(value, abs=1e-4)
+
+    def test_fetches_each_period_once(self, week_window):
+        """Look-back plus range periods are fetched exactly once."""
+        fetched = []
+        start, end = WeekEnding("2025-12-05"), WeekEnding("2026-01-09")
+
+        week_window.compute_series(start, end, fetch_fn=lambda w: fetched.append(w) or 1)
+
+        assert fetched == list(WeekEnding.range(start.previous(3), end))
+
+    def test_columns_and_empty_windows(self, week_window):
+        """Windows with no data have None statistics."""
+        end = WeekEnding("2026-01-09")
+        data = {end.previous(4).value: 10}
+
+        series = week_window.compute_series(end.previous(1), end, fetch_fn=lambda w: data.get(w.value))
+
+        columns = series.columns()
+        assert columns["periods_present"] == [1, 0]
+        assert columns["max"] == [10, None]
+        assert columns["is_complete"] == [False, False]
+        assert series.result_at(1).aggregates == {}
+
+    def test_end_before_start_rejected(self, week_window):
+        with pytest.raises(ValueError):
+            week_window.compute_series(WeekEnding("2026-01-09"), WeekEnding("2025-12-05"), lambda w: 1)
+
+
+class TestBulkFetch:
+    """Tests for fetch_many and the SQL bulk-fetch helpers."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE volume (symbol TEXT, tier TEXT, week_ending TEXT, total INTEGER)")
+        weeks = WeekEnding.range(WeekEnding("2025-12-05"), WeekEnding("2026-01-09"))
+        for i, week in enumerate(weeks):
+            for symbol in ("AAPL", "MSFT"):
+                if (symbol, i) != ("AAPL", 2):  # one gap
+                    conn.execute(
+                        "INSERT INTO volume VALUES (?, 'T1', ?, ?)",
+                        (symbol, str(week), (i + 1) * (10 if symbol == "AAPL" else 1)),
+                    )
+        yield conn
+        conn.close()
+
+    @pytest.fixture
+    def week_window(self):
+        return RollingWindow(size=4, step_back=lambda w: w.previous())
+
+    def test_fetch_many_replaces_per_period_fetch(self, week_window):
+        """fetch_many is called once with the whole window."""
+        calls = []
+
+        def fetch_many(periods):
+            calls.append(list(periods))
+            return dict.fromkeys(periods[1:], 5)
+
+        result = week_window.compute(
+            WeekEnding("2026-01-09"), None,
+            lambda pairs: {"sum": sum(v for _, v in pairs)},
+            fetch_many=fetch_many,
+        )
+
+        assert len(calls) == 1 and len(calls[0]) == 4
+        assert result.aggregates == {"sum": 15}
+        assert result.periods_present == 3
+
+    def test_fetch_required(self, week_window):
+        with pytest.raises(ValueError):
+            week_window.compute_series(WeekEnding("2026-01-02"), WeekEnding("2026-01-09"))
+
+    @pytest.mark.parametrize("use_range", [False, True])
+    def test_table_fetch_many_matches_per_week_queries(self, conn, week_window, use_range):
+        """One query returns the same window as per-week lookups."""
+        def fetch_fn(week):
+            row = conn.execute(
+                "SELECT total FROM volume WHERE symbol = 'AAPL' AND week_ending = ?", (str(week),)
+            ).fetchone()
+            return row[0] if row else None
+
+        fetch_many = table_fetch_many(
+            conn, "volume", "total", filters={"symbol": "AAPL", "tier": "T1"}, use_range=use_range
+        )
+
+        def aggregate(pairs):
+            return {"values": [v for _, v in pairs]}
+
+        as_of = WeekEnding("2026-01-09")
+
+        bulk = week_window.compute(as_of, None, aggregate, fetch_many=fetch_many)
+        single = week_window.compute(as_of, fetch_fn, aggregate)
+
+        assert bulk == single
+        assert bulk.aggregates["values"] == [40, 50, 60]
+
+    def test_fetch_periods_for_keys(self, conn, week_window):
+        """A batch of symbols is fetched in one query and split per key."""
+        as_of = WeekEnding("2026-01-09")
+        periods = week_window.get_window(as_of)
+
+        batch = fetch_periods_for_keys(conn, "volume", "total", "symbol", ["AAPL", "MSFT"], periods)
+
+        assert set(batch) == {"AAPL", "MSFT"}
+        assert batch["MSFT"][as_of] == 6
+        assert WeekEnding("2025-12-19") not in batch["AAPL"]
+        result = week_window.compute(
+            as_of, None, lambda pairs: {"n": len(pairs)},
+            fetch_many=lambda ps: batch.get("MSFT", {}),
+        )
+        assert result.is_complete is True
+
+    def test_build_period_query_rejects_bad_identifiers(self):
+        with pytest.raises(ValueError, match="identifier"):
+            build_period_query("volume; DROP TABLE x", "total", [WeekEnding("2026-01-09")])
+        with pytest.raises(ValueError):
+            build_period_query("volume", "total", [])
+
+
 class TestComputeTrend:
     """Tests for compute_trend function."""
 
@@ -0,0 +1,108 @@
+"""
+Tests for spine.core.rolling_array module.
+
+Tests cover:
+- Agreement with RollingWindow.compute / compute_trend per symbol
+- Missing-value masks and NaN handling
+- RollingResult conversion
+"""
+
+import statistics
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from spine.core.rolling import RollingWindow, compute_trend
+from spine.core.rolling_array import rolling_aggregates
+
+
+def reference(row, missing, size, trend_periods=2):
+    """Per-symbol loop over RollingWindow.compute, with periods as indices."""
+    window = RollingWindow(size=size, step_back=lambda t: t - 1)
+
+    def fetch(t):
+        return None if t < 0 or missing[t] else float(row[t])
+
+    def aggregate(pairs):
+        values = [v for _, v in pairs]
+        return {
+            "sum": sum(values),
+            "mean": sum(values) / len(values),
+            "min": min(values),
+            "max": max(values),
+            "std": statistics.stdev(values) if len(values) > 1 else None,
+        }
+
+    results = []
+    for as_of in range(len(row)):
+        result = window.compute(as_of, fetch, aggregate)
+        present = [(t, fetch(t)) for t in window.get_window(as_of) if fetch(t) is not None]
+        first = [v for t, v in present if t <= as_of - size + trend_periods]
+        last = [v for t, v in present if t > as_of - trend_periods]
+        results.append((result, compute_trend(first, last)))
+    return results
+
+
+class TestRollingAggregates:
+    """Tests for rolling_aggregates."""
+
+    def test_matches_per_symbol_compute(self):
+        """Every window agrees with the list-based path."""
+        rng = np.random.default_rng(3)
+        values = rng.integers(1, 1000, size=(5, 30)).astype(float)
+        mask = rng.random((5, 30)) < 0.2
+
+        stats = rolling_aggregates(values, size=6, mask=mask)
+
+        for s in range(5):
+            for t, (expected, (direction, pct)) in enumerate(reference(values[s], mask[s], 6)):
+                result = stats.result_at(s, t)
+                assert result.periods_present == expected.periods_present
+                assert result.is_complete == expected.is_complete
+                assert result.aggregates.get("trend_direction", "FLAT") == direction
+                assert result.aggregates.get("trend_pct", 0.0) == pytest.approx(pct)
+                for name, value in expected.aggregates.items():
+                    assert result.aggregates[name] == pytest.approx(value, abs=1e-6)
+
+    def test_nan_values_are_missing(self):
+        """Without a mask, NaNs mark missing periods."""
+        values = np.array([[1.0, np.nan, 3.0, 5.0]])
+
+        stats = rolling_aggregates(values, size=2)
+
+        assert stats.periods_present.tolist() == [[1, 1, 1, 2]]
+        assert stats.completeness.tolist() == [[0.5, 0.5, 0.5, 1.0]]
+        assert stats.mean[0, 3] == 4.0
+        assert np.isnan(stats.std[0, 2])
+        assert stats.max[0, 1] == 1.0
+
+    def test_empty_window_has_empty_aggregates(self):
+        """Windows without data mirror RollingWindow.compute."""
+        values = np.array([[1.0, 2.0, 3.0]])
+        mask = np.array([[True, True, False]])
+
+        stats = rolling_aggregates(values, size=2, mask=mask)
+
+        assert np.isnan(stats.sum[0, 1])
+        result = stats.result_at(0, 1)
+        assert result.aggregates == {}
+        assert result.periods_present == 0
+        assert len(stats.to_results(0)) == 3
+
+    def test_trend_direction(self):
+        """Rising values trend UP, flat values FLAT."""
+        values = np.array([[100.0, 110.0, 150.0, 160.0], [100.0, 102.0, 103.0, 101.0]])
+
+        stats = rolling_aggregates(values, size=4)
+
+        assert stats.trend_direction[:, -1].tolist() == ["UP", "FLAT"]
+        assert stats.trend_pct[0, -1] == 47.62  # (155 - 105) / 105
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            rolling_aggregates(np.zeros(5), size=2)
+        with pytest.raises(ValueError):
+            rolling_aggregates(np.zeros((2, 5)), size=2, mask=np.zeros((2, 4), dtype=bool))
+        with pytest.raises(ValueError):
+            rolling_aggregates(np.zeros((2, 5)), size=2, trend_periods=3)
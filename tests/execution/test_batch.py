@@ -1,15 +1,23 @@
 """Tests for batch execution."""
 
+import asyncio
+import sqlite3
+
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+from spine.core.schema import CORE_DDL
 from spine.execution.batch import (
+    AsyncBatchBuilder,
+    AsyncBatchExecutor,
     BatchItem,
     BatchResult,
     BatchBuilder,
     BatchExecutor,
 )
+from spine.execution.dlq import DLQManager
+from spine.execution.ledger import ExecutionLedger
 from spine.execution.models import ExecutionStatus
 
 
@@ -254,6 +262,84 @@ class TestBatchExecutor:
         assert result.failed >= 1
 
 
+def _patch_tracked(mock_tracked):
+    mock_ctx = MagicMock()
+    mock_ctx.id = "exec-123"
+    mock_tracked.return_value.__enter__ = MagicMock(return_value=mock_ctx)
+    mock_tracked.return_value.__exit__ = MagicMock(return_value=False)
+
+
+class TestBatchStreaming:
+    """Tests for streaming execution over an iterable."""
+
+    @patch("spine.execution.batch.tracked_execution")
+    def test_stream_yields_every_item(self, mock_tracked):
+        """Test that stream yields each completed item once."""
+        _patch_tracked(mock_tracked)
+        executor = BatchExecutor(MagicMock(), max_parallel=3)
+        executor.register_handler("double", lambda params: params["x"] * 2)
+        
+        entries = (("double", {"x": i}) for i in range(20))
+        results = sorted(item.result for item in executor.stream(entries))
+        
+        assert results == [i * 2 for i in range(20)]
+        assert executor.item_count == 0
+
+    @patch("spine.execution.batch.tracked_execution")
+    def test_stream_bounds_in_flight(self, mock_tracked):
+        """Test that the source is consumed no faster than the window allows."""
+        _patch_tracked(mock_tracked)
+        executor = BatchExecutor(MagicMock(), max_parallel=2)
+        pulled = 0
+        
+        def source():
+            nonlocal pulled
+            for i in range(50):
+                pulled += 1
+                yield ("p", {"i": i})
+        
+        stream = executor.stream(source(), max_in_flight=4)
+        first = next(stream)
+        
+        assert first.status == ExecutionStatus.COMPLETED
+        assert pulled <= 5
+        stream.close()
+
+    @patch("spine.execution.batch.tracked_execution")
+    def test_stream_sequential_accepts_items_and_names(self, mock_tracked):
+        """Test sequential streaming with BatchItems and bare pipeline names."""
+        _patch_tracked(mock_tracked)
+        executor = BatchExecutor(MagicMock(), max_parallel=1)
+        item = BatchItem(id="fixed", pipeline="p1", params={})
+        
+        streamed = list(executor.stream([item, "p2"]))
+        
+        assert streamed[0] is item
+        assert streamed[1].pipeline == "p2"
+        assert streamed[1].params == {}
+
+    @patch("spine.execution.batch.tracked_execution")
+    def test_run_stream_keeps_counters_only(self, mock_tracked):
+        """Test that run_stream aggregates without retaining items."""
+        _patch_tracked(mock_tracked)
+        executor = BatchExecutor(MagicMock(), max_parallel=4)
+        
+        def handler(params):
+            if params["i"] % 5 == 0:
+                raise ValueError("bad partition")
+            return params["i"]
+        
+        executor.register_handler("p", handler)
+        result = executor.run_stream(("p", {"i": i}) for i in range(25))
+        
+        assert result.items == []
+        assert result.total == 25
+        assert result.failed == 5
+        assert result.successful == 20
+        assert result.success_rate == 80.0
+        assert result.completed_at is not None
+
+
 class TestBatchBuilder:
     """Tests for BatchBuilder fluent API."""
 
@@ -350,3 +436,131 @@ class TestBatchBuilder:
         
         assert result.total == 2
         assert result.batch_id is not None
+
+
+@pytest.fixture
+def conn():
+    """In-memory SQLite database with the core tables."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    for ddl in CORE_DDL.values():
+        conn.execute(ddl)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+class TestAsyncBatchExecutor:
+    """Tests for the asyncio batch executor."""
+
+    @pytest.mark.asyncio
+    async def test_run_all_bounded_by_semaphore(self, conn):
+        """Test that no more than max_concurrency handlers run at once."""
+        executor = AsyncBatchExecutor(ExecutionLedger(conn), max_concurrency=5)
+        active = 0
+        peak = 0
+        
+        async def handler(params):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return {"i": params["i"]}
+        
+        executor.register_handler("io.fetch", handler)
+        for i in range(40):
+            executor.add("io.fetch", {"i": i})
+        
+        result = await executor.run_all()
+        
+        assert result.successful == 40
+        assert peak == 5
+        assert sorted(item.result["i"] for item in result.items) == list(range(40))
+
+    @pytest.mark.asyncio
+    async def test_failures_tracked_and_sent_to_dlq(self, conn):
+        """Test that failed items are recorded in the ledger and DLQ."""
+        ledger = ExecutionLedger(conn)
+        dlq = DLQManager(conn)
+        executor = AsyncBatchExecutor(ledger, dlq=dlq)
+        
+        async def handler(params):
+            if params["bad"]:
+                raise RuntimeError("upstream 503")
+            return {"ok": True}
+        
+        executor.register_handler("io.fetch", handler)
+        executor.add("io.fetch", {"bad": False})
+        executor.add("io.fetch", {"bad": True})
+        
+        result = await executor.run_all()
+        
+        assert result.successful == 1
+        assert result.failed == 1
+        failed = next(i for i in result.items if i.status == ExecutionStatus.FAILED)
+        assert failed.error == "upstream 503"
+        assert ledger.get_execution(failed.execution_id).status == ExecutionStatus.FAILED
+        assert dlq.count_unresolved("io.fetch") == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_off_loop(self, conn):
+        """Test that plain callables are supported."""
+        executor = AsyncBatchExecutor(ExecutionLedger(conn))
+        executor.register_handler("cpu.step", lambda params: {"n": params["n"] + 1})
+        executor.add("cpu.step", {"n": 1})
+        
+        result = await executor.run_all()
+        
+        assert result.items[0].result == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_run_sequential_stop_on_failure(self, conn):
+        """Test sequential run stops at the first failure."""
+        executor = AsyncBatchExecutor(ExecutionLedger(conn))
+        
+        async def handler(params):
+            if params["i"] == 1:
+                raise ValueError("boom")
+            return {}
+        
+        executor.register_handler("p", handler)
+        for i in range(3):
+            executor.add("p", {"i": i})
+        
+        result = await executor.run_sequential(stop_on_failure=True)
+        
+        assert result.successful == 1
+        assert result.failed == 1
+        assert result.pending == 1
+
+
+class TestAsyncBatchBuilder:
+    """Tests for AsyncBatchBuilder fluent API."""
+
+    def test_concurrency_config(self):
+        """Test concurrency configuration."""
+        builder = AsyncBatchBuilder(MagicMock()).concurrency(2000)
+        
+        assert builder._parallel is True
+        assert builder._executor._max_concurrency == 2000
+
+    @pytest.mark.asyncio
+    async def test_run(self, conn):
+        """Test running the batch through the builder."""
+        progress = []
+        
+        async def handler(params):
+            return {"x": params["x"]}
+        
+        result = await (
+            AsyncBatchBuilder(ExecutionLedger(conn))
+            .handler("p", handler)
+            .add("p", {"x": 1})
+            .add("p", {"x": 2})
+            .on_progress(lambda item: progress.append(item.id))
+            .run()
+        )
+        
+        assert result.total == 2
+        assert result.successful == 2
+        assert len(progress) == 2
@@ -1,10 +1,11 @@
 """Tests for TrackedExecution context manager."""
 
-import pytest
 import asyncio
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from spine.execution.context import (
     ExecutionContext,
     ExecutionLockError,
@@ -401,3 +402,62 @@ class TestTrackedExecutionAsync:
         
         # Lock should be released
         assert len(guard.release_calls) == 1
+
+
+class TestTrackedExecutionWriteBehind:
+    """Tests for tracked execution against a real, buffered ledger."""
+
+    def test_progress_events_committed_together(self):
+        """Progress events are buffered and committed when the run ends."""
+        import sqlite3
+
+        from spine.core.schema import CORE_DDL
+        from spine.execution.ledger import ExecutionLedger
+
+        conn = sqlite3.connect(":memory:")
+        for ddl in CORE_DDL.values():
+            conn.execute(ddl)
+        ledger = ExecutionLedger(conn)
+
+        with tracked_execution(ledger, None, None, "test.pipeline") as ctx:
+            for i in range(20):
+                ctx.log_progress("step", i=i)
+            assert ledger.pending_writes == 20
+            running = ledger.get_execution(ctx.id)
+            assert running.status == ExecutionStatus.RUNNING
+
+        assert ledger.pending_writes == 0
+        assert ledger.get_execution(ctx.id).status == ExecutionStatus.COMPLETED
+        events = ledger.get_events(ctx.id)
+        assert len(events) == 23  # created, started, 20 progress, completed
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_overlapping_async_executions_leave_ledger_unbuffered(self):
+        """Concurrent batches on one ledger don't leave it stuck buffering."""
+        import sqlite3
+
+        from spine.core.schema import CORE_DDL
+        from spine.execution.ledger import ExecutionLedger
+
+        conn = sqlite3.connect(":memory:")
+        for ddl in CORE_DDL.values():
+            conn.execute(ddl)
+        ledger = ExecutionLedger(conn)
+
+        async def run(name: str, delay: float) -> str:
+            async with tracked_execution_async(ledger, None, None, name) as ctx:
+                await asyncio.sleep(delay)
+                ctx.log_progress("step")
+            return ctx.id
+
+        first, second = await asyncio.gather(run("a", 0.01), run("b", 0.02))
+
+        assert ledger.pending_writes == 0
+        for execution_id in (first, second):
+            assert ledger.get_execution(execution_id).status == ExecutionStatus.COMPLETED
+
+        later = Execution.create(pipeline="unrelated")
+        ledger.create_execution(later)
+        assert ledger.pending_writes == 0
+        conn.close()
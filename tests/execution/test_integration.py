@@ -181,6 +181,65 @@ class TestMemoryExecutor:
         assert result == {"async": True}
 
 
+def _square(params):
+    """Module-level (picklable) handler for process-mode tests."""
+    return params["n"] * params["n"]
+
+
+class TestLocalExecutor:
+    """Test LocalExecutor thread, process and coroutine modes."""
+    
+    @pytest.mark.asyncio
+    async def test_result_future_is_awaitable(self):
+        """Test pool results can be awaited without blocking the loop."""
+        with LocalExecutor(max_workers=1) as executor:
+            executor.register_handler("task", "square", _square)
+            ref = await executor.submit(task_spec("square", {"n": 7}))
+            assert await executor.result_future(ref) == 49
+            assert await executor.get_status(ref) == "completed"
+    
+    @pytest.mark.asyncio
+    async def test_coroutine_handler_runs_on_event_loop(self):
+        """Test async handlers are awaited on the loop, not a pool thread."""
+        import threading
+        
+        async def where(params):
+            await asyncio.sleep(0)
+            return threading.current_thread() is threading.main_thread()
+        
+        with LocalExecutor(max_workers=1) as executor:
+            executor.register_handler("task", "where", where)
+            ref = await executor.submit(task_spec("where", {}))
+            assert await executor.get_result(ref, timeout=1) is True
+    
+    @pytest.mark.asyncio
+    async def test_process_mode(self):
+        """Test sync handlers run in worker processes."""
+        with LocalExecutor(max_workers=1, mode="process") as executor:
+            executor.register_handler("task", "square", _square)
+            ref = await executor.submit(task_spec("square", {"n": 12}))
+            assert await executor.get_result(ref, timeout=4) == 144
+    
+    @pytest.mark.asyncio
+    async def test_get_result_timeout_leaves_work_running(self):
+        """Test a get_result timeout does not cancel the work."""
+        import threading
+        release = threading.Event()
+        
+        with LocalExecutor(max_workers=1) as executor:
+            executor.register_handler("task", "block", lambda p: release.wait(2))
+            ref = await executor.submit(task_spec("block", {}))
+            with pytest.raises(TimeoutError):
+                await executor.get_result(ref, timeout=0.05)
+            release.set()
+            assert await executor.get_result(ref, timeout=2) is True
+    
+    def test_unknown_mode_rejected(self):
+        """Test invalid modes fail fast."""
+        with pytest.raises(ValueError):
+            LocalExecutor(mode="fiber")
+
+
 class TestStubExecutor:
     """Test StubExecutor functionality."""
     
@@ -421,3 +480,195 @@ class TestEndToEndWithMemoryExecutor:
         # Check metadata
         metadata = registry.get_metadata("task", "greet")
         assert metadata["description"] == "Says hello"
+
+
+class TestSubmitMany:
+    """Test batched Dispatcher.submit_many."""
+    
+    @pytest.mark.asyncio
+    async def test_returns_run_ids_in_input_order(self):
+        """Test run_ids line up with the input specs."""
+        executor = StubExecutor()
+        dispatcher = Dispatcher(executor=executor)
+        
+        specs = [task_spec(f"t{i}", {"i": i}) for i in range(5)]
+        run_ids = await dispatcher.submit_many(specs)
+        
+        assert len(run_ids) == 5
+        for i, run_id in enumerate(run_ids):
+            run = await dispatcher.get_run(run_id)
+            assert run.spec.name == f"t{i}"
+        assert executor.submission_count == 5
+    
+    @pytest.mark.asyncio
+    async def test_idempotency_resolved_across_batch_and_store(self):
+        """Test keys dedupe against prior runs and within the batch."""
+        dispatcher = Dispatcher(executor=StubExecutor())
+        prior = await dispatcher.submit_task("t", {}, idempotency_key="k1")
+        
+        run_ids = await dispatcher.submit_many([
+            task_spec("t", {}, idempotency_key="k1"),
+            task_spec("t", {}, idempotency_key="k2"),
+            task_spec("t", {}, idempotency_key="k2"),
+            task_spec("t", {}),
+        ])
+        
+        assert run_ids[0] == prior
+        assert run_ids[1] == run_ids[2]
+        assert len(set(run_ids)) == 3
+        assert len(await dispatcher.list_runs()) == 3
+    
+    @pytest.mark.asyncio
+    async def test_memory_executor_results_and_events(self):
+        """Test batch runs complete and record the usual events."""
+        def double(params):
+            return params["x"] * 2
+        
+        executor = MemoryExecutor(handlers={"task:double": double})
+        dispatcher = Dispatcher(executor=executor)
+        
+        run_ids = await dispatcher.submit_many(
+            task_spec("double", {"x": x}) for x in range(3)
+        )
+        
+        runs = [await dispatcher.get_run(run_id) for run_id in run_ids]
+        assert [r.result for r in runs] == [0, 2, 4]
+        assert all(r.status == RunStatus.COMPLETED for r in runs)
+        
+        event_types = [e.event_type for e in await dispatcher.get_events(run_ids[0])]
+        assert event_types == [EventType.CREATED, EventType.QUEUED, EventType.COMPLETED]
+    
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_per_spec(self):
+        """Test one bad spec fails alone when the executor rejects the batch."""
+        executor = LocalExecutor(max_workers=1)
+        executor.register_handler("task", "ok", lambda params: "ok")
+        dispatcher = Dispatcher(executor=executor)
+        
+        try:
+            run_ids = await dispatcher.submit_many([
+                task_spec("ok", {}),
+                task_spec("missing", {}),
+            ])
+        finally:
+            executor.shutdown()
+        
+        ok_run = await dispatcher.get_run(run_ids[0])
+        bad_run = await dispatcher.get_run(run_ids[1])
+        assert ok_run.status != RunStatus.FAILED
+        assert bad_run.status == RunStatus.FAILED
+        assert bad_run.error_type == "ValueError"
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_does_not_run_work_twice(self):
+        """Test a batch rejected by a wrapping executor runs each spec once."""
+        from spine.execution.executors import PriorityExecutor
+
+        calls = []
+        inner = MemoryExecutor(handlers={"task:a": lambda params: calls.append(params)})
+        dispatcher = Dispatcher(executor=PriorityExecutor(inner))
+
+        run_ids = await dispatcher.submit_many([
+            task_spec("a", {"i": 1}),
+            task_spec("a", {"i": 0}, priority="bogus"),
+            task_spec("a", {"i": 2}),
+        ])
+
+        assert sorted(c["i"] for c in calls) == [1, 2]
+        bad_run = await dispatcher.get_run(run_ids[1])
+        assert bad_run.status == RunStatus.FAILED
+        assert bad_run.error_type == "ValueError"
+
+
+class TestPushCompletion:
+    """Test executor-pushed completion and Dispatcher.wait_for."""
+    
+    @pytest.mark.asyncio
+    async def test_memory_executor_pushes_single_completion(self):
+        """Test synchronous completion is applied once, without polling."""
+        executor = MemoryExecutor(handlers={"task:echo": lambda p: p})
+        dispatcher = Dispatcher(executor=executor)
+        
+        run_id = await dispatcher.submit_task("echo", {"x": 1})
+        run = await dispatcher.get_run(run_id)
+        
+        assert run.status == RunStatus.COMPLETED
+        assert run.result == {"x": 1}
+        event_types = [e.event_type for e in await dispatcher.get_events(run_id)]
+        assert event_types.count(EventType.COMPLETED) == 1
+    
+    @pytest.mark.asyncio
+    async def test_local_executor_wait_for(self):
+        """Test wait_for resolves when a thread-pool run finishes."""
+        import threading
+        release = threading.Event()
+        
+        def slow(params):
+            release.wait(timeout=2)
+            return {"done": True}
+        
+        executor = LocalExecutor(max_workers=1)
+        executor.register_handler("task", "slow", slow)
+        dispatcher = Dispatcher(executor=executor)
+        
+        try:
+            run_id = await dispatcher.submit_task("slow", {})
+            assert (await dispatcher.get_run(run_id)).status in (
+                RunStatus.QUEUED, RunStatus.RUNNING,
+            )
+            release.set()
+            run = await dispatcher.wait_for(run_id, timeout=2)
+        finally:
+            executor.shutdown()
+        
+        assert run.status == RunStatus.COMPLETED
+        assert run.result == {"done": True}
+        assert run.started_at is not None
+        event_types = [e.event_type for e in await dispatcher.get_events(run_id)]
+        assert event_types == [
+            EventType.CREATED, EventType.QUEUED, EventType.STARTED, EventType.COMPLETED,
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_local_executor_failure_pushed(self):
+        """Test handler exceptions arrive as FAILED runs."""
+        def boom(params):
+            raise RuntimeError("kaboom")
+        
+        executor = LocalExecutor(max_workers=1)
+        executor.register_handler("task", "boom", boom)
+        dispatcher = Dispatcher(executor=executor)
+        
+        try:
+            run_id = await dispatcher.submit_task("boom", {})
+            run = await dispatcher.wait_for(run_id, timeout=2)
+        finally:
+            executor.shutdown()
+        
+        assert run.status == RunStatus.FAILED
+        assert run.error == "kaboom"
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_timeout(self):
+        """Test wait_for raises when the run does not finish in time."""
+        import threading
+        release = threading.Event()
+        
+        executor = LocalExecutor(max_workers=1)
+        executor.register_handler("task", "block", lambda p: release.wait(timeout=2))
+        dispatcher = Dispatcher(executor=executor)
+        
+        try:
+            run_id = await dispatcher.submit_task("block", {})
+            with pytest.raises(TimeoutError):
+                await dispatcher.wait_for(run_id, timeout=0.05)
+        finally:
+            release.set()
+            executor.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_unknown_run(self):
+        """Test wait_for rejects unknown run ids."""
+        dispatcher = Dispatcher(executor=StubExecutor())
+        with pytest.raises(ValueError):
+            await dispatcher.wait_for("missing")
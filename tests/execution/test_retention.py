@@ -0,0 +1,205 @@
+"""Tests for retention of finished runs in the Dispatcher and executors."""
+import pytest
+
+from spine.execution import Dispatcher, RetentionPolicy, RetentionTracker, RunStatus
+from spine.execution.executors import LocalExecutor, MemoryExecutor, PriorityExecutor
+from spine.execution.spec import task_spec
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SpillLedger:
+    """Minimal async run ledger collecting evicted runs."""
+
+    def __init__(self) -> None:
+        self.runs = {}
+        self.events = {}
+
+    async def save_run(self, run):
+        self.runs[run.run_id] = run
+
+    async def record_event(self, event):
+        self.events.setdefault(event.run_id, []).append(event)
+
+    async def get_run(self, run_id):
+        return self.runs.get(run_id)
+
+    async def get_events(self, run_id):
+        return self.events.get(run_id, [])
+
+    async def find_by_idempotency_key(self, key):
+        for run in self.runs.values():
+            if run.spec.idempotency_key == key:
+                return run
+        return None
+
+
+def echo_executor(**kwargs) -> MemoryExecutor:
+    return MemoryExecutor(handlers={"task:echo": lambda p: p}, **kwargs)
+
+
+class TestRetentionTracker:
+    """Tests for RetentionTracker."""
+
+    def test_max_runs_evicts_least_recently_used(self):
+        tracker = RetentionTracker(RetentionPolicy(max_runs=2))
+        assert tracker.finished("a") == []
+        assert tracker.finished("b") == []
+        tracker.touch("a")
+
+        assert tracker.finished("c") == ["b"]
+        assert len(tracker) == 2
+
+    def test_max_age_evicts_idle_entries(self):
+        clock = FakeClock()
+        tracker = RetentionTracker(RetentionPolicy(max_age_seconds=10), clock=clock)
+        tracker.finished("a")
+        clock.now = 5
+        tracker.finished("b")
+        clock.now = 11
+
+        assert tracker.sweep() == ["a"]
+        clock.now = 20
+        assert tracker.finished("c") == ["b"]
+
+    def test_rejects_negative_limits(self):
+        with pytest.raises(ValueError):
+            RetentionPolicy(max_runs=-1)
+
+
+class TestDispatcherRetention:
+    """Dispatcher applies retention to its in-memory runs."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_max_runs(self):
+        dispatcher = Dispatcher(
+            executor=echo_executor(),
+            retention=RetentionPolicy(max_runs=3),
+        )
+        run_ids = [await dispatcher.submit_task("echo", {"i": i}) for i in range(10)]
+
+        assert len(dispatcher._memory_runs) == 3
+        assert len(dispatcher._memory_events) == 3
+        assert await dispatcher.get_run(run_ids[0]) is None
+        assert (await dispatcher.get_run(run_ids[-1])).status == RunStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_evicted_idempotency_key_is_released(self):
+        dispatcher = Dispatcher(
+            executor=echo_executor(),
+            retention=RetentionPolicy(max_runs=1),
+        )
+        first = await dispatcher.submit(task_spec("echo", idempotency_key="k"))
+        await dispatcher.submit_task("echo", {})
+
+        assert dispatcher._idempotency_index == {}
+        assert await dispatcher.submit(task_spec("echo", idempotency_key="k")) != first
+
+    @pytest.mark.asyncio
+    async def test_spill_keeps_evicted_runs_reachable(self):
+        spill = SpillLedger()
+        dispatcher = Dispatcher(
+            executor=echo_executor(),
+            retention=RetentionPolicy(max_runs=1),
+            spill=spill,
+        )
+        first = await dispatcher.submit(task_spec("echo", idempotency_key="k"))
+        await dispatcher.submit_task("echo", {})
+
+        assert first not in dispatcher._memory_runs
+        assert (await dispatcher.get_run(first)).status == RunStatus.COMPLETED
+        assert [e.event_type for e in await dispatcher.get_events(first)][0] == "created"
+        assert await dispatcher.submit(task_spec("echo", idempotency_key="k")) == first
+
+    @pytest.mark.asyncio
+    async def test_writes_after_eviction_stay_out_of_memory(self):
+        spill = SpillLedger()
+        dispatcher = Dispatcher(
+            executor=echo_executor(),
+            retention=RetentionPolicy(max_runs=1),
+            spill=spill,
+        )
+        first = await dispatcher.submit_task("echo", {})
+        await dispatcher.submit_task("echo", {})
+
+        await dispatcher.record_progress(first, 1.0)
+        retried = await dispatcher.retry(first)
+        await dispatcher.mark_completed(first)
+
+        assert first not in dispatcher._memory_runs
+        assert first not in dispatcher._memory_events
+        assert len(dispatcher._memory_runs) == 1
+        assert [e.event_type for e in spill.events[first]][-3:] == ["progress", "retried", "completed"]
+        assert (await dispatcher.get_run(retried)).retry_of_run_id == first
+
+    @pytest.mark.asyncio
+    async def test_progress_for_evicted_run_without_spill_is_dropped(self):
+        dispatcher = Dispatcher(
+            executor=echo_executor(),
+            retention=RetentionPolicy(max_runs=0),
+        )
+        run_id = await dispatcher.submit_task("echo", {})
+
+        await dispatcher.record_progress(run_id, 0.5)
+
+        assert dispatcher._memory_events == {}
+
+    @pytest.mark.asyncio
+    async def test_running_work_is_never_evicted(self):
+        dispatcher = Dispatcher(
+            executor=echo_executor(),
+            retention=RetentionPolicy(max_runs=0),
+        )
+        pending = await dispatcher.submit(task_spec("missing"))  # fails immediately
+        manual = await dispatcher.submit_task("echo", {})
+
+        assert pending not in dispatcher._memory_runs
+        assert manual not in dispatcher._memory_runs
+
+
+class TestExecutorRetention:
+    """Executors apply the same policy to their per-ref state."""
+
+    @pytest.mark.asyncio
+    async def test_memory_executor(self):
+        executor = echo_executor(retention=RetentionPolicy(max_runs=2))
+        refs = [await executor.submit(task_spec("echo", {"i": i})) for i in range(5)]
+
+        assert len(executor._runs) == 2
+        assert await executor.get_status(refs[0]) is None
+        assert await executor.get_result(refs[-1]) == {"i": 4}
+
+    @pytest.mark.asyncio
+    async def test_local_executor(self):
+        executor = LocalExecutor(max_workers=2, retention=RetentionPolicy(max_runs=2))
+        executor.register_handler("task", "echo", lambda p: p)
+        try:
+            refs = [await executor.submit(task_spec("echo", {"i": i})) for i in range(6)]
+            for ref in refs:
+                future = executor.result_future(ref)
+                if future is not None:
+                    await future
+        finally:
+            executor.shutdown()
+
+        assert len(executor._futures) == 2
+        assert len(executor._results) == 2
+
+    @pytest.mark.asyncio
+    async def test_priority_executor(self):
+        executor = PriorityExecutor(
+            echo_executor(retention=RetentionPolicy(max_runs=2)),
+            retention=RetentionPolicy(max_runs=2),
+        )
+        refs = [await executor.submit(task_spec("echo", {"i": i})) for i in range(5)]
+
+        assert len(executor._inner_refs) == 2
+        assert executor._outer_refs == {}
+        assert await executor.get_status(refs[0]) is None
+        assert await executor.get_status(refs[-1]) == "completed"
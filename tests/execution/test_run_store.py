@@ -0,0 +1,139 @@
+"""Tests for the indexed in-memory run store."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from spine.execution import Dispatcher, MemoryRunStore, RunRecord, RunStatus
+from spine.execution.executors import StubExecutor
+from spine.execution.spec import WorkSpec
+
+BASE = datetime(2026, 1, 1)
+
+
+def make_run(
+    i: int,
+    kind: str = "task",
+    name: str = "t",
+    status: RunStatus = RunStatus.PENDING,
+    parent: str | None = None,
+) -> RunRecord:
+    return RunRecord(
+        run_id=f"run-{i}",
+        spec=WorkSpec(kind=kind, name=name, parent_run_id=parent),
+        status=status,
+        created_at=BASE + timedelta(seconds=i),
+    )
+
+
+class TestMemoryRunStore:
+    """Tests for MemoryRunStore."""
+
+    def test_save_and_get(self):
+        store = MemoryRunStore()
+        run = make_run(1)
+        store.save(run)
+        assert store.get("run-1") is run
+        assert "run-1" in store
+        assert len(store) == 1
+
+    def test_query_newest_first_with_pagination(self):
+        store = MemoryRunStore()
+        for i in range(10):
+            store.save(make_run(i))
+
+        page = store.query(limit=3, offset=2)
+        assert [r.run_id for r in page] == ["run-7", "run-6", "run-5"]
+
+    def test_out_of_order_inserts_are_sorted(self):
+        store = MemoryRunStore()
+        for i in (5, 1, 9, 3):
+            store.save(make_run(i))
+
+        assert [r.run_id for r in store.query()] == ["run-9", "run-5", "run-3", "run-1"]
+
+    def test_filters_combine(self):
+        store = MemoryRunStore()
+        store.save(make_run(1, kind="task", name="a"))
+        store.save(make_run(2, kind="pipeline", name="a"))
+        store.save(make_run(3, kind="pipeline", name="b", status=RunStatus.FAILED))
+        store.save(make_run(4, kind="step", name="s", parent="run-2"))
+
+        assert {r.run_id for r in store.query(kind="pipeline")} == {"run-2", "run-3"}
+        assert [r.run_id for r in store.query(kind="pipeline", name="a")] == ["run-2"]
+        assert [r.run_id for r in store.query(status=RunStatus.FAILED)] == ["run-3"]
+        assert [r.run_id for r in store.query(parent_run_id="run-2")] == ["run-4"]
+        assert store.query(name="missing") == []
+
+    def test_status_reindexed_on_save(self):
+        store = MemoryRunStore()
+        for i in range(5):
+            store.save(make_run(i))
+
+        run = store.get("run-2")
+        run.mark_failed("boom")
+        store.save(run)
+
+        assert [r.run_id for r in store.query(status=RunStatus.FAILED)] == ["run-2"]
+        assert len(store.query(status=RunStatus.PENDING)) == 4
+        assert [r.run_id for r in store.query(status="failed")] == ["run-2"]
+
+    def test_status_bucket_pagination(self):
+        store = MemoryRunStore()
+        for i in range(100):
+            status = RunStatus.FAILED if i % 10 == 0 else RunStatus.COMPLETED
+            store.save(make_run(i, status=status))
+
+        page = store.query(status=RunStatus.FAILED, limit=2, offset=1)
+        assert [r.run_id for r in page] == ["run-80", "run-70"]
+
+    def test_remove_drops_from_all_indexes(self):
+        store = MemoryRunStore()
+        store.save(make_run(1, kind="step", parent="wf"))
+        store.save(make_run(2, kind="step", parent="wf"))
+
+        removed = store.remove("run-1")
+        assert removed.run_id == "run-1"
+        assert store.remove("run-1") is None
+        assert [r.run_id for r in store.query(parent_run_id="wf")] == ["run-2"]
+        assert [r.run_id for r in store.query(status=RunStatus.PENDING)] == ["run-2"]
+
+    def test_bulk_removal_compacts_index(self):
+        store = MemoryRunStore()
+        for i in range(1000):
+            store.save(make_run(i))
+        for i in range(0, 1000, 2):
+            store.remove(f"run-{i}")
+        for i in range(1, 900, 2):
+            store.remove(f"run-{i}")
+
+        assert len(store) == 50
+        assert len(store._order) == 50
+        # Tombstones were compacted away rather than left in the lists
+        assert len(store._order._ids) < 1000
+        assert [r.run_id for r in store.query(limit=3)] == ["run-999", "run-997", "run-995"]
+
+        store.save(make_run(950))
+        assert [r.run_id for r in store.query(limit=3)] == ["run-999", "run-997", "run-995"]
+        assert store.query(limit=100)[-1].run_id == "run-901"
+
+    def test_clear(self):
+        store = MemoryRunStore()
+        store.save(make_run(1))
+        store.clear()
+        assert len(store) == 0
+        assert store.query() == []
+
+
+class TestDispatcherUsesRunStore:
+    """Dispatcher listing goes through the indexed store."""
+
+    @pytest.mark.asyncio
+    async def test_list_runs_by_status_after_update(self):
+        dispatcher = Dispatcher(executor=StubExecutor())
+        first = await dispatcher.submit_task("a", {})
+        await dispatcher.submit_task("b", {})
+
+        await dispatcher.mark_failed(first, "boom")
+
+        failed = await dispatcher.list_runs(status=RunStatus.FAILED)
+        assert [s.run_id for s in failed] == [first]
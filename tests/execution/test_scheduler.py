@@ -0,0 +1,175 @@
+"""Tests for the priority scheduler and PriorityExecutor."""
+import asyncio
+from collections import Counter
+
+import pytest
+
+from spine.execution import Dispatcher, PriorityScheduler, RunStatus
+from spine.execution.executors import LocalExecutor, MemoryExecutor, PriorityExecutor, StubExecutor
+from spine.execution.spec import task_spec
+from spine.observability.metrics import ExecutionMetrics, MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_scheduler(**kwargs) -> PriorityScheduler:
+    kwargs.setdefault("metrics", ExecutionMetrics(MetricsRegistry()))
+    return PriorityScheduler(**kwargs)
+
+
+def drain(scheduler: PriorityScheduler) -> list[str]:
+    keys = []
+    while (entry := scheduler.pop()) is not None:
+        keys.append(entry[0])
+    return keys
+
+
+class TestPriorityScheduler:
+    """Tests for PriorityScheduler."""
+
+    def test_priority_order_within_lane(self):
+        scheduler = make_scheduler(clock=FakeClock())
+        scheduler.push("low", None, priority="low")
+        scheduler.push("normal", None)
+        scheduler.push("realtime", None, priority="realtime")
+        scheduler.push("normal-2", None)
+
+        assert drain(scheduler) == ["realtime", "normal", "normal-2", "low"]
+
+    def test_aging_prevents_starvation(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(aging_seconds=10.0, clock=clock)
+        scheduler.push("old-slow", None, priority="slow")
+        clock.now = 39.0
+        scheduler.push("new-realtime", None, priority="realtime")
+        clock.now = 41.0
+        scheduler.push("newer-realtime", None, priority="realtime")
+
+        # slow waits 4 levels * 10s: ahead of work submitted 40s+ later
+        assert drain(scheduler) == ["new-realtime", "old-slow", "newer-realtime"]
+
+    def test_weighted_fair_sharing(self):
+        scheduler = make_scheduler(lane_weights={"interactive": 3, "bulk": 1})
+        for i in range(100):
+            scheduler.push(f"bulk-{i}", "bulk", lane="bulk")
+            scheduler.push(f"int-{i}", "interactive", lane="interactive")
+
+        first = [scheduler.pop()[1] for _ in range(40)]
+        assert Counter(first) == {"interactive": 30, "bulk": 10}
+
+    def test_idle_lane_does_not_bank_credit(self):
+        scheduler = make_scheduler()
+        for i in range(50):
+            scheduler.push(f"a-{i}", "a", lane="a")
+        for _ in range(40):
+            scheduler.pop()
+
+        for i in range(10):
+            scheduler.push(f"b-{i}", "b", lane="b")
+        # Lane b joins at the current virtual time and alternates with a
+        lanes = [scheduler.pop()[1] for _ in range(6)]
+        assert Counter(lanes) == {"a": 3, "b": 3}
+
+    def test_discard(self):
+        scheduler = make_scheduler()
+        scheduler.push("a", None)
+        scheduler.push("b", None)
+
+        assert scheduler.discard("a") is True
+        assert scheduler.discard("a") is False
+        assert "a" not in scheduler
+        assert drain(scheduler) == ["b"]
+
+    def test_rejects_unknown_priority_and_duplicates(self):
+        scheduler = make_scheduler()
+        with pytest.raises(ValueError):
+            scheduler.push("a", None, priority="urgent")
+        scheduler.push("a", None)
+        with pytest.raises(ValueError):
+            scheduler.push("a", None)
+
+    def test_queue_metrics_per_lane(self):
+        clock = FakeClock()
+        metrics = ExecutionMetrics(MetricsRegistry())
+        scheduler = make_scheduler(metrics=metrics, clock=clock)
+        scheduler.push("a", None, lane="backfill")
+        scheduler.push("b", None, lane="backfill")
+        clock.now = 2.0
+        scheduler.pop()
+
+        assert metrics.queue_depth.labels(lane="backfill").value == 1
+        wait = metrics.queue_wait.labels(lane="backfill").data
+        assert wait["count"] == 1
+        assert wait["sum"] == 2.0
+
+
+class TestPriorityExecutor:
+    """Tests for the PriorityExecutor wrapper."""
+
+    def test_requires_push_completion(self):
+        with pytest.raises(TypeError):
+            PriorityExecutor(StubExecutor())
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_in_priority_order(self):
+        order = []
+        inner = MemoryExecutor(handlers={"task:record": lambda p: order.append(p["name"])})
+        executor = PriorityExecutor(inner, max_in_flight=1, scheduler=make_scheduler())
+
+        await executor.submit_many([
+            task_spec("record", {"name": "bulk"}, priority="low"),
+            task_spec("record", {"name": "normal"}),
+            task_spec("record", {"name": "urgent"}, priority="realtime"),
+        ])
+
+        assert order == ["urgent", "normal", "bulk"]
+
+    @pytest.mark.asyncio
+    async def test_dispatcher_completes_through_local_executor(self):
+        inner = LocalExecutor(max_workers=2)
+        inner.register_handler("task", "double", lambda p: p["x"] * 2)
+        executor = PriorityExecutor(inner, max_in_flight=2, scheduler=make_scheduler())
+        dispatcher = Dispatcher(executor=executor)
+
+        try:
+            run_ids = [await dispatcher.submit_task("double", {"x": i}) for i in range(6)]
+            runs = [await dispatcher.wait_for(run_id, timeout=2) for run_id in run_ids]
+        finally:
+            inner.shutdown()
+
+        assert [run.status for run in runs] == [RunStatus.COMPLETED] * 6
+        assert [run.result for run in runs] == [0, 2, 4, 6, 8, 10]
+        assert executor.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_work(self):
+        release = asyncio.Event()
+
+        async def block(params):
+            await release.wait()
+
+        inner = LocalExecutor(max_workers=1)
+        inner.register_handler("task", "block", block)
+        executor = PriorityExecutor(inner, max_in_flight=1, scheduler=make_scheduler())
+        updates = []
+        executor.add_completion_callback(lambda ref, status, *_: updates.append((ref, status)))
+
+        try:
+            running = await executor.submit(task_spec("block"))
+            queued = await executor.submit(task_spec("block"))
+
+            assert await executor.get_status(queued) == "queued"
+            assert await executor.cancel(queued) is True
+            assert await executor.get_status(queued) == "cancelled"
+            assert (queued, "cancelled") in updates
+
+            release.set()
+            await inner.result_future(executor._inner_refs[running])
+        finally:
+            inner.shutdown()
@@ -822,3 +822,42 @@ class TestGroupRunnerParallelExecution:
         # Verify order
         step_names = [ex.step_name for ex in result.step_executions]
         assert step_names == ["step1", "step2", "step3"]
+
+    def test_parallel_skips_transitive_dependents(self):
+        """Test that a failure skips the whole downstream chain but not siblings."""
+        from spine.orchestration.models import (
+            ExecutionMode,
+            ExecutionPolicy,
+            FailurePolicy,
+        )
+
+        group = PipelineGroup(
+            name="test.parallel_transitive_skip",
+            domain="test",
+            steps=[
+                PipelineStep(name="bad", pipeline="test.failing_pipeline"),
+                PipelineStep(name="child", pipeline="test.transform_data", depends_on=["bad"]),
+                PipelineStep(name="grandchild", pipeline="test.load_data", depends_on=["child"]),
+                PipelineStep(name="other", pipeline="test.fetch_data"),
+                PipelineStep(name="after_other", pipeline="test.load_data", depends_on=["other"]),
+            ],
+            policy=ExecutionPolicy(
+                mode=ExecutionMode.PARALLEL,
+                on_failure=FailurePolicy.CONTINUE,
+                max_concurrency=2,
+            ),
+        )
+        register_group(group)
+
+        plan = PlanResolver().resolve(group)
+        result = GroupRunner().execute(plan)
+
+        statuses = {ex.step_name: ex.status for ex in result.step_executions}
+        assert statuses == {
+            "bad": StepStatus.FAILED,
+            "child": StepStatus.SKIPPED,
+            "grandchild": StepStatus.SKIPPED,
+            "other": StepStatus.COMPLETED,
+            "after_other": StepStatus.COMPLETED,
+        }
+        assert [ex.step_name for ex in result.step_executions] == [s.step_name for s in plan.steps]
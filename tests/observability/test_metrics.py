@@ -355,3 +355,16 @@ class TestExecutionMetrics:
         metrics.dlq_depth.labels(pipeline="test").set(10)
         
         assert metrics.dlq_depth.labels(pipeline="test").value == 10
+
+    def test_queue_wait_per_lane(self):
+        """Test scheduler queue depth and wait metrics."""
+        registry = MetricsRegistry()
+        metrics = ExecutionMetrics(registry)
+        
+        metrics.record_enqueue("backfill")
+        metrics.record_enqueue("backfill")
+        metrics.record_dequeue("backfill", 0.5)
+        metrics.record_dequeue("backfill")
+        
+        assert metrics.queue_depth.labels(lane="backfill").value == 0
+        assert metrics.queue_wait.labels(lane="backfill").data["count"] == 1
@@ -0,0 +1,289 @@
+"""Tests for AsyncGroupRunner and AsyncWorkflowRunner."""
+
+import asyncio
+
+import pytest
+
+from spine.execution import Dispatcher
+from spine.execution.executors import MemoryExecutor
+from spine.orchestration import (
+    AsyncGroupRunner,
+    AsyncWorkflowRunner,
+    ExecutionMode,
+    ExecutionPlan,
+    ExecutionPolicy,
+    FailurePolicy,
+    GroupExecutionStatus,
+    GroupStepStatus,
+    PlannedStep,
+    Step,
+    StepResult,
+    Workflow,
+    WorkflowStatus,
+)
+
+
+def make_plan(steps, mode=ExecutionMode.PARALLEL, on_failure=FailurePolicy.STOP, max_concurrency=4):
+    planned = [
+        PlannedStep(name, pipeline, {}, tuple(deps), i)
+        for i, (name, pipeline, deps) in enumerate(steps)
+    ]
+    policy = ExecutionPolicy(mode=mode, on_failure=on_failure, max_concurrency=max_concurrency)
+    return ExecutionPlan("test.async", 1, "batch-1", planned, policy)
+
+
+class Tracker:
+    """Async pipeline handlers that record concurrency."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+
+    def handler(self, name: str, delay: float = 0.01, fail: bool = False):
+        async def run(params):
+            self.calls.append(name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.active -= 1
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return {"pipeline": name, "batch_id": params.get("batch_id")}
+        return run
+
+
+def make_dispatcher(tracker: Tracker, **handlers) -> Dispatcher:
+    return Dispatcher(executor=MemoryExecutor(handlers={f"pipeline:{k}": v for k, v in handlers.items()}))
+
+
+class CancellableDispatcher:
+    """Dispatcher whose runs never finish until cancelled."""
+
+    def __init__(self) -> None:
+        self.submitted: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def submit(self, spec):
+        run_id = f"run-{len(self.submitted)}"
+        self.submitted.append(run_id)
+        return run_id
+
+    async def wait_for(self, run_id, timeout=None):
+        await asyncio.wait_for(asyncio.Event().wait(), timeout)
+
+    async def cancel(self, run_id):
+        self.cancelled.append(run_id)
+        return True
+
+
+class TestAsyncGroupRunner:
+    """Tests for AsyncGroupRunner."""
+
+    @pytest.mark.asyncio
+    async def test_runs_independent_steps_concurrently(self):
+        tracker = Tracker()
+        dispatcher = make_dispatcher(
+            tracker, a=tracker.handler("a"), b=tracker.handler("b"), c=tracker.handler("c")
+        )
+        plan = make_plan([("a", "a", []), ("b", "b", []), ("c", "c", ["a", "b"])], max_concurrency=2)
+
+        result = await AsyncGroupRunner(dispatcher).execute(plan)
+
+        assert result.status == GroupExecutionStatus.COMPLETED
+        assert tracker.peak == 2
+        assert tracker.calls[-1] == "c"
+        assert all(s.run_id for s in result.step_executions)
+        run = await dispatcher.get_run(result.get_step_execution("c").run_id)
+        assert run.result == {"pipeline": "c", "batch_id": "batch-1"}
+
+    @pytest.mark.asyncio
+    async def test_sequential_respects_plan_order(self):
+        tracker = Tracker()
+        dispatcher = make_dispatcher(tracker, a=tracker.handler("a"), b=tracker.handler("b"))
+        plan = make_plan([("b", "b", []), ("a", "a", [])], mode=ExecutionMode.SEQUENTIAL)
+
+        await AsyncGroupRunner(dispatcher).execute(plan)
+
+        assert tracker.calls == ["b", "a"]
+        assert tracker.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents(self):
+        tracker = Tracker()
+        dispatcher = make_dispatcher(
+            tracker,
+            bad=tracker.handler("bad", fail=True),
+            ok=tracker.handler("ok"),
+        )
+        plan = make_plan(
+            [("bad", "bad", []), ("child", "ok", ["bad"]), ("other", "ok", [])],
+            on_failure=FailurePolicy.CONTINUE,
+        )
+
+        result = await AsyncGroupRunner(dispatcher).execute(plan)
+
+        statuses = {s.step_name: s.status for s in result.step_executions}
+        assert statuses == {
+            "bad": GroupStepStatus.FAILED,
+            "child": GroupStepStatus.SKIPPED,
+            "other": GroupStepStatus.COMPLETED,
+        }
+        assert result.status == GroupExecutionStatus.PARTIAL
+        assert "bad failed" in result.get_step_execution("bad").error
+
+    @pytest.mark.asyncio
+    async def test_cancellation_cancels_dispatcher_runs(self):
+        dispatcher = CancellableDispatcher()
+        plan = make_plan([("a", "a", []), ("b", "b", []), ("c", "c", ["a"])])
+
+        task = asyncio.create_task(AsyncGroupRunner(dispatcher).execute(plan))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert sorted(dispatcher.cancelled) == ["run-0", "run-1"]
+
+    @pytest.mark.asyncio
+    async def test_step_timeout_cancels_run(self):
+        dispatcher = CancellableDispatcher()
+        plan = make_plan([("a", "a", [])])
+
+        result = await AsyncGroupRunner(dispatcher, step_timeout=0.01).execute(plan)
+
+        assert result.status == GroupExecutionStatus.FAILED
+        assert "timed out" in result.step_executions[0].error
+        assert dispatcher.cancelled == ["run-0"]
+
+
+class TestAsyncWorkflowRunner:
+    """Tests for AsyncWorkflowRunner."""
+
+    @pytest.mark.asyncio
+    async def test_context_passing_with_async_handlers(self):
+        async def fetch(ctx, config):
+            await asyncio.sleep(0)
+            return StepResult.ok(output={"rows": [1, 2, 3]})
+
+        def total(ctx, config):
+            return StepResult.ok(output={"total": sum(ctx.get_output("fetch", "rows"))})
+
+        workflow = Workflow(name="test.async_wf", steps=[
+            Step.lambda_("fetch", fetch),
+            Step.lambda_("total", total),
+        ])
+
+        result = await AsyncWorkflowRunner().execute(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.context.get_output("total", "total") == 6
+
+    @pytest.mark.asyncio
+    async def test_pipeline_step_via_dispatcher(self):
+        tracker = Tracker()
+        dispatcher = make_dispatcher(tracker, ingest=tracker.handler("ingest"))
+        workflow = Workflow(name="test.async_pipe", steps=[Step.pipeline("ingest", "ingest")])
+
+        result = await AsyncWorkflowRunner(dispatcher).execute(workflow, params={"batch_id": "b"})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        output = result.context.get_output("ingest", "pipeline_result")
+        assert output["result"] == {"pipeline": "ingest", "batch_id": "b"}
+
+    @pytest.mark.asyncio
+    async def test_pipeline_step_without_dispatcher_fails(self):
+        workflow = Workflow(name="test.async_nodispatch", steps=[Step.pipeline("ingest", "ingest")])
+
+        result = await AsyncWorkflowRunner().execute(workflow)
+
+        assert result.status == WorkflowStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_parallel_independent_steps(self):
+        active = 0
+        peak = 0
+
+        def slow(name):
+            async def handler(ctx, config):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return StepResult.ok(output={"name": name})
+            return handler
+
+        def join(ctx, config):
+            return StepResult.ok(output={"seen": [ctx.get_output(n, "name") for n in ("a", "b", "c")]})
+
+        workflow = Workflow(name="test.async_parallel", steps=[
+            Step.lambda_("a", slow("a"), depends_on=()),
+            Step.lambda_("b", slow("b"), depends_on=()),
+            Step.lambda_("c", slow("c"), depends_on=()),
+            Step.lambda_("join", join, depends_on=("a", "b", "c")),
+        ])
+
+        result = await AsyncWorkflowRunner(parallel=True, max_workers=2).execute(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert peak == 2
+        assert result.context.get_output("join", "seen") == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_map_step_collects_in_order(self):
+        async def double(ctx, config):
+            await asyncio.sleep(0.001 * (5 - ctx.get_param("item")))
+            return StepResult.ok(output={"value": ctx.get_param("item") * 2})
+
+        item_wf = Workflow(name="test.async_item", steps=[Step.lambda_("double", double)])
+        workflow = Workflow(name="test.async_map", steps=[
+            Step.map("fan", items_path="items", iterator_workflow=item_wf, max_concurrency=3),
+        ])
+
+        result = await AsyncWorkflowRunner().execute(workflow, params={"items": [1, 2, 3, 4]})
+
+        output = result.context.get_output("fan")
+        assert [r["double"]["value"] for r in output["results"]] == [2, 4, 6, 8]
+
+    @pytest.mark.asyncio
+    async def test_map_non_numeric_list_segment_is_configuration_error(self):
+        item_wf = Workflow(name="test.async_item", steps=[
+            Step.lambda_("noop", lambda ctx, config: StepResult.ok()),
+        ])
+        workflow = Workflow(name="test.async_map", steps=[
+            Step.map("fan", items_path="groups.first", iterator_workflow=item_wf),
+        ])
+
+        result = await AsyncWorkflowRunner().execute(workflow, params={"groups": [["a"]]})
+
+        assert result.status == WorkflowStatus.FAILED
+        step_result = result.step_executions[0].result
+        assert step_result.error_category == "CONFIGURATION"
+        assert "Map items not found" in step_result.error
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates_to_steps(self):
+        cancelled = []
+
+        async def hang(ctx, config):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        workflow = Workflow(name="test.async_cancel", steps=[
+            Step.lambda_("a", hang, depends_on=()),
+            Step.lambda_("b", hang, depends_on=()),
+        ])
+
+        task = asyncio.create_task(AsyncWorkflowRunner(parallel=True).execute(workflow))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled == [True, True]
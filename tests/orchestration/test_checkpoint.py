@@ -0,0 +1,200 @@
+"""Tests for workflow checkpoints and TrackedWorkflowRunner resume."""
+
+import sqlite3
+
+import pytest
+
+from spine.core.manifest import ManifestCache, WorkManifest
+from spine.core.schema import create_core_tables
+from spine.orchestration import (
+    CheckpointStore,
+    GroupError,
+    SnapshotCodec,
+    Step,
+    StepResult,
+    TrackedWorkflowRunner,
+    Workflow,
+    WorkflowContext,
+    WorkflowStatus,
+    register_codec,
+)
+
+PARTITION = {"week_ending": "2026-01-09"}
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    create_core_tables(conn)
+    yield conn
+    conn.close()
+
+
+def make_workflow(calls: list[str], fail_once: set[str]) -> Workflow:
+    def fetch(ctx, config):
+        calls.append("fetch")
+        return StepResult.ok(output={"rows": [1, 2, 3]})
+
+    def transform(ctx, config):
+        calls.append("transform")
+        if "transform" in fail_once:
+            fail_once.discard("transform")
+            return StepResult.fail("worker crashed")
+        return StepResult.ok(output={"total": sum(ctx.get_output("fetch", "rows"))})
+
+    def publish(ctx, config):
+        calls.append("publish")
+        return StepResult.ok(output={"published": ctx.get_output("transform", "total")})
+
+    return Workflow(
+        name="test.checkpointed",
+        steps=[
+            Step.lambda_("fetch", fetch),
+            Step.lambda_("transform", transform),
+            Step.lambda_("publish", publish),
+        ],
+    )
+
+
+class TestCheckpointStore:
+    """Tests for CheckpointStore."""
+
+    @pytest.mark.parametrize("codec", ["none", "zlib", "gzip", "lzma"])
+    def test_round_trip(self, conn, codec):
+        store = CheckpointStore(conn, codec=codec)
+        ctx = WorkflowContext.create("wf", params={"a": 1}).with_output("s1", {"rows": [1, 2]})
+        store.save(ctx, PARTITION, next_step="s2", completed_steps=["s1"])
+
+        checkpoint = store.load(ctx.run_id)
+
+        assert checkpoint.next_step == "s2"
+        assert checkpoint.completed_steps == ["s1"]
+        assert checkpoint.partition == PARTITION
+        assert checkpoint.context.params == {"a": 1}
+        assert checkpoint.context.get_output("s1", "rows") == [1, 2]
+
+    def test_snapshot_is_compressed(self, conn):
+        ctx = WorkflowContext.create("wf").with_output("s1", {"rows": ["x" * 10] * 1000})
+        raw = CheckpointStore(conn, codec="none").encode(ctx)
+        compressed = CheckpointStore(conn, codec="zlib").encode(ctx)
+
+        assert len(compressed) < len(raw) / 10
+
+    def test_custom_codec_and_old_snapshots(self, conn):
+        register_codec(SnapshotCodec("reversed", lambda b: b[::-1], lambda b: b[::-1]))
+        ctx = WorkflowContext.create("wf", params={"a": 1})
+        CheckpointStore(conn, codec="reversed").save(ctx, PARTITION, None, [])
+
+        # Readable with a store whose default codec differs
+        assert CheckpointStore(conn).load(ctx.run_id).context.params == {"a": 1}
+
+    def test_unknown_codec(self, conn):
+        with pytest.raises(ValueError):
+            CheckpointStore(conn, codec="brotli-9000")
+
+    def test_non_json_output_fails_checkpoint(self, conn):
+        from datetime import datetime
+
+        store = CheckpointStore(conn)
+        ctx = WorkflowContext.create("wf").with_output("s1", {"at": datetime(2026, 1, 9)})
+
+        with pytest.raises(ValueError, match="not JSON-serializable"):
+            store.save(ctx, PARTITION, next_step=None, completed_steps=["s1"])
+        assert store.load(ctx.run_id) is None
+
+
+class TestTrackedRunnerResume:
+    """Tests for checkpointed resume in TrackedWorkflowRunner."""
+
+    def test_resume_skips_completed_steps(self, conn):
+        calls: list[str] = []
+        workflow = make_workflow(calls, fail_once={"transform"})
+        runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn))
+
+        failed = runner.execute(workflow, partition=PARTITION)
+        assert failed.status == WorkflowStatus.FAILED
+
+        calls.clear()
+        result = runner.resume(failed.run_id, workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.run_id == failed.run_id
+        assert calls == ["transform", "publish"]
+        assert result.context.get_output("publish", "published") == 6
+        assert CheckpointStore(conn).load(failed.run_id).completed_steps == ["fetch", "transform", "publish"]
+
+    def test_execute_restores_unfinished_checkpoint_when_enabled(self, conn):
+        calls: list[str] = []
+        workflow = make_workflow(calls, fail_once={"transform"})
+        runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn), auto_resume=True)
+        failed = runner.execute(workflow, params={"source": "api"}, partition=PARTITION)
+
+        calls.clear()
+        result = runner.execute(workflow, params={"source": "api"}, partition=PARTITION)
+
+        assert result.run_id == failed.run_id
+        assert calls == ["transform", "publish"]
+        assert result.context.get_param("source") == "api"
+
+    def test_execute_does_not_adopt_checkpoint_by_default(self, conn):
+        calls: list[str] = []
+        workflow = make_workflow(calls, fail_once={"transform"})
+        runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn))
+        failed = runner.execute(workflow, params={"source": "api"}, partition=PARTITION)
+
+        result = runner.execute(workflow, params={"source": "file"}, partition=PARTITION)
+
+        assert result.run_id != failed.run_id
+        assert result.context.get_param("source") == "file"
+
+    def test_auto_resume_rejects_changed_params(self, conn):
+        workflow = make_workflow([], fail_once={"transform"})
+        runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn), auto_resume=True)
+        runner.execute(workflow, params={"source": "api"}, partition=PARTITION)
+
+        with pytest.raises(GroupError, match="source"):
+            runner.execute(workflow, params={"source": "file"}, partition=PARTITION)
+
+    def test_resume_finished_run_is_noop(self, conn):
+        calls: list[str] = []
+        workflow = make_workflow(calls, fail_once=set())
+        runner = TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn))
+        done = runner.execute(workflow, partition=PARTITION)
+
+        calls.clear()
+        result = runner.resume(done.run_id, workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert calls == []
+
+    def test_resume_errors(self, conn):
+        workflow = make_workflow([], fail_once=set())
+
+        with pytest.raises(GroupError):
+            TrackedWorkflowRunner(conn).resume("run-1", workflow)
+        with pytest.raises(GroupError):
+            TrackedWorkflowRunner(conn, checkpoints=CheckpointStore(conn)).resume("missing", workflow)
+
+
+class TestTrackedRunnerManifestCache:
+    """A failed run must not leave its stages in the shared cache."""
+
+    def test_failed_run_invalidates_partition(self, conn):
+        cache = ManifestCache()
+        runner = TrackedWorkflowRunner(conn, manifest_cache=cache)
+
+        failed = runner.execute(make_workflow([], fail_once={"transform"}), partition=PARTITION)
+
+        assert failed.status == WorkflowStatus.FAILED
+        assert len(cache) == 0
+
+    def test_completed_run_stays_cached(self, conn):
+        cache = ManifestCache()
+        runner = TrackedWorkflowRunner(conn, manifest_cache=cache)
+        runner.execute(make_workflow([], fail_once=set()), partition=PARTITION)
+
+        stages = ["STARTED", "STEP_FETCH", "STEP_TRANSFORM", "STEP_PUBLISH", "COMPLETED"]
+        manifest = WorkManifest(conn, "workflow.test.checkpointed", stages, cache=cache)
+        misses = cache.misses
+        assert manifest.is_at_least(PARTITION, "COMPLETED")
+        assert cache.misses == misses
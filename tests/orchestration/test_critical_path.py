@@ -0,0 +1,160 @@
+"""Tests for critical-path prioritization in GroupRunner."""
+
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from spine.core.schema import create_core_tables
+from spine.framework.pipelines import PipelineStatus
+from spine.orchestration import (
+    ExecutionMode,
+    ExecutionPlan,
+    ExecutionPolicy,
+    GroupExecutionStatus,
+    GroupRunner,
+    PlannedStep,
+)
+from spine.orchestration.critical_path import (
+    critical_path,
+    critical_path_priorities,
+    durations_from_executions,
+    durations_from_results,
+    predict_makespan,
+    step_weights,
+)
+
+DURATIONS = {"bench.chain": 5.0, "bench.leaf": 1.0}
+
+
+def make_plan(max_concurrency: int = 2) -> ExecutionPlan:
+    """Three short leaves listed before a long two-step chain."""
+    steps = [
+        PlannedStep("leaf1", "bench.leaf", {}, (), 0),
+        PlannedStep("leaf2", "bench.leaf", {}, (), 1),
+        PlannedStep("leaf3", "bench.leaf", {}, (), 2),
+        PlannedStep("head", "bench.chain", {}, (), 3),
+        PlannedStep("tail", "bench.chain", {}, ("head",), 4),
+    ]
+    policy = ExecutionPolicy(mode=ExecutionMode.PARALLEL, max_concurrency=max_concurrency)
+    return ExecutionPlan("test.critical", 1, "batch-1", steps, policy)
+
+
+class RecordingDispatcher:
+    def __init__(self) -> None:
+        self.order: list[str] = []
+
+    def submit(self, pipeline, params, trigger_source):
+        self.order.append(pipeline)
+        return SimpleNamespace(status=PipelineStatus.COMPLETED, result=None, error=None)
+
+
+class TestPriorities:
+    """Tests for path lengths and the makespan simulation."""
+
+    def test_longest_path_to_sink(self):
+        plan = make_plan()
+        priorities = critical_path_priorities(plan, step_weights(plan, DURATIONS))
+
+        assert priorities == {"leaf1": 1.0, "leaf2": 1.0, "leaf3": 1.0, "head": 10.0, "tail": 5.0}
+        assert critical_path(plan, priorities) == ["head", "tail"]
+
+    def test_unknown_durations_use_mean(self):
+        plan = make_plan()
+        weights = step_weights(plan, {"bench.chain": 4.0, "leaf1": 2.0})
+
+        assert weights["leaf1"] == 2.0
+        assert weights["leaf2"] == 3.0
+        assert step_weights(plan)["head"] == 1.0
+
+    def test_predicted_makespan(self):
+        plan = make_plan()
+        weights = step_weights(plan, DURATIONS)
+
+        # Plan order would start two leaves first and finish at 11
+        assert predict_makespan(plan, weights, 2) == 10.0
+        assert predict_makespan(plan, weights, 1) == 13.0
+
+
+class TestDurationSources:
+    """Tests for historical duration lookups."""
+
+    def test_from_executions(self):
+        conn = sqlite3.connect(":memory:")
+        create_core_tables(conn)
+        rows = [
+            ("e1", "a", "completed", "2026-01-01T00:00:00", "2026-01-01T00:00:10"),
+            ("e2", "a", "completed", "2026-01-02T00:00:00", "2026-01-02T00:00:20"),
+            ("e3", "a", "failed", "2026-01-03T00:00:00", "2026-01-03T00:05:00"),
+            ("e4", "b", "completed", "2026-01-01T00:00:00", "2026-01-01T00:00:02"),
+            ("e5", "c", "running", "2026-01-01T00:00:00", None),
+        ]
+        conn.executemany(
+            "INSERT INTO core_executions (id, pipeline, status, created_at, started_at, completed_at)"
+            " VALUES (?, ?, ?, '2026-01-01', ?, ?)",
+            rows,
+        )
+
+        assert durations_from_executions(conn) == {"a": 15.0, "b": 2.0}
+        assert durations_from_executions(conn, window=1) == {"a": 20.0, "b": 2.0}
+        assert durations_from_executions(conn, pipelines=["b"]) == {"b": 2.0}
+
+    def test_from_executions_limits_rows_in_sql(self):
+        conn = sqlite3.connect(":memory:")
+        create_core_tables(conn)
+        conn.executemany(
+            "INSERT INTO core_executions (id, pipeline, status, created_at, started_at, completed_at)"
+            " VALUES (?, ?, 'completed', '2026-01-01', '2026-01-01T00:00:00', ?)",
+            [(f"e{i}", "a", f"2026-01-01T00:00:{i:02d}") for i in range(1, 51)],
+        )
+        fetched = []
+
+        class CountingConn:
+            def execute(self, sql, params=()):
+                rows = conn.execute(sql, params).fetchall()
+                fetched.extend(rows)
+                return type("Cursor", (), {"fetchall": lambda self: rows})()
+
+        assert durations_from_executions(CountingConn(), window=5) == {"a": 48.0}
+        assert len(fetched) == 5
+
+    def test_from_results(self):
+        result = GroupRunner(dispatcher=RecordingDispatcher()).execute(make_plan())
+
+        assert set(durations_from_results([result])) == {"bench.leaf", "bench.chain"}
+
+
+class TestGroupRunnerOrdering:
+    """GroupRunner starts the critical path first."""
+
+    def test_dispatch_order_follows_critical_path(self):
+        dispatcher = RecordingDispatcher()
+        runner = GroupRunner(dispatcher=dispatcher, step_durations=DURATIONS)
+
+        result = runner.execute(make_plan(max_concurrency=1))
+
+        assert result.status == GroupExecutionStatus.COMPLETED
+        assert dispatcher.order[:2] == ["bench.chain", "bench.chain"]
+        assert [s.step_name for s in result.step_executions] == ["leaf1", "leaf2", "leaf3", "head", "tail"]
+
+    def test_unit_weights_favor_longer_chains(self):
+        dispatcher = RecordingDispatcher()
+
+        GroupRunner(dispatcher=dispatcher).execute(make_plan(max_concurrency=1))
+
+        assert dispatcher.order[0] == "bench.chain"
+
+    def test_makespan_report(self):
+        runner = GroupRunner(dispatcher=RecordingDispatcher(), step_durations=DURATIONS)
+
+        report = runner.execute(make_plan()).makespan_report()
+
+        assert report["predicted_seconds"] == 10.0
+        assert report["actual_seconds"] == pytest.approx(report["predicted_seconds"] + report["error_seconds"])
+        assert report["critical_path"] == ["head", "tail"]
+
+    def test_no_prediction_without_durations(self):
+        result = GroupRunner(dispatcher=RecordingDispatcher()).execute(make_plan())
+
+        assert result.predicted_makespan_seconds is None
+        assert result.to_dict()["makespan"]["ratio"] is None
@@ -8,9 +8,12 @@ Tests cover:
 - Error handling for invalid files
 """
 
+import os
+
 import pytest
 
 from spine.orchestration.loader import (
+    GroupCache,
     load_group_from_yaml,
     load_groups_from_directory,
     group_to_yaml,
@@ -273,6 +276,131 @@ spec:
             load_groups_from_directory(temp_dir, ignore_errors=False)
 
 
+def write_group(directory, name, pipeline="test.pipeline_a"):
+    path = directory / f"{name}.yaml"
+    path.write_text(f"""
+apiVersion: spine.io/v1
+kind: PipelineGroup
+metadata:
+  name: {name}
+  domain: test.domain
+spec:
+  pipelines:
+    - name: step_a
+      pipeline: {pipeline}
+""")
+    return path
+
+
+class TestGroupCache:
+    """Tests for load_groups_from_directory with a GroupCache."""
+
+    def test_warm_load_skips_parsing(self, temp_dir):
+        """Unchanged files come from the cache with identical content."""
+        groups_dir = temp_dir / "groups"
+        groups_dir.mkdir()
+        for i in range(3):
+            write_group(groups_dir, f"test.g{i}")
+        cold = load_groups_from_directory(groups_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        cache = GroupCache(temp_dir / "cache.json")
+        warm = load_groups_from_directory(groups_dir, cache=cache)
+
+        assert (cache.hits, cache.misses) == (3, 0)
+        assert sorted(g.to_dict()["name"] for g in warm) == ["test.g0", "test.g1", "test.g2"]
+        assert [g.to_dict() for g in warm] == [g.to_dict() for g in cold]
+
+    def test_edited_file_is_reparsed(self, temp_dir):
+        """A content change invalidates only that file's entry."""
+        write_group(temp_dir, "test.a")
+        write_group(temp_dir, "test.b")
+        load_groups_from_directory(temp_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        write_group(temp_dir, "test.b", pipeline="test.pipeline_changed")
+        cache = GroupCache(temp_dir / "cache.json")
+        groups = {g.name: g for g in load_groups_from_directory(temp_dir, cache=cache)}
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert groups["test.b"].steps[0].pipeline == "test.pipeline_changed"
+
+    def test_touched_file_hits_by_hash(self, temp_dir):
+        """An mtime change with identical content is still a hit."""
+        path = write_group(temp_dir, "test.a")
+        load_groups_from_directory(temp_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache = GroupCache(temp_dir / "cache.json")
+        load_groups_from_directory(temp_dir, cache=cache)
+
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_deleted_files_are_pruned(self, temp_dir):
+        """Entries for removed files are dropped from the index."""
+        write_group(temp_dir, "test.a")
+        stale = write_group(temp_dir, "test.b")
+        load_groups_from_directory(temp_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        stale.unlink()
+        load_groups_from_directory(temp_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        assert len(GroupCache(temp_dir / "cache.json")) == 1
+
+    def test_shared_cache_prunes_only_the_scanned_files(self, temp_dir):
+        """Scanning one directory or pattern keeps other scans' entries."""
+        first, second, nested = temp_dir / "first", temp_dir / "second", temp_dir / "second" / "nested"
+        nested.mkdir(parents=True)
+        first.mkdir()
+        write_group(first, "test.a")
+        write_group(second, "test.b")
+        write_group(nested, "test.c")
+        cache = GroupCache(temp_dir / "cache.json")
+
+        load_groups_from_directory(first, cache=cache)
+        load_groups_from_directory(nested, cache=cache)
+        load_groups_from_directory(second, pattern="*.yaml", cache=cache)
+        assert len(cache) == 3
+
+        (nested / "test.c.yaml").unlink()
+        load_groups_from_directory(second, cache=cache)
+        assert len(cache) == 2
+        assert len(GroupCache(temp_dir / "cache.json")) == 2
+
+    def test_corrupt_cache_is_ignored(self, temp_dir):
+        """An unreadable index behaves like an empty one."""
+        write_group(temp_dir, "test.a")
+        (temp_dir / "cache.json").write_text("{not json")
+
+        groups = load_groups_from_directory(temp_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        assert [g.name for g in groups] == ["test.a"]
+
+    def test_invalid_files_are_not_cached(self, temp_dir):
+        """Invalid files keep raising on every load."""
+        (temp_dir / "invalid.yaml").write_text("invalid: yaml: [")
+        cache = GroupCache(temp_dir / "cache.json")
+
+        assert load_groups_from_directory(temp_dir, ignore_errors=True, cache=cache) == []
+        assert len(cache) == 0
+        with pytest.raises(InvalidGroupSpecError):
+            load_groups_from_directory(temp_dir, cache=cache)
+
+    def test_parallel_parse_matches_sequential(self, temp_dir, monkeypatch):
+        """Process-pool parsing keeps glob order and reports errors."""
+        monkeypatch.setattr("spine.orchestration.loader.PARALLEL_PARSE_THRESHOLD", 2)
+        for i in range(4):
+            write_group(temp_dir, f"test.g{i}")
+
+        sequential = load_groups_from_directory(temp_dir)
+        parallel = load_groups_from_directory(temp_dir, workers=2)
+
+        assert [g.name for g in parallel] == [g.name for g in sequential]
+
+        (temp_dir / "invalid.yaml").write_text("invalid: yaml: [")
+        with pytest.raises(InvalidGroupSpecError):
+            load_groups_from_directory(temp_dir, workers=2)
+
+
 class TestGroupToYaml:
     """Tests for group_to_yaml function."""
 
@@ -344,3 +344,79 @@ class TestComplexGraphs:
         for branch in ["branch1", "branch2", "branch3", "branch4"]:
             idx = step_order.index(branch)
             assert 0 < idx < len(step_order) - 1
+
+
+class TestPlanCache:
+    """Tests for the PlanResolver plan cache."""
+
+    @pytest.fixture
+    def resolver(self):
+        return PlanResolver(validate_pipelines=False, cache_size=2)
+
+    @pytest.fixture
+    def group(self):
+        return PipelineGroup(
+            name="test.cached",
+            steps=[
+                PipelineStep("a", "pipeline.a"),
+                PipelineStep("b", "pipeline.b", depends_on=["a"]),
+            ],
+            defaults={"tier": "NMS_TIER_1"},
+        )
+
+    def test_hit_shares_steps_with_new_batch_id(self, resolver, group):
+        """Repeated resolves share immutable steps but get their own batch_id."""
+        first = resolver.resolve(group, params={"week": "2026-01-09"})
+        second = resolver.resolve(group, params={"week": "2026-01-09"})
+
+        assert second.steps[0] is first.steps[0]
+        assert second.batch_id != first.batch_id
+        assert resolver.cache_stats == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_cached_params_are_read_only(self, resolver, group):
+        """Cached steps cannot be mutated through a returned plan."""
+        plan = resolver.resolve(group)
+
+        with pytest.raises(TypeError):
+            plan.steps[0].params["tier"] = "OTC"
+        plan.steps.clear()
+        assert len(resolver.resolve(group).steps) == 2
+
+    def test_key_covers_params_and_group_content(self, resolver, group):
+        """Different params or an edited group miss the cache."""
+        resolver.resolve(group, params={"week": "1"})
+        assert resolver.resolve(group, params={"week": "2"}).steps[0].params["week"] == "2"
+
+        group.defaults["tier"] = "OTC"
+        assert resolver.resolve(group, params={"week": "2"}).steps[0].params["tier"] == "OTC"
+        assert resolver.cache_stats["hits"] == 0
+
+    def test_lru_eviction(self, resolver, group):
+        """Least recently used plans are evicted beyond cache_size."""
+        for week in ("1", "2", "1", "3"):
+            resolver.resolve(group, params={"week": week})
+
+        assert resolver.cache_stats["size"] == 2
+        resolver.resolve(group, params={"week": "1"})
+        assert resolver.cache_stats["hits"] == 2
+
+    def test_registry_change_invalidates(self, resolver, group):
+        """Registering a group drops cached plans."""
+        from spine.orchestration import clear_group_registry, register_group
+
+        resolver.resolve(group)
+        try:
+            register_group(PipelineGroup(name="test.other", steps=[PipelineStep("x", "pipeline.x")]))
+            resolver.resolve(group)
+        finally:
+            clear_group_registry()
+
+        assert resolver.cache_stats["hits"] == 0
+
+    def test_cache_disabled(self, group):
+        """cache_size=0 resolves every time."""
+        resolver = PlanResolver(validate_pipelines=False, cache_size=0)
+        resolver.resolve(group)
+        resolver.resolve(group)
+
+        assert resolver.cache_stats == {"hits": 0, "misses": 0, "size": 0}
@@ -12,6 +12,7 @@ Tests cover:
 import pytest
 
 from spine.orchestration import (
+    GroupCache,
     PipelineGroup,
     PipelineStep,
     register_group,
@@ -19,7 +20,10 @@ from spine.orchestration import (
     list_groups,
     clear_group_registry,
     group_exists,
+    register_lazy_group,
+    register_groups_from_directory,
 )
+from spine.orchestration.registry import get_registry_stats
 from spine.orchestration.exceptions import GroupNotFoundError
 
 
@@ -165,3 +169,54 @@ class TestClearGroupRegistry:
         register_group(simple_linear_group)
         
         assert group_exists("test.simple_linear")
+
+
+class TestLazyGroups:
+    """Tests for lazily registered groups."""
+
+    def test_factory_runs_on_first_get(self, simple_linear_group):
+        """Lazy groups are listed without building them."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return simple_linear_group
+
+        register_lazy_group("test.simple_linear", factory, domain="test")
+
+        assert group_exists("test.simple_linear")
+        assert list_groups(domain="test") == ["test.simple_linear"]
+        assert calls == []
+        assert get_group("test.simple_linear") is simple_linear_group
+        assert get_group("test.simple_linear") is simple_linear_group
+        assert calls == [1]
+
+    def test_duplicate_with_eager_group_rejected(self, simple_linear_group):
+        """Lazy and eager registrations share one namespace."""
+        register_lazy_group("test.simple_linear", lambda: simple_linear_group)
+
+        with pytest.raises(ValueError, match="already registered"):
+            register_group(simple_linear_group)
+
+    def test_register_directory_lazy_on_warm_cache(self, temp_dir):
+        """Cached groups register lazily; the registry serves them on demand."""
+        groups_dir = temp_dir / "groups"
+        groups_dir.mkdir()
+        for name in ("test.a", "test.b"):
+            (groups_dir / f"{name}.yaml").write_text(
+                f"metadata:\n  name: {name}\n  domain: test\n"
+                "spec:\n  pipelines:\n    - name: s\n      pipeline: p\n"
+            )
+        register_groups_from_directory(groups_dir, cache=GroupCache(temp_dir / "cache.json"))
+        clear_group_registry()
+
+        names = register_groups_from_directory(groups_dir, cache=GroupCache(temp_dir / "cache.json"))
+
+        assert sorted(names) == ["test.a", "test.b"]
+        assert get_registry_stats()["lazy_groups"] == 2
+        assert get_group("test.a").steps[0].pipeline == "p"
+        assert get_registry_stats() == {
+            "total_groups": 2,
+            "groups_by_domain": {"test": 2},
+            "lazy_groups": 1,
+        }
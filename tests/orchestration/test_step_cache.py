@@ -0,0 +1,251 @@
+"""Tests for the workflow step result cache."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from spine.core.schema import create_core_tables
+from spine.orchestration import (
+    DatabaseStepCache,
+    DirectoryStepCache,
+    Step,
+    StepResult,
+    Workflow,
+    WorkflowContext,
+    WorkflowRunner,
+    WorkflowStatus,
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    create_core_tables(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(params=["database", "directory"])
+def make_cache(request, conn, tmp_path):
+    def factory(**kwargs):
+        if request.param == "database":
+            return DatabaseStepCache(conn, **kwargs)
+        return DirectoryStepCache(tmp_path / "cache", **kwargs)
+    return factory
+
+
+# Module-level so handlers don't capture it: captured values are part of
+# the handler fingerprint
+CALLS: list[str] = []
+
+
+@pytest.fixture
+def calls():
+    CALLS.clear()
+    yield CALLS
+    CALLS.clear()
+
+
+def make_workflow() -> Workflow:
+    def fetch(ctx, config):
+        CALLS.append("fetch")
+        return StepResult.ok(output={"rows": list(range(ctx.get_param("n")))})
+
+    def total(ctx, config):
+        CALLS.append("total")
+        return StepResult.ok(output={"total": sum(ctx.get_output("fetch", "rows"))})
+
+    def publish(ctx, config):
+        CALLS.append("publish")
+        return StepResult.ok(output={"published": ctx.get_output("total", "total")})
+
+    return Workflow(name="test.cached", steps=[
+        Step.lambda_("fetch", fetch),
+        Step.lambda_("total", total),
+        Step.lambda_("publish", publish, cacheable=False),
+    ])
+
+
+class TestStepCacheRunner:
+    """WorkflowRunner reuses cached step results."""
+
+    def test_rerun_skips_unchanged_steps(self, make_cache, calls):
+        workflow = make_workflow()
+        runner = WorkflowRunner(cache=make_cache())
+
+        first = runner.execute(workflow, params={"n": 4})
+        calls.clear()
+        second = runner.execute(workflow, params={"n": 4})
+
+        assert second.status == WorkflowStatus.COMPLETED
+        assert calls == ["publish"]
+        assert [s.cached for s in second.step_executions] == [True, True, False]
+        assert second.context.get_output("publish", "published") == first.context.get_output("publish", "published") == 6
+
+    def test_changed_params_miss(self, make_cache, calls):
+        workflow = make_workflow()
+        runner = WorkflowRunner(cache=make_cache())
+        runner.execute(workflow, params={"n": 4})
+
+        calls.clear()
+        result = runner.execute(workflow, params={"n": 5})
+
+        assert calls == ["fetch", "total", "publish"]
+        assert result.context.get_output("total", "total") == 10
+
+    def test_ignored_params_do_not_change_key(self, make_cache, calls):
+        runner = WorkflowRunner(cache=make_cache(ignore_params=["requested_at"]))
+        runner.execute(make_workflow(), params={"n": 3, "requested_at": "t1"})
+
+        calls.clear()
+        runner.execute(make_workflow(), params={"n": 3, "requested_at": "t2"})
+
+        assert calls == ["publish"]
+
+    def test_failures_and_unserializable_output_not_cached(self, make_cache):
+        attempts = []
+
+        def flaky(ctx, config):
+            attempts.append(1)
+            if len(attempts) == 1:
+                return StepResult.fail("boom")
+            return StepResult.ok(output={"obj": object()})
+
+        workflow = Workflow(name="test.uncached", steps=[Step.lambda_("flaky", flaky)])
+        cache = make_cache()
+        runner = WorkflowRunner(cache=cache)
+        for _ in range(3):
+            runner.execute(workflow)
+
+        assert len(attempts) == 3
+        assert cache.stats.stores == 0
+
+    def test_invalidate(self, make_cache, calls):
+        cache = make_cache()
+        runner = WorkflowRunner(cache=cache)
+        runner.execute(make_workflow(), params={"n": 2})
+
+        assert cache.invalidate("test.cached", "total") == 1
+        calls.clear()
+        runner.execute(make_workflow(), params={"n": 2})
+
+        assert calls == ["total", "publish"]
+
+
+class TestStepCacheEviction:
+    """TTL and size-based eviction."""
+
+    def store(self, cache, name: str) -> str:
+        step = Step.lambda_(name, lambda ctx, config: None)
+        key = cache.key_for("wf", step, WorkflowContext.create("wf"), [])
+        cache.store(key, "wf", name, StepResult.ok(output={"name": name}))
+        return key
+
+    def test_max_entries_evicts_least_recently_used(self, make_cache):
+        cache = make_cache(max_entries=2)
+        a = self.store(cache, "a")
+        b = self.store(cache, "b")
+        assert cache.lookup(a) is not None  # a is now more recent than b
+        c = self.store(cache, "c")
+
+        assert cache.lookup(b) is None
+        assert cache.lookup(a).output == {"name": "a"}
+        assert cache.lookup(c) is not None
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expires_entries(self, make_cache):
+        cache = make_cache(ttl_seconds=0)
+        key = self.store(cache, "a")
+
+        assert cache.lookup(key) is None
+
+    def test_handler_change_changes_key(self, make_cache):
+        cache = make_cache()
+        ctx = WorkflowContext.create("wf")
+        one = Step.lambda_("s", lambda ctx, config: StepResult.ok(output={"v": 1}))
+        two = Step.lambda_("s", lambda ctx, config: StepResult.ok(output={"v": 2}))
+
+        assert cache.key_for("wf", one, ctx, []) != cache.key_for("wf", two, ctx, [])
+
+    def test_rejects_negative_limits(self, conn):
+        with pytest.raises(ValueError):
+            DatabaseStepCache(conn, max_entries=-1)
+
+    def test_database_hit_does_not_commit(self, conn):
+        cache = DatabaseStepCache(conn)
+        key = self.store(cache, "a")
+        changes = conn.total_changes
+
+        assert cache.lookup(key) is not None
+        assert conn.total_changes == changes
+
+
+class TestStepCacheKeys:
+    """Keys distinguish inputs that str() would conflate."""
+
+    def test_closures_from_one_factory_get_different_keys(self, make_cache):
+        def make_handler(threshold):
+            def handler(ctx, config):
+                return StepResult.ok(output={"passed": threshold})
+            return handler
+
+        cache = make_cache()
+        ctx = WorkflowContext.create("wf")
+        low = Step.lambda_("s", make_handler(1))
+        high = Step.lambda_("s", make_handler(2))
+        again = Step.lambda_("s", make_handler(1))
+
+        assert cache.key_for("wf", low, ctx, []) != cache.key_for("wf", high, ctx, [])
+        assert cache.key_for("wf", low, ctx, []) == cache.key_for("wf", again, ctx, [])
+
+    def test_non_json_inputs_run_uncached(self, make_cache):
+        np = pytest.importorskip("numpy")
+        seen = []
+
+        def head(ctx, config):
+            seen.append(int(ctx.get_param("values")[1000]))
+            return StepResult.ok(output={"n": len(seen)})
+
+        workflow = Workflow(name="test.unkeyable", steps=[Step.lambda_("head", head)])
+        cache = make_cache()
+        runner = WorkflowRunner(cache=cache)
+        first = np.zeros(2000)
+        second = first.copy()
+        second[1000] = 1
+
+        runner.execute(workflow, params={"values": first})
+        runner.execute(workflow, params={"values": second})
+
+        assert seen == [0, 1]
+        assert cache.stats.stores == 0
+        assert cache.key_for("wf", workflow.steps[0], WorkflowContext.create("wf", params={"values": first}), []) is None
+
+    def test_fingerprint_stable_across_processes(self, tmp_path):
+        (tmp_path / "handlers.py").write_text(textwrap.dedent("""
+            def handler(ctx, config):
+                rows = sorted(config["rows"], key=lambda r: r["n"])
+                keep = [r for r in rows if r["kind"] in {"a", "b", "c"}]
+                return sum(r["n"] for r in keep)
+        """))
+        script = (
+            "from handlers import handler\n"
+            "from spine.orchestration.step_cache import _handler_fingerprint\n"
+            "print(_handler_fingerprint(handler))\n"
+        )
+
+        def fingerprint(seed: str) -> str:
+            out = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=tmp_path,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return out.stdout.strip()
+
+        assert fingerprint("1") == fingerprint("2")
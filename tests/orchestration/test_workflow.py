@@ -1,5 +1,9 @@
 """Tests for spine.orchestration workflow modules."""
 
+import json
+import threading
+import time
+
 import pytest
 
 from spine.orchestration import (
@@ -11,6 +15,7 @@ from spine.orchestration import (
     WorkflowRunner,
     WorkflowStatus,
 )
+from spine.orchestration.step_types import ErrorPolicy, RetryPolicy
 from spine.core.errors import PipelineError
 
 
@@ -164,6 +169,65 @@ class TestWorkflowContext:
         assert ctx.get_output("step1", "result") == "value1"
         assert ctx.get_output("step2", "result") == "value2"
 
+    def test_context_mappings_are_read_only(self):
+        """params and outputs cannot be mutated in place."""
+        ctx = WorkflowContext.create(workflow_name="test", params={"a": 1})
+        ctx = ctx.with_output("step1", {"n": 1})
+
+        with pytest.raises(TypeError):
+            ctx.params["a"] = 2
+        with pytest.raises(TypeError):
+            ctx.outputs["step1"]["n"] = 2
+
+    def test_context_pickles_copies_and_encodes_as_dicts(self):
+        """Read-only mappings still behave like dicts for serialization."""
+        import copy
+        import pickle
+
+        ctx = WorkflowContext.create(workflow_name="test", params={"a": [1]}, partition={"d": "2024-01-01"})
+        ctx = ctx.with_output("step1", {"n": 1})
+
+        restored = pickle.loads(pickle.dumps(ctx))
+        assert restored.params == {"a": [1]}
+        assert restored.get_output("step1", "n") == 1
+        with pytest.raises(TypeError):
+            restored.params["a"] = 2
+
+        clone = copy.deepcopy(ctx)
+        assert clone.params["a"] is not ctx.params["a"]
+        assert json.loads(json.dumps(ctx.partition)) == {"d": "2024-01-01"}
+        assert json.dumps(ctx.outputs) == '{"step1": {"n": 1}}'
+
+    def test_context_shares_prior_outputs(self):
+        """New contexts share earlier outputs instead of copying them."""
+        output = {"rows": list(range(1000))}
+        ctx1 = WorkflowContext().with_output("step1", output)
+        ctx2 = ctx1.with_output("step2", {"n": 1}).with_params({"x": 1})
+
+        assert ctx2.outputs["step1"] is ctx1.outputs["step1"]
+        assert ctx2.get_output("step1", "rows") is output["rows"]
+        assert "step2" not in ctx1.outputs
+        assert "x" not in ctx1.params
+
+    def test_context_copies_returned_output(self):
+        """Mutating a returned output dict later does not leak into the context."""
+        output = {"n": 1}
+        ctx = WorkflowContext().with_output("step1", output)
+        output["n"] = 2
+
+        assert ctx.get_output("step1", "n") == 1
+
+    def test_context_to_dict_is_json_serializable(self):
+        """to_dict returns plain dicts and round-trips via from_dict."""
+        ctx = WorkflowContext.create(workflow_name="test", params={"a": 1})
+        ctx = ctx.with_output("step1", {"n": 1})
+
+        data = json.loads(json.dumps(ctx.to_dict()))
+        restored = WorkflowContext.from_dict(data)
+
+        assert restored.params == {"a": 1}
+        assert restored.get_output("step1", "n") == 1
+
 
 class TestStepResult:
     """Test StepResult."""
@@ -297,3 +361,341 @@ class TestWorkflowRunner:
         
         assert "step1" in result.completed_steps
         assert "step2" in result.completed_steps
+
+
+class TestParallelWorkflow:
+    """Test parallel execution of independent steps."""
+
+    def test_depends_on_must_reference_earlier_steps(self):
+        """depends_on may only name earlier steps."""
+        ok = lambda ctx, cfg: StepResult.ok()
+        with pytest.raises(ValueError, match="later step"):
+            Workflow(name="w", steps=[
+                Step.lambda_("a", ok, depends_on=["b"]),
+                Step.lambda_("b", ok),
+            ])
+        with pytest.raises(ValueError, match="unknown step"):
+            Workflow(name="w", steps=[Step.lambda_("a", ok, depends_on=["x"])])
+
+    def test_undeclared_steps_depend_on_all_earlier_steps(self):
+        """Steps without depends_on keep sequential semantics."""
+        ok = lambda ctx, cfg: StepResult.ok()
+        workflow = Workflow(name="w", steps=[
+            Step.lambda_("a", ok),
+            Step.lambda_("b", ok, depends_on=[]),
+            Step.lambda_("c", ok),
+        ])
+
+        assert workflow.dependencies() == {"a": None, "b": (), "c": None}
+        assert workflow.dependencies() is workflow.dependencies()
+        assert [workflow.upstream(name) for name in "abc"] == [(), (), ("a", "b")]
+
+    def test_batch_dependencies_use_frontier_for_undeclared_steps(self):
+        """Undeclared steps only wait on earlier steps nothing else needs."""
+        from spine.orchestration.workflow_runner import _batch_dependencies
+
+        ok = lambda ctx, cfg: StepResult.ok()
+        workflow = Workflow(name="w", steps=[
+            Step.lambda_("a", ok, depends_on=[]),
+            Step.lambda_("b", ok, depends_on=[]),
+            Step.lambda_("c", ok, depends_on=["a"]),
+            Step.lambda_("d", ok),
+            Step.lambda_("e", ok),
+        ])
+
+        deps = _batch_dependencies(workflow.steps, workflow)
+        assert deps == {"a": [], "b": [], "c": ["a"], "d": ["b", "c"], "e": ["d"]}
+
+    def test_independent_steps_run_concurrently(self):
+        """Independent fetch steps overlap; the join step sees all outputs."""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def fetch(ctx, config):
+            barrier.wait()  # only passes if all three run at once
+            return StepResult.ok(output={"rows": config["rows"]})
+
+        def join(ctx, config):
+            total = sum(ctx.get_output(name, "rows") for name in ("f1", "f2", "f3"))
+            return StepResult.ok(output={"total": total})
+
+        workflow = Workflow(name="ingest", steps=[
+            Step.lambda_("f1", fetch, config={"rows": 1}, depends_on=[]),
+            Step.lambda_("f2", fetch, config={"rows": 2}, depends_on=[]),
+            Step.lambda_("f3", fetch, config={"rows": 3}, depends_on=[]),
+            Step.lambda_("join", join),
+        ])
+        result = WorkflowRunner(parallel=True, max_workers=3).execute(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.context.get_output("join", "total") == 6
+        assert result.completed_steps == ["f1", "f2", "f3", "join"]
+
+    def test_context_updates_merge_in_workflow_order(self):
+        """Conflicting context_updates resolve by step order, not finish order."""
+        def slow(ctx, config):
+            time.sleep(0.05)
+            return StepResult.ok(context_updates={"winner": "first"})
+
+        def fast(ctx, config):
+            return StepResult.ok(context_updates={"winner": "second"})
+
+        workflow = Workflow(name="w", steps=[
+            Step.lambda_("first", slow, depends_on=[]),
+            Step.lambda_("second", fast, depends_on=[]),
+        ])
+        result = WorkflowRunner(parallel=True).execute(workflow)
+
+        assert result.context.get_param("winner") == "second"
+
+    def test_step_sees_only_its_dependencies(self):
+        """A step's context holds its dependencies' outputs, never a sibling's."""
+        seen = {}
+
+        def record(ctx, config):
+            seen[config["name"]] = sorted(ctx.outputs)
+            return StepResult.ok()
+
+        workflow = Workflow(name="w", steps=[
+            Step.lambda_("a", record, config={"name": "a"}, depends_on=[]),
+            Step.lambda_("b", record, config={"name": "b"}, depends_on=[]),
+            Step.lambda_("c", record, config={"name": "c"}, depends_on=["a"]),
+        ])
+        WorkflowRunner(parallel=True).execute(workflow)
+
+        assert seen["c"] == ["a"]
+
+    def test_choice_branching_in_parallel_mode(self):
+        """Choice steps still skip to their target."""
+        executed = []
+
+        def track(ctx, config):
+            executed.append(config["name"])
+            return StepResult.ok()
+
+        workflow = Workflow(name="w", steps=[
+            Step.lambda_("a", track, config={"name": "a"}),
+            Step.choice("route", condition=lambda ctx: True, then_step="d"),
+            Step.lambda_("b", track, config={"name": "b"}, depends_on=[]),
+            Step.lambda_("c", track, config={"name": "c"}, depends_on=[]),
+            Step.lambda_("d", track, config={"name": "d"}, depends_on=[]),
+            Step.lambda_("e", track, config={"name": "e"}, depends_on=[]),
+        ])
+        result = WorkflowRunner(parallel=True).execute(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert sorted(executed) == ["a", "d", "e"]
+
+    def test_failure_stops_dependents(self):
+        """A STOP failure prevents steps that depend on it from starting."""
+        executed = []
+
+        def fail(ctx, config):
+            return StepResult.fail("boom")
+
+        def track(ctx, config):
+            executed.append(config["name"])
+            return StepResult.ok()
+
+        workflow = Workflow(name="w", steps=[
+            Step.lambda_("bad", fail, depends_on=[]),
+            Step.lambda_("after", track, config={"name": "after"}, depends_on=["bad"]),
+        ])
+        result = WorkflowRunner(parallel=True).execute(workflow)
+
+        assert result.status == WorkflowStatus.FAILED
+        assert result.error_step == "bad"
+        assert executed == []
+
+
+def _item_workflow(handler):
+    return Workflow(name="test.item", steps=[Step.lambda_("work", handler)])
+
+
+class TestMapStep:
+    """Test map step fan-out/fan-in."""
+
+    def test_map_collects_outputs_in_item_order(self):
+        """Outputs are ordered by item, not by completion."""
+        def work(ctx, config):
+            item = ctx.get_param("item")
+            time.sleep(0.01 * (5 - item))  # later items finish first
+            return StepResult.ok(output={"square": item * item})
+
+        workflow = Workflow(
+            name="test.map",
+            steps=[Step.map("fan", "numbers", _item_workflow(work), max_concurrency=5)],
+        )
+        result = WorkflowRunner().execute(workflow, params={"numbers": [1, 2, 3, 4]})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        output = result.context.get_output("fan")
+        assert [r["work"]["square"] for r in output["results"]] == [1, 4, 9, 16]
+        assert output["completed"] == 4
+
+    def test_map_respects_max_concurrency(self):
+        """No more than max_concurrency items run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(ctx, config):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return StepResult.ok()
+
+        workflow = Workflow(
+            name="test.map",
+            steps=[Step.map("fan", "items", _item_workflow(work), max_concurrency=2)],
+        )
+        result = WorkflowRunner().execute(workflow, params={"items": list(range(8))})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert state["peak"] <= 2
+
+    def test_map_reads_items_from_previous_output(self):
+        """items_path can point into an earlier step's output."""
+        workflow = Workflow(
+            name="test.map",
+            steps=[
+                Step.lambda_("list", lambda ctx, cfg: StepResult.ok(output={"symbols": ["A", "B"]})),
+                Step.map(
+                    "fan",
+                    "outputs.list.symbols",
+                    _item_workflow(lambda ctx, cfg: StepResult.ok(output={"s": ctx.get_param("symbol")})),
+                    item_param="symbol",
+                ),
+            ],
+        )
+        result = WorkflowRunner().execute(workflow)
+
+        results = result.context.get_output("fan", "results")
+        assert [r["work"]["s"] for r in results] == ["A", "B"]
+
+    def test_map_stop_fails_fast(self):
+        """With STOP, the first failed item fails the step and cancels the rest."""
+        started = []
+
+        def work(ctx, config):
+            started.append(ctx.get_param("item"))
+            if ctx.get_param("item") == 0:
+                return StepResult.fail("bad item", category="DATA_QUALITY")
+            return StepResult.ok()
+
+        workflow = Workflow(
+            name="test.map",
+            steps=[Step.map("fan", "items", _item_workflow(work), max_concurrency=1)],
+        )
+        result = WorkflowRunner().execute(workflow, params={"items": list(range(5))})
+
+        assert result.status == WorkflowStatus.FAILED
+        assert "Map item 0 failed" in result.error
+        execution = result.step_executions[0]
+        assert execution.result.error_category == "DATA_QUALITY"
+        assert execution.result.output["skipped"] == 5 - len(started)
+        assert len(started) < 5
+
+    def test_map_continue_records_failures(self):
+        """With CONTINUE, every item runs and failures are reported."""
+        def work(ctx, config):
+            if ctx.get_param("item") % 2:
+                return StepResult.fail("odd")
+            return StepResult.ok(output={"item": ctx.get_param("item")})
+
+        workflow = Workflow(
+            name="test.map",
+            steps=[
+                Step.map("fan", "items", _item_workflow(work), on_error=ErrorPolicy.CONTINUE),
+            ],
+        )
+        result = WorkflowRunner().execute(workflow, params={"items": [0, 1, 2, 3]})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        output = result.context.get_output("fan")
+        assert output["failed"] == 2
+        assert [e["index"] for e in output["errors"]] == [1, 3]
+        assert output["results"][1] is None
+        assert output["results"][2]["work"]["item"] == 2
+
+    def test_map_retries_transient_failures(self):
+        """With RETRY, retryable item failures are retried."""
+        attempts = []
+
+        def work(ctx, config):
+            attempts.append(ctx.get_param("item"))
+            if len(attempts) < 3:
+                return StepResult.fail("flaky", category="TRANSIENT")
+            return StepResult.ok()
+
+        workflow = Workflow(
+            name="test.map",
+            steps=[
+                Step.map(
+                    "fan",
+                    "items",
+                    _item_workflow(work),
+                    on_error=ErrorPolicy.RETRY,
+                    retry_policy=RetryPolicy(max_attempts=3, initial_delay_seconds=0),
+                ),
+            ],
+        )
+        result = WorkflowRunner().execute(workflow, params={"items": ["x"]})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert attempts == ["x", "x", "x"]
+
+    def test_map_missing_items_is_configuration_error(self):
+        """Unresolvable items_path fails with CONFIGURATION."""
+        workflow = Workflow(
+            name="test.map",
+            steps=[Step.map("fan", "missing", _item_workflow(lambda ctx, cfg: StepResult.ok()))],
+        )
+        result = WorkflowRunner().execute(workflow)
+
+        assert result.status == WorkflowStatus.FAILED
+        assert result.step_executions[0].result.error_category == "CONFIGURATION"
+
+    def test_map_non_numeric_list_segment_is_configuration_error(self):
+        """A non-numeric segment into a list fails with CONFIGURATION."""
+        workflow = Workflow(
+            name="test.map",
+            steps=[Step.map("fan", "groups.first", _item_workflow(lambda ctx, cfg: StepResult.ok()))],
+        )
+        result = WorkflowRunner().execute(workflow, params={"groups": [["a"]]})
+
+        assert result.status == WorkflowStatus.FAILED
+        step_result = result.step_executions[0].result
+        assert step_result.error_category == "CONFIGURATION"
+        assert "Map items not found" in step_result.error
+
+    def test_map_under_tracked_runner_runs_every_item(self):
+        """Items sharing the parent partition are not skipped as already done."""
+        import sqlite3
+
+        from spine.core.schema import create_core_tables
+        from spine.orchestration import TrackedWorkflowRunner
+
+        conn = sqlite3.connect(":memory:")
+        create_core_tables(conn)
+        workflow = Workflow(
+            name="test.map",
+            steps=[
+                Step.map(
+                    "fan",
+                    "items",
+                    _item_workflow(lambda ctx, cfg: StepResult.ok(output={"sq": ctx.get_param("item") ** 2})),
+                    max_concurrency=3,
+                ),
+            ],
+        )
+        result = TrackedWorkflowRunner(conn).execute(
+            workflow, params={"items": [1, 2, 3]}, partition={"d": "2024-01-01"}
+        )
+        conn.close()
+
+        assert result.status == WorkflowStatus.COMPLETED
+        output = result.context.get_output("fan")
+        assert [r["work"]["sq"] for r in output["results"]] == [1, 4, 9]
+        assert (output["completed"], output["skipped"]) == (3, 0)
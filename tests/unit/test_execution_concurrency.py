@@ -8,7 +8,7 @@ import pytest
 from datetime import datetime, timezone, timedelta
 
 from spine.core.schema import CORE_DDL
-from spine.execution.concurrency import ConcurrencyGuard
+from spine.execution.concurrency import ConcurrencyGuard, LocalLockTable
 
 
 @pytest.fixture
@@ -209,5 +209,130 @@ class TestCleanupExpired:
         assert guard.is_locked("expired.lock") is False
 
 
+class TestUpsertAcquire:
+    """Test single-statement acquire semantics."""
+
+    def test_takes_over_expired_lock(self, guard, conn):
+        """An expired lock is taken over without a separate cleanup."""
+        past = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+        conn.execute(
+            "INSERT INTO core_concurrency_locks VALUES (?, ?, ?, ?)",
+            ("stale.lock", "old-exec", past, past),
+        )
+        conn.commit()
+
+        assert guard.acquire("stale.lock", "new-exec") is True
+        assert guard.get_lock_holder("stale.lock") == "new-exec"
+
+    def test_reacquire_keeps_acquired_at(self, guard, conn):
+        """Re-acquiring extends expiry but keeps the original acquired_at."""
+        guard.acquire("test.lock", "exec-123", timeout_seconds=60)
+        first = conn.execute(
+            "SELECT acquired_at, expires_at FROM core_concurrency_locks"
+        ).fetchone()
+
+        guard.acquire("test.lock", "exec-123", timeout_seconds=7200)
+        second = conn.execute(
+            "SELECT acquired_at, expires_at FROM core_concurrency_locks"
+        ).fetchone()
+
+        assert second[0] == first[0]
+        assert second[1] > first[1]
+
+
+class TestAcquireMany:
+    """Test batch lock acquisition."""
+
+    def test_acquires_all_keys(self, guard):
+        """All keys are acquired together."""
+        assert guard.acquire_many(["a", "b", "c"], "exec-1") is True
+        assert {lock["lock_key"] for lock in guard.list_active_locks()} == {"a", "b", "c"}
+
+    def test_all_or_nothing(self, conn):
+        """If any key is held elsewhere, none are acquired."""
+        other = ConcurrencyGuard(conn)
+        other.acquire("b", "exec-other")
+
+        guard = ConcurrencyGuard(conn)
+        assert guard.acquire_many(["a", "b", "c"], "exec-1") is False
+        assert guard.is_locked("a") is False
+        assert guard.is_locked("c") is False
+        assert guard.get_lock_holder("b") == "exec-other"
+
+    def test_database_error_rolls_back_partial_batch(self, guard, conn):
+        """A failing upsert leaves no open transaction or in-process claims."""
+        conn.execute("""
+            CREATE TRIGGER reject_c BEFORE INSERT ON core_concurrency_locks
+            WHEN NEW.lock_key = 'c' BEGIN SELECT RAISE(ABORT, 'rejected'); END
+        """)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            guard.acquire_many(["a", "b", "c"], "exec-1")
+
+        assert conn.in_transaction is False
+        assert guard.is_locked("a") is False
+        conn.execute("DROP TRIGGER reject_c")
+        assert ConcurrencyGuard(conn).acquire("a", "exec-2") is True
+
+    def test_empty_and_duplicate_keys(self, guard):
+        """Empty batches succeed; duplicate keys are collapsed."""
+        assert guard.acquire_many([], "exec-1") is True
+        assert guard.acquire_many(["a", "a"], "exec-1") is True
+
+
+class TestLocalLockTable:
+    """Test the in-process fast path."""
+
+    def test_shared_table_refuses_without_database(self):
+        """Guards sharing a table refuse keys held in-process."""
+        locks = LocalLockTable()
+        conn_a = sqlite3.connect(":memory:")
+        conn_b = sqlite3.connect(":memory:")
+        for c in (conn_a, conn_b):
+            for ddl in CORE_DDL.values():
+                c.execute(ddl)
+
+        guard_a = ConcurrencyGuard(conn_a, local_locks=locks)
+        guard_b = ConcurrencyGuard(conn_b, local_locks=locks)
+
+        assert guard_a.acquire("shared.lock", "exec-a") is True
+        # conn_b's table is empty: only the local table can refuse this
+        assert guard_b.acquire("shared.lock", "exec-b") is False
+
+        guard_a.release("shared.lock", execution_id="exec-a")
+        assert len(locks) == 0
+        assert guard_b.acquire("shared.lock", "exec-b") is True
+
+    def test_threads_contend_for_one_winner(self, tmp_path):
+        """Exactly one of many threads acquires a contended key."""
+        import threading
+
+        path = tmp_path / "locks.db"
+        setup = sqlite3.connect(path)
+        for ddl in CORE_DDL.values():
+            setup.execute(ddl)
+        setup.commit()
+        setup.close()
+
+        locks = LocalLockTable()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker(i):
+            conn = sqlite3.connect(path, timeout=5)
+            guard = ConcurrencyGuard(conn, local_locks=locks)
+            barrier.wait()
+            results.append(guard.acquire("hot.lock", f"exec-{i}"))
+            conn.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results.count(True) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -274,3 +274,70 @@ class TestIncrementRetry:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestBufferedWrites:
+    """Test the write-behind buffer."""
+
+    def _count(self, conn, table):
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_batch_defers_writes_until_exit(self, ledger, conn):
+        """Writes inside batch() are committed together on exit."""
+        execution = Execution.create(pipeline="test.pipeline")
+
+        with ledger.batch():
+            ledger.create_execution(execution)
+            for i in range(10):
+                ledger.record_event(execution.id, EventType.PROGRESS, {"i": i})
+            assert ledger.pending_writes == 12
+            assert self._count(conn, "core_execution_events") == 0
+
+        assert ledger.pending_writes == 0
+        assert self._count(conn, "core_executions") == 1
+        assert self._count(conn, "core_execution_events") == 11
+
+    def test_flush_on_size_threshold(self, conn):
+        """Buffer flushes once flush_size writes are pending."""
+        ledger = ExecutionLedger(conn, buffered=True, flush_size=5, flush_interval=60)
+        execution = Execution.create(pipeline="test.pipeline")
+        ledger.create_execution(execution)
+
+        for i in range(3):
+            ledger.record_event(execution.id, EventType.PROGRESS, {"i": i})
+
+        assert ledger.pending_writes == 0
+        assert self._count(conn, "core_execution_events") == 4
+
+    def test_flush_on_time_threshold(self, conn):
+        """Buffer flushes when the oldest write exceeds flush_interval."""
+        ledger = ExecutionLedger(conn, buffered=True, flush_size=1000, flush_interval=0)
+        execution = Execution.create(pipeline="test.pipeline")
+        ledger.create_execution(execution)
+
+        assert ledger.pending_writes == 0
+        assert self._count(conn, "core_executions") == 1
+
+    def test_reads_see_buffered_writes(self, conn):
+        """Reads flush first, so buffered writes are visible."""
+        ledger = ExecutionLedger(conn, buffered=True, flush_size=1000, flush_interval=60)
+        execution = Execution.create(pipeline="test.pipeline")
+        ledger.create_execution(execution)
+        ledger.update_status(execution.id, ExecutionStatus.RUNNING)
+
+        fetched = ledger.get_execution(execution.id)
+        assert fetched.status == ExecutionStatus.RUNNING
+        assert len(ledger.get_events(execution.id)) == 2
+
+    def test_order_preserved_across_statements(self, conn):
+        """Status updates apply in the order they were issued."""
+        with ExecutionLedger(conn, buffered=True, flush_size=1000, flush_interval=60) as ledger:
+            execution = Execution.create(pipeline="test.pipeline")
+            ledger.create_execution(execution)
+            ledger.update_status(execution.id, ExecutionStatus.RUNNING)
+            ledger.update_status(execution.id, ExecutionStatus.COMPLETED, result={"ok": True})
+
+        fetched = ExecutionLedger(conn).get_execution(execution.id)
+        assert fetched.status == ExecutionStatus.COMPLETED
+        assert fetched.result == {"ok": True}
+        assert fetched.started_at is not None